@@ -2207,6 +2207,118 @@ int32_t kc_engine_apply_policy_action(KCEngine *engine, KCAction action) {
     return kc_engine_apply_ai_action(engine, action);
 }
 
+static KCDensePolicyActionFeatures kc_vector_env_candidate_rows(KCDensePolicyActionFeatures rows, int32_t env_index) {
+    size_t offset = (size_t)env_index * (size_t)rows.max_actions;
+    if (rows.actions) rows.actions += offset;
+    if (rows.action_heads) rows.action_heads += offset;
+    if (rows.kind_ids) rows.kind_ids += offset;
+    if (rows.player_ids) rows.player_ids += offset;
+    if (rows.suit_ids) rows.suit_ids += offset;
+    if (rows.target_suit_ids) rows.target_suit_ids += offset;
+    if (rows.card_suit_ids) rows.card_suit_ids += offset;
+    if (rows.card_value_ids) rows.card_value_ids += offset;
+    if (rows.hand_suit_ids) rows.hand_suit_ids += offset;
+    if (rows.hand_value_ids) rows.hand_value_ids += offset;
+    if (rows.plot_suit_ids) rows.plot_suit_ids += offset;
+    if (rows.plot_value_ids) rows.plot_value_ids += offset;
+    if (rows.plot_zone_ids) rows.plot_zone_ids += offset;
+    if (rows.action_scalars) rows.action_scalars += offset * (size_t)rows.action_scalar_count;
+    if (rows.features) rows.features += offset * (size_t)rows.input_size;
+    return rows;
+}
+
+static KCDenseObjectTokens kc_vector_env_object_rows(KCDenseObjectTokens rows, int32_t env_index) {
+    size_t offset = (size_t)env_index * (size_t)rows.max_tokens;
+    if (rows.type_ids) rows.type_ids += offset;
+    if (rows.owner_ids) rows.owner_ids += offset;
+    if (rows.zone_ids) rows.zone_ids += offset;
+    if (rows.suit_ids) rows.suit_ids += offset;
+    if (rows.value_ids) rows.value_ids += offset;
+    if (rows.index_ids) rows.index_ids += offset;
+    if (rows.scalars) rows.scalars += offset * KC_OBJECT_SCALAR_COUNT;
+    return rows;
+}
+
+/*
+ * Applies one chosen action per engine, then plays heuristic actions until a seat in
+ * that engine's decision_seats bitmask is waiting. With a candidate buffer, a decision
+ * seat without policy candidates is played by the heuristic too. stop_on_year_change
+ * also pauses heuristic play at the first state of a new year. Outputs for engine i
+ * go to row i of every buffer. Returns the number of engines waiting for a decision.
+ */
+int32_t kc_vector_env_step(KCVectorEnvStep step) {
+    if (!step.engines || step.env_count <= 0) {
+        return 0;
+    }
+    bool with_candidates = step.candidates.max_actions > 0;
+    int32_t waiting = 0;
+    for (int32_t env_index = 0; env_index < step.env_count; env_index++) {
+        KCEngine *engine = step.engines[env_index];
+        int32_t player_id = KC_NO_PLAYER;
+        int32_t candidate_count = 0;
+        int32_t automatic = 0;
+        int32_t error = 0;
+        bool decision = false;
+        if (!engine) {
+            if (step.waiting_players) step.waiting_players[env_index] = KC_NO_PLAYER;
+            if (step.candidate_counts) step.candidate_counts[env_index] = 0;
+            continue;
+        }
+        KCDensePolicyActionFeatures candidates = kc_vector_env_candidate_rows(step.candidates, env_index);
+        int32_t decision_seats = step.decision_seats ? step.decision_seats[env_index] : 0;
+        int32_t start_year = engine->year;
+        if (step.apply_actions && step.actions && step.apply_actions[env_index]) {
+            error = kc_engine_apply_policy_action(engine, step.actions[env_index]);
+        }
+        while (error == 0) {
+            player_id = kc_engine_waiting_player(engine);
+            if (player_id < 0 || player_id >= KC_PLAYER_COUNT) {
+                player_id = KC_NO_PLAYER;
+                break;
+            }
+            if ((decision_seats & (1 << player_id)) != 0) {
+                candidate_count = with_candidates
+                    ? kc_engine_policy_action_dense_features(engine, player_id, candidates)
+                    : 0;
+                decision = !with_candidates || candidate_count > 0;
+                if (decision) {
+                    break;
+                }
+            }
+            KCAction action;
+            if ((step.stop_on_year_change && engine->year != start_year) ||
+                automatic >= step.max_automatic_actions ||
+                !kc_engine_heuristic_policy_action(engine, &action)) {
+                break;
+            }
+            error = kc_engine_apply_policy_action(engine, action);
+            automatic += 1;
+        }
+        if (decision) {
+            waiting += 1;
+            if (step.object_tokens.max_tokens > 0) {
+                int32_t token_count = kc_engine_object_token_dense_features(
+                    engine, player_id, kc_vector_env_object_rows(step.object_tokens, env_index));
+                if (step.object_token_counts) step.object_token_counts[env_index] = token_count;
+            }
+            if (step.state_features && step.state_input_size > 0) {
+                kc_engine_state_features(
+                    engine,
+                    player_id,
+                    step.state_features + (size_t)env_index * (size_t)step.state_input_size,
+                    step.state_input_size);
+            }
+        }
+        if (step.apply_errors) step.apply_errors[env_index] = error;
+        if (step.automatic_actions) step.automatic_actions[env_index] = automatic;
+        if (step.waiting_players) step.waiting_players[env_index] = player_id;
+        if (step.phases) step.phases[env_index] = engine->phase;
+        if (step.years) step.years[env_index] = engine->year;
+        if (step.candidate_counts) step.candidate_counts[env_index] = decision ? candidate_count : 0;
+    }
+    return waiting;
+}
+
 bool kc_engine_policy_action_with_workspace(const KCEngine *engine, KCPolicyModelBuffer model, KCPolicyWorkspace *workspace, KCAction *selected) {
     if (!engine) {
         return false;
@@ -388,6 +388,27 @@ typedef struct {
     int32_t transition_batch_depth;
 } KCEngine;
 
+typedef struct {
+    KCEngine **engines;
+    int32_t env_count;
+    const KCAction *actions;
+    const bool *apply_actions;
+    const int32_t *decision_seats;
+    int32_t max_automatic_actions;
+    bool stop_on_year_change;
+    int32_t *apply_errors;
+    int32_t *automatic_actions;
+    int32_t *waiting_players;
+    int32_t *phases;
+    int32_t *years;
+    int32_t *candidate_counts;
+    KCDensePolicyActionFeatures candidates;
+    int32_t *object_token_counts;
+    KCDenseObjectTokens object_tokens;
+    float *state_features;
+    int32_t state_input_size;
+} KCVectorEnvStep;
+
 void kc_variants_kolkhoz(KCVariants *variants);
 void kc_controllers_all_external(KCControllers *controllers);
 void kc_controllers_default_single_player(KCControllers *controllers);
@@ -420,6 +441,7 @@ int32_t kc_engine_policy_action_dense_features(const KCEngine *engine, int32_t p
 int32_t kc_engine_state_features(const KCEngine *engine, int32_t perspective_player, float *features, int32_t feature_count);
 int32_t kc_engine_object_tokens(const KCEngine *engine, int32_t perspective_player, KCObjectToken *tokens, int32_t max_tokens);
 int32_t kc_engine_object_token_dense_features(const KCEngine *engine, int32_t perspective_player, KCDenseObjectTokens output);
+int32_t kc_vector_env_step(KCVectorEnvStep step);
 bool kc_engine_heuristic_policy_action(const KCEngine *engine, KCAction *selected);
 bool kc_engine_waiting_for_external_action(const KCEngine *engine);
 int32_t kc_engine_waiting_player(const KCEngine *engine);
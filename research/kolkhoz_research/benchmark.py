@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 import math
+import multiprocessing
+import os
 import random
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
 from dataclasses import asdict, dataclass
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +23,10 @@ DEFAULT_BOT_POLICY_PATHS = {
     "mediumAI": REPO_ROOT / "policies/medium_policy.json",
     "neuralAI": REPO_ROOT / "policies/hard_policy.json",
 }
+BENCHMARK_CHUNK_GAMES = 8
+BOOTSTRAP_ENGINES = ("numpy", "python")
+# Bound each vectorized resample block to about 4M indices (32 MiB of int64).
+BOOTSTRAP_BLOCK_CELLS = 1 << 22
 
 
 @dataclass(frozen=True)
@@ -80,17 +90,104 @@ def _mean(values: list[float]) -> float:
     return sum(values) / len(values) if values else 0.0
 
 
-def _ci(values: list[float], samples: int, seed: int) -> dict[str, float]:
+def _strata_groups(count: int, strata: list[int] | None) -> list[list[int]]:
+    if strata is None:
+        return [list(range(count))]
+    if len(strata) != count:
+        raise ValueError("bootstrap strata must label every value")
+    groups: dict[int, list[int]] = {}
+    for index, stratum in enumerate(strata):
+        groups.setdefault(stratum, []).append(index)
+    return [groups[key] for key in sorted(groups)]
+
+
+def _python_bootstrap_means(
+    values: list[float], samples: int, seed: int, strata: list[int] | None
+) -> list[float]:
+    rng = random.Random(seed)
+    if strata is None:
+        # Same draw order as historical records; keep it byte-for-byte stable.
+        return [
+            _mean([values[rng.randrange(len(values))] for _ in values])
+            for _ in range(samples)
+        ]
+    groups = _strata_groups(len(values), strata)
+    return [
+        _mean(
+            [
+                values[members[rng.randrange(len(members))]]
+                for members in groups
+                for _ in members
+            ]
+        )
+        for _ in range(samples)
+    ]
+
+
+def _numpy_bootstrap_means(
+    values: list[float], samples: int, seed: int, strata: list[int] | None
+) -> list[float]:
+    try:
+        import numpy as np
+    except ImportError as error:
+        raise RuntimeError(
+            "vectorized bootstrap requires numpy; use bootstrap='python'"
+        ) from error
+
+    data = np.asarray(values, dtype=np.float64)
+    rng = np.random.default_rng(seed & 0xFFFF_FFFF_FFFF_FFFF)
+    groups = [
+        np.asarray(members, dtype=np.int64)
+        for members in _strata_groups(len(values), strata)
+    ]
+    means = np.empty(samples, dtype=np.float64)
+    rows = max(1, BOOTSTRAP_BLOCK_CELLS // len(values))
+    for start in range(0, samples, rows):
+        count = min(rows, samples - start)
+        totals = np.zeros(count, dtype=np.float64)
+        for members in groups:
+            picks = members[rng.integers(0, len(members), size=(count, len(members)))]
+            totals += data[picks].sum(axis=1)
+        means[start : start + count] = totals / len(values)
+    return means.tolist()
+
+
+def _bootstrap_means(
+    values: list[float],
+    samples: int,
+    seed: int,
+    *,
+    bootstrap: str,
+    strata: list[int] | None,
+) -> list[float]:
+    """Means of ``samples`` resamples of ``values``, optionally within strata.
+
+    ``numpy`` draws each block of resample indices as one integer matrix; ``python``
+    reproduces the draws behind historical benchmark records.
+    """
+    if bootstrap == "numpy":
+        return _numpy_bootstrap_means(values, samples, seed, strata)
+    if bootstrap == "python":
+        return _python_bootstrap_means(values, samples, seed, strata)
+    raise ValueError(f"unknown bootstrap engine {bootstrap!r}")
+
+
+def _ci(
+    values: list[float],
+    samples: int,
+    seed: int,
+    *,
+    bootstrap: str = "python",
+    strata: list[int] | None = None,
+) -> dict[str, float]:
     if not values:
         return {"low": 0.0, "mean": 0.0, "high": 0.0}
     if samples <= 0 or len(values) == 1:
         mean = _mean(values)
         return {"low": mean, "mean": mean, "high": mean}
-    rng = random.Random(seed)
-    means = []
-    for _ in range(samples):
-        means.append(_mean([values[rng.randrange(len(values))] for _ in values]))
-    means.sort()
+    means = sorted(
+        _bootstrap_means(values, samples, seed, bootstrap=bootstrap, strata=strata)
+    )
     low = means[int(0.025 * (len(means) - 1))]
     high = means[int(0.975 * (len(means) - 1))]
     return {"low": low, "mean": _mean(values), "high": high}
@@ -105,18 +202,22 @@ def _quantile(values: list[float], q: float) -> float:
 
 
 def _bootstrap_positive_rate(
-    values: list[float], samples: int, seed: int, threshold: float = 0.0
+    values: list[float],
+    samples: int,
+    seed: int,
+    threshold: float = 0.0,
+    *,
+    bootstrap: str = "python",
+    strata: list[int] | None = None,
 ) -> float:
     if not values:
         return 0.0
     if samples <= 0 or len(values) == 1:
         return 1.0 if _mean(values) > threshold else 0.0
-    rng = random.Random(seed)
-    positive = 0
-    for _ in range(samples):
-        sample_mean = _mean([values[rng.randrange(len(values))] for _ in values])
-        positive += 1 if sample_mean > threshold else 0
-    return positive / samples
+    means = _bootstrap_means(
+        values, samples, seed, bootstrap=bootstrap, strata=strata
+    )
+    return sum(1 for mean in means if mean > threshold) / samples
 
 
 def _histogram(values: list[float], bucket_size: float = 5.0) -> list[dict[str, float]]:
@@ -155,7 +256,21 @@ def _record_metric(record: Any, side: str, key: str) -> float:
     return float(getattr(getattr(record, side), key))
 
 
-def _margin_shape(records: list[Any], bootstrap_samples: int, seed: int) -> dict[str, Any]:
+def _record_seat(record: Any) -> int:
+    if isinstance(record, dict):
+        return int(record["seat"])
+    return int(getattr(record, "seat"))
+
+
+def _margin_shape(
+    records: list[Any],
+    bootstrap_samples: int,
+    seed: int,
+    *,
+    bootstrap: str = "python",
+    by_seat: bool = False,
+) -> dict[str, Any]:
+    strata = [_record_seat(record) for record in records] if by_seat else None
     win_values = [_record_delta(record, "win_delta") for record in records]
     rank_values = [_record_delta(record, "rank_delta") for record in records]
     margin_values = [_record_delta(record, "margin_delta") for record in records]
@@ -175,13 +290,25 @@ def _margin_shape(records: list[Any], bootstrap_samples: int, seed: int) -> dict
     return {
         "positive_rates": {
             "win_delta": _bootstrap_positive_rate(
-                win_values, bootstrap_samples, seed ^ 0x5010
+                win_values,
+                bootstrap_samples,
+                seed ^ 0x5010,
+                bootstrap=bootstrap,
+                strata=strata,
             ),
             "rank_delta": _bootstrap_positive_rate(
-                rank_values, bootstrap_samples, seed ^ 0x5011
+                rank_values,
+                bootstrap_samples,
+                seed ^ 0x5011,
+                bootstrap=bootstrap,
+                strata=strata,
             ),
             "margin_delta": _bootstrap_positive_rate(
-                margin_values, bootstrap_samples, seed ^ 0x5012
+                margin_values,
+                bootstrap_samples,
+                seed ^ 0x5012,
+                bootstrap=bootstrap,
+                strata=strata,
             ),
         },
         "margin_delta_quantiles": {
@@ -237,6 +364,8 @@ def _promotion_decision(
     risk_min_rank_delta_mean: float | None,
     risk_min_margin_delta_mean: float | None,
     evidence_grade: str,
+    bootstrap: str = "python",
+    strata: list[int] | None = None,
 ) -> dict[str, Any]:
     utility_values = [
         utility_win_weight * win
@@ -244,7 +373,13 @@ def _promotion_decision(
         + utility_margin_weight * margin
         for win, rank, margin in zip(win_values, rank_values, margin_values)
     ]
-    utility_interval = _ci(utility_values, bootstrap_samples, seed ^ 0xA11C)
+    utility_interval = _ci(
+        utility_values,
+        bootstrap_samples,
+        seed ^ 0xA11C,
+        bootstrap=bootstrap,
+        strata=strata,
+    )
     intervals["utility_delta"] = utility_interval
 
     means = {
@@ -384,6 +519,101 @@ def run_policy_game(
     }
 
 
+def _paired_game(
+    engine: CEngine,
+    game: tuple[int, int],
+    *,
+    candidate: PolicyArtifact,
+    baseline: PolicyArtifact | None,
+    round_curriculum: bool,
+    round_plot_cards: int,
+    round_famine_rate: float,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    seat, game_seed = game
+    baseline_is_heuristic = baseline is None
+    candidate_game = run_policy_game(
+        engine,
+        seed=game_seed,
+        model=candidate,
+        model_is_heuristic=False,
+        opponent=baseline,
+        opponent_is_heuristic=baseline_is_heuristic,
+        seat=seat,
+        round_curriculum=round_curriculum,
+        round_plot_cards=round_plot_cards,
+        round_famine_rate=round_famine_rate,
+    )
+    baseline_game = run_policy_game(
+        engine,
+        seed=game_seed,
+        model=baseline,
+        model_is_heuristic=baseline_is_heuristic,
+        opponent=baseline,
+        opponent_is_heuristic=baseline_is_heuristic,
+        seat=seat,
+        round_curriculum=round_curriculum,
+        round_plot_cards=round_plot_cards,
+        round_famine_rate=round_famine_rate,
+    )
+    return candidate_game, baseline_game
+
+
+# Per-process state for benchmark pool workers: one engine, artifacts loaded once.
+_WORKER_ENGINE: CEngine | None = None
+_WORKER_ARTIFACTS: dict[str, PolicyArtifact] = {}
+
+
+def _init_benchmark_worker(library_path: str) -> None:
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = CEngine(Path(library_path))
+
+
+def _worker_artifact(path: str) -> PolicyArtifact:
+    artifact = _WORKER_ARTIFACTS.get(path)
+    if artifact is None:
+        artifact = _WORKER_ARTIFACTS[path] = PolicyArtifact.load(Path(path))
+    return artifact
+
+
+def _worker_paired_game(
+    game: tuple[int, int],
+    *,
+    candidate_path: str,
+    baseline_path: str | None,
+    **options: Any,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    if _WORKER_ENGINE is None:
+        raise RuntimeError("benchmark worker was not initialized")
+    return _paired_game(
+        _WORKER_ENGINE,
+        game,
+        candidate=_worker_artifact(candidate_path),
+        baseline=_worker_artifact(baseline_path) if baseline_path else None,
+        **options,
+    )
+
+
+@contextmanager
+def benchmark_pool(engine: CEngine, workers: int) -> Iterator[Executor | None]:
+    """Yield a process pool for paired games, or ``None`` to run them in-process.
+
+    Each worker loads its own ``CEngine`` from the same shared library. Games are
+    seeded independently, so pooled results match the serial run exactly.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if workers == 1:
+        yield None
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_benchmark_worker,
+        initargs=(os.fspath(engine.library_path),),
+    ) as executor:
+        yield executor
+
+
 def benchmark_candidate(
     engine: CEngine,
     *,
@@ -410,63 +640,80 @@ def benchmark_candidate(
     risk_min_win_delta_mean: float | None = None,
     risk_min_rank_delta_mean: float | None = None,
     risk_min_margin_delta_mean: float | None = None,
+    workers: int = 1,
+    executor: Executor | None = None,
+    bootstrap: str = "python",
+    bootstrap_by_seat: bool = False,
 ) -> dict[str, Any]:
+    if bootstrap not in BOOTSTRAP_ENGINES:
+        raise ValueError(f"unknown bootstrap engine {bootstrap!r}")
     candidate = PolicyArtifact.load(candidate_path)
     baseline = PolicyArtifact.load(baseline_path) if baseline_path else None
-    baseline_is_heuristic = baseline is None
     records: list[PairedRecord] = []
     games: list[dict[str, Any]] = []
-
-    for seat in range(4):
-        for offset in range(games_per_seat):
-            game_seed = seed + seat * games_per_seat + offset
-            candidate_game = run_policy_game(
-                engine,
-                seed=game_seed,
-                model=candidate,
-                model_is_heuristic=False,
-                opponent=baseline,
-                opponent_is_heuristic=baseline_is_heuristic,
-                seat=seat,
-                round_curriculum=round_curriculum,
-                round_plot_cards=round_plot_cards,
-                round_famine_rate=round_famine_rate,
+    schedule = [
+        (seat, seed + seat * games_per_seat + offset)
+        for seat in range(4)
+        for offset in range(games_per_seat)
+    ]
+    options = {
+        "round_curriculum": round_curriculum,
+        "round_plot_cards": round_plot_cards,
+        "round_famine_rate": round_famine_rate,
+    }
+    with ExitStack() as stack:
+        if executor is None:
+            executor = stack.enter_context(benchmark_pool(engine, workers))
+        if executor is None:
+            pairs = [
+                _paired_game(
+                    engine, game, candidate=candidate, baseline=baseline, **options
+                )
+                for game in schedule
+            ]
+        else:
+            # map() yields in submission order, so records stay in seed order.
+            pairs = list(
+                executor.map(
+                    partial(
+                        _worker_paired_game,
+                        candidate_path=os.fspath(candidate_path),
+                        baseline_path=os.fspath(baseline_path) if baseline_path else None,
+                        **options,
+                    ),
+                    schedule,
+                    chunksize=BENCHMARK_CHUNK_GAMES,
+                )
             )
-            baseline_game = run_policy_game(
-                engine,
+
+    for (seat, game_seed), (candidate_game, baseline_game) in zip(schedule, pairs):
+        candidate_metrics = GameMetrics(**candidate_game["metrics"])
+        baseline_metrics = GameMetrics(**baseline_game["metrics"])
+        records.append(
+            PairedRecord(
                 seed=game_seed,
-                model=baseline,
-                model_is_heuristic=baseline_is_heuristic,
-                opponent=baseline,
-                opponent_is_heuristic=baseline_is_heuristic,
                 seat=seat,
-                round_curriculum=round_curriculum,
-                round_plot_cards=round_plot_cards,
-                round_famine_rate=round_famine_rate,
-            )
-            candidate_metrics = GameMetrics(**candidate_game["metrics"])
-            baseline_metrics = GameMetrics(**baseline_game["metrics"])
-            records.append(
-                PairedRecord(
-                    seed=game_seed,
-                    seat=seat,
-                    candidate=candidate_metrics,
-                    baseline=baseline_metrics,
-                    win_delta=candidate_metrics.win - baseline_metrics.win,
-                    rank_delta=baseline_metrics.rank - candidate_metrics.rank,
-                    margin_delta=candidate_metrics.margin - baseline_metrics.margin,
-                )
+                candidate=candidate_metrics,
+                baseline=baseline_metrics,
+                win_delta=candidate_metrics.win - baseline_metrics.win,
+                rank_delta=baseline_metrics.rank - candidate_metrics.rank,
+                margin_delta=candidate_metrics.margin - baseline_metrics.margin,
             )
-            if include_games:
-                games.append({"candidate": candidate_game, "baseline": baseline_game})
+        )
+        if include_games:
+            games.append({"candidate": candidate_game, "baseline": baseline_game})
 
     win_values = [record.win_delta for record in records]
     rank_values = [record.rank_delta for record in records]
     margin_values = [record.margin_delta for record in records]
+    strata = [record.seat for record in records] if bootstrap_by_seat else None
+    resampling = {"bootstrap": bootstrap, "strata": strata}
     intervals = {
-        "win_delta": _ci(win_values, bootstrap_samples, seed ^ 0xB00A),
-        "rank_delta": _ci(rank_values, bootstrap_samples, seed ^ 0xB00B),
-        "margin_delta": _ci(margin_values, bootstrap_samples, seed ^ 0xB00C),
+        "win_delta": _ci(win_values, bootstrap_samples, seed ^ 0xB00A, **resampling),
+        "rank_delta": _ci(rank_values, bootstrap_samples, seed ^ 0xB00B, **resampling),
+        "margin_delta": _ci(
+            margin_values, bootstrap_samples, seed ^ 0xB00C, **resampling
+        ),
     }
     evidence_grade = "promotion" if (
         games_per_seat >= promotion_min_games_per_seat
@@ -493,6 +740,7 @@ def benchmark_candidate(
         risk_min_rank_delta_mean=risk_min_rank_delta_mean,
         risk_min_margin_delta_mean=risk_min_margin_delta_mean,
         evidence_grade=evidence_grade,
+        **resampling,
     )
     record: dict[str, Any] = {
         "kind": "policy_benchmark",
@@ -517,6 +765,8 @@ def benchmark_candidate(
             "promotion_min_bootstrap_samples": promotion_min_bootstrap_samples,
             "paired_same_seed": True,
             "rotated_seats": True,
+            "bootstrap": bootstrap,
+            "bootstrap_by_seat": bootstrap_by_seat,
             "primary_objective": decision["primary_objective"],
             "guardrails": ["rank_delta", "margin_delta"],
             "candidate_pool": decision["candidate_pool"],
@@ -524,7 +774,13 @@ def benchmark_candidate(
         },
         "promotion_objective": decision["objective"],
         "intervals": intervals,
-        "distribution": _margin_shape(records, bootstrap_samples, seed ^ 0xD157),
+        "distribution": _margin_shape(
+            records,
+            bootstrap_samples,
+            seed ^ 0xD157,
+            bootstrap=bootstrap,
+            by_seat=bootstrap_by_seat,
+        ),
         "summary": {
             "candidate_win_rate": _mean([record.candidate.win for record in records]),
             "baseline_win_rate": _mean([record.baseline.win for record in records]),
@@ -881,6 +1137,27 @@ def run_tournament(
     baseline_path: Path | None,
     games_per_seat: int,
     seed: int,
+    workers: int = 1,
+) -> dict[str, Any]:
+    with benchmark_pool(engine, workers) as executor:
+        return _run_tournament(
+            engine,
+            model_paths=model_paths,
+            baseline_path=baseline_path,
+            games_per_seat=games_per_seat,
+            seed=seed,
+            executor=executor,
+        )
+
+
+def _run_tournament(
+    engine: CEngine,
+    *,
+    model_paths: list[Path],
+    baseline_path: Path | None,
+    games_per_seat: int,
+    seed: int,
+    executor: Executor | None,
 ) -> dict[str, Any]:
     entries = [
         {"name": f"{path.parent.name}/{path.stem}", "path": path, "score": 0.0, "matches": 0}
@@ -897,6 +1174,7 @@ def run_tournament(
                 games_per_seat=games_per_seat,
                 seed=seed + len(matches) * 100_000,
                 bootstrap_samples=0,
+                executor=executor,
             )
             delta = result["intervals"]["win_delta"]["mean"]
             left["score"] += delta
@@ -913,6 +1191,7 @@ def run_tournament(
                 games_per_seat=games_per_seat,
                 seed=seed + 5_000_000 + index * 100_000,
                 bootstrap_samples=0,
+                executor=executor,
             )
             entry["baseline_win_delta"] = result["intervals"]["win_delta"]["mean"]
     standings = sorted(
@@ -5,7 +5,7 @@ import hashlib
 import os
 import platform
 import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 
@@ -362,6 +362,29 @@ class KCDenseObjectTokens(ctypes.Structure):
     ]
 
 
+class KCVectorEnvStep(ctypes.Structure):
+    _fields_ = [
+        ("engines", ctypes.POINTER(ctypes.c_void_p)),
+        ("env_count", ctypes.c_int32),
+        ("actions", ctypes.POINTER(KCAction)),
+        ("apply_actions", ctypes.POINTER(ctypes.c_bool)),
+        ("decision_seats", IntPointer),
+        ("max_automatic_actions", ctypes.c_int32),
+        ("stop_on_year_change", ctypes.c_bool),
+        ("apply_errors", IntPointer),
+        ("automatic_actions", IntPointer),
+        ("waiting_players", IntPointer),
+        ("phases", IntPointer),
+        ("years", IntPointer),
+        ("candidate_counts", IntPointer),
+        ("candidates", KCDensePolicyActionFeatures),
+        ("object_token_counts", IntPointer),
+        ("object_tokens", KCDenseObjectTokens),
+        ("state_features", FloatPointer),
+        ("state_input_size", ctypes.c_int32),
+    ]
+
+
 @dataclass(frozen=True)
 class DensePolicyActionFeatures:
     count: int
@@ -387,7 +410,7 @@ class DensePolicyActionFeatures:
         return self.count
 
     def action_at(self, index: int) -> KCAction:
-        return self.actions[index]
+        return KCAction.from_buffer_copy(self.actions[index])
 
 
 @dataclass(frozen=True)
@@ -405,6 +428,289 @@ class DenseObjectTokens:
         return self.count
 
 
+class _DenseActionBuffers:
+    def __init__(self, max_features: int, input_size: int) -> None:
+        self.max_features = max_features
+        self.input_size = input_size
+        self.actions = (KCAction * max_features)()
+        self.action_heads = (ctypes.c_int32 * max_features)()
+        self.kind_ids = (ctypes.c_int32 * max_features)()
+        self.player_ids = (ctypes.c_int32 * max_features)()
+        self.suit_ids = (ctypes.c_int32 * max_features)()
+        self.target_suit_ids = (ctypes.c_int32 * max_features)()
+        self.card_suit_ids = (ctypes.c_int32 * max_features)()
+        self.card_value_ids = (ctypes.c_int32 * max_features)()
+        self.hand_suit_ids = (ctypes.c_int32 * max_features)()
+        self.hand_value_ids = (ctypes.c_int32 * max_features)()
+        self.plot_suit_ids = (ctypes.c_int32 * max_features)()
+        self.plot_value_ids = (ctypes.c_int32 * max_features)()
+        self.plot_zone_ids = (ctypes.c_int32 * max_features)()
+        self.action_scalars = (ctypes.c_float * (max_features * ACTION_SCALAR_COUNT))()
+        self.features = (ctypes.c_float * (max_features * input_size))()
+        self.output = KCDensePolicyActionFeatures(
+            self.actions,
+            self.action_heads,
+            self.kind_ids,
+            self.player_ids,
+            self.suit_ids,
+            self.target_suit_ids,
+            self.card_suit_ids,
+            self.card_value_ids,
+            self.hand_suit_ids,
+            self.hand_value_ids,
+            self.plot_suit_ids,
+            self.plot_value_ids,
+            self.plot_zone_ids,
+            self.action_scalars,
+            ACTION_SCALAR_COUNT,
+            self.features,
+            max_features,
+            input_size,
+        )
+
+    def result(self, count: int) -> DensePolicyActionFeatures:
+        return DensePolicyActionFeatures(
+            count=count,
+            input_size=self.input_size,
+            actions=self.actions,
+            action_heads=self.action_heads,
+            kind_ids=self.kind_ids,
+            player_ids=self.player_ids,
+            suit_ids=self.suit_ids,
+            target_suit_ids=self.target_suit_ids,
+            card_suit_ids=self.card_suit_ids,
+            card_value_ids=self.card_value_ids,
+            hand_suit_ids=self.hand_suit_ids,
+            hand_value_ids=self.hand_value_ids,
+            plot_suit_ids=self.plot_suit_ids,
+            plot_value_ids=self.plot_value_ids,
+            plot_zone_ids=self.plot_zone_ids,
+            action_scalars=self.action_scalars,
+            action_scalar_count=ACTION_SCALAR_COUNT,
+            features=self.features,
+        )
+
+
+class _DenseObjectBuffers:
+    def __init__(self, max_tokens: int) -> None:
+        self.max_tokens = max_tokens
+        self.type_ids = (ctypes.c_int32 * max_tokens)()
+        self.owner_ids = (ctypes.c_int32 * max_tokens)()
+        self.zone_ids = (ctypes.c_int32 * max_tokens)()
+        self.suit_ids = (ctypes.c_int32 * max_tokens)()
+        self.value_ids = (ctypes.c_int32 * max_tokens)()
+        self.index_ids = (ctypes.c_int32 * max_tokens)()
+        self.scalars = (ctypes.c_float * (max_tokens * OBJECT_SCALAR_COUNT))()
+        self.output = KCDenseObjectTokens(
+            self.type_ids,
+            self.owner_ids,
+            self.zone_ids,
+            self.suit_ids,
+            self.value_ids,
+            self.index_ids,
+            self.scalars,
+            max_tokens,
+        )
+
+    def result(self, count: int) -> DenseObjectTokens:
+        return DenseObjectTokens(
+            count=count,
+            type_ids=self.type_ids,
+            owner_ids=self.owner_ids,
+            zone_ids=self.zone_ids,
+            suit_ids=self.suit_ids,
+            value_ids=self.value_ids,
+            index_ids=self.index_ids,
+            scalars=self.scalars,
+        )
+
+
+class DenseFeatureWorkspace:
+    """Reusable output buffers for the dense feature calls on ``CEngine``.
+
+    Features written through a workspace share its buffers, so they are valid only
+    until the next call that uses the same workspace. Keep one workspace per pending
+    decision, e.g. one per rollout environment.
+    """
+
+    def __init__(self) -> None:
+        self._actions: _DenseActionBuffers | None = None
+        self._objects: _DenseObjectBuffers | None = None
+
+    def action_buffers(self, max_features: int, input_size: int) -> _DenseActionBuffers:
+        buffers = self._actions
+        if (
+            buffers is None
+            or buffers.max_features != max_features
+            or buffers.input_size != input_size
+        ):
+            buffers = self._actions = _DenseActionBuffers(max_features, input_size)
+        return buffers
+
+    def object_buffers(self, max_tokens: int) -> _DenseObjectBuffers:
+        buffers = self._objects
+        if buffers is None or buffers.max_tokens != max_tokens:
+            buffers = self._objects = _DenseObjectBuffers(max_tokens)
+        return buffers
+
+
+def _rows(array: ctypes.Array, start: int, length: int) -> ctypes.Array:
+    item = array._type_
+    return (item * length).from_buffer(array, start * ctypes.sizeof(item))
+
+
+class VectorEnvBatch:
+    """Buffers for advancing many engines with one ``CEngine.step_vector_envs`` call.
+
+    Fill ``engines`` and ``decision_seats`` (a bitmask of seats that stop for a
+    decision), and set ``actions``/``apply_actions`` for engines that decided last
+    step. Row ``i`` of every output belongs to ``engines[i]`` and is overwritten by
+    the next step.
+    """
+
+    def __init__(
+        self,
+        env_count: int,
+        *,
+        input_size: int = 0,
+        max_actions: int = 256,
+        object_tokens: bool = False,
+        max_tokens: int = MAX_OBJECT_TOKENS,
+        state_input_size: int = 0,
+        max_automatic_actions: int = 2000,
+        stop_on_year_change: bool = False,
+    ) -> None:
+        if env_count <= 0:
+            raise ValueError("env_count must be positive")
+        self.env_count = env_count
+        self.engines = (ctypes.c_void_p * env_count)()
+        self.actions = (KCAction * env_count)()
+        self.apply_actions = (ctypes.c_bool * env_count)()
+        self.decision_seats = (ctypes.c_int32 * env_count)()
+        self.apply_errors = (ctypes.c_int32 * env_count)()
+        self.automatic_actions = (ctypes.c_int32 * env_count)()
+        self.waiting_players = (ctypes.c_int32 * env_count)()
+        self.phases = (ctypes.c_int32 * env_count)()
+        self.years = (ctypes.c_int32 * env_count)()
+        self.candidate_counts = (ctypes.c_int32 * env_count)()
+        self.object_token_counts = (ctypes.c_int32 * env_count)()
+        self.state_features = (
+            (ctypes.c_float * (env_count * state_input_size))()
+            if state_input_size > 0
+            else None
+        )
+        candidates = KCDensePolicyActionFeatures()
+        self._candidates: list[DensePolicyActionFeatures] = []
+        if input_size > 0:
+            buffers = _DenseActionBuffers(env_count * max_actions, input_size)
+            candidates = KCDensePolicyActionFeatures.from_buffer_copy(buffers.output)
+            candidates.max_actions = max_actions
+            self._candidates = [
+                self._candidate_rows(buffers, env_index * max_actions, max_actions)
+                for env_index in range(env_count)
+            ]
+        tokens = KCDenseObjectTokens()
+        self._object_tokens: list[DenseObjectTokens] = []
+        if object_tokens:
+            objects = _DenseObjectBuffers(env_count * max_tokens)
+            tokens = KCDenseObjectTokens.from_buffer_copy(objects.output)
+            tokens.max_tokens = max_tokens
+            self._object_tokens = [
+                self._object_rows(objects, env_index * max_tokens, max_tokens)
+                for env_index in range(env_count)
+            ]
+        self.output = KCVectorEnvStep(
+            self.engines,
+            env_count,
+            self.actions,
+            self.apply_actions,
+            self.decision_seats,
+            max_automatic_actions,
+            stop_on_year_change,
+            self.apply_errors,
+            self.automatic_actions,
+            self.waiting_players,
+            self.phases,
+            self.years,
+            self.candidate_counts,
+            candidates,
+            self.object_token_counts,
+            tokens,
+            self.state_features,
+            state_input_size,
+        )
+
+    @staticmethod
+    def _candidate_rows(
+        buffers: _DenseActionBuffers, start: int, length: int
+    ) -> DensePolicyActionFeatures:
+        return DensePolicyActionFeatures(
+            count=0,
+            input_size=buffers.input_size,
+            actions=_rows(buffers.actions, start, length),
+            action_heads=_rows(buffers.action_heads, start, length),
+            kind_ids=_rows(buffers.kind_ids, start, length),
+            player_ids=_rows(buffers.player_ids, start, length),
+            suit_ids=_rows(buffers.suit_ids, start, length),
+            target_suit_ids=_rows(buffers.target_suit_ids, start, length),
+            card_suit_ids=_rows(buffers.card_suit_ids, start, length),
+            card_value_ids=_rows(buffers.card_value_ids, start, length),
+            hand_suit_ids=_rows(buffers.hand_suit_ids, start, length),
+            hand_value_ids=_rows(buffers.hand_value_ids, start, length),
+            plot_suit_ids=_rows(buffers.plot_suit_ids, start, length),
+            plot_value_ids=_rows(buffers.plot_value_ids, start, length),
+            plot_zone_ids=_rows(buffers.plot_zone_ids, start, length),
+            action_scalars=_rows(
+                buffers.action_scalars,
+                start * ACTION_SCALAR_COUNT,
+                length * ACTION_SCALAR_COUNT,
+            ),
+            action_scalar_count=ACTION_SCALAR_COUNT,
+            features=_rows(
+                buffers.features,
+                start * buffers.input_size,
+                length * buffers.input_size,
+            ),
+        )
+
+    @staticmethod
+    def _object_rows(
+        buffers: _DenseObjectBuffers, start: int, length: int
+    ) -> DenseObjectTokens:
+        return DenseObjectTokens(
+            count=0,
+            type_ids=_rows(buffers.type_ids, start, length),
+            owner_ids=_rows(buffers.owner_ids, start, length),
+            zone_ids=_rows(buffers.zone_ids, start, length),
+            suit_ids=_rows(buffers.suit_ids, start, length),
+            value_ids=_rows(buffers.value_ids, start, length),
+            index_ids=_rows(buffers.index_ids, start, length),
+            scalars=_rows(
+                buffers.scalars,
+                start * OBJECT_SCALAR_COUNT,
+                length * OBJECT_SCALAR_COUNT,
+            ),
+        )
+
+    def set_action(self, env_index: int, action: KCAction) -> None:
+        self.actions[env_index] = action
+        self.apply_actions[env_index] = True
+
+    def candidates(self, env_index: int) -> DensePolicyActionFeatures:
+        return replace(
+            self._candidates[env_index],
+            count=int(self.candidate_counts[env_index]),
+        )
+
+    def object_tokens(self, env_index: int) -> DenseObjectTokens | None:
+        if not self._object_tokens:
+            return None
+        return replace(
+            self._object_tokens[env_index],
+            count=int(self.object_token_counts[env_index]),
+        )
+
+
 @dataclass(frozen=True)
 class EngineProvenance:
     git_sha: str
@@ -435,6 +741,20 @@ def _sha256_sources(paths: list[Path]) -> str:
     return digest.hexdigest()
 
 
+def _provenance_signature(paths: list[Path]) -> tuple[tuple[str, int, int], ...]:
+    # HEAD and its reflog move on every checkout and commit, so their mtimes stand
+    # in for re-running ``git rev-parse``.
+    watched = [*paths, ENGINE_H, REPO_ROOT / ".git/HEAD", REPO_ROOT / ".git/logs/HEAD"]
+    signature: list[tuple[str, int, int]] = []
+    for path in watched:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        signature.append((os.fspath(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
 def _git_sha() -> str:
     try:
         result = subprocess.run(
@@ -499,6 +819,9 @@ class CEngine:
         self.library_path = library_path or build_shared_library()
         self.lib = ctypes.CDLL(os.fspath(self.library_path))
         self._policy_workspaces: dict[int, int] = {}
+        self._provenance: (
+            tuple[tuple[tuple[str, int, int], ...], EngineProvenance] | None
+        ) = None
 
         self.lib.kc_variants_kolkhoz.argtypes = [ctypes.POINTER(KCVariants)]
         self.lib.kc_variants_kolkhoz.restype = None
@@ -623,6 +946,8 @@ class CEngine:
             KCDenseObjectTokens,
         ]
         self.lib.kc_engine_object_token_dense_features.restype = ctypes.c_int32
+        self.lib.kc_vector_env_step.argtypes = [KCVectorEnvStep]
+        self.lib.kc_vector_env_step.restype = ctypes.c_int32
         self.lib.kc_engine_heuristic_policy_action.argtypes = [
             ctypes.c_void_p,
             ctypes.POINTER(KCAction),
@@ -722,6 +1047,27 @@ class CEngine:
         self.lib.kc_engine_clone(pointer, clone)
         return ctypes.c_void_p(clone)
 
+    def engine_state(self, pointer: ctypes.c_void_p) -> bytes:
+        """Copy the flat engine struct; valid only for the same C source digest."""
+
+        return ctypes.string_at(pointer, ctypes.sizeof(KCEngineSnapshot))
+
+    @staticmethod
+    def engine_state_size() -> int:
+        return ctypes.sizeof(KCEngineSnapshot)
+
+    def restore_engine(self, state: bytes) -> ctypes.c_void_p:
+        if len(state) != ctypes.sizeof(KCEngineSnapshot):
+            raise ValueError(
+                f"engine state has {len(state)} bytes, "
+                f"expected {ctypes.sizeof(KCEngineSnapshot)}"
+            )
+        pointer = self.lib.kc_engine_alloc()
+        if not pointer:
+            raise MemoryError("kc_engine_alloc failed")
+        ctypes.memmove(pointer, state, len(state))
+        return ctypes.c_void_p(pointer)
+
     def sample_determinization(
         self,
         pointer: ctypes.c_void_p,
@@ -841,67 +1187,19 @@ class CEngine:
         player_id: int,
         input_size: int,
         max_features: int = 256,
+        workspace: DenseFeatureWorkspace | None = None,
     ) -> DensePolicyActionFeatures:
-        actions = (KCAction * max_features)()
-        action_heads = (ctypes.c_int32 * max_features)()
-        kind_ids = (ctypes.c_int32 * max_features)()
-        player_ids = (ctypes.c_int32 * max_features)()
-        suit_ids = (ctypes.c_int32 * max_features)()
-        target_suit_ids = (ctypes.c_int32 * max_features)()
-        card_suit_ids = (ctypes.c_int32 * max_features)()
-        card_value_ids = (ctypes.c_int32 * max_features)()
-        hand_suit_ids = (ctypes.c_int32 * max_features)()
-        hand_value_ids = (ctypes.c_int32 * max_features)()
-        plot_suit_ids = (ctypes.c_int32 * max_features)()
-        plot_value_ids = (ctypes.c_int32 * max_features)()
-        plot_zone_ids = (ctypes.c_int32 * max_features)()
-        action_scalars = (ctypes.c_float * (max_features * ACTION_SCALAR_COUNT))()
-        features = (ctypes.c_float * (max_features * input_size))()
-        output = KCDensePolicyActionFeatures(
-            actions,
-            action_heads,
-            kind_ids,
-            player_ids,
-            suit_ids,
-            target_suit_ids,
-            card_suit_ids,
-            card_value_ids,
-            hand_suit_ids,
-            hand_value_ids,
-            plot_suit_ids,
-            plot_value_ids,
-            plot_zone_ids,
-            action_scalars,
-            ACTION_SCALAR_COUNT,
-            features,
-            max_features,
-            input_size,
+        buffers = (
+            workspace.action_buffers(max_features, input_size)
+            if workspace is not None
+            else _DenseActionBuffers(max_features, input_size)
         )
         count = self.lib.kc_engine_policy_action_dense_features(
             pointer,
             ctypes.c_int32(player_id),
-            output,
-        )
-        return DensePolicyActionFeatures(
-            count=int(count),
-            input_size=input_size,
-            actions=actions,
-            action_heads=action_heads,
-            kind_ids=kind_ids,
-            player_ids=player_ids,
-            suit_ids=suit_ids,
-            target_suit_ids=target_suit_ids,
-            card_suit_ids=card_suit_ids,
-            card_value_ids=card_value_ids,
-            hand_suit_ids=hand_suit_ids,
-            hand_value_ids=hand_value_ids,
-            plot_suit_ids=plot_suit_ids,
-            plot_value_ids=plot_value_ids,
-            plot_zone_ids=plot_zone_ids,
-            action_scalars=action_scalars,
-            action_scalar_count=ACTION_SCALAR_COUNT,
-            features=features,
+            buffers.output,
         )
+        return buffers.result(int(count))
 
     def state_features(
         self,
@@ -921,6 +1219,27 @@ class CEngine:
             return []
         return [float(features[index]) for index in range(input_size)]
 
+    def state_features_into(
+        self,
+        pointer: ctypes.c_void_p,
+        address: int,
+        *,
+        perspective_player: int,
+        input_size: int = STATE_INPUT_SIZE,
+    ) -> bool:
+        """Write state features into caller-owned memory instead of a new list.
+
+        ``address`` must point at ``input_size`` writable float32 values, such as a
+        row of a contiguous CPU tensor from ``data_ptr()``.
+        """
+        count = self.lib.kc_engine_state_features(
+            pointer,
+            ctypes.c_int32(perspective_player),
+            ctypes.cast(address, ctypes.POINTER(ctypes.c_float)),
+            ctypes.c_int32(input_size),
+        )
+        return int(count) > 0
+
     def object_tokens(
         self,
         pointer: ctypes.c_void_p,
@@ -943,39 +1262,28 @@ class CEngine:
         *,
         perspective_player: int,
         max_tokens: int = MAX_OBJECT_TOKENS,
+        workspace: DenseFeatureWorkspace | None = None,
     ) -> DenseObjectTokens:
-        type_ids = (ctypes.c_int32 * max_tokens)()
-        owner_ids = (ctypes.c_int32 * max_tokens)()
-        zone_ids = (ctypes.c_int32 * max_tokens)()
-        suit_ids = (ctypes.c_int32 * max_tokens)()
-        value_ids = (ctypes.c_int32 * max_tokens)()
-        index_ids = (ctypes.c_int32 * max_tokens)()
-        scalars = (ctypes.c_float * (max_tokens * OBJECT_SCALAR_COUNT))()
-        output = KCDenseObjectTokens(
-            type_ids,
-            owner_ids,
-            zone_ids,
-            suit_ids,
-            value_ids,
-            index_ids,
-            scalars,
-            max_tokens,
+        buffers = (
+            workspace.object_buffers(max_tokens)
+            if workspace is not None
+            else _DenseObjectBuffers(max_tokens)
         )
         count = self.lib.kc_engine_object_token_dense_features(
             pointer,
             ctypes.c_int32(perspective_player),
-            output,
-        )
-        return DenseObjectTokens(
-            count=int(count),
-            type_ids=type_ids,
-            owner_ids=owner_ids,
-            zone_ids=zone_ids,
-            suit_ids=suit_ids,
-            value_ids=value_ids,
-            index_ids=index_ids,
-            scalars=scalars,
+            buffers.output,
         )
+        return buffers.result(int(count))
+
+    def step_vector_envs(self, batch: VectorEnvBatch) -> int:
+        """Apply queued actions and advance each engine to its next decision.
+
+        Returns the number of engines waiting for a decision.
+        """
+        waiting = int(self.lib.kc_vector_env_step(batch.output))
+        ctypes.memset(batch.apply_actions, 0, ctypes.sizeof(batch.apply_actions))
+        return waiting
 
     def heuristic_action(self, pointer: ctypes.c_void_p) -> KCAction:
         action = KCAction()
@@ -1042,12 +1350,18 @@ class CEngine:
 
     def provenance(self) -> EngineProvenance:
         sources = _engine_sources()
-        return EngineProvenance(
+        signature = _provenance_signature(sources)
+        cached = self._provenance
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        value = EngineProvenance(
             git_sha=_git_sha(),
             c_sha256=_sha256_sources(sources),
             header_sha256=_sha256(ENGINE_H),
             library_path=os.fspath(self.library_path),
         )
+        self._provenance = (signature, value)
+        return value
 
     @staticmethod
     def snapshot(pointer: ctypes.c_void_p) -> KCEngineSnapshot:
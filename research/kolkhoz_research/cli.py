@@ -9,6 +9,7 @@ from pathlib import Path
 
 from .artifact_cleanup import cleanup_artifacts
 from .benchmark import (
+    BOOTSTRAP_ENGINES,
     benchmark_candidate,
     mine_seed_panel,
     run_bot_rating_simulation,
@@ -194,6 +195,9 @@ def benchmark(args: argparse.Namespace) -> int:
         risk_min_win_delta_mean=args.risk_min_win_delta_mean,
         risk_min_rank_delta_mean=args.risk_min_rank_delta_mean,
         risk_min_margin_delta_mean=args.risk_min_margin_delta_mean,
+        workers=args.workers,
+        bootstrap=args.bootstrap,
+        bootstrap_by_seat=args.bootstrap_by_seat,
     )
     record["engine"] = asdict(engine.provenance())
     if args.record:
@@ -293,6 +297,7 @@ def tournament(args: argparse.Namespace) -> int:
         baseline_path=args.baseline,
         games_per_seat=args.games_per_seat,
         seed=args.seed,
+        workers=args.workers,
     )
     record["engine"] = asdict(engine.provenance())
     status = _emit(record, args.record)
@@ -425,6 +430,7 @@ def torch_train_command(args: argparse.Namespace) -> int:
         eval_include_heuristic=args.eval_include_heuristic,
         select_best_eval_checkpoint=args.select_best_eval_checkpoint,
         eval_patience=args.eval_patience,
+        async_eval=args.async_eval,
         round_curriculum=args.round_curriculum,
         curriculum_schedule=args.curriculum_schedule,
         curriculum_rounds=args.curriculum_rounds,
@@ -475,6 +481,7 @@ def masked_state_train_command(args: argparse.Namespace) -> int:
         round_famine_rate=args.round_famine_rate,
         record_history=args.record,
         progress_callback=_current_experiment_callback(args),
+        vector_envs=args.vector_envs,
     )
     record["engine"] = asdict(engine.provenance())
     return _emit(record, False)
@@ -507,6 +514,7 @@ def masked_state_rnn_train_command(args: argparse.Namespace) -> int:
         eval_seed=args.eval_seed,
         record_history=args.record,
         progress_callback=_current_experiment_callback(args),
+        vector_envs=args.vector_envs,
     )
     record["engine"] = asdict(engine.provenance())
     return _emit(record, False)
@@ -543,6 +551,7 @@ def masked_state_transformer_train_command(args: argparse.Namespace) -> int:
         eval_seed=args.eval_seed,
         record_history=args.record,
         progress_callback=_current_experiment_callback(args),
+        vector_envs=args.vector_envs,
     )
     record["engine"] = asdict(engine.provenance())
     return _emit(record, False)
@@ -579,6 +588,7 @@ def masked_state_routed_transformer_train_command(args: argparse.Namespace) -> i
         eval_seed=args.eval_seed,
         record_history=args.record,
         progress_callback=_current_experiment_callback(args),
+        vector_envs=args.vector_envs,
     )
     record["engine"] = asdict(engine.provenance())
     return _emit(record, False)
@@ -617,11 +627,26 @@ def supervised_generate_command(args: argparse.Namespace) -> int:
         round_famine_rate=args.round_famine_rate,
         curriculum_rounds=args.curriculum_rounds,
         progress_callback=_current_experiment_callback(args),
+        output_format=args.output_format,
+        workers=args.workers,
     )
     record["engine"] = asdict(engine.provenance())
     return _emit(record, args.record)
 
 
+def trajectory_convert_command(args: argparse.Namespace) -> int:
+    from .trajectory_shards import convert_jsonl_to_shard, convert_shard_to_jsonl
+
+    if args.to == "shard":
+        engine = {"c_sha256": args.engine_sha256} if args.engine_sha256 else None
+        record = convert_jsonl_to_shard(args.input, args.output, engine=engine)
+    else:
+        if len(args.input) != 1:
+            raise SystemExit("--to jsonl converts exactly one shard")
+        record = convert_shard_to_jsonl(args.input[0], args.output)
+    return _emit(record, False)
+
+
 def supervised_pretrain_command(args: argparse.Namespace) -> int:
     from .torch_policy import pretrain_torch_policy_from_trajectories
 
@@ -896,6 +921,7 @@ def self_play_improve_command(args: argparse.Namespace) -> int:
             eval_include_heuristic=args.eval_include_heuristic,
             select_best_eval_checkpoint=args.select_best_eval_checkpoint,
             eval_patience=args.eval_patience,
+            async_eval=args.async_eval,
             round_curriculum=args.round_curriculum,
             curriculum_schedule=args.curriculum_schedule,
             curriculum_rounds=args.curriculum_rounds,
@@ -1103,6 +1129,7 @@ def trajectory_oracle_benchmark_command(args: argparse.Namespace) -> int:
         round_plot_cards=args.round_plot_cards,
         round_famine_rate=args.round_famine_rate,
         include_games=args.include_games,
+        oracle_index_path=args.oracle_index,
         progress_callback=_current_experiment_callback(args),
     )
     record["engine"] = asdict(engine.provenance())
@@ -1253,6 +1280,17 @@ def main() -> int:
     bench.add_argument("--games-per-seat", type=int, default=32)
     bench.add_argument("--seed", type=int, default=13_500_000)
     bench.add_argument("--bootstrap-samples", type=int, default=1000)
+    bench.add_argument(
+        "--bootstrap",
+        choices=BOOTSTRAP_ENGINES,
+        default="python",
+        help="resampling engine; numpy is vectorized and requires NumPy",
+    )
+    bench.add_argument(
+        "--bootstrap-by-seat",
+        action="store_true",
+        help="resample paired games within each candidate seat",
+    )
     bench.add_argument("--min-win-delta", type=float, default=0.0)
     bench.add_argument("--min-rank-delta", type=float, default=0.0)
     bench.add_argument("--min-margin-delta", type=float, default=0.0)
@@ -1264,6 +1302,12 @@ def main() -> int:
     bench.add_argument("--round-plot-cards", type=int, default=6)
     bench.add_argument("--round-famine-rate", type=float, default=0.2)
     bench.add_argument("--include-games", action="store_true")
+    bench.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="processes for paired games; results match the serial run",
+    )
     bench.add_argument("--promotion-min-games-per-seat", type=int, default=64)
     bench.add_argument("--promotion-min-bootstrap-samples", type=int, default=1000)
     _add_promotion_objective_args(bench)
@@ -1324,6 +1368,12 @@ def main() -> int:
     tournament_parser.add_argument("--baseline", type=_path, default=None)
     tournament_parser.add_argument("--games-per-seat", type=int, default=16)
     tournament_parser.add_argument("--seed", type=int, default=21_000_000)
+    tournament_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="processes for paired games; results match the serial run",
+    )
     tournament_parser.add_argument("--record", action="store_true")
     tournament_parser.add_argument("--rebuild", action="store_true")
     tournament_parser.set_defaults(func=tournament)
@@ -1530,6 +1580,11 @@ def main() -> int:
         default=0,
         help="stop after this many non-improving primary evals; 0 disables",
     )
+    torch_train_parser.add_argument(
+        "--async-eval",
+        action="store_true",
+        help="run periodic evals on checkpoint snapshots in a background process while training continues",
+    )
     torch_train_parser.add_argument(
         "--serious-run",
         action="store_true",
@@ -1589,6 +1644,12 @@ def main() -> int:
     masked_state_parser.add_argument("--scratch-scale", type=float, default=0.02)
     masked_state_parser.add_argument("--episodes", type=int, default=32)
     masked_state_parser.add_argument("--batch-size", type=int, default=8)
+    masked_state_parser.add_argument(
+        "--vector-envs",
+        type=int,
+        default=1,
+        help="engines stepped in lockstep with one batched forward pass per step",
+    )
     masked_state_parser.add_argument("--seed", type=int, default=92_000_000)
     masked_state_parser.add_argument("--learning-rate", type=float, default=1e-4)
     masked_state_parser.add_argument("--temperature", type=float, default=1.0)
@@ -1622,6 +1683,12 @@ def main() -> int:
     masked_state_rnn_parser.add_argument("--scratch-scale", type=float, default=0.02)
     masked_state_rnn_parser.add_argument("--episodes", type=int, default=32)
     masked_state_rnn_parser.add_argument("--batch-size", type=int, default=8)
+    masked_state_rnn_parser.add_argument(
+        "--vector-envs",
+        type=int,
+        default=1,
+        help="engines stepped in lockstep with one batched forward pass per step",
+    )
     masked_state_rnn_parser.add_argument("--seed", type=int, default=92_500_000)
     masked_state_rnn_parser.add_argument("--learning-rate", type=float, default=1e-4)
     masked_state_rnn_parser.add_argument("--temperature", type=float, default=1.0)
@@ -1655,6 +1722,12 @@ def main() -> int:
     masked_state_transformer_parser.add_argument("--scratch-scale", type=float, default=0.02)
     masked_state_transformer_parser.add_argument("--episodes", type=int, default=32)
     masked_state_transformer_parser.add_argument("--batch-size", type=int, default=8)
+    masked_state_transformer_parser.add_argument(
+        "--vector-envs",
+        type=int,
+        default=1,
+        help="engines stepped in lockstep with one batched forward pass per step",
+    )
     masked_state_transformer_parser.add_argument("--seed", type=int, default=92_700_000)
     masked_state_transformer_parser.add_argument("--learning-rate", type=float, default=1e-4)
     masked_state_transformer_parser.add_argument("--temperature", type=float, default=1.0)
@@ -1688,6 +1761,12 @@ def main() -> int:
     masked_state_routed_transformer_parser.add_argument("--scratch-scale", type=float, default=0.02)
     masked_state_routed_transformer_parser.add_argument("--episodes", type=int, default=32)
     masked_state_routed_transformer_parser.add_argument("--batch-size", type=int, default=8)
+    masked_state_routed_transformer_parser.add_argument(
+        "--vector-envs",
+        type=int,
+        default=1,
+        help="engines stepped in lockstep with one batched forward pass per step",
+    )
     masked_state_routed_transformer_parser.add_argument("--seed", type=int, default=92_900_000)
     masked_state_routed_transformer_parser.add_argument("--learning-rate", type=float, default=1e-4)
     masked_state_routed_transformer_parser.add_argument("--temperature", type=float, default=1.0)
@@ -1798,6 +1877,7 @@ def main() -> int:
     self_play_parser.add_argument("--eval-include-heuristic", action="store_true")
     self_play_parser.add_argument("--select-best-eval-checkpoint", action="store_true")
     self_play_parser.add_argument("--eval-patience", type=int, default=0)
+    self_play_parser.add_argument("--async-eval", action="store_true")
     self_play_parser.add_argument("--round-curriculum", action="store_true")
     self_play_parser.add_argument(
         "--curriculum-schedule",
@@ -1847,7 +1927,19 @@ def main() -> int:
         help="generate legal C-engine supervised trajectories with rollout-search soft targets",
     )
     supervised_generate_parser.add_argument("--output", type=Path, required=True)
+    supervised_generate_parser.add_argument(
+        "--output-format",
+        choices=["jsonl", "shard"],
+        default="jsonl",
+        help="shard writes a binary columnar trajectory directory instead of JSONL",
+    )
     supervised_generate_parser.add_argument("--games", type=int, default=8)
+    supervised_generate_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="processes generating contiguous game ranges; output matches the serial run",
+    )
     supervised_generate_parser.add_argument("--seed", type=int, default=61_000_000)
     supervised_generate_parser.add_argument("--input-size", type=int, default=200)
     supervised_generate_parser.add_argument(
@@ -1930,6 +2022,24 @@ def main() -> int:
     supervised_generate_parser.add_argument("--rebuild", action="store_true")
     supervised_generate_parser.set_defaults(func=supervised_generate_command)
 
+    trajectory_convert_parser = subparsers.add_parser(
+        "trajectory-convert",
+        help="convert supervised trajectories between JSONL and binary shards",
+    )
+    trajectory_convert_parser.add_argument(
+        "--input", type=Path, nargs="+", required=True
+    )
+    trajectory_convert_parser.add_argument("--output", type=Path, required=True)
+    trajectory_convert_parser.add_argument(
+        "--to", choices=["shard", "jsonl"], required=True
+    )
+    trajectory_convert_parser.add_argument(
+        "--engine-sha256",
+        default=None,
+        help="engine source digest to record in the shard manifest",
+    )
+    trajectory_convert_parser.set_defaults(func=trajectory_convert_command)
+
     online_export_parser = subparsers.add_parser(
         "export-online-trajectories",
         help="replay eligible four-human production games into training JSONL",
@@ -2134,6 +2244,12 @@ def main() -> int:
     oracle_bench_parser.add_argument("--round-plot-cards", type=int, default=6)
     oracle_bench_parser.add_argument("--round-famine-rate", type=float, default=0.2)
     oracle_bench_parser.add_argument("--include-games", action="store_true")
+    oracle_bench_parser.add_argument(
+        "--oracle-index",
+        type=Path,
+        default=None,
+        help="directory for the persistent oracle index; rebuilt when the trajectories change",
+    )
     oracle_bench_parser.add_argument(
         "--cpu", action="store_true", help="force CPU instead of MPS"
     )
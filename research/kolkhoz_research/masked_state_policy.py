@@ -27,6 +27,8 @@ KC_ACTION_ASSIGN = 5
 KC_ACTION_SUBMIT_ASSIGNMENTS = 6
 KC_ACTION_CONTINUE_AFTER_REQUISITION = 7
 KC_ACTION_UNDO_SWAP = 8
+KC_ACTION_REVEAL_REWARD = 10
+KC_ACTION_REVEAL_TRUMP = 11
 
 CARD_SUIT_COUNT = 5
 CARD_VALUE_COUNT = 15
@@ -39,6 +41,9 @@ SWAP_BASE = ASSIGN_BASE + 4
 SWAP_ZONE_COUNT = 2
 ACTION_SPACE_SIZE = SWAP_BASE + CARD_COUNT * CARD_COUNT * SWAP_ZONE_COUNT
 
+# Planning reveals are single bookkeeping steps, never a choice for the policy.
+FORCED_ACTION_KINDS = {KC_ACTION_REVEAL_REWARD, KC_ACTION_REVEAL_TRUMP}
+
 SPECIAL_ACTION_IDS = {
     KC_ACTION_CONFIRM_SWAP: 0,
     KC_ACTION_SUBMIT_ASSIGNMENTS: 1,
@@ -80,7 +85,7 @@ def action_id(action: KCAction) -> int | None:
 
 @dataclass
 class MaskedTransition:
-    state: list[float]
+    state: torch.Tensor
     legal_ids: list[int]
     action_id: int
     log_probability: float
@@ -99,8 +104,8 @@ class MaskedEpisode:
 
 @dataclass
 class RecurrentMaskedTransition:
-    state: list[float]
-    hidden: list[float]
+    state: torch.Tensor
+    hidden: torch.Tensor
     legal_ids: list[int]
     action_id: int
     log_probability: float
@@ -119,7 +124,7 @@ class RecurrentMaskedEpisode:
 
 @dataclass
 class TransformerMaskedTransition:
-    context: list[list[float]]
+    context: torch.Tensor
     legal_ids: list[int]
     action_id: int
     log_probability: float
@@ -410,6 +415,15 @@ def _all_external_controllers() -> KCControllers:
     return KCControllers((0, 0, 0, 0))
 
 
+def _forced_action(phase: int, actions: list[KCAction]) -> KCAction | None:
+    """The action to apply without asking the policy, if this step has no choice."""
+    if phase == KC_PHASE_REQUISITION:
+        return actions[0]
+    if len(actions) == 1 and int(actions[0].kind) in FORCED_ACTION_KINDS:
+        return actions[0]
+    return None
+
+
 def _legal_action_map(actions: list[KCAction]) -> tuple[list[int], dict[int, KCAction]]:
     legal_ids: list[int] = []
     by_id: dict[int, KCAction] = {}
@@ -463,7 +477,7 @@ def _choose_model_action(
     transition = None
     if sample:
         transition = MaskedTransition(
-            state=state.squeeze(0).detach().cpu().tolist(),
+            state=state.squeeze(0).detach(),
             legal_ids=legal_ids,
             action_id=selected_id,
             log_probability=float(distribution.log_prob(selected).detach().cpu().item()),
@@ -532,8 +546,9 @@ def rollout_masked_episode(
                     raise RuntimeError(f"automatic masked rollout step failed: {status}")
                 continue
             player_id = int(actions[0].player_id)
-            if phase == KC_PHASE_REQUISITION:
-                engine.apply_action(pointer, actions[0])
+            forced = _forced_action(phase, actions)
+            if forced is not None:
+                engine.apply_action(pointer, forced)
                 continue
             action, transition = _choose_model_action(
                 model,
@@ -552,6 +567,241 @@ def rollout_masked_episode(
         engine.free_engine(pointer)
 
 
+@dataclass
+class _LockstepDecision:
+    env_index: int
+    pointer: Any
+    player_id: int
+    actions: list[KCAction]
+
+
+class _StateFeatureBuffer:
+    """Preallocated ``(K, input_size)`` host tensor the C engine writes rows into."""
+
+    def __init__(self, capacity: int, input_size: int) -> None:
+        self.input_size = input_size
+        self.host = torch.zeros((capacity, input_size), dtype=torch.float32)
+        self._row_bytes = self.host.stride(0) * self.host.element_size()
+
+    def gather(
+        self,
+        engine: CEngine,
+        decisions: list[_LockstepDecision],
+        device: torch.device,
+    ) -> torch.Tensor:
+        address = self.host.data_ptr()
+        for row, decision in enumerate(decisions):
+            if not engine.state_features_into(
+                decision.pointer,
+                address + row * self._row_bytes,
+                perspective_player=decision.player_id,
+                input_size=self.input_size,
+            ):
+                raise RuntimeError("C engine returned no masked-policy state features")
+        # Copied out: transitions keep these rows after the buffer is reused.
+        return self.host[: len(decisions)].to(device, copy=True)
+
+
+def _rollout_lockstep(
+    engine: CEngine,
+    seeds: list[int],
+    *,
+    input_size: int,
+    device: torch.device,
+    decide: Callable[
+        [list[_LockstepDecision], torch.Tensor], list[tuple[KCAction, Any]]
+    ],
+    label: str,
+    max_actions: int,
+    **engine_options: Any,
+) -> list[tuple[list[int], list[Any]]]:
+    """Step one engine per seed in lockstep, deciding every waiting seat at once.
+
+    Each env advances through automatic and forced steps exactly as the
+    single-engine rollouts do; ``decide`` then receives all pending decisions with
+    their state features gathered into one tensor and returns an action and
+    transition per decision. Returns final scores and transitions per seed.
+    """
+    pointers: list[Any] = []
+    try:
+        for seed in seeds:
+            pointers.append(
+                engine.new_engine(
+                    seed, controllers=_all_external_controllers(), **engine_options
+                )
+            )
+        buffer = _StateFeatureBuffer(len(seeds), input_size)
+        transitions: list[list[Any]] = [[] for _ in seeds]
+        scores: list[list[int] | None] = [None] * len(seeds)
+        steps = [0] * len(seeds)
+        while any(item is None for item in scores):
+            decisions: list[_LockstepDecision] = []
+            for env_index, pointer in enumerate(pointers):
+                while scores[env_index] is None:
+                    if steps[env_index] >= max_actions:
+                        raise RuntimeError(f"{label} rollout exceeded action limit")
+                    steps[env_index] += 1
+                    phase = engine.phase(pointer)
+                    if phase == KC_PHASE_GAME_OVER:
+                        scores[env_index] = engine.final_scores(pointer)
+                        break
+                    actions = engine.legal_actions(pointer)
+                    if not actions:
+                        status = engine.step_automatic(pointer)
+                        if status < 0:
+                            raise RuntimeError(
+                                f"automatic {label} rollout step failed: {status}"
+                            )
+                        continue
+                    forced = _forced_action(phase, actions)
+                    if forced is not None:
+                        engine.apply_action(pointer, forced)
+                        continue
+                    decisions.append(
+                        _LockstepDecision(
+                            env_index, pointer, int(actions[0].player_id), actions
+                        )
+                    )
+                    break
+            if not decisions:
+                continue
+            states = buffer.gather(engine, decisions, device)
+            for decision, (action, transition) in zip(
+                decisions, decide(decisions, states)
+            ):
+                transitions[decision.env_index].append(transition)
+                engine.apply_policy_action(decision.pointer, action)
+        return [
+            (final, env_transitions)
+            for final, env_transitions in zip(scores, transitions)
+            if final is not None
+        ]
+    finally:
+        for pointer in pointers:
+            engine.free_engine(pointer)
+
+
+def _lockstep_episodes(
+    results: list[tuple[list[int], list[Any]]], episode_type: Callable[..., Any]
+) -> list[Any]:
+    episodes = []
+    for scores, transitions in results:
+        rewards = _player_rewards(scores)
+        for transition in transitions:
+            transition.reward = rewards[transition.player_id]
+        episodes.append(
+            episode_type(
+                transitions=transitions,
+                scores=scores,
+                rewards=rewards,
+                winner_id=_winner_id(scores),
+            )
+        )
+    return episodes
+
+
+def _legal_id_mask(
+    legal_ids: list[list[int]], size: int, device: torch.device
+) -> torch.Tensor:
+    rows = [row for row, ids in enumerate(legal_ids) for _ in ids]
+    columns = [item for ids in legal_ids for item in ids]
+    mask = torch.zeros((len(legal_ids), size), dtype=torch.bool)
+    mask[rows, columns] = True
+    return mask.to(device)
+
+
+def _sample_batch(
+    logits: torch.Tensor, temperature: float
+) -> tuple[list[int], list[float]]:
+    distribution = torch.distributions.Categorical(
+        logits=logits / max(0.05, temperature)
+    )
+    selected = distribution.sample()
+    return (
+        selected.cpu().tolist(),
+        distribution.log_prob(selected).cpu().tolist(),
+    )
+
+
+def _sample_masked_batch(
+    logits: torch.Tensor,
+    legal_ids: list[list[int]],
+    temperature: float,
+) -> tuple[list[int], list[float]]:
+    mask = _legal_id_mask(legal_ids, logits.shape[1], logits.device)
+    return _sample_batch(logits.masked_fill(~mask, -1.0e9), temperature)
+
+
+def _legal_action_maps(
+    decisions: list[_LockstepDecision], label: str
+) -> list[tuple[list[int], dict[int, KCAction]]]:
+    legal = [_legal_action_map(decision.actions) for decision in decisions]
+    if any(not legal_ids for legal_ids, _ in legal):
+        raise RuntimeError(f"{label} was asked to move with no legal actions")
+    return legal
+
+
+def rollout_masked_episodes(
+    engine: CEngine,
+    model: MaskedStatePolicy,
+    *,
+    seeds: list[int],
+    device: torch.device,
+    temperature: float,
+    round_curriculum: bool = False,
+    curriculum_rounds: int = 2,
+    round_plot_cards: int = 6,
+    round_famine_rate: float = 0.2,
+    max_actions: int = 512,
+) -> list[MaskedEpisode]:
+    """``rollout_masked_episode`` for many seeds with one forward pass per step."""
+
+    def decide(
+        decisions: list[_LockstepDecision], states: torch.Tensor
+    ) -> list[tuple[KCAction, MaskedTransition]]:
+        legal = _legal_action_maps(decisions, "masked policy")
+        with torch.no_grad():
+            logits, values = model(states)
+        selected, log_probs = _sample_masked_batch(
+            logits, [legal_ids for legal_ids, _ in legal], temperature
+        )
+        row_values = values.cpu().tolist()
+        choices = []
+        for row, decision in enumerate(decisions):
+            legal_ids, by_id = legal[row]
+            choices.append(
+                (
+                    by_id[selected[row]],
+                    MaskedTransition(
+                        state=states[row],
+                        legal_ids=legal_ids,
+                        action_id=selected[row],
+                        log_probability=log_probs[row],
+                        value=row_values[row],
+                        player_id=decision.player_id,
+                    ),
+                )
+            )
+        return choices
+
+    return _lockstep_episodes(
+        _rollout_lockstep(
+            engine,
+            seeds,
+            input_size=model.input_size,
+            device=device,
+            decide=decide,
+            label="masked",
+            max_actions=max_actions,
+            round_curriculum=round_curriculum,
+            curriculum_rounds=curriculum_rounds,
+            round_plot_cards=round_plot_cards,
+            round_famine_rate=round_famine_rate,
+        ),
+        MaskedEpisode,
+    )
+
+
 def _batch_masked_logits(
     logits: torch.Tensor, legal_ids: list[list[int]]
 ) -> torch.Tensor:
@@ -620,7 +870,7 @@ def _ppo_update(
 ) -> dict[str, float]:
     if not transitions:
         return {"loss": 0.0, "policy_loss": 0.0, "value_loss": 0.0, "entropy": 0.0}
-    states = torch.tensor([item.state for item in transitions], dtype=torch.float32, device=device)
+    states = torch.stack([item.state for item in transitions]).to(device)
     actions = torch.tensor([item.action_id for item in transitions], dtype=torch.long, device=device)
     old_log_probs = torch.tensor(
         [item.log_probability for item in transitions], dtype=torch.float32, device=device
@@ -713,8 +963,9 @@ def evaluate_masked_policy(
                                 raise RuntimeError(f"eval automatic step failed: {status}")
                             continue
                         player_id = int(actions[0].player_id)
-                        if phase == KC_PHASE_REQUISITION:
-                            engine.apply_action(pointer, actions[0])
+                        forced = _forced_action(phase, actions)
+                        if forced is not None:
+                            engine.apply_action(pointer, forced)
                         elif player_id == model_seat:
                             action, _ = _choose_model_action(
                                 model,
@@ -779,8 +1030,8 @@ def _choose_recurrent_model_action(
     transition = None
     if sample:
         transition = RecurrentMaskedTransition(
-            state=state.squeeze(0).detach().cpu().tolist(),
-            hidden=hidden_before.squeeze(0).detach().cpu().tolist(),
+            state=state.squeeze(0).detach(),
+            hidden=hidden_before.squeeze(0).detach(),
             legal_ids=legal_ids,
             action_id=selected_id,
             log_probability=float(distribution.log_prob(selected).detach().cpu().item()),
@@ -823,8 +1074,9 @@ def rollout_recurrent_masked_episode(
                     raise RuntimeError(f"automatic recurrent rollout step failed: {status}")
                 continue
             player_id = int(actions[0].player_id)
-            if phase == KC_PHASE_REQUISITION:
-                engine.apply_action(pointer, actions[0])
+            forced = _forced_action(phase, actions)
+            if forced is not None:
+                engine.apply_action(pointer, forced)
                 continue
             action, transition, next_hidden = _choose_recurrent_model_action(
                 model,
@@ -845,6 +1097,70 @@ def rollout_recurrent_masked_episode(
         engine.free_engine(pointer)
 
 
+def rollout_recurrent_masked_episodes(
+    engine: CEngine,
+    model: RecurrentMaskedStatePolicy,
+    *,
+    seeds: list[int],
+    device: torch.device,
+    temperature: float,
+    max_actions: int = 512,
+) -> list[RecurrentMaskedEpisode]:
+    """``rollout_recurrent_masked_episode`` for many seeds in lockstep."""
+
+    # One hidden state per (env, seat), updated in place as seats move.
+    hidden_states = model.initial_hidden(len(seeds) * 4, device)
+
+    def decide(
+        decisions: list[_LockstepDecision], states: torch.Tensor
+    ) -> list[tuple[KCAction, RecurrentMaskedTransition]]:
+        legal = _legal_action_maps(decisions, "recurrent masked policy")
+        slots = torch.tensor(
+            [decision.env_index * 4 + decision.player_id for decision in decisions],
+            dtype=torch.long,
+            device=device,
+        )
+        hidden_before = hidden_states[slots]
+        with torch.no_grad():
+            logits, values, next_hidden = model.forward_step(states, hidden_before)
+        hidden_states[slots] = next_hidden
+        selected, log_probs = _sample_masked_batch(
+            logits, [legal_ids for legal_ids, _ in legal], temperature
+        )
+        row_values = values.cpu().tolist()
+        choices = []
+        for row, decision in enumerate(decisions):
+            legal_ids, by_id = legal[row]
+            choices.append(
+                (
+                    by_id[selected[row]],
+                    RecurrentMaskedTransition(
+                        state=states[row],
+                        hidden=hidden_before[row],
+                        legal_ids=legal_ids,
+                        action_id=selected[row],
+                        log_probability=log_probs[row],
+                        value=row_values[row],
+                        player_id=decision.player_id,
+                    ),
+                )
+            )
+        return choices
+
+    return _lockstep_episodes(
+        _rollout_lockstep(
+            engine,
+            seeds,
+            input_size=model.input_size,
+            device=device,
+            decide=decide,
+            label="recurrent masked",
+            max_actions=max_actions,
+        ),
+        RecurrentMaskedEpisode,
+    )
+
+
 def _recurrent_ppo_update(
     model: RecurrentMaskedStatePolicy,
     optimizer: torch.optim.Optimizer,
@@ -859,8 +1175,8 @@ def _recurrent_ppo_update(
 ) -> dict[str, float]:
     if not transitions:
         return {"loss": 0.0, "policy_loss": 0.0, "value_loss": 0.0, "entropy": 0.0}
-    states = torch.tensor([item.state for item in transitions], dtype=torch.float32, device=device)
-    hiddens = torch.tensor([item.hidden for item in transitions], dtype=torch.float32, device=device)
+    states = torch.stack([item.state for item in transitions]).to(device)
+    hiddens = torch.stack([item.hidden for item in transitions]).to(device)
     actions = torch.tensor([item.action_id for item in transitions], dtype=torch.long, device=device)
     old_log_probs = torch.tensor(
         [item.log_probability for item in transitions], dtype=torch.float32, device=device
@@ -947,8 +1263,9 @@ def evaluate_recurrent_masked_policy(
                                 raise RuntimeError(f"recurrent eval automatic step failed: {status}")
                             continue
                         player_id = int(actions[0].player_id)
-                        if phase == KC_PHASE_REQUISITION:
-                            engine.apply_action(pointer, actions[0])
+                        forced = _forced_action(phase, actions)
+                        if forced is not None:
+                            engine.apply_action(pointer, forced)
                         elif player_id == model_seat:
                             action, _, next_hidden = _choose_recurrent_model_action(
                                 model,
@@ -1013,7 +1330,10 @@ def train_recurrent_masked_state_policy(
     eval_seed: int = 91_000_000,
     record_history: bool = False,
     progress_callback: Callable[[dict[str, Any]], None] | None = None,
+    vector_envs: int = 1,
 ) -> dict[str, Any]:
+    if vector_envs < 1:
+        raise ValueError("vector_envs must be at least 1")
     device = best_device(prefer_mps)
     if start_model_path is None:
         model = RecurrentMaskedStatePolicy.scratch(
@@ -1033,16 +1353,30 @@ def train_recurrent_masked_state_policy(
     best_eval_score: float | None = None
     while completed < episodes:
         current_batch = min(batch_size, episodes - completed)
-        batch_episodes = [
-            rollout_recurrent_masked_episode(
-                engine,
-                model,
-                seed=seed + completed + index,
-                device=device,
-                temperature=temperature,
-            )
-            for index in range(current_batch)
-        ]
+        batch_seeds = [seed + completed + index for index in range(current_batch)]
+        if vector_envs > 1:
+            batch_episodes = [
+                episode
+                for start in range(0, current_batch, vector_envs)
+                for episode in rollout_recurrent_masked_episodes(
+                    engine,
+                    model,
+                    seeds=batch_seeds[start : start + vector_envs],
+                    device=device,
+                    temperature=temperature,
+                )
+            ]
+        else:
+            batch_episodes = [
+                rollout_recurrent_masked_episode(
+                    engine,
+                    model,
+                    seed=episode_seed,
+                    device=device,
+                    temperature=temperature,
+                )
+                for episode_seed in batch_seeds
+            ]
         transitions = [
             transition
             for episode in batch_episodes
@@ -1100,6 +1434,7 @@ def train_recurrent_masked_state_policy(
                     "action_space_size": ACTION_SPACE_SIZE,
                     "episodes": episodes,
                     "batch_size": batch_size,
+                    "vector_envs": vector_envs,
                     "seed": seed,
                     "learning_rate": learning_rate,
                     "points": all_points,
@@ -1124,6 +1459,7 @@ def train_recurrent_masked_state_policy(
                     "training": {
                         "episodes": episodes,
                         "batch_size": batch_size,
+                        "vector_envs": vector_envs,
                         "seed": seed,
                         "learning_rate": learning_rate,
                         "ppo_epochs": ppo_epochs,
@@ -1153,6 +1489,7 @@ def train_recurrent_masked_state_policy(
         "action_space_size": ACTION_SPACE_SIZE,
         "episodes": episodes,
         "batch_size": batch_size,
+        "vector_envs": vector_envs,
         "seed": seed,
         "learning_rate": learning_rate,
         "points": all_points,
@@ -1220,7 +1557,7 @@ def _choose_transformer_model_action(
     transition = None
     if sample:
         transition = TransformerMaskedTransition(
-            context=next_context.detach().cpu().tolist(),
+            context=next_context.detach(),
             legal_ids=legal_ids,
             action_id=selected_id,
             log_probability=float(distribution.log_prob(selected).detach().cpu().item()),
@@ -1263,8 +1600,9 @@ def rollout_transformer_masked_episode(
                     raise RuntimeError(f"automatic transformer rollout step failed: {status}")
                 continue
             player_id = int(actions[0].player_id)
-            if phase == KC_PHASE_REQUISITION:
-                engine.apply_action(pointer, actions[0])
+            forced = _forced_action(phase, actions)
+            if forced is not None:
+                engine.apply_action(pointer, forced)
                 continue
             action, transition, next_context = _choose_transformer_model_action(
                 model,
@@ -1285,6 +1623,68 @@ def rollout_transformer_masked_episode(
         engine.free_engine(pointer)
 
 
+def rollout_transformer_masked_episodes(
+    engine: CEngine,
+    model: TransformerMaskedStatePolicy,
+    *,
+    seeds: list[int],
+    device: torch.device,
+    temperature: float,
+    max_actions: int = 512,
+) -> list[TransformerMaskedEpisode]:
+    """``rollout_transformer_masked_episode`` for many seeds in lockstep."""
+
+    contexts = model.initial_context(len(seeds) * 4, device)
+
+    def decide(
+        decisions: list[_LockstepDecision], states: torch.Tensor
+    ) -> list[tuple[KCAction, TransformerMaskedTransition]]:
+        legal = _legal_action_maps(decisions, "transformer masked policy")
+        slots = torch.tensor(
+            [decision.env_index * 4 + decision.player_id for decision in decisions],
+            dtype=torch.long,
+            device=device,
+        )
+        next_contexts = torch.cat([contexts[slots, 1:], states.unsqueeze(1)], dim=1)
+        contexts[slots] = next_contexts
+        with torch.no_grad():
+            logits, values = model.forward_context(next_contexts)
+        selected, log_probs = _sample_masked_batch(
+            logits, [legal_ids for legal_ids, _ in legal], temperature
+        )
+        row_values = values.cpu().tolist()
+        choices = []
+        for row, decision in enumerate(decisions):
+            legal_ids, by_id = legal[row]
+            choices.append(
+                (
+                    by_id[selected[row]],
+                    TransformerMaskedTransition(
+                        context=next_contexts[row],
+                        legal_ids=legal_ids,
+                        action_id=selected[row],
+                        log_probability=log_probs[row],
+                        value=row_values[row],
+                        player_id=decision.player_id,
+                    ),
+                )
+            )
+        return choices
+
+    return _lockstep_episodes(
+        _rollout_lockstep(
+            engine,
+            seeds,
+            input_size=model.input_size,
+            device=device,
+            decide=decide,
+            label="transformer masked",
+            max_actions=max_actions,
+        ),
+        TransformerMaskedEpisode,
+    )
+
+
 def _transformer_ppo_update(
     model: TransformerMaskedStatePolicy,
     optimizer: torch.optim.Optimizer,
@@ -1299,7 +1699,7 @@ def _transformer_ppo_update(
 ) -> dict[str, float]:
     if not transitions:
         return {"loss": 0.0, "policy_loss": 0.0, "value_loss": 0.0, "entropy": 0.0}
-    contexts = torch.tensor([item.context for item in transitions], dtype=torch.float32, device=device)
+    contexts = torch.stack([item.context for item in transitions]).to(device)
     actions = torch.tensor([item.action_id for item in transitions], dtype=torch.long, device=device)
     old_log_probs = torch.tensor(
         [item.log_probability for item in transitions], dtype=torch.float32, device=device
@@ -1385,8 +1785,9 @@ def evaluate_transformer_masked_policy(
                                 raise RuntimeError(f"transformer eval automatic step failed: {status}")
                             continue
                         player_id = int(actions[0].player_id)
-                        if phase == KC_PHASE_REQUISITION:
-                            engine.apply_action(pointer, actions[0])
+                        forced = _forced_action(phase, actions)
+                        if forced is not None:
+                            engine.apply_action(pointer, forced)
                         elif player_id == model_seat:
                             action, _, next_context = _choose_transformer_model_action(
                                 model,
@@ -1455,7 +1856,10 @@ def train_transformer_masked_state_policy(
     eval_seed: int = 91_000_000,
     record_history: bool = False,
     progress_callback: Callable[[dict[str, Any]], None] | None = None,
+    vector_envs: int = 1,
 ) -> dict[str, Any]:
+    if vector_envs < 1:
+        raise ValueError("vector_envs must be at least 1")
     device = best_device(prefer_mps)
     if start_model_path is None:
         model = TransformerMaskedStatePolicy.scratch(
@@ -1479,16 +1883,30 @@ def train_transformer_masked_state_policy(
     best_eval_score: float | None = None
     while completed < episodes:
         current_batch = min(batch_size, episodes - completed)
-        batch_episodes = [
-            rollout_transformer_masked_episode(
-                engine,
-                model,
-                seed=seed + completed + index,
-                device=device,
-                temperature=temperature,
-            )
-            for index in range(current_batch)
-        ]
+        batch_seeds = [seed + completed + index for index in range(current_batch)]
+        if vector_envs > 1:
+            batch_episodes = [
+                episode
+                for start in range(0, current_batch, vector_envs)
+                for episode in rollout_transformer_masked_episodes(
+                    engine,
+                    model,
+                    seeds=batch_seeds[start : start + vector_envs],
+                    device=device,
+                    temperature=temperature,
+                )
+            ]
+        else:
+            batch_episodes = [
+                rollout_transformer_masked_episode(
+                    engine,
+                    model,
+                    seed=episode_seed,
+                    device=device,
+                    temperature=temperature,
+                )
+                for episode_seed in batch_seeds
+            ]
         transitions = [
             transition
             for episode in batch_episodes
@@ -1549,6 +1967,7 @@ def train_transformer_masked_state_policy(
                     "action_space_size": ACTION_SPACE_SIZE,
                     "episodes": episodes,
                     "batch_size": batch_size,
+                    "vector_envs": vector_envs,
                     "seed": seed,
                     "learning_rate": learning_rate,
                     "points": all_points,
@@ -1576,6 +1995,7 @@ def train_transformer_masked_state_policy(
                     "training": {
                         "episodes": episodes,
                         "batch_size": batch_size,
+                        "vector_envs": vector_envs,
                         "seed": seed,
                         "learning_rate": learning_rate,
                         "ppo_epochs": ppo_epochs,
@@ -1608,6 +2028,7 @@ def train_transformer_masked_state_policy(
         "action_space_size": ACTION_SPACE_SIZE,
         "episodes": episodes,
         "batch_size": batch_size,
+        "vector_envs": vector_envs,
         "seed": seed,
         "learning_rate": learning_rate,
         "points": all_points,
@@ -1671,7 +2092,10 @@ def train_masked_state_policy(
     round_famine_rate: float = 0.2,
     record_history: bool = False,
     progress_callback: Callable[[dict[str, Any]], None] | None = None,
+    vector_envs: int = 1,
 ) -> dict[str, Any]:
+    if vector_envs < 1:
+        raise ValueError("vector_envs must be at least 1")
     device = best_device(prefer_mps)
     if start_model_path is None:
         model = MaskedStatePolicy.scratch(
@@ -1691,20 +2115,38 @@ def train_masked_state_policy(
     best_eval_score: float | None = None
     while completed < episodes:
         current_batch = min(batch_size, episodes - completed)
-        batch_episodes = [
-            rollout_masked_episode(
-                engine,
-                model,
-                seed=seed + completed + index,
-                device=device,
-                temperature=temperature,
-                round_curriculum=round_curriculum,
-                curriculum_rounds=curriculum_rounds,
-                round_plot_cards=round_plot_cards,
-                round_famine_rate=round_famine_rate,
-            )
-            for index in range(current_batch)
-        ]
+        batch_seeds = [seed + completed + index for index in range(current_batch)]
+        if vector_envs > 1:
+            batch_episodes = [
+                episode
+                for start in range(0, current_batch, vector_envs)
+                for episode in rollout_masked_episodes(
+                    engine,
+                    model,
+                    seeds=batch_seeds[start : start + vector_envs],
+                    device=device,
+                    temperature=temperature,
+                    round_curriculum=round_curriculum,
+                    curriculum_rounds=curriculum_rounds,
+                    round_plot_cards=round_plot_cards,
+                    round_famine_rate=round_famine_rate,
+                )
+            ]
+        else:
+            batch_episodes = [
+                rollout_masked_episode(
+                    engine,
+                    model,
+                    seed=episode_seed,
+                    device=device,
+                    temperature=temperature,
+                    round_curriculum=round_curriculum,
+                    curriculum_rounds=curriculum_rounds,
+                    round_plot_cards=round_plot_cards,
+                    round_famine_rate=round_famine_rate,
+                )
+                for episode_seed in batch_seeds
+            ]
         transitions = [
             transition
             for episode in batch_episodes
@@ -1766,6 +2208,7 @@ def train_masked_state_policy(
                     "action_space_size": ACTION_SPACE_SIZE,
                     "episodes": episodes,
                     "batch_size": batch_size,
+                    "vector_envs": vector_envs,
                     "seed": seed,
                     "learning_rate": learning_rate,
                     "points": all_points,
@@ -1790,6 +2233,7 @@ def train_masked_state_policy(
                     "training": {
                         "episodes": episodes,
                         "batch_size": batch_size,
+                        "vector_envs": vector_envs,
                         "seed": seed,
                         "learning_rate": learning_rate,
                         "ppo_epochs": ppo_epochs,
@@ -1819,6 +2263,7 @@ def train_masked_state_policy(
         "action_space_size": ACTION_SPACE_SIZE,
         "episodes": episodes,
         "batch_size": batch_size,
+        "vector_envs": vector_envs,
         "seed": seed,
         "learning_rate": learning_rate,
         "points": all_points,
@@ -1865,8 +2310,8 @@ ROUTED_ACTION_FEATURE_SIZE = 48
 
 @dataclass
 class RoutedTransformerMaskedTransition:
-    context: list[list[float]]
-    action_features: list[list[float]]
+    context: torch.Tensor
+    action_features: torch.Tensor
     action_head_ids: list[int]
     selected_index: int
     log_probability: float
@@ -2146,8 +2591,8 @@ def _choose_routed_transformer_model_action(
     transition = None
     if sample:
         transition = RoutedTransformerMaskedTransition(
-            context=next_context.detach().cpu().tolist(),
-            action_features=action_features,
+            context=next_context.detach(),
+            action_features=features_tensor[0],
             action_head_ids=action_head_ids,
             selected_index=selected_index,
             log_probability=float(distribution.log_prob(selected).detach().cpu().item()),
@@ -2190,8 +2635,9 @@ def rollout_routed_transformer_masked_episode(
                     raise RuntimeError(f"automatic routed transformer rollout step failed: {status}")
                 continue
             player_id = int(actions[0].player_id)
-            if phase == KC_PHASE_REQUISITION:
-                engine.apply_action(pointer, actions[0])
+            forced = _forced_action(phase, actions)
+            if forced is not None:
+                engine.apply_action(pointer, forced)
                 continue
             action, transition, next_context = _choose_routed_transformer_model_action(
                 model,
@@ -2212,6 +2658,88 @@ def rollout_routed_transformer_masked_episode(
         engine.free_engine(pointer)
 
 
+def rollout_routed_transformer_masked_episodes(
+    engine: CEngine,
+    model: RoutedTransformerMaskedStatePolicy,
+    *,
+    seeds: list[int],
+    device: torch.device,
+    temperature: float,
+    max_actions: int = 512,
+) -> list[RoutedTransformerMaskedEpisode]:
+    """``rollout_routed_transformer_masked_episode`` for many seeds in lockstep."""
+
+    contexts = model.initial_context(len(seeds) * 4, device)
+
+    def decide(
+        decisions: list[_LockstepDecision], states: torch.Tensor
+    ) -> list[tuple[KCAction, RoutedTransformerMaskedTransition]]:
+        routed = [_routed_legal_actions(decision.actions) for decision in decisions]
+        if any(not routed_actions for routed_actions, _, _ in routed):
+            raise RuntimeError(
+                "routed transformer policy was asked to move with no legal actions"
+            )
+        slots = torch.tensor(
+            [decision.env_index * 4 + decision.player_id for decision in decisions],
+            dtype=torch.long,
+            device=device,
+        )
+        next_contexts = torch.cat([contexts[slots, 1:], states.unsqueeze(1)], dim=1)
+        contexts[slots] = next_contexts
+        width = max(len(routed_actions) for routed_actions, _, _ in routed)
+        action_features = torch.zeros(
+            (len(decisions), width, model.action_feature_size), dtype=torch.float32
+        )
+        action_head_ids = torch.zeros((len(decisions), width), dtype=torch.long)
+        action_mask = torch.zeros((len(decisions), width), dtype=torch.bool)
+        for row, (routed_actions, features, head_ids) in enumerate(routed):
+            count = len(routed_actions)
+            action_features[row, :count] = torch.tensor(features, dtype=torch.float32)
+            action_head_ids[row, :count] = torch.tensor(head_ids, dtype=torch.long)
+            action_mask[row, :count] = True
+        action_features = action_features.to(device)
+        with torch.no_grad():
+            scores, values = model.score_actions(
+                next_contexts,
+                action_features,
+                action_head_ids.to(device),
+                action_mask.to(device),
+            )
+        selected, log_probs = _sample_batch(scores, temperature)
+        row_values = values.cpu().tolist()
+        choices = []
+        for row, decision in enumerate(decisions):
+            routed_actions, _, head_ids = routed[row]
+            choices.append(
+                (
+                    routed_actions[selected[row]],
+                    RoutedTransformerMaskedTransition(
+                        context=next_contexts[row],
+                        action_features=action_features[row, : len(routed_actions)],
+                        action_head_ids=head_ids,
+                        selected_index=selected[row],
+                        log_probability=log_probs[row],
+                        value=row_values[row],
+                        player_id=decision.player_id,
+                    ),
+                )
+            )
+        return choices
+
+    return _lockstep_episodes(
+        _rollout_lockstep(
+            engine,
+            seeds,
+            input_size=model.input_size,
+            device=device,
+            decide=decide,
+            label="routed transformer masked",
+            max_actions=max_actions,
+        ),
+        RoutedTransformerMaskedEpisode,
+    )
+
+
 def _routed_transformer_ppo_update(
     model: RoutedTransformerMaskedStatePolicy,
     optimizer: torch.optim.Optimizer,
@@ -2226,7 +2754,7 @@ def _routed_transformer_ppo_update(
 ) -> dict[str, float]:
     if not transitions:
         return {"loss": 0.0, "policy_loss": 0.0, "value_loss": 0.0, "entropy": 0.0}
-    contexts = torch.tensor([item.context for item in transitions], dtype=torch.float32, device=device)
+    contexts = torch.stack([item.context for item in transitions]).to(device)
     max_actions = max(len(item.action_features) for item in transitions)
     action_features = torch.zeros(
         (len(transitions), max_actions, ROUTED_ACTION_FEATURE_SIZE),
@@ -2241,9 +2769,7 @@ def _routed_transformer_ppo_update(
     )
     for row, item in enumerate(transitions):
         count = len(item.action_features)
-        action_features[row, :count] = torch.tensor(
-            item.action_features, dtype=torch.float32, device=device
-        )
+        action_features[row, :count] = item.action_features
         action_head_ids[row, :count] = torch.tensor(
             item.action_head_ids, dtype=torch.long, device=device
         )
@@ -2342,8 +2868,9 @@ def evaluate_routed_transformer_masked_policy(
                                 )
                             continue
                         player_id = int(actions[0].player_id)
-                        if phase == KC_PHASE_REQUISITION:
-                            engine.apply_action(pointer, actions[0])
+                        forced = _forced_action(phase, actions)
+                        if forced is not None:
+                            engine.apply_action(pointer, forced)
                         elif player_id == model_seat:
                             action, _, next_context = _choose_routed_transformer_model_action(
                                 model,
@@ -2414,7 +2941,10 @@ def train_routed_transformer_masked_state_policy(
     eval_seed: int = 91_000_000,
     record_history: bool = False,
     progress_callback: Callable[[dict[str, Any]], None] | None = None,
+    vector_envs: int = 1,
 ) -> dict[str, Any]:
+    if vector_envs < 1:
+        raise ValueError("vector_envs must be at least 1")
     device = best_device(prefer_mps)
     if start_model_path is None:
         model = RoutedTransformerMaskedStatePolicy.scratch(
@@ -2438,16 +2968,30 @@ def train_routed_transformer_masked_state_policy(
     best_eval_score: float | None = None
     while completed < episodes:
         current_batch = min(batch_size, episodes - completed)
-        batch_episodes = [
-            rollout_routed_transformer_masked_episode(
-                engine,
-                model,
-                seed=seed + completed + index,
-                device=device,
-                temperature=temperature,
-            )
-            for index in range(current_batch)
-        ]
+        batch_seeds = [seed + completed + index for index in range(current_batch)]
+        if vector_envs > 1:
+            batch_episodes = [
+                episode
+                for start in range(0, current_batch, vector_envs)
+                for episode in rollout_routed_transformer_masked_episodes(
+                    engine,
+                    model,
+                    seeds=batch_seeds[start : start + vector_envs],
+                    device=device,
+                    temperature=temperature,
+                )
+            ]
+        else:
+            batch_episodes = [
+                rollout_routed_transformer_masked_episode(
+                    engine,
+                    model,
+                    seed=episode_seed,
+                    device=device,
+                    temperature=temperature,
+                )
+                for episode_seed in batch_seeds
+            ]
         transitions = [
             transition
             for episode in batch_episodes
@@ -2510,6 +3054,7 @@ def train_routed_transformer_masked_state_policy(
                     "routed_head_count": ROUTED_HEAD_COUNT,
                     "episodes": episodes,
                     "batch_size": batch_size,
+                    "vector_envs": vector_envs,
                     "seed": seed,
                     "learning_rate": learning_rate,
                     "points": all_points,
@@ -2539,6 +3084,7 @@ def train_routed_transformer_masked_state_policy(
                     "training": {
                         "episodes": episodes,
                         "batch_size": batch_size,
+                        "vector_envs": vector_envs,
                         "seed": seed,
                         "learning_rate": learning_rate,
                         "ppo_epochs": ppo_epochs,
@@ -2573,6 +3119,7 @@ def train_routed_transformer_masked_state_policy(
         "routed_head_count": ROUTED_HEAD_COUNT,
         "episodes": episodes,
         "batch_size": batch_size,
+        "vector_envs": vector_envs,
         "seed": seed,
         "learning_rate": learning_rate,
         "points": all_points,
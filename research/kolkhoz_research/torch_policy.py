@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import io
 import json
-import hashlib
 import itertools
 import math
+import multiprocessing
+import os
+import queue
 import random
+import shutil
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable
 
 import torch
 from torch import nn
@@ -24,15 +31,24 @@ from .benchmark import (
 from .c_engine import (
     ACTION_SCALAR_COUNT,
     CEngine,
+    DenseFeatureWorkspace,
     DenseObjectTokens,
     DensePolicyActionFeatures,
     KCAction,
     KCCard,
     KCObjectToken,
     OBJECT_SCALAR_COUNT,
+    PLAYER_COUNT,
+    VectorEnvBatch,
 )
 from .history import append_history
 from .model import FEATURE_VERSION, HEAD_COUNT, INPUT_SIZE, PolicyArtifact
+from .trajectory_dataset import SupervisedTrajectoryDataset, open_trajectory_shard
+
+if TYPE_CHECKING:
+    # Shard writing and the oracle index need NumPy; they are imported where used
+    # so the other torch commands do not.
+    from .trajectory_oracle_index import TrajectoryOracleIndex
 
 OBJECT_TYPE_EMBEDDINGS = 8
 OBJECT_OWNER_EMBEDDINGS = 6
@@ -555,7 +571,9 @@ class TorchPolicy(nn.Module):
         return model.to(device)
 
     @classmethod
-    def from_checkpoint(cls, path: Path, device: torch.device) -> "TorchPolicy":
+    def from_checkpoint(
+        cls, path: Path | BinaryIO, device: torch.device
+    ) -> "TorchPolicy":
         checkpoint = torch.load(path, map_location="cpu")
         transformer_dropout = checkpoint.get("transformer_dropout", 0.05)
         if transformer_dropout is None:
@@ -731,9 +749,10 @@ class TorchPolicy(nn.Module):
         PolicyArtifact(data=data).save(path)
 
     def save_checkpoint(
-        self, path: Path, *, training_record: dict[str, Any] | None = None
+        self, path: Path | BinaryIO, *, training_record: dict[str, Any] | None = None
     ) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(path, Path):
+            path.parent.mkdir(parents=True, exist_ok=True)
         torch.save(
             {
                 "format": "kolkhoz-torch-policy-v1",
@@ -1562,16 +1581,22 @@ def _rollout_policy_action(
     rollout_model: TorchPolicy | None,
     sample: bool,
     temperature: float,
+    workspace: DenseFeatureWorkspace | None = None,
 ) -> KCAction:
     if rollout_model is None:
         return engine.heuristic_action(pointer)
     candidates = engine.dense_policy_action_features(
-        pointer, player_id=player_id, input_size=rollout_model.input_size
+        pointer,
+        player_id=player_id,
+        input_size=rollout_model.input_size,
+        workspace=workspace,
     )
     if not candidates:
         return engine.heuristic_action(pointer)
     object_tokens = (
-        engine.dense_object_tokens(pointer, perspective_player=player_id)
+        engine.dense_object_tokens(
+            pointer, perspective_player=player_id, workspace=workspace
+        )
         if rollout_model.uses_object_tokens
         else None
     )
@@ -1678,6 +1703,7 @@ def _finish_with_rollout_policy(
     actions_after_candidate: int,
 ) -> dict[str, Any]:
     actions = 0
+    workspace = DenseFeatureWorkspace()
     while actions < max_actions:
         if _curriculum_complete(
             engine,
@@ -1714,6 +1740,7 @@ def _finish_with_rollout_policy(
                 rollout_model=rollout_model,
                 sample=rollout_sample,
                 temperature=rollout_temperature,
+                workspace=workspace,
             )
         except RuntimeError:
             return {
@@ -1972,55 +1999,100 @@ def _search_target_values(
     }
 
 
-def generate_supervised_trajectories(
+TRAJECTORY_GENERATION_POLL_SECONDS = 0.2
+
+_GENERATION_ENGINE: CEngine | None = None
+_GENERATION_PROGRESS: Any = None
+
+
+def _empty_generation_summary() -> dict[str, Any]:
+    return {
+        "states": 0,
+        "records": 0,
+        "searched_states": 0,
+        "forced_states": 0,
+        "soft_target_states": 0,
+        "skipped_low_signal_states": 0,
+        "phase_record_counts": {},
+        "phase_skipped_counts": {},
+    }
+
+
+def _merge_generation_summaries(summaries: list[dict[str, Any]]) -> dict[str, Any]:
+    merged = _empty_generation_summary()
+    for summary in summaries:
+        for key, value in summary.items():
+            if isinstance(value, dict):
+                counts = merged[key]
+                for phase, count in value.items():
+                    counts[phase] = counts.get(phase, 0) + count
+            else:
+                merged[key] += value
+    for key in ("phase_record_counts", "phase_skipped_counts"):
+        merged[key] = dict(sorted(merged[key].items()))
+    return merged
+
+
+def _load_rollout_model(path: Path | None, prefer_mps: bool) -> TorchPolicy | None:
+    if path is None:
+        return None
+    model, _ = load_torch_policy(path, best_device(prefer_mps))
+    model.eval()
+    return model
+
+
+def _generate_supervised_games(
     engine: CEngine,
     *,
     output_path: Path,
-    games: int,
+    output_format: str,
+    game_indices: range,
     seed: int,
-    input_size: int = INPUT_SIZE,
-    seats: list[int] | None = None,
-    max_search_actions: int = 8,
-    rollout_action_limit: int = 512,
-    rollout_model_path: Path | None = None,
-    rollout_sample: bool = False,
-    rollout_temperature: float = 1.0,
-    rollouts_per_action: int = 1,
-    determinize_search: bool = True,
-    search_horizon: str = "full-game",
-    search_target: str = "paired-baseline",
-    target_temperature: float = 0.25,
-    min_search_q_margin: float = 0.0,
-    min_search_q_std: float = 0.0,
-    skip_forced_targets: bool = False,
-    win_weight: float = 1.0,
-    rank_weight: float = 0.05,
-    margin_weight: float = 0.001,
-    prefer_mps: bool = True,
-    round_curriculum: bool = False,
-    round_plot_cards: int = 0,
-    round_famine_rate: float = 0.0,
-    curriculum_rounds: int = 5,
-    progress_callback: Callable[[dict[str, Any]], None] | None = None,
+    input_size: int,
+    seats: list[int],
+    max_search_actions: int,
+    rollout_action_limit: int,
+    rollout_model: TorchPolicy | None,
+    rollout_model_path: Path | None,
+    rollout_sample: bool,
+    rollout_temperature: float,
+    rollouts_per_action: int,
+    determinize_search: bool,
+    search_horizon: str,
+    search_target: str,
+    target_temperature: float,
+    min_search_q_margin: float,
+    min_search_q_std: float,
+    skip_forced_targets: bool,
+    win_weight: float,
+    rank_weight: float,
+    margin_weight: float,
+    round_curriculum: bool,
+    round_plot_cards: int,
+    round_famine_rate: float,
+    curriculum_rounds: int,
+    on_game: Callable[[int, dict[str, Any]], None] | None = None,
 ) -> dict[str, Any]:
-    seats = seats or [0, 1, 2, 3]
-    rollout_model: TorchPolicy | None = None
-    if rollout_model_path is not None:
-        rollout_model, _ = load_torch_policy(
-            rollout_model_path, best_device(prefer_mps)
-        )
-        rollout_model.eval()
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    state_count = 0
-    record_count = 0
-    searched_count = 0
-    forced_count = 0
-    soft_target_count = 0
-    skipped_low_signal_count = 0
-    phase_record_counts: dict[str, int] = {}
-    phase_skipped_counts: dict[str, int] = {}
-    with output_path.open("w", encoding="utf-8") as handle:
-        for game_index in range(games):
+    summary = _empty_generation_summary()
+    with ExitStack() as stack:
+        if output_format == "shard":
+            from .trajectory_shards import TrajectoryShardWriter
+
+            provenance = engine.provenance()
+            shard = stack.enter_context(
+                TrajectoryShardWriter(
+                    output_path,
+                    input_size=input_size,
+                    engine={
+                        "git_sha": provenance.git_sha,
+                        "c_sha256": provenance.c_sha256,
+                        "header_sha256": provenance.header_sha256,
+                    },
+                )
+            )
+        else:
+            handle = stack.enter_context(output_path.open("w", encoding="utf-8"))
+        for game_index in game_indices:
             game_seed = seed + game_index
             pointer = engine.new_engine(
                 game_seed,
@@ -2097,9 +2169,9 @@ def generate_supervised_trajectories(
                             rank_weight=rank_weight,
                             margin_weight=margin_weight,
                         )
-                        state_count += 1
-                        searched_count += 1 if search.get("searched") else 0
-                        forced_count += 1 if len(candidates) == 1 else 0
+                        summary["states"] += 1
+                        summary["searched_states"] += 1 if search.get("searched") else 0
+                        summary["forced_states"] += 1 if len(candidates) == 1 else 0
                         q_values = search.get("q_values")
                         target_policy = search.get("target_policy")
                         target_value = search.get("target_value")
@@ -2108,7 +2180,7 @@ def generate_supervised_trajectories(
                         q_std = search.get("q_std")
                         target_entropy = search.get("target_entropy")
                         if q_values is not None and target_policy is not None:
-                            soft_target_count += 1
+                            summary["soft_target_states"] += 1
                         skip_record = False
                         q_margin_value = float(q_margin) if q_margin is not None else 0.0
                         q_std_value = float(q_std) if q_std is not None else 0.0
@@ -2122,10 +2194,9 @@ def generate_supervised_trajectories(
                         if min_search_q_std > 0.0 and q_std_value < min_search_q_std:
                             skip_record = True
                         if skip_record:
-                            skipped_low_signal_count += 1
-                            phase_skipped_counts[phase] = (
-                                phase_skipped_counts.get(phase, 0) + 1
-                            )
+                            summary["skipped_low_signal_states"] += 1
+                            skipped = summary["phase_skipped_counts"]
+                            skipped[phase] = skipped.get(phase, 0) + 1
                         else:
                             record = {
                                 "format": "kolkhoz-supervised-trajectory-v3",
@@ -2153,16 +2224,18 @@ def generate_supervised_trajectories(
                                     candidates.action_at(baseline_index)
                                 ),
                                 "search": search,
-                                "features": _dense_features_record(
-                                    candidates, object_tokens
-                                ),
                             }
-                            handle.write(json.dumps(record, sort_keys=True))
-                            handle.write("\n")
-                            record_count += 1
-                            phase_record_counts[phase] = (
-                                phase_record_counts.get(phase, 0) + 1
-                            )
+                            if output_format == "shard":
+                                shard.append(record, candidates, object_tokens)
+                            else:
+                                record["features"] = _dense_features_record(
+                                    candidates, object_tokens
+                                )
+                                handle.write(json.dumps(record, sort_keys=True))
+                                handle.write("\n")
+                            summary["records"] += 1
+                            recorded = summary["phase_record_counts"]
+                            recorded[phase] = recorded.get(phase, 0) + 1
                     action = (
                         candidates.action_at(target_index)
                         if player_id in seats
@@ -2180,50 +2253,260 @@ def generate_supervised_trajectories(
                     action_index += 1
             finally:
                 engine.free_engine(pointer)
-            if progress_callback is not None:
-                progress_callback(
-                    {
-                        "kind": "supervised_trajectory_generation",
-                        "status": "running",
-                        "phase": "trajectory_generation",
-                        "output_model": str(output_path),
-                        "training": {
-                            "games": games,
-                            "seed": seed,
-                            "input_size": input_size,
-                            "seats": seats,
-                            "rollout_model": str(rollout_model_path)
-                            if rollout_model_path
-                            else "heuristic",
-                            "search_horizon": search_horizon,
-                            "search_target": search_target,
-                            "determinize_search": determinize_search,
-                        },
-                        "progress": {
-                            "completed_games": game_index + 1,
-                            "total_games": games,
-                            "percent": (game_index + 1) / max(1, games),
-                        },
-                        "summary": {
-                            "states": state_count,
-                            "records": record_count,
-                            "searched_states": searched_count,
-                            "forced_states": forced_count,
-                            "soft_target_states": soft_target_count,
-                            "skipped_low_signal_states": skipped_low_signal_count,
-                            "phase_record_counts": dict(
-                                sorted(phase_record_counts.items())
-                            ),
-                            "phase_skipped_counts": dict(
-                                sorted(phase_skipped_counts.items())
-                            ),
-                        },
-                    }
+            if on_game is not None:
+                on_game(game_index, summary)
+    return summary
+
+
+def _init_generation_worker(library_path: str, progress: Any) -> None:
+    global _GENERATION_ENGINE, _GENERATION_PROGRESS
+    # One interpreter per core already; keep torch from oversubscribing them.
+    torch.set_num_threads(1)
+    _GENERATION_ENGINE = CEngine(Path(library_path))
+    _GENERATION_PROGRESS = progress
+
+
+def _generation_worker(
+    part: int,
+    game_indices: range,
+    *,
+    output_path: str,
+    output_format: str,
+    prefer_mps: bool,
+    options: dict[str, Any],
+) -> dict[str, Any]:
+    if _GENERATION_ENGINE is None:
+        raise RuntimeError("trajectory generation worker was not initialized")
+    progress = _GENERATION_PROGRESS
+
+    def on_game(game_index: int, summary: dict[str, Any]) -> None:
+        if progress is not None:
+            completed = game_index + 1 - game_indices.start
+            progress.put((part, completed, _merge_generation_summaries([summary])))
+
+    return _generate_supervised_games(
+        _GENERATION_ENGINE,
+        output_path=Path(output_path),
+        output_format=output_format,
+        game_indices=game_indices,
+        rollout_model=_load_rollout_model(options["rollout_model_path"], prefer_mps),
+        on_game=on_game,
+        **options,
+    )
+
+
+def _merge_trajectory_parts(
+    part_paths: list[Path], output_path: Path, output_format: str
+) -> None:
+    if output_format == "shard":
+        from .trajectory_shards import merge_trajectory_shards
+
+        merge_trajectory_shards(part_paths, output_path)
+        for path in part_paths:
+            shutil.rmtree(path)
+        return
+    with output_path.open("wb") as handle:
+        for path in part_paths:
+            with path.open("rb") as part:
+                shutil.copyfileobj(part, handle)
+            path.unlink()
+
+
+def _generate_supervised_parts(
+    engine: CEngine,
+    *,
+    output_path: Path,
+    output_format: str,
+    games: int,
+    workers: int,
+    prefer_mps: bool,
+    report: Callable[[int, dict[str, Any]], None] | None,
+    options: dict[str, Any],
+) -> dict[str, Any]:
+    """Generate contiguous game ranges in worker processes, then merge in order.
+
+    Every game is seeded from its index alone, so the merged output is identical to
+    a serial run regardless of how the games were split.
+    """
+    ranges = [
+        range(games * part // workers, games * (part + 1) // workers)
+        for part in range(workers)
+    ]
+    ranges = [games_range for games_range in ranges if len(games_range)]
+    part_paths = [
+        output_path.with_name(f"{output_path.name}.part-{part:03d}")
+        for part in range(len(ranges))
+    ]
+    context = multiprocessing.get_context("spawn")
+    progress = context.Queue() if report is not None else None
+    with ProcessPoolExecutor(
+        max_workers=len(ranges),
+        mp_context=context,
+        initializer=_init_generation_worker,
+        initargs=(os.fspath(engine.library_path), progress),
+    ) as executor:
+        futures = [
+            executor.submit(
+                _generation_worker,
+                part,
+                games_range,
+                output_path=os.fspath(part_paths[part]),
+                output_format=output_format,
+                prefer_mps=prefer_mps,
+                options=options,
+            )
+            for part, games_range in enumerate(ranges)
+        ]
+        latest: dict[int, tuple[int, dict[str, Any]]] = {}
+        while progress is not None and report is not None:
+            try:
+                part, completed, summary = progress.get(
+                    timeout=TRAJECTORY_GENERATION_POLL_SECONDS
                 )
+            except queue.Empty:
+                if all(future.done() for future in futures):
+                    break
+                continue
+            latest[part] = (completed, summary)
+            report(
+                sum(completed for completed, _ in latest.values()),
+                _merge_generation_summaries(
+                    [summary for _, summary in latest.values()]
+                ),
+            )
+        summaries = [future.result() for future in futures]
+    _merge_trajectory_parts(part_paths, output_path, output_format)
+    return _merge_generation_summaries(summaries)
+
+
+def generate_supervised_trajectories(
+    engine: CEngine,
+    *,
+    output_path: Path,
+    games: int,
+    seed: int,
+    input_size: int = INPUT_SIZE,
+    seats: list[int] | None = None,
+    max_search_actions: int = 8,
+    rollout_action_limit: int = 512,
+    rollout_model_path: Path | None = None,
+    rollout_sample: bool = False,
+    rollout_temperature: float = 1.0,
+    rollouts_per_action: int = 1,
+    determinize_search: bool = True,
+    search_horizon: str = "full-game",
+    search_target: str = "paired-baseline",
+    target_temperature: float = 0.25,
+    min_search_q_margin: float = 0.0,
+    min_search_q_std: float = 0.0,
+    skip_forced_targets: bool = False,
+    win_weight: float = 1.0,
+    rank_weight: float = 0.05,
+    margin_weight: float = 0.001,
+    prefer_mps: bool = True,
+    round_curriculum: bool = False,
+    round_plot_cards: int = 0,
+    round_famine_rate: float = 0.0,
+    curriculum_rounds: int = 5,
+    progress_callback: Callable[[dict[str, Any]], None] | None = None,
+    output_format: str = "jsonl",
+    workers: int = 1,
+) -> dict[str, Any]:
+    if output_format not in ("jsonl", "shard"):
+        raise ValueError(f"unknown trajectory output format {output_format!r}")
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    seats = seats or [0, 1, 2, 3]
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    options: dict[str, Any] = {
+        "seed": seed,
+        "input_size": input_size,
+        "seats": seats,
+        "max_search_actions": max_search_actions,
+        "rollout_action_limit": rollout_action_limit,
+        "rollout_model_path": rollout_model_path,
+        "rollout_sample": rollout_sample,
+        "rollout_temperature": rollout_temperature,
+        "rollouts_per_action": rollouts_per_action,
+        "determinize_search": determinize_search,
+        "search_horizon": search_horizon,
+        "search_target": search_target,
+        "target_temperature": target_temperature,
+        "min_search_q_margin": min_search_q_margin,
+        "min_search_q_std": min_search_q_std,
+        "skip_forced_targets": skip_forced_targets,
+        "win_weight": win_weight,
+        "rank_weight": rank_weight,
+        "margin_weight": margin_weight,
+        "round_curriculum": round_curriculum,
+        "round_plot_cards": round_plot_cards,
+        "round_famine_rate": round_famine_rate,
+        "curriculum_rounds": curriculum_rounds,
+    }
+    def report(completed_games: int, summary: dict[str, Any]) -> None:
+        if progress_callback is None:
+            return
+        progress_callback(
+            {
+                "kind": "supervised_trajectory_generation",
+                "status": "running",
+                "phase": "trajectory_generation",
+                "output_model": str(output_path),
+                "training": {
+                    "games": games,
+                    "seed": seed,
+                    "input_size": input_size,
+                    "seats": seats,
+                    "rollout_model": str(rollout_model_path)
+                    if rollout_model_path
+                    else "heuristic",
+                    "search_horizon": search_horizon,
+                    "search_target": search_target,
+                    "determinize_search": determinize_search,
+                    "workers": workers,
+                },
+                "progress": {
+                    "completed_games": completed_games,
+                    "total_games": games,
+                    "percent": completed_games / max(1, games),
+                },
+                "summary": summary,
+            }
+        )
+
+    def report_game(game_index: int, summary: dict[str, Any]) -> None:
+        report(game_index + 1, _merge_generation_summaries([summary]))
+
+    if workers == 1 or games <= 1:
+        summary = _merge_generation_summaries(
+            [
+                _generate_supervised_games(
+                    engine,
+                    output_path=output_path,
+                    output_format=output_format,
+                    game_indices=range(games),
+                    rollout_model=_load_rollout_model(rollout_model_path, prefer_mps),
+                    on_game=report_game,
+                    **options,
+                )
+            ]
+        )
+    else:
+        summary = _generate_supervised_parts(
+            engine,
+            output_path=output_path,
+            output_format=output_format,
+            games=games,
+            workers=workers,
+            prefer_mps=prefer_mps,
+            report=report if progress_callback is not None else None,
+            options=options,
+        )
     return {
         "kind": "supervised_trajectory_generation",
         "status": "generated",
         "output_model": str(output_path),
+        "output_format": output_format,
         "training": {
             "games": games,
             "seed": seed,
@@ -2253,17 +2536,9 @@ def generate_supervised_trajectories(
             "curriculum_rounds": curriculum_rounds if round_curriculum else None,
             "round_plot_cards": round_plot_cards,
             "round_famine_rate": round_famine_rate,
+            "workers": workers,
         },
-        "summary": {
-            "states": state_count,
-            "records": record_count,
-            "searched_states": searched_count,
-            "forced_states": forced_count,
-            "soft_target_states": soft_target_count,
-            "skipped_low_signal_states": skipped_low_signal_count,
-            "phase_record_counts": dict(sorted(phase_record_counts.items())),
-            "phase_skipped_counts": dict(sorted(phase_skipped_counts.items())),
-        },
+        "summary": summary,
     }
 
 
@@ -2276,12 +2551,18 @@ def _record_object_batch(
     count = int(tokens.get("count", 0))
     max_tokens = max(1, count)
 
+    # Values may be JSON lists or NumPy views from a trajectory shard.
     def long_row(key: str) -> torch.Tensor:
-        values = list(tokens.get(key, []))[:count] + [0] * max(0, max_tokens - count)
-        return torch.tensor([values], dtype=torch.long, device=device)
-
-    scalars = list(tokens.get("scalars", []))[: count * OBJECT_SCALAR_COUNT]
-    scalars += [0.0] * max(0, max_tokens * OBJECT_SCALAR_COUNT - len(scalars))
+        row = torch.zeros((1, max_tokens), dtype=torch.long)
+        if count:
+            row[0, :count] = torch.as_tensor(tokens.get(key, [])[:count])
+        return row.to(device)
+
+    scalars = torch.zeros((max_tokens * OBJECT_SCALAR_COUNT,), dtype=torch.float32)
+    stored = torch.as_tensor(
+        tokens.get("scalars", [])[: count * OBJECT_SCALAR_COUNT], dtype=torch.float32
+    )
+    scalars[: stored.numel()] = stored
     padding = torch.ones((1, max_tokens), dtype=torch.bool, device=device)
     if count:
         padding[0, :count] = False
@@ -2292,9 +2573,7 @@ def _record_object_batch(
         long_row("suit_ids"),
         long_row("value_ids"),
         long_row("index_ids"),
-        torch.tensor(scalars, dtype=torch.float32, device=device).view(
-            1, max_tokens, OBJECT_SCALAR_COUNT
-        ),
+        scalars.view(1, max_tokens, OBJECT_SCALAR_COUNT).to(device),
         padding,
     )
 
@@ -2316,20 +2595,23 @@ def _record_action_batch(
         "plot_value_ids",
         "plot_zone_ids",
     ]
-    action_scalars = list(features_record.get("action_scalars", []))
+    action_scalars = torch.as_tensor(
+        features_record.get("action_scalars", []), dtype=torch.float32
+    )
     stored_scalar_count = int(features_record.get("action_scalar_count", 0))
     scalar_tensor = torch.zeros((count, ACTION_SCALAR_COUNT), dtype=torch.float32)
-    if stored_scalar_count > 0 and action_scalars:
+    if stored_scalar_count > 0 and action_scalars.numel():
         scalar_count = min(stored_scalar_count, ACTION_SCALAR_COUNT)
         expected = count * stored_scalar_count
-        values = action_scalars[:expected] + [0.0] * max(0, expected - len(action_scalars))
+        values = torch.zeros((expected,), dtype=torch.float32)
+        stored = action_scalars[:expected]
+        values[: stored.numel()] = stored
         scalar_tensor[:, :scalar_count].copy_(
-            torch.tensor(values, dtype=torch.float32)
-            .view(count, stored_scalar_count)[:, :scalar_count]
+            values.view(count, stored_scalar_count)[:, :scalar_count]
         )
     return (
         *(
-        torch.tensor(features_record[key], dtype=torch.long, device=device)
+        torch.as_tensor(features_record[key], dtype=torch.long).to(device)
         for key in keys
         ),
         scalar_tensor.to(device),
@@ -2341,6 +2623,13 @@ def _load_supervised_records(
 ) -> list[dict[str, Any]]:
     records: list[dict[str, Any]] = []
     for path in paths:
+        shard = open_trajectory_shard(path)
+        if shard is not None:
+            for index in range(len(shard)):
+                records.append(shard.record(index))
+                if limit is not None and len(records) >= limit:
+                    return records
+            continue
         with path.open("r", encoding="utf-8") as handle:
             for line in handle:
                 if not line.strip():
@@ -2381,34 +2670,6 @@ def _supervised_record_phase(record: dict[str, Any]) -> str:
     return "unknown"
 
 
-def _supervised_phase_counts(records: list[dict[str, Any]]) -> dict[str, int]:
-    counts: dict[str, int] = {}
-    for record in records:
-        phase = _supervised_record_phase(record)
-        counts[phase] = counts.get(phase, 0) + 1
-    return dict(sorted(counts.items()))
-
-
-def _weighted_supervised_epoch_records(
-    records: list[dict[str, Any]],
-    phase_sample_weights: dict[str, float] | None,
-    rng: random.Random,
-) -> list[dict[str, Any]]:
-    if not phase_sample_weights:
-        epoch_records = list(records)
-        rng.shuffle(epoch_records)
-        return epoch_records
-    weights = [
-        max(0.0, float(phase_sample_weights.get(_supervised_record_phase(record), 1.0)))
-        for record in records
-    ]
-    if not records or sum(weights) <= 0.0:
-        return []
-    epoch_records = rng.choices(records, weights=weights, k=len(records))
-    rng.shuffle(epoch_records)
-    return epoch_records
-
-
 def pretrain_torch_policy_from_trajectories(
     *,
     trajectory_paths: list[Path],
@@ -2452,19 +2713,19 @@ def pretrain_torch_policy_from_trajectories(
         model, artifact = load_torch_policy(start_model_path, device)
         if transformer_dropout is not None:
             model.set_transformer_dropout(transformer_dropout)
-    records = _load_supervised_records(trajectory_paths, limit_states)
-    if not records:
+    dataset = SupervisedTrajectoryDataset(
+        trajectory_paths, phase_of=_supervised_record_phase, limit=limit_states
+    )
+    if not len(dataset):
         raise ValueError("no supervised trajectory records found")
-    phase_counts = _supervised_phase_counts(records)
+    phase_counts = dataset.phase_counts()
     optimizer = torch.optim.Adam(model.parameters(), lr=learning_rate)
     updates: list[dict[str, float]] = []
     model.train()
     rng = random.Random(0x51A7E)
     for epoch in range(1, epochs + 1):
-        epoch_records = _weighted_supervised_epoch_records(
-            records, phase_sample_weights, rng
-        )
-        if not epoch_records:
+        epoch_indices = dataset.epoch_indices(phase_sample_weights, rng)
+        if not epoch_indices:
             raise ValueError("phase sampling produced no supervised records")
         total_loss = 0.0
         total_policy_loss = 0.0
@@ -2477,8 +2738,7 @@ def pretrain_torch_policy_from_trajectories(
         total_policy_weight = 0.0
         total_skipped_policy_targets = 0
         total_states = 0
-        for start in range(0, len(epoch_records), batch_size):
-            batch = epoch_records[start : start + batch_size]
+        for batch in dataset.batches(epoch_indices, batch_size):
             losses = []
             policy_losses = []
             value_losses = []
@@ -2487,15 +2747,17 @@ def pretrain_torch_policy_from_trajectories(
             for record in batch:
                 feature_record = record["features"]
                 count = int(feature_record["candidate_count"])
-                features = torch.tensor(
-                    feature_record["features"], dtype=torch.float32, device=device
-                ).view(count, int(feature_record["input_size"]))
+                features = (
+                    torch.as_tensor(feature_record["features"], dtype=torch.float32)
+                    .view(count, int(feature_record["input_size"]))
+                    .to(device)
+                )
                 player_ids = torch.full(
                     (count,), int(record["player_id"]), dtype=torch.long, device=device
                 )
-                action_heads = torch.tensor(
-                    feature_record["action_heads"], dtype=torch.long, device=device
-                )
+                action_heads = torch.as_tensor(
+                    feature_record["action_heads"], dtype=torch.long
+                ).to(device)
                 group_ids = torch.zeros((count,), dtype=torch.long, device=device)
                 object_batch = (
                     _record_object_batch(record, device)
@@ -2677,8 +2939,8 @@ def pretrain_torch_policy_from_trajectories(
                         "q_value_loss_weight": q_value_loss_weight,
                         "phase_sample_weights": phase_sample_weights or {},
                         "phase_record_counts": phase_counts,
-                        "states": len(records),
-                        "epoch_states": len(epoch_records),
+                        "states": len(dataset),
+                        "epoch_states": len(epoch_indices),
                     },
                     "progress": {
                         "completed_epochs": epoch,
@@ -2717,8 +2979,8 @@ def pretrain_torch_policy_from_trajectories(
             "q_value_loss_weight": q_value_loss_weight,
             "phase_sample_weights": phase_sample_weights or {},
             "phase_record_counts": phase_counts,
-            "states": len(records),
-            "epoch_states": len(records),
+            "states": len(dataset),
+            "epoch_states": len(dataset),
         },
         "updates": updates,
         "summary": updates[-1],
@@ -2865,6 +3127,7 @@ def distill_action_transformer_policy(
         _spawn_distill_env(engine, seed + offset)
         for offset in range(max(1, rollout_envs))
     ]
+    workspaces = [DenseFeatureWorkspace() for _ in envs]
     next_seed = seed + len(envs)
     completed_states = 0
     update_records: list[dict[str, Any]] = []
@@ -2918,11 +3181,16 @@ def distill_action_transformer_policy(
                         progressed = True
                         continue
                     candidates = engine.dense_policy_action_features(
-                        pointer, player_id=player_id, input_size=model.input_size
+                        pointer,
+                        player_id=player_id,
+                        input_size=model.input_size,
+                        workspace=workspaces[env_index],
                     )
                     if candidates:
                         object_tokens = engine.dense_object_tokens(
-                            pointer, perspective_player=player_id
+                            pointer,
+                            perspective_player=player_id,
+                            workspace=workspaces[env_index],
                         )
                         groups.append((env_index, candidates, player_id, object_tokens))
                         progressed = True
@@ -3596,15 +3864,67 @@ def run_torch_games_batched(
                 "score_snapshots": [
                     _score_snapshot(engine, pointer, seat=seat, action_index=0)
                 ],
+                "workspace": DenseFeatureWorkspace(),
                 "done": False,
             }
         )
     complete: list[dict[str, Any] | None] = [None] * len(envs)
+    # One ctypes call per step applies every chosen action and plays heuristic
+    # seats. Pausing at each new year keeps score snapshots and curriculum cutoffs
+    # identical to stepping each engine from Python. Candidates come back in the
+    # batch unless the opponent expects a different input size.
+    batched_candidates = (
+        opponent_model is None or opponent_model.input_size == model.input_size
+    )
+    batch = VectorEnvBatch(
+        len(envs),
+        input_size=model.input_size if batched_candidates else 0,
+        object_tokens=batched_candidates
+        and (
+            model.uses_object_tokens
+            or (opponent_model is not None and opponent_model.uses_object_tokens)
+        ),
+        stop_on_year_change=True,
+    )
+    all_seats = (1 << PLAYER_COUNT) - 1
+    for env_index, env in enumerate(envs):
+        batch.engines[env_index] = env["pointer"]
+        batch.decision_seats[env_index] = (
+            all_seats if opponent_model is not None else 1 << int(env["seat"])
+        )
+    pending = [False] * len(envs)
+
+    def finish(env_index: int) -> None:
+        env = envs[env_index]
+        complete[env_index] = _game_result(
+            engine,
+            env["pointer"],
+            seed=int(env["seed"]),
+            seat=int(env["seat"]),
+            actions=int(env["actions"]),
+            log_probs=env["log_probs"],
+            values=env["values"],
+            entropies=env["entropies"],
+            phase_ids=env["phase_ids"],
+            kl_terms=env["kl_terms"],
+            ppo_samples=env["ppo_samples"],
+            score_snapshots=env["score_snapshots"],
+        )
+        env["done"] = True
+        batch.engines[env_index] = None
+        engine.free_engine(env["pointer"])
+
+    def queue_action(env_index: int, action: KCAction) -> None:
+        batch.set_action(env_index, action)
+        pending[env_index] = True
+        envs[env_index]["actions"] = int(envs[env_index]["actions"]) + 1
+
     try:
         for _ in range(2000):
             if all(env["done"] for env in envs):
                 return [item for item in complete if item is not None]
 
+            engine.step_vector_envs(batch)
             model_groups: list[
                 tuple[int, DensePolicyActionFeatures, int, DenseObjectTokens | None]
             ] = []
@@ -3616,6 +3936,24 @@ def run_torch_games_batched(
                 if env["done"]:
                     continue
                 pointer = env["pointer"]
+                status = int(batch.apply_errors[env_index])
+                if status != 0:
+                    raise RuntimeError(
+                        f"C engine rejected AI action with status {status}"
+                    )
+                automatic = int(batch.automatic_actions[env_index])
+                acted = pending[env_index] or automatic > 0
+                pending[env_index] = False
+                env["actions"] = int(env["actions"]) + automatic
+                if acted:
+                    _append_score_snapshot(
+                        env["score_snapshots"],
+                        engine,
+                        pointer,
+                        seat=int(env["seat"]),
+                        action_index=len(env["log_probs"]),
+                    )
+                    progressed = True
                 if _curriculum_complete(
                     engine,
                     pointer,
@@ -3623,109 +3961,58 @@ def run_torch_games_batched(
                     round_curriculum=use_round_curriculum,
                     curriculum_rounds=curriculum_rounds,
                 ):
-                    complete[env_index] = _game_result(
-                        engine,
-                        pointer,
-                        seed=int(env["seed"]),
-                        seat=int(env["seat"]),
-                        actions=int(env["actions"]),
-                        log_probs=env["log_probs"],
-                        values=env["values"],
-                        entropies=env["entropies"],
-                        phase_ids=env["phase_ids"],
-                        kl_terms=env["kl_terms"],
-                        ppo_samples=env["ppo_samples"],
-                        score_snapshots=env["score_snapshots"],
-                    )
-                    env["done"] = True
-                    engine.free_engine(pointer)
+                    finish(env_index)
                     progressed = True
                     continue
-                player_id = engine.waiting_player(pointer)
+                player_id = int(batch.waiting_players[env_index])
                 if player_id < 0:
-                    complete[env_index] = _game_result(
-                        engine,
-                        pointer,
-                        seed=int(env["seed"]),
-                        seat=int(env["seat"]),
-                        actions=int(env["actions"]),
-                        log_probs=env["log_probs"],
-                        values=env["values"],
-                        entropies=env["entropies"],
-                        phase_ids=env["phase_ids"],
-                        kl_terms=env["kl_terms"],
-                        ppo_samples=env["ppo_samples"],
-                        score_snapshots=env["score_snapshots"],
-                    )
-                    env["done"] = True
-                    engine.free_engine(pointer)
+                    finish(env_index)
                     progressed = True
                     continue
-                if player_id == env["seat"]:
-                    candidates = engine.dense_policy_action_features(
-                        pointer, player_id=player_id, input_size=model.input_size
+                if batch.decision_seats[env_index] & (1 << player_id):
+                    policy = (
+                        opponent_model
+                        if opponent_model is not None and player_id != env["seat"]
+                        else model
                     )
-                    if candidates:
+                    if batched_candidates:
+                        candidates = batch.candidates(env_index)
                         object_tokens = (
-                            engine.dense_object_tokens(
-                                pointer, perspective_player=player_id
-                            )
-                            if model.uses_object_tokens
+                            batch.object_tokens(env_index)
+                            if policy.uses_object_tokens
                             else None
                         )
-                        model_groups.append(
-                            (env_index, candidates, player_id, object_tokens)
+                    else:
+                        candidates = engine.dense_policy_action_features(
+                            pointer,
+                            player_id=player_id,
+                            input_size=policy.input_size,
+                            workspace=env["workspace"],
                         )
-                        continue
-                elif opponent_model is not None:
-                    candidates = engine.dense_policy_action_features(
-                        pointer,
-                        player_id=player_id,
-                        input_size=opponent_model.input_size,
-                    )
-                    if candidates:
                         object_tokens = (
                             engine.dense_object_tokens(
-                                pointer, perspective_player=player_id
+                                pointer,
+                                perspective_player=player_id,
+                                workspace=env["workspace"],
                             )
-                            if opponent_model.uses_object_tokens
+                            if candidates and policy.uses_object_tokens
                             else None
                         )
-                        opponent_groups.append(
-                            (env_index, candidates, player_id, object_tokens)
-                        )
+                    if candidates:
+                        groups = model_groups if policy is model else opponent_groups
+                        groups.append((env_index, candidates, player_id, object_tokens))
                         continue
-                try:
-                    action = engine.heuristic_action(pointer)
-                except RuntimeError:
-                    complete[env_index] = _game_result(
-                        engine,
-                        pointer,
-                        seed=int(env["seed"]),
-                        seat=int(env["seat"]),
-                        actions=int(env["actions"]),
-                        log_probs=env["log_probs"],
-                        values=env["values"],
-                        entropies=env["entropies"],
-                        phase_ids=env["phase_ids"],
-                        kl_terms=env["kl_terms"],
-                        ppo_samples=env["ppo_samples"],
-                        score_snapshots=env["score_snapshots"],
-                    )
-                    env["done"] = True
-                    engine.free_engine(pointer)
+                    if not batched_candidates:
+                        try:
+                            queue_action(env_index, engine.heuristic_action(pointer))
+                        except RuntimeError:
+                            finish(env_index)
+                        progressed = True
+                        continue
+                if not acted:
+                    # Nothing moved since the last step: the heuristic cannot act.
+                    finish(env_index)
                     progressed = True
-                    continue
-                engine.apply_policy_action(pointer, action)
-                env["actions"] = int(env["actions"]) + 1
-                _append_score_snapshot(
-                    env["score_snapshots"],
-                    engine,
-                    pointer,
-                    seat=int(env["seat"]),
-                    action_index=len(env["log_probs"]),
-                )
-                progressed = True
 
             def apply_scored_groups(
                 policy: TorchPolicy,
@@ -3754,7 +4041,7 @@ def run_torch_games_batched(
                         selected_tensor = distribution.sample()
                         selected = int(selected_tensor.item())
                         old_log_prob = distribution.log_prob(selected_tensor)
-                        phase_id = engine.phase(envs[env_index]["pointer"])
+                        phase_id = int(batch.phases[env_index])
                         envs[env_index]["log_probs"].append(old_log_prob)
                         envs[env_index]["values"].append(values[group_index])
                         envs[env_index]["entropies"].append(distribution.entropy())
@@ -3786,17 +4073,7 @@ def run_torch_games_batched(
                             )
                     else:
                         selected = int(torch.argmax(logits).item())
-                    engine.apply_policy_action(
-                        envs[env_index]["pointer"], candidates.action_at(selected)
-                    )
-                    envs[env_index]["actions"] = int(envs[env_index]["actions"]) + 1
-                    _append_score_snapshot(
-                        envs[env_index]["score_snapshots"],
-                        engine,
-                        envs[env_index]["pointer"],
-                        seat=int(envs[env_index]["seat"]),
-                        action_index=len(envs[env_index]["log_probs"]),
-                    )
+                    queue_action(env_index, candidates.action_at(selected))
                 progressed = True
 
             if sample:
@@ -4099,6 +4376,7 @@ def torch_benchmark_candidate(
             "promotion_min_bootstrap_samples": promotion_min_bootstrap_samples,
             "paired_same_seed": True,
             "rotated_seats": True,
+            "bootstrap": "python",
             "primary_objective": decision["primary_objective"],
             "guardrails": ["rank_delta", "margin_delta"],
             "candidate_pool": decision["candidate_pool"],
@@ -4134,60 +4412,14 @@ def torch_benchmark_candidate(
     return record
 
 
-def _rounded_float_payload(values: list[Any]) -> list[float]:
-    return [round(float(value), 6) for value in values]
-
-
-def _trajectory_oracle_state_key(
-    *,
-    player_id: int,
-    phase_id: int,
-    features_record: dict[str, Any],
-) -> str:
-    object_tokens = features_record.get("object_tokens") or {}
-    payload = {
-        "player_id": int(player_id),
-        "phase_id": int(phase_id),
-        "candidate_count": int(features_record.get("candidate_count", 0)),
-        "input_size": int(features_record.get("input_size", INPUT_SIZE)),
-        "action_heads": list(features_record.get("action_heads", [])),
-        "kind_ids": list(features_record.get("kind_ids", [])),
-        "player_ids": list(features_record.get("player_ids", [])),
-        "suit_ids": list(features_record.get("suit_ids", [])),
-        "target_suit_ids": list(features_record.get("target_suit_ids", [])),
-        "card_suit_ids": list(features_record.get("card_suit_ids", [])),
-        "card_value_ids": list(features_record.get("card_value_ids", [])),
-        "hand_suit_ids": list(features_record.get("hand_suit_ids", [])),
-        "hand_value_ids": list(features_record.get("hand_value_ids", [])),
-        "plot_suit_ids": list(features_record.get("plot_suit_ids", [])),
-        "plot_value_ids": list(features_record.get("plot_value_ids", [])),
-        "plot_zone_ids": list(features_record.get("plot_zone_ids", [])),
-        "action_scalar_count": int(features_record.get("action_scalar_count", 0)),
-        "action_scalars": _rounded_float_payload(
-            list(features_record.get("action_scalars", []))
-        ),
-        "features": _rounded_float_payload(list(features_record.get("features", []))),
-        "object_tokens": {
-            "count": int(object_tokens.get("count", 0)),
-            "type_ids": list(object_tokens.get("type_ids", [])),
-            "owner_ids": list(object_tokens.get("owner_ids", [])),
-            "zone_ids": list(object_tokens.get("zone_ids", [])),
-            "suit_ids": list(object_tokens.get("suit_ids", [])),
-            "value_ids": list(object_tokens.get("value_ids", [])),
-            "index_ids": list(object_tokens.get("index_ids", [])),
-            "scalars": _rounded_float_payload(list(object_tokens.get("scalars", []))),
-        },
-    }
-    data = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return hashlib.sha256(data).hexdigest()
-
-
 def _build_trajectory_oracle_table(
     trajectory_paths: list[Path],
-) -> tuple[dict[str, tuple[int, ...]], dict[str, Any]]:
+) -> tuple[dict[bytes, tuple[int, ...]], dict[str, Any]]:
+    from .trajectory_oracle_index import record_state_key
+
     records = _load_supervised_records(trajectory_paths)
-    table: dict[str, tuple[int, ...]] = {}
-    margins: dict[str, float] = {}
+    table: dict[bytes, tuple[int, ...]] = {}
+    margins: dict[bytes, float] = {}
     conflicts = 0
     malformed = 0
     phase_counts: dict[str, int] = {}
@@ -4196,7 +4428,7 @@ def _build_trajectory_oracle_table(
             features_record = record["features"]
             player_id = int(record["player_id"])
             phase_id = int(record.get("phase_id", 0))
-            key = _trajectory_oracle_state_key(
+            key = record_state_key(
                 player_id=player_id,
                 phase_id=phase_id,
                 features_record=features_record,
@@ -4224,6 +4456,22 @@ def _build_trajectory_oracle_table(
     }
 
 
+def _load_trajectory_oracle_index(
+    trajectory_paths: list[Path], index_path: Path | None
+) -> TrajectoryOracleIndex:
+    from .trajectory_oracle_index import TrajectoryOracleIndex
+
+    if index_path is not None:
+        index = TrajectoryOracleIndex.load(index_path, sources=trajectory_paths)
+        if index is not None:
+            return index
+    table, summary = _build_trajectory_oracle_table(trajectory_paths)
+    index = TrajectoryOracleIndex.from_table(table, summary)
+    if index_path is not None:
+        index.save(index_path, sources=trajectory_paths)
+    return index
+
+
 def _baseline_policy_action_or_heuristic(
     engine: CEngine,
     pointer: Any,
@@ -4247,7 +4495,7 @@ def _baseline_policy_action_or_heuristic(
 def _run_trajectory_oracle_game(
     engine: CEngine,
     *,
-    oracle_table: dict[str, tuple[int, ...]],
+    oracle_index: TrajectoryOracleIndex,
     baseline_model: TorchPolicy | None,
     seed: int,
     model_seat: int,
@@ -4257,6 +4505,8 @@ def _run_trajectory_oracle_game(
     round_plot_cards: int,
     round_famine_rate: float,
 ) -> dict[str, Any]:
+    from .trajectory_oracle_index import dense_state_key
+
     pointer = engine.new_engine(
         seed,
         round_curriculum=round_curriculum,
@@ -4286,12 +4536,14 @@ def _run_trajectory_oracle_game(
                 object_tokens = engine.dense_object_tokens(
                     pointer, perspective_player=player_id
                 )
-                key = _trajectory_oracle_state_key(
-                    player_id=player_id,
-                    phase_id=phase_id,
-                    features_record=_dense_features_record(candidates, object_tokens),
+                target_signature = oracle_index.get(
+                    dense_state_key(
+                        player_id=player_id,
+                        phase_id=phase_id,
+                        candidates=candidates,
+                        object_tokens=object_tokens,
+                    )
                 )
-                target_signature = oracle_table.get(key)
                 selected_action: KCAction | None = None
                 if target_signature is not None:
                     for index in range(len(candidates)):
@@ -4363,11 +4615,11 @@ def trajectory_oracle_benchmark(
     round_plot_cards: int = 0,
     round_famine_rate: float = 0.0,
     include_games: bool = False,
+    oracle_index_path: Path | None = None,
     progress_callback: Callable[[dict[str, Any]], None] | None = None,
 ) -> dict[str, Any]:
-    oracle_table, oracle_table_summary = _build_trajectory_oracle_table(
-        trajectory_paths
-    )
+    oracle_index = _load_trajectory_oracle_index(trajectory_paths, oracle_index_path)
+    oracle_table_summary = oracle_index.summary
     device = best_device(prefer_mps)
     baseline = None
     if baseline_path is not None:
@@ -4387,7 +4639,7 @@ def trajectory_oracle_benchmark(
         for game_seed, seat in chunk:
             candidate_games_by_key[(game_seed, seat)] = _run_trajectory_oracle_game(
                 engine,
-                oracle_table=oracle_table,
+                oracle_index=oracle_index,
                 baseline_model=baseline,
                 seed=game_seed,
                 model_seat=seat,
@@ -5026,6 +5278,107 @@ def _paired_eval_in_memory(
     }
 
 
+_EVAL_ENGINE: CEngine | None = None
+_EVAL_BASELINES: dict[str, TorchPolicy] = {}
+
+
+def _init_training_eval_worker(library_path: str) -> None:
+    global _EVAL_ENGINE
+    # The training process keeps running alongside; leave it half of the cores.
+    torch.set_num_threads(max(1, torch.get_num_threads() // 2))
+    _EVAL_ENGINE = CEngine(Path(library_path))
+
+
+def _training_eval_worker(
+    *,
+    snapshot: bytes,
+    checkpoint_path: str | None,
+    baseline_path: str | None,
+    prefer_mps: bool,
+    **options: Any,
+) -> dict[str, Any]:
+    if _EVAL_ENGINE is None:
+        raise RuntimeError("training evaluation worker was not initialized")
+    device = best_device(prefer_mps)
+    candidate = TorchPolicy.from_checkpoint(io.BytesIO(snapshot), device)
+    baseline = None
+    if baseline_path is not None:
+        baseline = _EVAL_BASELINES.get(baseline_path)
+        if baseline is None:
+            baseline, _ = load_torch_policy(Path(baseline_path), device)
+            _EVAL_BASELINES[baseline_path] = baseline
+    return _paired_eval_in_memory(
+        _EVAL_ENGINE,
+        candidate=candidate,
+        baseline=baseline,
+        baseline_path=Path(baseline_path) if baseline_path is not None else None,
+        checkpoint_path=Path(checkpoint_path) if checkpoint_path is not None else None,
+        device=device,
+        **options,
+    )
+
+
+def _checkpoint_snapshot(model: TorchPolicy) -> bytes:
+    # Serialize now: the optimizer keeps mutating the live parameters in place.
+    buffer = io.BytesIO()
+    model.save_checkpoint(buffer)
+    return buffer.getvalue()
+
+
+class _BackgroundEvaluator:
+    """Run periodic training evals on model snapshots in a worker process.
+
+    The worker owns its own engine and rebuilds each candidate from an in-memory
+    snapshot, so training continues while the games run and nothing extra is
+    written to disk. Results come back in submission order, which keeps patience
+    and best-checkpoint selection identical to inline evals.
+    """
+
+    def __init__(self, engine: CEngine, *, prefer_mps: bool) -> None:
+        self.prefer_mps = prefer_mps
+        executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_training_eval_worker,
+            initargs=(os.fspath(engine.library_path),),
+        )
+        self._submit = executor.submit
+        self._pending: list[Any] = []
+        # Also stops the worker when training raises before close() is reached.
+        self.close = weakref.finalize(
+            self, executor.shutdown, wait=False, cancel_futures=True
+        )
+
+    def submit(
+        self,
+        *,
+        snapshot: bytes,
+        checkpoint_path: Path | None,
+        baseline_path: Path | None,
+        **options: Any,
+    ) -> None:
+        self._pending.append(
+            self._submit(
+                _training_eval_worker,
+                snapshot=snapshot,
+                checkpoint_path=os.fspath(checkpoint_path)
+                if checkpoint_path is not None
+                else None,
+                baseline_path=os.fspath(baseline_path)
+                if baseline_path is not None
+                else None,
+                prefer_mps=self.prefer_mps,
+                **options,
+            )
+        )
+
+    def completed(self, *, wait: bool = False) -> list[dict[str, Any]]:
+        records = []
+        while self._pending and (wait or self._pending[0].done()):
+            records.append(self._pending.pop(0).result())
+        return records
+
+
 def _torch_training_progress(
     *,
     model: TorchPolicy,
@@ -6114,6 +6467,7 @@ def train_torch_policy(
     eval_include_heuristic: bool = False,
     select_best_eval_checkpoint: bool = False,
     eval_patience: int = 0,
+    async_eval: bool = False,
     round_curriculum: bool = False,
     curriculum_schedule: str = "constant",
     curriculum_rounds: int = 2,
@@ -6219,6 +6573,60 @@ def train_torch_policy(
     best_eval_score: tuple[float, float, float, int] | None = None
     evals_since_improvement = 0
     early_stop: dict[str, Any] | None = None
+    background_eval = (
+        _BackgroundEvaluator(engine, prefer_mps=prefer_mps)
+        if async_eval and eval_interval > 0
+        else None
+    )
+
+    def absorb_evals(new_evals: list[dict[str, Any]]) -> dict[str, Any] | None:
+        nonlocal best_eval_score, evals_since_improvement
+        stop: dict[str, Any] | None = None
+        for eval_record in new_evals:
+            if (
+                stop is not None
+                and eval_record["completed_episodes"] != stop["evaluated_episodes"]
+            ):
+                # Inline evals would have stopped training before this one ran.
+                break
+            eval_records.append(eval_record)
+            if record_eval_history:
+                append_history(
+                    {
+                        **eval_record,
+                        "training_output_model": str(output_path),
+                        "training_start_model": str(start_model_path)
+                        if start_model_path
+                        else "scratch",
+                        "training_seed": seed,
+                        "engine": asdict(engine.provenance()),
+                    }
+                )
+            if (
+                stop is not None
+                or eval_patience <= 0
+                or eval_record.get("comparison") == "heuristic"
+            ):
+                continue
+            score = _primary_eval_score(eval_record)
+            if best_eval_score is None or score > best_eval_score:
+                best_eval_score = score
+                evals_since_improvement = 0
+            else:
+                evals_since_improvement += 1
+            if evals_since_improvement >= eval_patience:
+                stop = {
+                    "reason": "eval_patience",
+                    "patience": eval_patience,
+                    "completed_episodes": completed,
+                    "evaluated_episodes": eval_record["completed_episodes"],
+                    "best_score": list(best_eval_score)
+                    if best_eval_score is not None
+                    else None,
+                    "latest_score": list(score),
+                }
+        return stop
+
     initial_curriculum_rounds = _scheduled_curriculum_rounds(
         episode=1,
         episodes=episodes,
@@ -6699,6 +7107,7 @@ def train_torch_policy(
                     {key: value for key, value in update.items() if key != "episode"}
                 )
             pending_episodes.clear()
+        new_evals: list[dict[str, Any]] = []
         if next_eval_episode is not None and completed >= next_eval_episode:
             while next_eval_episode is not None and completed >= next_eval_episode:
                 next_eval_episode += eval_interval
@@ -6710,6 +7119,9 @@ def train_torch_policy(
                     / f"{output_path.stem}_ep{completed}.pt"
                 )
                 model.save_checkpoint(checkpoint_path)
+            snapshot = (
+                _checkpoint_snapshot(model) if background_eval is not None else None
+            )
             eval_specs: list[tuple[TorchPolicy | None, Path | None, str, str]] = []
             if eval_baseline is not None or eval_baseline_path is not None:
                 eval_specs.append(
@@ -6717,8 +7129,7 @@ def train_torch_policy(
                 )
             if eval_include_heuristic or not eval_specs:
                 eval_specs.append((None, None, "heuristic", "heuristic"))
-            new_primary_evals: list[dict[str, Any]] = []
-            if progress_callback is not None:
+            if progress_callback is not None and background_eval is None:
                 progress_callback(
                     _torch_training_progress(
                         model=model,
@@ -6786,55 +7197,38 @@ def train_torch_policy(
                 comparison,
                 comparison_label,
             ) in eval_specs:
-                eval_record = _paired_eval_in_memory(
-                    engine,
-                    candidate=model,
-                    baseline=baseline_model,
-                    baseline_path=baseline_path,
-                    comparison=comparison,
-                    comparison_label=comparison_label,
-                    checkpoint_path=checkpoint_path,
-                    completed_episodes=completed,
-                    games_per_seat=eval_games_per_seat,
-                    seed=eval_seed + completed,
-                    bootstrap_samples=eval_bootstrap_samples,
-                    rollout_envs=rollout_envs,
-                    device=device,
-                )
-                eval_records.append(eval_record)
-                if eval_record.get("comparison") != "heuristic":
-                    new_primary_evals.append(eval_record)
-                if record_eval_history:
-                    append_history(
-                        {
-                            **eval_record,
-                            "training_output_model": str(output_path),
-                            "training_start_model": str(start_model_path)
-                            if start_model_path
-                            else "scratch",
-                            "training_seed": seed,
-                            "engine": asdict(engine.provenance()),
-                        }
+                eval_options = {
+                    "comparison": comparison,
+                    "comparison_label": comparison_label,
+                    "completed_episodes": completed,
+                    "games_per_seat": eval_games_per_seat,
+                    "seed": eval_seed + completed,
+                    "bootstrap_samples": eval_bootstrap_samples,
+                    "rollout_envs": rollout_envs,
+                }
+                if background_eval is not None and snapshot is not None:
+                    background_eval.submit(
+                        snapshot=snapshot,
+                        checkpoint_path=checkpoint_path,
+                        baseline_path=baseline_path,
+                        **eval_options,
                     )
-            if eval_patience > 0:
-                for eval_record in new_primary_evals:
-                    score = _primary_eval_score(eval_record)
-                    if best_eval_score is None or score > best_eval_score:
-                        best_eval_score = score
-                        evals_since_improvement = 0
-                    else:
-                        evals_since_improvement += 1
-                    if evals_since_improvement >= eval_patience:
-                        early_stop = {
-                            "reason": "eval_patience",
-                            "patience": eval_patience,
-                            "completed_episodes": completed,
-                            "best_score": list(best_eval_score)
-                            if best_eval_score is not None
-                            else None,
-                            "latest_score": list(score),
-                        }
-                        break
+                    continue
+                new_evals.append(
+                    _paired_eval_in_memory(
+                        engine,
+                        candidate=model,
+                        baseline=baseline_model,
+                        baseline_path=baseline_path,
+                        checkpoint_path=checkpoint_path,
+                        device=device,
+                        **eval_options,
+                    )
+                )
+        if background_eval is not None:
+            new_evals.extend(background_eval.completed())
+        if new_evals:
+            early_stop = absorb_evals(new_evals)
             if progress_callback is not None:
                 progress_callback(
                     _torch_training_progress(
@@ -6898,6 +7292,11 @@ def train_torch_policy(
                 )
             if early_stop is not None:
                 break
+    if background_eval is not None:
+        if early_stop is None:
+            # Training is done; the evals still in flight decide the final record.
+            early_stop = absorb_evals(background_eval.completed(wait=True))
+        background_eval.close()
 
     summary = {
         "episodes": episodes,
@@ -7077,6 +7476,7 @@ def train_torch_policy(
             "eval_seed": eval_seed,
             "eval_bootstrap_samples": eval_bootstrap_samples,
             "eval_patience": eval_patience,
+            "async_eval": async_eval,
             "eval_baseline_model": str(eval_baseline_path)
             if eval_baseline_path
             else "heuristic",
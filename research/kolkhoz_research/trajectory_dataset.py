@@ -0,0 +1,209 @@
+"""Streaming access to supervised trajectory corpora larger than memory."""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import random
+import threading
+import weakref
+from array import array
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .trajectory_shards import TrajectoryShard
+
+
+DEFAULT_PREFETCH_BATCHES = 4
+_END = object()
+
+
+def open_trajectory_shard(path: Path) -> TrajectoryShard | None:
+    """Open ``path`` as a columnar shard, or return None for a JSONL file.
+
+    Shards need NumPy, so it is only imported once a shard directory is found.
+    """
+
+    if not path.is_dir():
+        return None
+    from .trajectory_shards import TrajectoryShard, is_trajectory_shard
+
+    return TrajectoryShard(path) if is_trajectory_shard(path) else None
+
+
+class _JsonlSource:
+    """Byte-offset index over the non-blank lines of one JSONL file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.starts = array("q")
+        self.ends = array("q")
+        self._fd = os.open(path, os.O_RDONLY)
+        weakref.finalize(self, os.close, self._fd)
+
+    def scan(self) -> Iterator[tuple[int, bytes]]:
+        offset = 0
+        with self.path.open("rb") as handle:
+            for line in handle:
+                start = offset
+                offset += len(line)
+                if not line.strip():
+                    continue
+                self.starts.append(start)
+                self.ends.append(offset)
+                yield len(self.starts) - 1, line
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def record(self, index: int) -> dict[str, Any]:
+        start = self.starts[index]
+        return json.loads(os.pread(self._fd, self.ends[index] - start, start))
+
+
+class SupervisedTrajectoryDataset:
+    """Index over supervised records in JSONL files and trajectory shards.
+
+    Indexing reads every record once but keeps only its location and phase; records
+    are decoded again on access. ``batches`` decodes ahead on a background thread.
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[Path],
+        *,
+        phase_of: Callable[[Mapping[str, Any]], str],
+        limit: int | None = None,
+    ) -> None:
+        self._sources: list[_JsonlSource | TrajectoryShard] = []
+        self._source_ids = array("I")
+        self._positions = array("q")
+        self._phase_ids = array("H")
+        self._phases: list[str] = []
+        phase_ids: dict[str, int] = {}
+
+        def add(position: int, record: Mapping[str, Any]) -> bool:
+            phase = phase_of(record)
+            if phase not in phase_ids:
+                phase_ids[phase] = len(self._phases)
+                self._phases.append(phase)
+            self._source_ids.append(len(self._sources) - 1)
+            self._positions.append(position)
+            self._phase_ids.append(phase_ids[phase])
+            return limit is not None and len(self._positions) >= limit
+
+        for path in paths:
+            if limit is not None and len(self._positions) >= limit:
+                break
+            shard = open_trajectory_shard(path)
+            if shard is not None:
+                self._sources.append(shard)
+                for index in range(len(shard)):
+                    if add(index, shard.record(index)):
+                        break
+            else:
+                source = _JsonlSource(path)
+                self._sources.append(source)
+                for index, line in source.scan():
+                    if add(index, json.loads(line)):
+                        break
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __getitem__(self, index: int) -> dict[str, Any]:
+        source = self._sources[self._source_ids[index]]
+        return source.record(self._positions[index])
+
+    def phase(self, index: int) -> str:
+        return self._phases[self._phase_ids[index]]
+
+    def phase_counts(self) -> dict[str, int]:
+        counts = [0] * len(self._phases)
+        for phase_id in self._phase_ids:
+            counts[phase_id] += 1
+        return dict(sorted(zip(self._phases, counts)))
+
+    def epoch_indices(
+        self,
+        phase_sample_weights: Mapping[str, float] | None,
+        rng: random.Random,
+    ) -> list[int]:
+        """Record order for one epoch, optionally resampled by phase weight.
+
+        Draws the same rng sequence as shuffling or ``rng.choices`` over the
+        records themselves, so a seeded run visits records in the same order.
+        """
+        if not phase_sample_weights:
+            indices = list(range(len(self)))
+            rng.shuffle(indices)
+            return indices
+        phase_weights = [
+            max(0.0, float(phase_sample_weights.get(phase, 1.0)))
+            for phase in self._phases
+        ]
+        weights = [phase_weights[phase_id] for phase_id in self._phase_ids]
+        if not weights or sum(weights) <= 0.0:
+            return []
+        indices = rng.choices(range(len(self)), weights=weights, k=len(self))
+        rng.shuffle(indices)
+        return indices
+
+    def batches(
+        self,
+        indices: Sequence[int],
+        batch_size: int,
+        *,
+        prefetch: int = DEFAULT_PREFETCH_BATCHES,
+    ) -> Iterator[list[dict[str, Any]]]:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        starts = range(0, len(indices), batch_size)
+        if prefetch <= 0:
+            for start in starts:
+                yield [self[index] for index in indices[start : start + batch_size]]
+            return
+
+        pending: queue.Queue[object] = queue.Queue(maxsize=prefetch)
+        stopped = threading.Event()
+
+        def put(item: object) -> bool:
+            while not stopped.is_set():
+                try:
+                    pending.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for start in starts:
+                    batch = [
+                        self[index] for index in indices[start : start + batch_size]
+                    ]
+                    if not put(batch):
+                        return
+            except Exception as error:
+                put(error)
+                return
+            put(_END)
+
+        thread = threading.Thread(
+            target=produce, name="kolkhoz-trajectory-prefetch", daemon=True
+        )
+        thread.start()
+        try:
+            while True:
+                item = pending.get()
+                if item is _END:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item  # type: ignore[misc]
+        finally:
+            stopped.set()
+            thread.join()
@@ -0,0 +1,262 @@
+"""Binary state keys and a persistent lookup index for the trajectory oracle.
+
+A state key is a 16-byte BLAKE2b digest over the canonical little-endian bytes of
+a decision's dense features: integer id columns as ``<i4`` and float columns
+quantized to millionths as ``<i8``. Record dicts (JSONL lists or shard NumPy
+views) and live engine buffers hash to the same key without building any
+intermediate Python lists.
+
+The index is a directory holding a sorted key column and the matching action
+signatures as raw column files, memory-mapped on load. ``manifest.json`` is
+written last and records a fingerprint of the trajectory sources, so an index
+whose sources changed is rebuilt rather than reused.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .c_engine import OBJECT_SCALAR_COUNT, DenseObjectTokens, DensePolicyActionFeatures
+from .model import INPUT_SIZE
+from .trajectory_shards import CANDIDATE_ID_COLUMNS, OBJECT_ID_COLUMNS
+
+INDEX_FORMAT = "kolkhoz-trajectory-oracle-index-v1"
+KEY_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+KEY_SIZE = 16
+KEY_DTYPE = np.dtype(f"S{KEY_SIZE}")
+INT_DTYPE = np.dtype("<i4")
+QUANTIZED_DTYPE = np.dtype("<i8")
+HEADER_DTYPE = np.dtype("<i8")
+SIGNATURE_DTYPE = np.dtype("<i4")
+FLOAT_SCALE = 1_000_000.0
+
+
+def _int_column(values: Any, count: int | None = None) -> np.ndarray:
+    if count is not None:
+        if count <= 0:
+            return np.empty(0, dtype=INT_DTYPE)
+        # ctypes arrays expose the buffer protocol: view them without a Python loop.
+        values = np.frombuffer(values, dtype=INT_DTYPE.newbyteorder("="), count=count)
+    return np.asarray(values, dtype=INT_DTYPE).reshape(-1)
+
+
+def _float_column(values: Any, count: int | None = None) -> np.ndarray:
+    if count is not None:
+        if count <= 0:
+            return np.empty(0, dtype=QUANTIZED_DTYPE)
+        values = np.frombuffer(values, dtype=np.dtype("=f4"), count=count)
+    # Millionths match the six-decimal rounding of the original JSON keys.
+    scaled = np.rint(np.asarray(values, dtype=np.float64).reshape(-1) * FLOAT_SCALE)
+    return scaled.astype(QUANTIZED_DTYPE)
+
+
+def _state_key(
+    header: Sequence[int],
+    candidate_columns: Iterable[np.ndarray],
+    object_columns: Iterable[np.ndarray],
+) -> bytes:
+    digest = hashlib.blake2b(digest_size=KEY_SIZE)
+    digest.update(np.asarray([KEY_VERSION, *header], dtype=HEADER_DTYPE).tobytes())
+    for column in (*candidate_columns, *object_columns):
+        # Length prefixes keep adjacent columns from trading values.
+        digest.update(np.asarray([column.size], dtype=HEADER_DTYPE).tobytes())
+        digest.update(column.tobytes())
+    return digest.digest()
+
+
+def record_state_key(
+    *, player_id: int, phase_id: int, features_record: Mapping[str, Any]
+) -> bytes:
+    """Key a supervised record's ``features`` as decoded from JSONL or a shard."""
+    tokens = features_record.get("object_tokens") or {}
+    return _state_key(
+        (
+            int(player_id),
+            int(phase_id),
+            int(features_record.get("candidate_count", 0)),
+            int(features_record.get("input_size", INPUT_SIZE)),
+            int(features_record.get("action_scalar_count", 0)),
+            int(tokens.get("count", 0)),
+        ),
+        (
+            *(
+                _int_column(features_record.get(key, ()))
+                for key in CANDIDATE_ID_COLUMNS
+            ),
+            _float_column(features_record.get("action_scalars", ())),
+            _float_column(features_record.get("features", ())),
+        ),
+        (
+            *(_int_column(tokens.get(key, ())) for key in OBJECT_ID_COLUMNS),
+            _float_column(tokens.get("scalars", ())),
+        ),
+    )
+
+
+def dense_state_key(
+    *,
+    player_id: int,
+    phase_id: int,
+    candidates: DensePolicyActionFeatures,
+    object_tokens: DenseObjectTokens | None,
+) -> bytes:
+    """Key live engine buffers; equal to ``record_state_key`` of their record."""
+    count = len(candidates)
+    scalar_count = int(candidates.action_scalar_count)
+    input_size = int(candidates.input_size)
+    token_count = 0 if object_tokens is None else len(object_tokens)
+    if object_tokens is not None:
+        object_columns = (
+            *(
+                _int_column(getattr(object_tokens, key), token_count)
+                for key in OBJECT_ID_COLUMNS
+            ),
+            _float_column(object_tokens.scalars, token_count * OBJECT_SCALAR_COUNT),
+        )
+    else:
+        object_columns = (
+            *(_int_column(()) for _ in OBJECT_ID_COLUMNS),
+            _float_column(()),
+        )
+    return _state_key(
+        (int(player_id), int(phase_id), count, input_size, scalar_count, token_count),
+        (
+            *(
+                _int_column(getattr(candidates, key), count)
+                for key in CANDIDATE_ID_COLUMNS
+            ),
+            _float_column(candidates.action_scalars, count * scalar_count),
+            _float_column(candidates.features, count * input_size),
+        ),
+        object_columns,
+    )
+
+
+def source_fingerprint(paths: Sequence[Path]) -> list[dict[str, Any]]:
+    """Size and mtime of every file behind ``paths``; shard directories are walked."""
+    entries = []
+    for path in paths:
+        files = (
+            sorted(item for item in path.rglob("*") if item.is_file())
+            if path.is_dir()
+            else [path]
+        )
+        for file in files:
+            stat = file.stat()
+            entries.append(
+                {
+                    "path": str(file.resolve()),
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                }
+            )
+    return entries
+
+
+class TrajectoryOracleIndex:
+    """Sorted state keys with the oracle's action signature for each key.
+
+    ``get`` binary-searches the key column, so a loaded index answers lookups
+    straight from the mapped files without materializing a dict.
+    """
+
+    def __init__(
+        self,
+        keys: np.ndarray,
+        signatures: np.ndarray,
+        summary: Mapping[str, Any] | None = None,
+    ) -> None:
+        if len(keys) != len(signatures):
+            raise ValueError(
+                f"index has {len(keys)} keys but {len(signatures)} signatures"
+            )
+        self.keys = keys
+        self.signatures = signatures
+        self.summary = dict(summary or {})
+
+    @classmethod
+    def from_table(
+        cls,
+        table: Mapping[bytes, Sequence[int]],
+        summary: Mapping[str, Any] | None = None,
+    ) -> TrajectoryOracleIndex:
+        keys = np.asarray(list(table), dtype=KEY_DTYPE)
+        width = len(next(iter(table.values()))) if table else 0
+        signatures = np.asarray(list(table.values()), dtype=SIGNATURE_DTYPE).reshape(
+            len(keys), width
+        )
+        order = np.argsort(keys, kind="stable")
+        return cls(keys[order], signatures[order], summary)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def get(self, key: bytes) -> tuple[int, ...] | None:
+        position = int(np.searchsorted(self.keys, key))
+        if position >= len(self.keys):
+            return None
+        # Compare raw bytes: NumPy strips trailing NULs from S-dtype scalars.
+        if self.keys[position : position + 1].tobytes() != key:
+            return None
+        return tuple(int(value) for value in self.signatures[position])
+
+    def save(self, path: Path, *, sources: Sequence[Path]) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+        manifest_path = path / MANIFEST_NAME
+        # Invalidate the old index before its columns are overwritten.
+        manifest_path.unlink(missing_ok=True)
+        np.ascontiguousarray(self.keys, dtype=KEY_DTYPE).tofile(path / "keys.bin")
+        np.ascontiguousarray(self.signatures, dtype=SIGNATURE_DTYPE).tofile(
+            path / "signatures.bin"
+        )
+        manifest = {
+            "format": INDEX_FORMAT,
+            "key_version": KEY_VERSION,
+            "entries": len(self),
+            "signature_width": int(self.signatures.shape[1]),
+            "sources": source_fingerprint(sources),
+            "summary": self.summary,
+        }
+        with manifest_path.open("w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+
+    @classmethod
+    def load(
+        cls, path: Path, *, sources: Sequence[Path]
+    ) -> TrajectoryOracleIndex | None:
+        """Map a saved index, or return ``None`` if it is missing or stale."""
+        manifest_path = path / MANIFEST_NAME
+        if not manifest_path.is_file():
+            return None
+        with manifest_path.open("r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+        if (
+            manifest.get("format") != INDEX_FORMAT
+            or int(manifest.get("key_version", -1)) != KEY_VERSION
+            or manifest.get("sources") != source_fingerprint(sources)
+        ):
+            return None
+        entries = int(manifest["entries"])
+        width = int(manifest["signature_width"])
+        if entries == 0:
+            keys = np.empty(0, dtype=KEY_DTYPE)
+            signatures = np.empty((0, width), dtype=SIGNATURE_DTYPE)
+        else:
+            keys = np.memmap(
+                path / "keys.bin", dtype=KEY_DTYPE, mode="r", shape=(entries,)
+            )
+            signatures = np.memmap(
+                path / "signatures.bin",
+                dtype=SIGNATURE_DTYPE,
+                mode="r",
+                shape=(entries, width),
+            )
+        return cls(keys, signatures, manifest.get("summary"))
@@ -0,0 +1,491 @@
+"""Binary columnar storage for supervised trajectory records.
+
+A shard is a directory. Dense candidate and object-token arrays are stored as raw
+little-endian column files indexed by per-record offsets, the remaining record
+fields as one JSON line per record, and ``manifest.json`` is written last so a
+directory without it is an incomplete shard.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import weakref
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import numpy as np
+
+from .c_engine import OBJECT_SCALAR_COUNT, DenseObjectTokens, DensePolicyActionFeatures
+from .model import FEATURE_VERSION
+
+SHARD_FORMAT = "kolkhoz-trajectory-shard-v1"
+MANIFEST_NAME = "manifest.json"
+RECORDS_NAME = "records.jsonl"
+CANDIDATE_ID_COLUMNS = (
+    "action_heads",
+    "kind_ids",
+    "player_ids",
+    "suit_ids",
+    "target_suit_ids",
+    "card_suit_ids",
+    "card_value_ids",
+    "hand_suit_ids",
+    "hand_value_ids",
+    "plot_suit_ids",
+    "plot_value_ids",
+    "plot_zone_ids",
+)
+OBJECT_ID_COLUMNS = (
+    "type_ids",
+    "owner_ids",
+    "zone_ids",
+    "suit_ids",
+    "value_ids",
+    "index_ids",
+)
+INT_DTYPE = np.dtype("<i4")
+FLOAT_DTYPE = np.dtype("<f4")
+OFFSET_DTYPE = np.dtype("<i8")
+
+
+def is_trajectory_shard(path: Path) -> bool:
+    return (path / MANIFEST_NAME).is_file()
+
+
+def _column_name(group: str, key: str) -> str:
+    return f"{group}.{key}"
+
+
+class TrajectoryShardWriter:
+    """Append supervised records to a new shard directory.
+
+    ``append`` copies dense features straight out of the engine's ctypes buffers;
+    ``append_json`` accepts records already decoded from JSONL.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        input_size: int,
+        engine: Mapping[str, str] | None = None,
+    ) -> None:
+        if is_trajectory_shard(path):
+            raise FileExistsError(f"{path} already contains a trajectory shard")
+        path.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.input_size = input_size
+        self.engine = dict(engine or {})
+        self.action_scalar_count: int | None = None
+        self._records = 0
+        self._candidates = 0
+        self._object_tokens = 0
+        self._candidate_offsets = [0]
+        self._object_offsets = [0]
+        self._object_present: list[int] = []
+        self._metadata_offsets = [0]
+        self._metadata = (path / RECORDS_NAME).open("wb")
+        self._columns: dict[str, BinaryIO] = {}
+        for name in self._column_dtypes():
+            self._columns[name] = (path / f"{name}.bin").open("wb")
+
+    @staticmethod
+    def _column_dtypes() -> dict[str, np.dtype]:
+        columns = {
+            _column_name("candidates", key): INT_DTYPE for key in CANDIDATE_ID_COLUMNS
+        }
+        columns[_column_name("candidates", "action_scalars")] = FLOAT_DTYPE
+        columns[_column_name("candidates", "features")] = FLOAT_DTYPE
+        columns.update(
+            {_column_name("objects", key): INT_DTYPE for key in OBJECT_ID_COLUMNS}
+        )
+        columns[_column_name("objects", "scalars")] = FLOAT_DTYPE
+        return columns
+
+    def __enter__(self) -> TrajectoryShardWriter:
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, traceback: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._close_files()
+
+    def __len__(self) -> int:
+        return self._records
+
+    def append(
+        self,
+        record: Mapping[str, Any],
+        candidates: DensePolicyActionFeatures,
+        object_tokens: DenseObjectTokens | None,
+    ) -> None:
+        count = len(candidates)
+        scalar_count = int(candidates.action_scalar_count)
+        if int(candidates.input_size) != self.input_size:
+            raise ValueError(
+                f"candidate input size {candidates.input_size} does not match "
+                f"shard input size {self.input_size}"
+            )
+        for key in CANDIDATE_ID_COLUMNS:
+            self._write("candidates", key, getattr(candidates, key), INT_DTYPE, count)
+        self._write_scalars(candidates.action_scalars, scalar_count, count)
+        self._write(
+            "candidates",
+            "features",
+            candidates.features,
+            FLOAT_DTYPE,
+            count * self.input_size,
+        )
+        token_count = None
+        if object_tokens is not None:
+            token_count = len(object_tokens)
+            for key in OBJECT_ID_COLUMNS:
+                self._write(
+                    "objects", key, getattr(object_tokens, key), INT_DTYPE, token_count
+                )
+            self._write(
+                "objects",
+                "scalars",
+                object_tokens.scalars,
+                FLOAT_DTYPE,
+                token_count * OBJECT_SCALAR_COUNT,
+            )
+        self._finish_record(record, count, token_count)
+
+    def append_json(self, record: Mapping[str, Any]) -> None:
+        features = record["features"]
+        count = int(features["candidate_count"])
+        if int(features.get("input_size", self.input_size)) != self.input_size:
+            raise ValueError(
+                f"record input size {features.get('input_size')} does not match "
+                f"shard input size {self.input_size}"
+            )
+        for key in CANDIDATE_ID_COLUMNS:
+            self._write("candidates", key, features[key], INT_DTYPE, count)
+        self._write_scalars(
+            features.get("action_scalars", []),
+            int(features.get("action_scalar_count", 0)),
+            count,
+        )
+        self._write(
+            "candidates",
+            "features",
+            features["features"],
+            FLOAT_DTYPE,
+            count * self.input_size,
+        )
+        tokens = features.get("object_tokens")
+        token_count = None
+        if tokens is not None:
+            token_count = int(tokens["count"])
+            for key in OBJECT_ID_COLUMNS:
+                self._write("objects", key, tokens[key], INT_DTYPE, token_count)
+            self._write(
+                "objects",
+                "scalars",
+                tokens["scalars"],
+                FLOAT_DTYPE,
+                token_count * OBJECT_SCALAR_COUNT,
+            )
+        self._finish_record(record, count, token_count)
+
+    def _write(
+        self, group: str, key: str, values: Any, dtype: np.dtype, count: int
+    ) -> None:
+        if count <= 0:
+            return
+        if isinstance(values, (list, tuple)):
+            array = np.asarray(values[:count], dtype=dtype)
+        else:
+            # ctypes arrays expose the buffer protocol: copy without a Python loop.
+            array = np.frombuffer(values, dtype=dtype.newbyteorder("="), count=count)
+        if array.size != count:
+            raise ValueError(
+                f"{group}.{key} holds {array.size} values, expected {count}"
+            )
+        array.astype(dtype, copy=False).tofile(self._columns[_column_name(group, key)])
+
+    def _write_scalars(self, values: Any, scalar_count: int, count: int) -> None:
+        if self.action_scalar_count is None:
+            self.action_scalar_count = scalar_count
+        elif scalar_count != self.action_scalar_count:
+            raise ValueError(
+                f"action scalar count {scalar_count} does not match shard count "
+                f"{self.action_scalar_count}"
+            )
+        self._write(
+            "candidates", "action_scalars", values, FLOAT_DTYPE, count * scalar_count
+        )
+
+    def _finish_record(
+        self, record: Mapping[str, Any], count: int, token_count: int | None
+    ) -> None:
+        metadata = {key: value for key, value in record.items() if key != "features"}
+        line = json.dumps(metadata, sort_keys=True).encode("utf-8") + b"\n"
+        self._metadata.write(line)
+        self._metadata_offsets.append(self._metadata_offsets[-1] + len(line))
+        self._candidates += count
+        self._object_tokens += token_count or 0
+        self._candidate_offsets.append(self._candidates)
+        self._object_offsets.append(self._object_tokens)
+        self._object_present.append(0 if token_count is None else 1)
+        self._records += 1
+
+    def _close_files(self) -> None:
+        self._metadata.close()
+        for handle in self._columns.values():
+            handle.close()
+
+    def close(self) -> None:
+        self._close_files()
+        np.asarray(self._candidate_offsets, dtype=OFFSET_DTYPE).tofile(
+            self.path / "candidate_offsets.bin"
+        )
+        np.asarray(self._object_offsets, dtype=OFFSET_DTYPE).tofile(
+            self.path / "object_offsets.bin"
+        )
+        np.asarray(self._object_present, dtype=np.uint8).tofile(
+            self.path / "object_present.bin"
+        )
+        np.asarray(self._metadata_offsets, dtype=OFFSET_DTYPE).tofile(
+            self.path / "metadata_offsets.bin"
+        )
+        scalar_count = self.action_scalar_count or 0
+        shapes = {
+            _column_name("candidates", key): [self._candidates]
+            for key in CANDIDATE_ID_COLUMNS
+        }
+        shapes[_column_name("candidates", "action_scalars")] = [
+            self._candidates,
+            scalar_count,
+        ]
+        shapes[_column_name("candidates", "features")] = [
+            self._candidates,
+            self.input_size,
+        ]
+        shapes.update(
+            {
+                _column_name("objects", key): [self._object_tokens]
+                for key in OBJECT_ID_COLUMNS
+            }
+        )
+        shapes[_column_name("objects", "scalars")] = [
+            self._object_tokens,
+            OBJECT_SCALAR_COUNT,
+        ]
+        columns = {
+            name: {"dtype": dtype.str, "shape": shapes[name]}
+            for name, dtype in self._column_dtypes().items()
+        }
+        columns["candidate_offsets"] = {
+            "dtype": OFFSET_DTYPE.str,
+            "shape": [self._records + 1],
+        }
+        columns["object_offsets"] = {
+            "dtype": OFFSET_DTYPE.str,
+            "shape": [self._records + 1],
+        }
+        columns["object_present"] = {"dtype": "|u1", "shape": [self._records]}
+        columns["metadata_offsets"] = {
+            "dtype": OFFSET_DTYPE.str,
+            "shape": [self._records + 1],
+        }
+        manifest = {
+            "format": SHARD_FORMAT,
+            "feature_version": FEATURE_VERSION,
+            "engine": self.engine,
+            "records": self._records,
+            "input_size": self.input_size,
+            "action_scalar_count": scalar_count,
+            "object_scalar_count": OBJECT_SCALAR_COUNT,
+            "columns": columns,
+        }
+        with (self.path / MANIFEST_NAME).open("w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2, sort_keys=True)
+            handle.write("\n")
+
+
+class TrajectoryShard:
+    """Memory-mapped reader returning records shaped like decoded JSONL records.
+
+    Dense fields are NumPy views into the mapped columns rather than Python lists,
+    and each record's JSON fields are read on demand by byte offset, so only the
+    pages a caller touches become resident. Reads are safe from several threads.
+    """
+
+    def __init__(self, path: Path) -> None:
+        with (path / MANIFEST_NAME).open("r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+        if manifest.get("format") != SHARD_FORMAT:
+            raise ValueError(f"{path} is not a {SHARD_FORMAT} trajectory shard")
+        if int(manifest.get("feature_version", -1)) != FEATURE_VERSION:
+            raise ValueError(
+                f"{path} has feature version {manifest.get('feature_version')}, "
+                f"expected {FEATURE_VERSION}"
+            )
+        self.path = path
+        self.manifest = manifest
+        self.input_size = int(manifest["input_size"])
+        self.action_scalar_count = int(manifest["action_scalar_count"])
+        self._columns = {
+            name: self._map(name, spec) for name, spec in manifest["columns"].items()
+        }
+        self._metadata_fd = os.open(path / RECORDS_NAME, os.O_RDONLY)
+        weakref.finalize(self, os.close, self._metadata_fd)
+
+    def _map(self, name: str, spec: Mapping[str, Any]) -> np.ndarray:
+        dtype = np.dtype(spec["dtype"])
+        shape = tuple(int(size) for size in spec["shape"])
+        if 0 in shape:
+            return np.empty(shape, dtype=dtype)
+        # Copy-on-write keeps the views writable for torch without touching the file.
+        return np.memmap(self.path / f"{name}.bin", dtype=dtype, mode="c", shape=shape)
+
+    @property
+    def engine(self) -> dict[str, str]:
+        return dict(self.manifest.get("engine") or {})
+
+    def __len__(self) -> int:
+        return int(self.manifest["records"])
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for index in range(len(self)):
+            yield self.record(index)
+
+    def metadata(self, index: int) -> dict[str, Any]:
+        start, stop = (
+            int(value) for value in self._columns["metadata_offsets"][index : index + 2]
+        )
+        return json.loads(os.pread(self._metadata_fd, stop - start, start))
+
+    def features(self, index: int) -> dict[str, Any]:
+        columns = self._columns
+        start, stop = (
+            int(value) for value in columns["candidate_offsets"][index : index + 2]
+        )
+        count = stop - start
+        features: dict[str, Any] = {
+            "candidate_count": count,
+            "input_size": self.input_size,
+            "action_scalar_count": self.action_scalar_count,
+            "action_scalars": columns["candidates.action_scalars"][start:stop].reshape(
+                -1
+            ),
+            "features": columns["candidates.features"][start:stop].reshape(-1),
+            "object_tokens": None,
+        }
+        for key in CANDIDATE_ID_COLUMNS:
+            features[key] = columns[_column_name("candidates", key)][start:stop]
+        if columns["object_present"][index]:
+            first, last = (
+                int(value) for value in columns["object_offsets"][index : index + 2]
+            )
+            tokens: dict[str, Any] = {
+                "count": last - first,
+                "scalars": columns["objects.scalars"][first:last].reshape(-1),
+            }
+            for key in OBJECT_ID_COLUMNS:
+                tokens[key] = columns[_column_name("objects", key)][first:last]
+            features["object_tokens"] = tokens
+        return features
+
+    def record(self, index: int) -> dict[str, Any]:
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        record = dict(self.metadata(index))
+        record["features"] = self.features(index)
+        return record
+
+
+def _jsonable_features(features: Mapping[str, Any]) -> dict[str, Any]:
+    result = {
+        key: value.tolist() if isinstance(value, np.ndarray) else value
+        for key, value in features.items()
+        if key != "object_tokens"
+    }
+    tokens = features.get("object_tokens")
+    result["object_tokens"] = (
+        None
+        if tokens is None
+        else {
+            key: value.tolist() if isinstance(value, np.ndarray) else value
+            for key, value in tokens.items()
+        }
+    )
+    return result
+
+
+def convert_jsonl_to_shard(
+    jsonl_paths: Iterable[Path],
+    output_path: Path,
+    *,
+    engine: Mapping[str, str] | None = None,
+) -> dict[str, Any]:
+    writer: TrajectoryShardWriter | None = None
+    sources = [str(path) for path in jsonl_paths]
+    for source in sources:
+        with Path(source).open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if writer is None:
+                    writer = TrajectoryShardWriter(
+                        output_path,
+                        input_size=int(record["features"]["input_size"]),
+                        engine=engine,
+                    )
+                writer.append_json(record)
+    if writer is None:
+        raise ValueError("no supervised trajectory records found")
+    writer.close()
+    return {
+        "kind": "trajectory_shard_conversion",
+        "status": "converted",
+        "inputs": sources,
+        "output": str(output_path),
+        "format": SHARD_FORMAT,
+        "records": len(writer),
+    }
+
+
+def merge_trajectory_shards(shard_paths: Sequence[Path], output_path: Path) -> int:
+    """Concatenate shards in order into one shard carrying the first's provenance."""
+    if not shard_paths:
+        raise ValueError("no trajectory shards to merge")
+    first = TrajectoryShard(shard_paths[0])
+    with TrajectoryShardWriter(
+        output_path, input_size=first.input_size, engine=first.engine or None
+    ) as writer:
+        for path in shard_paths:
+            shard = TrajectoryShard(path)
+            if shard.input_size != first.input_size:
+                raise ValueError(
+                    f"{path} has input size {shard.input_size}, "
+                    f"expected {first.input_size}"
+                )
+            for record in shard:
+                writer.append_json(record)
+    return len(writer)
+
+
+def convert_shard_to_jsonl(shard_path: Path, output_path: Path) -> dict[str, Any]:
+    shard = TrajectoryShard(shard_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with output_path.open("w", encoding="utf-8") as handle:
+        for index in range(len(shard)):
+            record = dict(shard.metadata(index))
+            record["features"] = _jsonable_features(shard.features(index))
+            handle.write(json.dumps(record, sort_keys=True))
+            handle.write("\n")
+    return {
+        "kind": "trajectory_shard_conversion",
+        "status": "converted",
+        "inputs": [str(shard_path)],
+        "output": str(output_path),
+        "format": "jsonl",
+        "records": len(shard),
+    }
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Decisions/sec for dense feature extraction with fresh buffers vs a workspace."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from research.kolkhoz_research.c_engine import (  # noqa: E402
+    CEngine,
+    DenseFeatureWorkspace,
+    KCControllers,
+)
+from research.kolkhoz_research.model import INPUT_SIZE  # noqa: E402
+
+
+def collect_decisions(engine: CEngine, *, games: int, seed: int) -> list[tuple]:
+    """Clone every policy decision of ``games`` heuristic games."""
+    decisions = []
+    for game in range(games):
+        pointer = engine.new_engine(
+            seed + game, controllers=KCControllers((2, 2, 2, 2))
+        )
+        try:
+            for _ in range(2000):
+                player_id = engine.waiting_player(pointer)
+                if player_id < 0:
+                    break
+                decisions.append((engine.clone_engine(pointer), player_id))
+                engine.apply_policy_action(pointer, engine.heuristic_action(pointer))
+        finally:
+            engine.free_engine(pointer)
+    return decisions
+
+
+def measure(
+    engine: CEngine,
+    decisions: list[tuple],
+    *,
+    workspace: DenseFeatureWorkspace | None,
+    repeats: int,
+) -> float:
+    started = time.perf_counter()
+    for _ in range(repeats):
+        for pointer, player_id in decisions:
+            engine.dense_policy_action_features(
+                pointer, player_id=player_id, input_size=INPUT_SIZE, workspace=workspace
+            )
+            engine.dense_object_tokens(
+                pointer, perspective_player=player_id, workspace=workspace
+            )
+    elapsed = time.perf_counter() - started
+    return len(decisions) * repeats / elapsed if elapsed > 0 else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=20260721)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = CEngine()
+    decisions = collect_decisions(engine, games=args.games, seed=args.seed)
+    try:
+        measure(engine, decisions, workspace=None, repeats=1)
+        fresh = measure(engine, decisions, workspace=None, repeats=args.repeats)
+        reused = measure(
+            engine, decisions, workspace=DenseFeatureWorkspace(), repeats=args.repeats
+        )
+    finally:
+        for pointer, _ in decisions:
+            engine.free_engine(pointer)
+    print(
+        json.dumps(
+            {
+                "decisions": len(decisions),
+                "repeats": args.repeats,
+                "fresh_decisions_per_second": round(fresh, 1),
+                "workspace_decisions_per_second": round(reused, 1),
+                "speedup": round(reused / fresh, 2) if fresh else None,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
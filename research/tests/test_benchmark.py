@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from research.kolkhoz_research.benchmark import (
+    _bootstrap_means,
+    _bootstrap_positive_rate,
+    _ci,
+    benchmark_candidate,
+    run_tournament,
+)
+from research.kolkhoz_research.c_engine import CEngine
+from research.kolkhoz_research.model import PolicyArtifact
+
+
+def _scratch(path: Path, seed: int) -> Path:
+    PolicyArtifact.scratch(hidden_layers=[8], seed=seed, scale=0.2).save(path)
+    return path
+
+
+def test_pooled_benchmark_and_tournament_match_the_serial_run(tmp_path: Path) -> None:
+    engine = CEngine()
+    candidate = _scratch(tmp_path / "candidate.json", 1)
+    baseline = _scratch(tmp_path / "baseline.json", 2)
+    options = {
+        "candidate_path": candidate,
+        "baseline_path": baseline,
+        "games_per_seat": 3,
+        "seed": 4_200,
+        "bootstrap_samples": 50,
+        "bootstrap": "python",
+        "include_games": True,
+    }
+
+    serial = benchmark_candidate(engine, **options)
+    pooled = benchmark_candidate(engine, workers=2, **options)
+
+    assert pooled == serial
+    assert [game["candidate"]["seed"] for game in pooled["games"]] == [
+        4_200 + index for index in range(12)
+    ]
+
+    models = [candidate, baseline, _scratch(tmp_path / "third.json", 3)]
+    assert run_tournament(
+        engine, model_paths=models, baseline_path=None, games_per_seat=1, seed=7, workers=3
+    ) == run_tournament(
+        engine, model_paths=models, baseline_path=None, games_per_seat=1, seed=7
+    )
+
+
+def test_python_bootstrap_reproduces_historical_draws() -> None:
+    values = [float(value % 7 - 3) for value in range(40)]
+    rng = random.Random(99)
+    historical = sorted(
+        sum(values[rng.randrange(len(values))] for _ in values) / len(values)
+        for _ in range(200)
+    )
+
+    interval = _ci(values, 200, 99, bootstrap="python")
+
+    assert interval["low"] == historical[int(0.025 * 199)]
+    assert interval["high"] == historical[int(0.975 * 199)]
+
+
+@pytest.mark.parametrize("bootstrap", ["python", "numpy"])
+def test_stratified_bootstrap_resamples_within_each_seat(bootstrap: str) -> None:
+    if bootstrap == "numpy":
+        pytest.importorskip("numpy")
+    # Seat 0 always wins and seat 1 always loses, so every stratified resample has
+    # exactly half wins; an unstratified resample almost never does.
+    values = [1.0] * 8 + [0.0] * 8
+    seats = [0] * 8 + [1] * 8
+
+    means = _bootstrap_means(values, 64, 5, bootstrap=bootstrap, strata=seats)
+
+    assert means == [0.5] * 64
+    assert _bootstrap_positive_rate(
+        values, 64, 5, 0.49, bootstrap=bootstrap, strata=seats
+    ) == 1.0
+
+
+def test_bootstrap_defaults_to_the_python_engine() -> None:
+    values = [float(index % 7) for index in range(40)]
+
+    assert _ci(values, 200, 9) == _ci(values, 200, 9, bootstrap="python")
+
+
+def test_numpy_bootstrap_matches_python_statistics_and_is_seeded() -> None:
+    pytest.importorskip("numpy")
+    rng = random.Random(3)
+    values = [rng.gauss(0.2, 1.0) for _ in range(300)]
+
+    vectorized = _ci(values, 2000, 17, bootstrap="numpy")
+    reference = _ci(values, 2000, 17, bootstrap="python")
+
+    assert vectorized == _ci(values, 2000, 17, bootstrap="numpy")
+    assert vectorized["mean"] == reference["mean"]
+    assert abs(vectorized["low"] - reference["low"]) < 0.05
+    assert abs(vectorized["high"] - reference["high"]) < 0.05
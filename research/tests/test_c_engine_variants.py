@@ -4,7 +4,10 @@ import ctypes
 import unittest
 
 from research.kolkhoz_research.c_engine import (
+    OBJECT_SCALAR_COUNT,
+    STATE_INPUT_SIZE,
     CEngine,
+    DenseFeatureWorkspace,
     KCAction,
     KCCard,
     KCControllers,
@@ -54,6 +57,67 @@ class VariantEngineTests(unittest.TestCase):
         finally:
             self.engine.free_engine(pointer)
 
+    def test_state_features_into_writes_the_same_values_in_place(self) -> None:
+        pointer = self.engine.new_engine(20260721, controllers=self.controllers)
+        try:
+            expected = self.engine.state_features(pointer, perspective_player=1)
+            size = len(expected)
+            buffer = (ctypes.c_float * (size + 1))(*([-1.0] * (size + 1)))
+            written = self.engine.state_features_into(
+                pointer,
+                ctypes.addressof(buffer),
+                perspective_player=1,
+                input_size=size,
+            )
+            self.assertTrue(written)
+            self.assertEqual(list(buffer[:size]), expected)
+            self.assertEqual(buffer[size], -1.0)
+        finally:
+            self.engine.free_engine(pointer)
+
+    def test_dense_feature_workspace_matches_fresh_buffers(self) -> None:
+        workspace = DenseFeatureWorkspace()
+        pointer = self.engine.new_engine(20260721, controllers=self.controllers)
+        try:
+            for _ in range(12):
+                player_id = self.engine.waiting_player(pointer)
+                fresh = self.engine.dense_policy_action_features(
+                    pointer, player_id=player_id, input_size=STATE_INPUT_SIZE
+                )
+                if player_id < 0 or not fresh:
+                    break
+                reused = self.engine.dense_policy_action_features(
+                    pointer,
+                    player_id=player_id,
+                    input_size=STATE_INPUT_SIZE,
+                    workspace=workspace,
+                )
+                size = len(fresh) * STATE_INPUT_SIZE
+                self.assertEqual(len(reused), len(fresh))
+                self.assertEqual(reused.features[:size], fresh.features[:size])
+                fresh_tokens = self.engine.dense_object_tokens(
+                    pointer, perspective_player=player_id
+                )
+                tokens = self.engine.dense_object_tokens(
+                    pointer, perspective_player=player_id, workspace=workspace
+                )
+                self.assertEqual(len(tokens), len(fresh_tokens))
+                scalar_count = len(tokens) * OBJECT_SCALAR_COUNT
+                self.assertEqual(
+                    tokens.scalars[:scalar_count], fresh_tokens.scalars[:scalar_count]
+                )
+                selected = reused.action_at(len(reused) - 1)
+                self.assertEqual(
+                    bytes(selected), bytes(fresh.action_at(len(fresh) - 1))
+                )
+                self.engine.apply_policy_action(pointer, selected)
+            self.assertIs(
+                workspace.action_buffers(256, STATE_INPUT_SIZE).features,
+                reused.features,
+            )
+        finally:
+            self.engine.free_engine(pointer)
+
     def test_current_trick_winner_updates_when_trump_overtakes_lead(self) -> None:
         pointer = self.engine.new_engine(20260723, controllers=self.controllers)
         try:
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import unittest
+
+from research.kolkhoz_research.c_engine import (
+    STATE_INPUT_SIZE,
+    CEngine,
+    VectorEnvBatch,
+)
+
+
+SEEDS = (11, 12, 13)
+SEAT = 0
+
+
+class VectorEnvStepTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = CEngine()
+
+    def serial_game(
+        self, seed: int, seat: int | None = SEAT
+    ) -> tuple[list[int], int, list[int]]:
+        pointer = self.engine.new_engine(seed)
+        actions = 0
+        years = [self.engine.year(pointer)]
+        try:
+            while (player_id := self.engine.waiting_player(pointer)) >= 0:
+                candidates = (
+                    self.engine.dense_policy_action_features(
+                        pointer, player_id=player_id, input_size=STATE_INPUT_SIZE
+                    )
+                    if player_id == seat
+                    else None
+                )
+                action = (
+                    candidates.action_at(len(candidates) - 1)
+                    if candidates
+                    else self.engine.heuristic_action(pointer)
+                )
+                self.engine.apply_policy_action(pointer, action)
+                actions += 1
+                if self.engine.year(pointer) != years[-1]:
+                    years.append(self.engine.year(pointer))
+            return self.engine.final_scores(pointer), actions, years
+        finally:
+            self.engine.free_engine(pointer)
+
+    def test_vector_step_matches_stepping_each_engine(self) -> None:
+        batch = VectorEnvBatch(
+            len(SEEDS),
+            input_size=STATE_INPUT_SIZE,
+            object_tokens=True,
+            state_input_size=STATE_INPUT_SIZE,
+            stop_on_year_change=True,
+        )
+        pointers = [self.engine.new_engine(seed) for seed in SEEDS]
+        actions = [0] * len(SEEDS)
+        years = [[self.engine.year(pointer)] for pointer in pointers]
+        finished = [False] * len(SEEDS)
+        try:
+            for env_index, pointer in enumerate(pointers):
+                batch.engines[env_index] = pointer
+                batch.decision_seats[env_index] = 1 << SEAT
+            while not all(finished):
+                self.engine.step_vector_envs(batch)
+                for env_index, pointer in enumerate(pointers):
+                    if finished[env_index]:
+                        continue
+                    self.assertEqual(batch.apply_errors[env_index], 0)
+                    actions[env_index] += batch.automatic_actions[env_index]
+                    if batch.years[env_index] != years[env_index][-1]:
+                        years[env_index].append(batch.years[env_index])
+                    player_id = batch.waiting_players[env_index]
+                    if player_id < 0:
+                        finished[env_index] = True
+                        batch.engines[env_index] = None
+                        continue
+                    candidates = batch.candidates(env_index)
+                    if not candidates:
+                        # Paused at the first state of a new year.
+                        continue
+                    self.assertEqual(player_id, SEAT)
+                    expected = self.engine.dense_policy_action_features(
+                        pointer, player_id=SEAT, input_size=STATE_INPUT_SIZE
+                    )
+                    size = len(expected) * STATE_INPUT_SIZE
+                    self.assertEqual(len(candidates), len(expected))
+                    self.assertEqual(
+                        candidates.features[:size], expected.features[:size]
+                    )
+                    tokens = batch.object_tokens(env_index)
+                    expected_tokens = self.engine.dense_object_tokens(
+                        pointer, perspective_player=SEAT
+                    )
+                    self.assertEqual(len(tokens), len(expected_tokens))
+                    state = batch.state_features[
+                        env_index * STATE_INPUT_SIZE : (env_index + 1)
+                        * STATE_INPUT_SIZE
+                    ]
+                    self.assertEqual(
+                        state,
+                        self.engine.state_features(pointer, perspective_player=SEAT),
+                    )
+                    batch.set_action(
+                        env_index, candidates.action_at(len(candidates) - 1)
+                    )
+                    actions[env_index] += 1
+            for env_index, pointer in enumerate(pointers):
+                self.assertEqual(
+                    (
+                        self.engine.final_scores(pointer),
+                        actions[env_index],
+                        years[env_index],
+                    ),
+                    self.serial_game(SEEDS[env_index]),
+                )
+        finally:
+            for pointer in pointers:
+                self.engine.free_engine(pointer)
+
+    def test_engines_without_a_decision_seat_play_to_completion(self) -> None:
+        batch = VectorEnvBatch(1)
+        pointer = self.engine.new_engine(SEEDS[0])
+        try:
+            batch.engines[0] = pointer
+            self.assertEqual(self.engine.step_vector_envs(batch), 0)
+            self.assertEqual(batch.waiting_players[0], -1)
+            self.assertEqual(
+                (self.engine.final_scores(pointer), batch.automatic_actions[0]),
+                self.serial_game(SEEDS[0], seat=None)[:2],
+            )
+        finally:
+            self.engine.free_engine(pointer)
+
+
+if __name__ == "__main__":
+    unittest.main()
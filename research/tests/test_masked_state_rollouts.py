@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from research.kolkhoz_research.c_engine import CEngine  # noqa: E402
+from research.kolkhoz_research.masked_state_policy import (  # noqa: E402
+    KC_PHASE_GAME_OVER,
+    MaskedStatePolicy,
+    _all_external_controllers,
+    _forced_action,
+    _legal_action_map,
+    rollout_masked_episode,
+    rollout_masked_episodes,
+)
+
+
+def _greedy_model() -> MaskedStatePolicy:
+    torch.manual_seed(5)
+    model = MaskedStatePolicy(layer_sizes=[32])
+    with torch.no_grad():
+        # A state-independent preference with wide gaps makes sampling pick the
+        # lowest legal action ID, so both rollouts draw identical games. Lowest
+        # first confirms swaps instead of cycling through swap and undo.
+        model.policy_head.weight.zero_()
+        model.policy_head.bias.copy_(
+            torch.arange(model.action_space_size, dtype=torch.float32) * -100.0
+        )
+    return model.eval()
+
+
+def test_lockstep_rollout_matches_sequential_rollouts() -> None:
+    engine = CEngine()
+    model = _greedy_model()
+    device = torch.device("cpu")
+    seeds = [11, 12, 13]
+
+    sequential = [
+        rollout_masked_episode(engine, model, seed=seed, device=device, temperature=1.0)
+        for seed in seeds
+    ]
+    lockstep = rollout_masked_episodes(
+        engine, model, seeds=seeds, device=device, temperature=1.0
+    )
+
+    assert len(lockstep) == len(sequential)
+    for expected, actual in zip(sequential, lockstep):
+        assert actual.scores == expected.scores
+        assert actual.rewards == expected.rewards
+        assert actual.winner_id == expected.winner_id
+        assert len(actual.transitions) == len(expected.transitions)
+        for want, got in zip(expected.transitions, actual.transitions):
+            assert got.player_id == want.player_id
+            assert got.legal_ids == want.legal_ids
+            assert got.action_id == want.action_id
+            assert got.reward == want.reward
+            assert torch.equal(got.state.cpu(), want.state.cpu())
+            assert got.value == pytest.approx(want.value, abs=1e-5)
+
+
+def test_every_policy_decision_has_a_mapped_action() -> None:
+    engine = CEngine()
+    pointer = engine.new_engine(11, controllers=_all_external_controllers())
+    forced_kinds = set()
+    try:
+        for _ in range(512):
+            phase = engine.phase(pointer)
+            if phase == KC_PHASE_GAME_OVER:
+                break
+            actions = engine.legal_actions(pointer)
+            if not actions:
+                assert engine.step_automatic(pointer) >= 0
+                continue
+            forced = _forced_action(phase, actions)
+            if forced is not None:
+                forced_kinds.add(int(forced.kind))
+                engine.apply_action(pointer, forced)
+                continue
+            legal_ids, by_id = _legal_action_map(actions)
+            assert legal_ids, [int(action.kind) for action in actions]
+            engine.apply_policy_action(pointer, by_id[min(legal_ids)])
+        assert engine.phase(pointer) == KC_PHASE_GAME_OVER
+    finally:
+        engine.free_engine(pointer)
+    # Planning reveals never reach the policy, so the engine must offer them.
+    assert forced_kinds
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from research.kolkhoz_research.c_engine import CEngine  # noqa: E402
+from research.kolkhoz_research.torch_policy import train_torch_policy  # noqa: E402
+
+
+def _train(output_path: Path, *, async_eval: bool) -> dict[str, Any]:
+    return train_torch_policy(
+        CEngine(),
+        start_model_path=None,
+        output_path=output_path,
+        architecture="mlp",
+        layer_sizes=[16],
+        scratch_seed=3,
+        scratch_scale=0.05,
+        episodes=8,
+        batch_size=2,
+        seed=17,
+        learning_rate=1e-3,
+        temperature=1.0,
+        prefer_mps=False,
+        rollout_envs=2,
+        eval_interval=2,
+        eval_games_per_seat=1,
+        eval_bootstrap_samples=10,
+        eval_patience=1,
+        async_eval=async_eval,
+    )
+
+
+def _eval_view(record: dict[str, Any]) -> dict[str, Any]:
+    checkpoint = record["checkpoint_model"]
+    return {
+        "completed_episodes": record["completed_episodes"],
+        "comparison": record["comparison"],
+        "checkpoint_model": Path(checkpoint).name if checkpoint else None,
+        "summary": record["summary"],
+    }
+
+
+def test_async_eval_matches_inline_eval(tmp_path: Path) -> None:
+    inline_output = tmp_path / "inline" / "policy.pt"
+    async_output = tmp_path / "async" / "policy.pt"
+
+    inline = _train(inline_output, async_eval=False)
+    background = _train(async_output, async_eval=True)
+
+    # Results are absorbed in submission order against the same snapshots.
+    assert [_eval_view(record) for record in background["evaluations"]] == [
+        _eval_view(record) for record in inline["evaluations"]
+    ]
+    # Patience trips on the same eval; async mode only learns of it later.
+    assert (background["early_stop"] is None) == (inline["early_stop"] is None)
+    if inline["early_stop"] is not None:
+        for key in ("reason", "evaluated_episodes", "best_score", "latest_score"):
+            assert background["early_stop"][key] == inline["early_stop"][key]
+    assert background["status"] == inline["status"]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from research.kolkhoz_research.c_engine import CEngine  # noqa: E402
+from research.kolkhoz_research.model import HEAD_COUNT, INPUT_SIZE  # noqa: E402
+from research.kolkhoz_research.torch_policy import (  # noqa: E402
+    TorchPolicy,
+    run_torch_game,
+    run_torch_games_batched,
+)
+
+SEEDS = [3, 4, 5, 6]
+SEATS = [0, 1, 2, 3]
+
+
+def _model(seed: int) -> TorchPolicy:
+    model = TorchPolicy.scratch(
+        architecture="mlp",
+        layer_sizes=[16],
+        input_size=INPUT_SIZE,
+        head_count=HEAD_COUNT,
+        seed=seed,
+        scale=0.05,
+        device=torch.device("cpu"),
+    )
+    model.eval()
+    return model
+
+
+def _outcome(game: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: game[key]
+        for key in ("seed", "seat", "actions", "scores", "medals", "winner_id")
+    }
+
+
+@pytest.mark.parametrize(
+    ("opponent", "round_curriculum"),
+    [(False, False), (True, False), (False, True)],
+    ids=["heuristic", "opponent", "curriculum"],
+)
+def test_batched_argmax_games_match_the_per_engine_loop(
+    opponent: bool, round_curriculum: bool
+) -> None:
+    engine = CEngine()
+    model = _model(7)
+    opponent_model = _model(11) if opponent else None
+    options: dict[str, Any] = {
+        "opponent_model": opponent_model,
+        "round_curriculum": round_curriculum,
+        "round_plot_cards": 2 if round_curriculum else 0,
+    }
+
+    with torch.no_grad():
+        sequential = [
+            run_torch_game(engine, model, seed=seed, model_seat=seat, **options)
+            for seed, seat in zip(SEEDS, SEATS)
+        ]
+        batched = run_torch_games_batched(
+            engine, model, seeds=SEEDS, seats=SEATS, **options
+        )
+
+    assert [_outcome(game) for game in batched] == [
+        _outcome(game) for game in sequential
+    ]
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from research.kolkhoz_research.c_engine import CEngine  # noqa: E402
+from research.kolkhoz_research.trajectory_oracle_index import (  # noqa: E402
+    TrajectoryOracleIndex,
+    dense_state_key,
+    record_state_key,
+)
+from research.kolkhoz_research.trajectory_shards import (  # noqa: E402
+    TrajectoryShard,
+    TrajectoryShardWriter,
+    _jsonable_features,
+)
+
+
+def test_record_and_buffer_keys_agree(tmp_path: Path) -> None:
+    engine = CEngine()
+    pointer = engine.new_engine(907)
+    path = tmp_path / "states.kts"
+    dense_keys = []
+    try:
+        with TrajectoryShardWriter(path, input_size=200) as writer:
+            for action_index in range(12):
+                player_id = engine.waiting_player(pointer)
+                if player_id < 0:
+                    break
+                phase_id = engine.phase(pointer)
+                candidates = engine.dense_policy_action_features(
+                    pointer, player_id=player_id, input_size=200
+                )
+                tokens = engine.dense_object_tokens(
+                    pointer, perspective_player=player_id
+                )
+                tokens = tokens if action_index % 3 else None
+                writer.append(
+                    {"player_id": player_id, "phase_id": phase_id},
+                    candidates,
+                    tokens,
+                )
+                dense_keys.append(
+                    dense_state_key(
+                        player_id=player_id,
+                        phase_id=phase_id,
+                        candidates=candidates,
+                        object_tokens=tokens,
+                    )
+                )
+                engine.apply_policy_action(pointer, engine.heuristic_action(pointer))
+    finally:
+        engine.free_engine(pointer)
+
+    shard = TrajectoryShard(path)
+    shard_keys = []
+    json_keys = []
+    for record in shard:
+        shard_keys.append(
+            record_state_key(
+                player_id=record["player_id"],
+                phase_id=record["phase_id"],
+                features_record=record["features"],
+            )
+        )
+        json_keys.append(
+            record_state_key(
+                player_id=record["player_id"],
+                phase_id=record["phase_id"],
+                features_record=json.loads(
+                    json.dumps(_jsonable_features(record["features"]))
+                ),
+            )
+        )
+
+    assert shard_keys == dense_keys
+    assert json_keys == dense_keys
+    assert len(set(dense_keys)) == len(dense_keys)
+    assert all(len(key) == 16 for key in dense_keys)
+
+
+def test_index_round_trips_and_detects_stale_sources(tmp_path: Path) -> None:
+    source = tmp_path / "trajectories.jsonl"
+    source.write_text("{}\n", encoding="utf-8")
+    # Include a digest ending in NUL bytes, which S-dtype scalars would strip.
+    table = {
+        bytes([index]) * 15 + b"\x00": tuple(range(index, index + 11))
+        for index in range(1, 40, 3)
+    }
+    index = TrajectoryOracleIndex.from_table(table, {"records": len(table)})
+    index_path = tmp_path / "oracle.index"
+    index.save(index_path, sources=[source])
+
+    loaded = TrajectoryOracleIndex.load(index_path, sources=[source])
+    assert loaded is not None
+    assert len(loaded) == len(table)
+    assert loaded.summary == {"records": len(table)}
+    for key, signature in table.items():
+        assert loaded.get(key) == signature
+    assert loaded.get(b"\x00" * 16) is None
+    assert loaded.get(b"\xff" * 16) is None
+
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert TrajectoryOracleIndex.load(index_path, sources=[source]) is None
+
+
+def test_empty_index_round_trips(tmp_path: Path) -> None:
+    source = tmp_path / "trajectories.jsonl"
+    source.write_text("", encoding="utf-8")
+    TrajectoryOracleIndex.from_table({}).save(tmp_path / "empty", sources=[source])
+
+    loaded = TrajectoryOracleIndex.load(tmp_path / "empty", sources=[source])
+    assert loaded is not None
+    assert len(loaded) == 0
+    assert loaded.get(b"\x01" * 16) is None
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+import random
+import subprocess
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from research.kolkhoz_research.c_engine import OBJECT_SCALAR_COUNT, CEngine  # noqa: E402
+from research.kolkhoz_research.trajectory_dataset import (  # noqa: E402
+    SupervisedTrajectoryDataset,
+)
+from research.kolkhoz_research.trajectory_shards import (  # noqa: E402
+    TrajectoryShard,
+    TrajectoryShardWriter,
+    convert_jsonl_to_shard,
+    convert_shard_to_jsonl,
+    is_trajectory_shard,
+    merge_trajectory_shards,
+)
+
+
+def _write_engine_shard(
+    path: Path, states: int = 12
+) -> list[tuple[list[float], list[int]]]:
+    engine = CEngine()
+    pointer = engine.new_engine(811)
+    expected: list[tuple[list[float], list[int]]] = []
+    try:
+        with TrajectoryShardWriter(
+            path, input_size=200, engine={"c_sha256": "abc"}
+        ) as writer:
+            for action_index in range(states):
+                player_id = engine.waiting_player(pointer)
+                if player_id < 0:
+                    break
+                candidates = engine.dense_policy_action_features(
+                    pointer, player_id=player_id, input_size=200
+                )
+                tokens = engine.dense_object_tokens(
+                    pointer, perspective_player=player_id
+                )
+                tokens = tokens if action_index % 3 else None
+                writer.append(
+                    {
+                        "action_index": action_index,
+                        "player_id": player_id,
+                        "q_values": None,
+                    },
+                    candidates,
+                    tokens,
+                )
+                expected.append(
+                    (
+                        [
+                            float(candidates.features[index])
+                            for index in range(len(candidates) * 200)
+                        ],
+                        []
+                        if tokens is None
+                        else [
+                            int(tokens.type_ids[index]) for index in range(len(tokens))
+                        ],
+                    )
+                )
+                engine.apply_policy_action(pointer, engine.heuristic_action(pointer))
+    finally:
+        engine.free_engine(pointer)
+    return expected
+
+
+def test_shard_reads_back_engine_buffers_without_loss(tmp_path: Path) -> None:
+    path = tmp_path / "states.kts"
+    expected = _write_engine_shard(path)
+
+    shard = TrajectoryShard(path)
+
+    assert is_trajectory_shard(path)
+    assert len(shard) == len(expected)
+    assert shard.engine == {"c_sha256": "abc"}
+    for index, (features, type_ids) in enumerate(expected):
+        record = shard.record(index)
+        assert record["action_index"] == index
+        assert record["features"]["features"].tolist() == features
+        tokens = record["features"]["object_tokens"]
+        if index % 3:
+            assert tokens["type_ids"].tolist() == type_ids
+            assert tokens["scalars"].shape == (len(type_ids) * OBJECT_SCALAR_COUNT,)
+        else:
+            assert tokens is None
+
+
+def test_jsonl_conversion_round_trips_records_exactly(tmp_path: Path) -> None:
+    shard_path = tmp_path / "states.kts"
+    _write_engine_shard(shard_path)
+    jsonl_path = tmp_path / "states.jsonl"
+
+    convert_shard_to_jsonl(shard_path, jsonl_path)
+    summary = convert_jsonl_to_shard([jsonl_path], tmp_path / "again.kts")
+    convert_shard_to_jsonl(tmp_path / "again.kts", tmp_path / "again.jsonl")
+
+    first = jsonl_path.read_text(encoding="utf-8")
+    assert summary["records"] == len(first.splitlines())
+    assert (tmp_path / "again.jsonl").read_text(encoding="utf-8") == first
+    record = json.loads(first.splitlines()[1])
+    assert isinstance(record["features"]["features"][0], float)
+    assert record["features"]["candidate_count"] * 200 == len(
+        record["features"]["features"]
+    )
+    with pytest.raises(FileExistsError):
+        TrajectoryShardWriter(shard_path, input_size=200)
+
+
+def test_dataset_streams_jsonl_and_shards_with_seeded_phase_sampling(
+    tmp_path: Path,
+) -> None:
+    shard_path = tmp_path / "states.kts"
+    _write_engine_shard(shard_path)
+    jsonl_path = tmp_path / "states.jsonl"
+    convert_shard_to_jsonl(shard_path, jsonl_path)
+    with jsonl_path.open("a", encoding="utf-8") as handle:
+        handle.write("\n")
+
+    def phase_of(record: Mapping[str, Any]) -> str:
+        return "even" if record["action_index"] % 2 == 0 else "odd"
+
+    dataset = SupervisedTrajectoryDataset([jsonl_path, shard_path], phase_of=phase_of)
+    records = [dataset[index] for index in range(len(dataset))]
+    weights = {"even": 3.0, "odd": 0.5}
+
+    assert len(dataset) == 2 * len(TrajectoryShard(shard_path))
+    assert dataset.phase_counts() == {"even": 12, "odd": 12}
+    # Matches drawing directly over the in-memory record list.
+    legacy = random.Random(7)
+    sampled = legacy.choices(
+        records, weights=[weights[phase_of(record)] for record in records], k=24
+    )
+    legacy.shuffle(sampled)
+    indices = dataset.epoch_indices(weights, random.Random(7))
+    assert [records[index] for index in indices] == sampled
+    assert [dataset.phase(index) for index in indices] == [
+        phase_of(record) for record in sampled
+    ]
+
+    prefetched = [
+        [record["action_index"] for record in batch]
+        for batch in dataset.batches(indices, 5)
+    ]
+    inline = [
+        [record["action_index"] for record in batch]
+        for batch in dataset.batches(indices, 5, prefetch=0)
+    ]
+    assert prefetched == inline
+    assert [len(batch) for batch in prefetched] == [5, 5, 5, 5, 4]
+    assert (
+        len(SupervisedTrajectoryDataset([jsonl_path], phase_of=phase_of, limit=5)) == 5
+    )
+
+
+def test_jsonl_dataset_does_not_import_numpy(tmp_path: Path) -> None:
+    jsonl_path = tmp_path / "states.jsonl"
+    jsonl_path.write_text(json.dumps({"action_index": 0}) + "\n", encoding="utf-8")
+    script = (
+        "import sys; sys.modules['numpy'] = None\n"
+        "from pathlib import Path\n"
+        "from research.kolkhoz_research.trajectory_dataset import "
+        "SupervisedTrajectoryDataset\n"
+        f"paths = [Path({str(jsonl_path)!r})]\n"
+        "print(len(SupervisedTrajectoryDataset(paths, phase_of=lambda _: 'all')))\n"
+    )
+
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parents[2],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.strip() == "1"
+
+
+def test_merged_shards_concatenate_records_in_order(tmp_path: Path) -> None:
+    parts = [tmp_path / "states.kts.part-000", tmp_path / "states.kts.part-001"]
+    _write_engine_shard(parts[0], states=5)
+    _write_engine_shard(parts[1], states=9)
+    merged = tmp_path / "states.kts"
+
+    assert merge_trajectory_shards(parts, merged) == 14
+
+    expected = ""
+    for index, part in enumerate(parts):
+        convert_shard_to_jsonl(part, tmp_path / f"part-{index}.jsonl")
+        expected += (tmp_path / f"part-{index}.jsonl").read_text(encoding="utf-8")
+    convert_shard_to_jsonl(merged, tmp_path / "merged.jsonl")
+    assert (tmp_path / "merged.jsonl").read_text(encoding="utf-8") == expected
+    assert TrajectoryShard(merged).engine == {"c_sha256": "abc"}
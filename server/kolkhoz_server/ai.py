@@ -45,6 +45,7 @@ class ModelCache(Generic[Model]):
         self._loader = loader
         self._models: dict[str, Model] = {}
         self._lock = threading.Lock()
+        self._digest: tuple[tuple[tuple[str, int, int], ...], str | None] | None = None
 
     def get(self, controller: str) -> Model:
         cached = self._models.get(controller)
@@ -67,16 +68,34 @@ class ModelCache(Generic[Model]):
             return model
 
     def sha256(self) -> str | None:
-        available = {name: path for name, path in self._paths.items() if path.exists()}
-        if not available:
-            return None
-        digest = hashlib.sha256()
-        for name, path in sorted(available.items()):
-            digest.update(name.encode())
-            with path.open("rb") as handle:
-                for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-                    digest.update(chunk)
-        return digest.hexdigest()
+        """Digest of the configured policy files, rehashed only when one changes."""
+
+        signature = self._signature()
+        cached = self._digest
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        if not signature:
+            value = None
+        else:
+            digest = hashlib.sha256()
+            for name, _, _ in signature:
+                digest.update(name.encode())
+                with self._paths[name].open("rb") as handle:
+                    for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                        digest.update(chunk)
+            value = digest.hexdigest()
+        self._digest = (signature, value)
+        return value
+
+    def _signature(self) -> tuple[tuple[str, int, int], ...]:
+        signature: list[tuple[str, int, int]] = []
+        for name, path in sorted(self._paths.items()):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            signature.append((name, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
 
 
 @dataclass
@@ -176,6 +195,28 @@ class AutomaticAdvancer(Generic[Model]):
         *,
         now: float,
         record: Callable[[JsonObject, str], None],
+        flush: Callable[[], None] | None = None,
+    ) -> int:
+        """Apply up to ``AUTOMATIC_BATCH_LIMIT`` bot moves.
+
+        ``record`` sees each move right after it is applied. ``flush`` runs once
+        afterwards, even when a later move fails, so a caller can buffer the
+        recorded moves and commit them together.
+        """
+
+        try:
+            return self._advance(engine, state, now=now, record=record)
+        finally:
+            if flush is not None:
+                flush()
+
+    def _advance(
+        self,
+        engine: AutomaticEngine[Model],
+        state: AutomaticState,
+        *,
+        now: float,
+        record: Callable[[JsonObject, str], None],
     ) -> int:
         applied = 0
         for _ in range(AUTOMATIC_BATCH_LIMIT):
@@ -9,9 +9,9 @@ import uuid
 from collections import OrderedDict
 from copy import deepcopy
 from datetime import datetime, timezone
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from http import HTTPStatus
-from typing import Mapping
+from typing import Callable, Mapping, Sequence
 from urllib.parse import parse_qs, urlsplit
 
 from .contracts import (
@@ -24,11 +24,18 @@ from .contracts import (
     merge_session_engine_projection,
 )
 from .errors import ServerError
-from .lobby import LobbyRepository, SeatRecord, SeatUnavailable, SessionRecord
+from .lobby import (
+    LobbyRepository,
+    SeatRecord,
+    SeatUnavailable,
+    SessionReadModel,
+    SessionRecord,
+)
 from .matchmaking import Matchmaker, MatchmakingSession, MatchRequest
-from .model import JsonObject
+from .model import GameUpdate, JsonObject
 from .routes import resolve_route
 from .runtime import GameRuntime
+from .store import GameNotFound
 from .social import SocialService
 from .results import ResultsRepository
 from .notifications import NotificationService, NotificationRepository
@@ -43,6 +50,9 @@ REACTION_IDS = frozenset(
     ("comrade", "medal", "protected", "warning", "wheat", "wrecker")
 )
 UPDATE_CONTEXT_CACHE_LIMIT = 256
+UPDATE_SOURCE_TTL_SECONDS = 1.0
+LISTING_SNAPSHOT_TTL_SECONDS = 1.0
+GAME_LOG_WINDOW = 64
 
 
 @dataclass(frozen=True)
@@ -59,6 +69,18 @@ class Response:
     body: object
 
 
+@dataclass(frozen=True)
+class _UpdateSources:
+    """Non-engine inputs of a session update, shared by every viewer of a revision."""
+
+    revision: int
+    expires_at: float
+    model: SessionReadModel
+    player_profiles: list[JsonObject]
+    series: JsonObject | None
+    tournament: JsonObject | None
+
+
 class AuthVerifier:
     def user_id(self, authorization: str | None) -> str | None: ...
 
@@ -112,8 +134,23 @@ class OnlineApplication:
             OrderedDict()
         )
         self._update_context_lock = threading.Lock()
+        self._update_sources: OrderedDict[str, _UpdateSources] = OrderedDict()
+        self._listings: dict[str, tuple[float, list[JsonObject]]] = {}
+        self._listing_locks = {
+            "sessions.list": threading.Lock(),
+            "sessions.watchable": threading.Lock(),
+        }
 
     def dispatch(self, request: Request) -> Response:
+        try:
+            return self._dispatch(request)
+        finally:
+            if request.method != "GET":
+                # Any local write may open, fill or start a table; the next browse
+                # request rebuilds instead of serving a snapshot that predates it.
+                self._listings.clear()
+
+    def _dispatch(self, request: Request) -> Response:
         parsed = urlsplit(request.target)
         route = resolve_route(request.method, parsed.path)
         if route is None:
@@ -146,6 +183,7 @@ class OnlineApplication:
             ).startswith("Bearer khz_")
             if identity_session and self.identity is not None:
                 self.identity.delete_player(deleted_user_id)
+                self._invalidate_auth(deleted_user_id)
                 return Response(HTTPStatus.OK, {"deleted": True})
             if self.accounts is None:
                 raise ServerError(
@@ -156,9 +194,7 @@ class OnlineApplication:
                 self.accounts.delete(deleted_user_id)
             except AccountDeletionError as error:
                 raise ServerError(HTTPStatus.BAD_GATEWAY, str(error)) from error
-            invalidate_user = getattr(self.auth, "invalidate_user", None)
-            if invalidate_user is not None:
-                invalidate_user(deleted_user_id)
+            self._invalidate_auth(deleted_user_id)
             return Response(HTTPStatus.OK, {"deleted": True})
         if operation == "admin.operations":
             admin_id = self._require_user(user_id)
@@ -357,22 +393,25 @@ class OnlineApplication:
                     ),
                 )
             if operation == "identity.email.verify":
-                return Response(
-                    HTTPStatus.OK,
-                    self.identity.verify_email_code(
-                        player_id,
-                        str(request.body.get("email") or ""),
-                        str(request.body.get("code") or ""),
-                        device_id=_header(request.headers, "X-Kolkhoz-Device-ID") or "",
-                    ),
+                verified = self.identity.verify_email_code(
+                    player_id,
+                    str(request.body.get("email") or ""),
+                    str(request.body.get("code") or ""),
+                    device_id=_header(request.headers, "X-Kolkhoz-Device-ID") or "",
                 )
+                # Merging into an existing email account revokes this player's
+                # sessions.
+                self._invalidate_auth(player_id)
+                return Response(HTTPStatus.OK, verified)
             if operation == "identity.links.create":
                 return Response(HTTPStatus.OK, self.identity.create_link(player_id))
             if operation == "identity.links.status":
-                return Response(
-                    HTTPStatus.OK,
-                    self.identity.link_status(player_id, params["requestID"]),
-                )
+                status = self.identity.link_status(player_id, params["requestID"])
+                # Only the poll that completes a link issues the target device a
+                # new token and revokes its previous sessions.
+                if status.get("status") == "approved" and "accessToken" in status:
+                    self._invalidate_auth(player_id)
+                return Response(HTTPStatus.OK, status)
             if operation == "identity.links.cancel":
                 return Response(
                     HTTPStatus.OK,
@@ -396,6 +435,11 @@ class OnlineApplication:
             raise ServerError(HTTPStatus.CONFLICT, str(error)) from error
         raise ServerError(HTTPStatus.NOT_IMPLEMENTED, f"{operation} is not implemented")
 
+    def _invalidate_auth(self, user_id: str) -> None:
+        invalidate_user = getattr(self.auth, "invalidate_user", None)
+        if invalidate_user is not None:
+            invalidate_user(user_id)
+
     def _dispatch_commerce(
         self, operation: str, request: Request, user_id: str | None
     ) -> Response:
@@ -461,18 +505,20 @@ class OnlineApplication:
         if operation == "sessions.list":
             return Response(
                 HTTPStatus.OK,
-                [
-                    self._listing(value, browser_listing=True)
-                    for value in self.lobby.list_open(time.time())
-                ],
+                self._listing_snapshot(
+                    operation,
+                    lambda: self._listings_for(
+                        self.lobby.list_open(time.time()), browser_listing=True
+                    ),
+                ),
             )
         if operation == "sessions.watchable":
             return Response(
                 HTTPStatus.OK,
-                [
-                    self._listing(value)
-                    for value in self.lobby.list_watchable(time.time())
-                ],
+                self._listing_snapshot(
+                    operation,
+                    lambda: self._listings_for(self.lobby.list_watchable(time.time())),
+                ),
             )
         if operation == "sessions.get":
             return Response(
@@ -1040,6 +1086,83 @@ class OnlineApplication:
     def advance_automatic_session(self, session_id: str) -> None:
         self._command_update(session_id, None)
 
+    def advance_automatic_sessions(
+        self, session_ids: Sequence[str]
+    ) -> dict[str, Exception | None]:
+        """Advance many automatic sessions through one batched runtime call.
+
+        Lobby rows, seats and turn deadlines for the whole batch are read in one
+        repository call and changed deadlines are written in another. Only lobbies
+        that may start and games that just finished fall back to per-session
+        synchronization. Returns each session's failure, or ``None`` once its lobby
+        row, result and turn deadline are synchronized. No client update is
+        rendered.
+        """
+        results: dict[str, Exception | None] = {}
+        states = self.lobby.sync_states(list(dict.fromkeys(session_ids)))
+        records: dict[str, SessionRecord] = {}
+        for session_id in session_ids:
+            try:
+                state = states.get(session_id)
+                if state is None:
+                    raise KeyError(session_id)
+                records[session_id] = (
+                    self._sync_lobby(session_id)
+                    if state.record.status == "open"
+                    else state.record
+                )
+            except Exception as error:
+                results[session_id] = error
+        active = [
+            record.session_id
+            for record in records.values()
+            if record.status == "active"
+        ]
+        advance_batch = getattr(self.runtime, "advance_automatic_batch", None)
+        updates: Mapping[str, GameUpdate | Exception] = {}
+        if active and advance_batch is not None:
+            updates = advance_batch(active, now=time.time())
+        deadlines: dict[str, tuple[int | None, float | None]] = {}
+        for session_id, record in records.items():
+            try:
+                update = updates.get(record.session_id)
+                if isinstance(update, Exception):
+                    raise update
+                if update is None:
+                    update = (
+                        self.runtime.advance_and_state(
+                            record.session_id, viewer_id=None, now=time.time()
+                        )
+                        if record.status == "active"
+                        else self.runtime.state(record.session_id, None)
+                    )
+                state = states[session_id]
+                if (
+                    record is not state.record
+                    or optional_int(update.state.get("phase"), -1) == 5
+                ):
+                    # A lobby that just started or a game that just finished
+                    # re-reads the rows it changed.
+                    self._sync_runtime_update(record, update)
+                else:
+                    desired = self._desired_turn_deadline(
+                        record,
+                        state.seats,
+                        update.state.get("waitingPlayer"),
+                        (state.turn_player_id, state.turn_deadline_at),
+                    )
+                    if desired is not None:
+                        deadlines[record.session_id] = desired
+                results[session_id] = None
+            except Exception as error:
+                results[session_id] = error
+        if deadlines:
+            try:
+                self.lobby.set_turn_deadlines(deadlines, now=time.time())
+            except Exception as error:
+                results.update(dict.fromkeys(deadlines, error))
+        return results
+
     def _matchmake(
         self, body: JsonObject, user_id: str | None, device_id: str | None = None
     ) -> JsonObject:
@@ -1133,34 +1256,23 @@ class OnlineApplication:
         request: Request,
         user_id: str | None,
     ) -> object:
-        record = self.lobby.session(params["sessionID"])
         body = request.body
         viewer = optional_int(
             body.get("playerID")
             if operation in {"sessions.actions.submit", "sessions.reactions.submit"}
             else (query.get("viewerID") or [params.get("playerID")])[0]
         )
+        if operation in {
+            "sessions.state",
+            "sessions.actions.legal",
+            "sessions.actions.since",
+        }:
+            return self._game_read(
+                operation, params["sessionID"], viewer, query, request, user_id
+            )
+        record = self.lobby.session(params["sessionID"])
         seats = self.lobby.seats(record.session_id)
         self._authenticate(record.session_id, viewer, request, user_id, seats=seats)
-        if operation == "sessions.state":
-            return self._read_update(record.session_id, viewer)
-        if operation == "sessions.actions.legal":
-            update = self._read_update(record.session_id, viewer)
-            return update["legalActions"]
-        if operation == "sessions.actions.since":
-            after = int((query.get("afterRevision") or ["-1"])[0])
-            current = self._read_update(record.session_id, viewer)
-            after_reaction = optional_int(
-                (query.get("afterReactionRevision") or [None])[0]
-            )
-            return self.runtime.updates_since(
-                record.session_id,
-                after_revision=after,
-                viewer_id=viewer,
-                resync_update=lambda: current,
-                after_reaction_revision=after_reaction,
-                durable_reactions=self.lobby.reactions(record.session_id),
-            )
         if operation == "sessions.actions.submit":
             action = body.get("action")
             if not isinstance(action, dict):
@@ -1320,13 +1432,78 @@ class OnlineApplication:
             "update": self._command_update(record.session_id, host_player_id),
         }
 
-    def _read_update(self, session_id: str, viewer_id: int | None) -> JsonObject:
+    def _game_read(
+        self,
+        operation: str,
+        session_id: str,
+        viewer: int | None,
+        query: dict[str, list[str]],
+        request: Request,
+        user_id: str | None,
+    ) -> object:
+        """Serve a polling read from the runtime and a single lobby read model.
+
+        The seats that authenticate the viewer and the durable reactions come
+        from the same read model that renders the update, so a revision already
+        cached costs no lobby query and a miss costs one.
+        """
+
+        try:
+            runtime_update = self.runtime.state(session_id, viewer)
+        except GameNotFound:
+            # Invite codes still resolve through the lobby.
+            session_id = self.lobby.session(session_id).session_id
+            runtime_update = self.runtime.state(session_id, viewer)
+        sources = self._sources_for_update(
+            session_id, runtime_update.revision, cached=True
+        )
+        model = sources.model
+        try:
+            self._authenticate(
+                model.record.session_id, viewer, request, user_id, seats=model.seats
+            )
+        except (ServerError, SeatUnavailable):
+            # A seat joined, left or re-keyed within the cache TTL: check fresh
+            # seats.
+            sources = self._sources_for_update(
+                session_id, runtime_update.revision, cached=False
+            )
+            model = sources.model
+            self._authenticate(
+                model.record.session_id, viewer, request, user_id, seats=model.seats
+            )
+        current = self._build_update(
+            model.record.session_id,
+            viewer,
+            runtime_update.state,
+            runtime_update.revision,
+            cached=True,
+        )
+        if operation == "sessions.state":
+            return current
+        if operation == "sessions.actions.legal":
+            return current["legalActions"]
+        after = int((query.get("afterRevision") or ["-1"])[0])
+        after_reaction = optional_int((query.get("afterReactionRevision") or [None])[0])
+        return self.runtime.updates_since(
+            model.record.session_id,
+            after_revision=after,
+            viewer_id=viewer,
+            resync_update=lambda: current,
+            after_reaction_revision=after_reaction,
+            durable_reactions=model.reactions,
+        )
+
+    def _read_update(
+        self, session_id: str, viewer_id: int | None, *, cached: bool = False
+    ) -> JsonObject:
         runtime_update = self.runtime.state(session_id, viewer_id)
         return self._build_update(
             session_id,
             viewer_id,
             runtime_update.state,
             runtime_update.revision,
+            cached=cached,
         )
 
     def _command_update(self, session_id: str, viewer_id: int | None) -> JsonObject:
@@ -1351,13 +1528,14 @@ class OnlineApplication:
             )
         else:
             runtime_update = self.runtime.state(record.session_id, viewer_id)
-        self._finalize_if_needed(record, runtime_update.state)
+        self._sync_runtime_update(record, runtime_update)
+        return record.session_id, runtime_update.state, runtime_update.revision
+
+    def _sync_runtime_update(self, record: SessionRecord, update: GameUpdate) -> None:
+        self._finalize_if_needed(record, update.state)
         current = self.lobby.session(record.session_id)
         seats = self.lobby.seats(record.session_id)
-        self._sync_turn_deadline(
-            current, seats, runtime_update.state.get("waitingPlayer")
-        )
-        return record.session_id, runtime_update.state, runtime_update.revision
+        self._sync_turn_deadline(current, seats, update.state.get("waitingPlayer"))
 
     def _build_update(
         self,
@@ -1369,29 +1547,31 @@ class OnlineApplication:
         record: SessionRecord | None = None,
         seats: list[SeatRecord] | None = None,
         turn_state: tuple[int | None, float | None] | None = None,
+        cached: bool = False,
     ) -> JsonObject:
-        record = record or self.lobby.session(session_id)
+        sources = self._sources_for_update(
+            record.session_id if record is not None else session_id,
+            revision,
+            cached=cached,
+        )
+        model = sources.model
+        record = record or model.record
         snapshot = dict(state)
         snapshot.pop("legalActions", None)
-        raw_actions = [
-            event.payload
-            for event in self.runtime.events(
-                record.session_id, after_revision=max(0, revision - 64)
-            )
-        ]
         actions = privacy_safe_action_log(
-            raw_actions,
+            model.actions,
             viewer_id,
             game_over=int(snapshot.get("phase", -1)) == 5,
         )
-        seats = seats if seats is not None else self.lobby.seats(record.session_id)
-        player_profiles = (
-            self.social.player_profiles(seats, record.controllers)
-            if self.social is not None
-            else []
-        )
+        player_profiles = sources.player_profiles
+        if seats is None:
+            seats = model.seats
+        elif seats != model.seats and self.social is not None:
+            player_profiles = self.social.player_profiles(seats, record.controllers)
         turn_player_id, turn_deadline_at = (
-            turn_state if turn_state is not None else self.lobby.turn_state(session_id)
+            turn_state
+            if turn_state is not None
+            else (model.turn_player_id, model.turn_deadline_at)
         )
         base_update = {
             "sessionID": record.session_id,
@@ -1399,12 +1579,12 @@ class OnlineApplication:
             "inviteCode": record.invite_code,
             "started": record.status == "active",
             "lobbyCountdownEndsAt": record.lobby_countdown_ends_at,
-            "reactions": self.lobby.reactions(record.session_id),
+            "reactions": list(model.reactions),
             "variants": record.variants,
             "controllers": record.controllers,
             "ranked": record.ranked,
             "browserJoinable": record.browser_joinable,
-            "playerProfiles": player_profiles,
+            "playerProfiles": list(player_profiles),
             "seatPresence": _seat_presence(seats),
         }
         update = merge_session_engine_projection(
@@ -1417,17 +1597,78 @@ class OnlineApplication:
             turn_player_id=turn_player_id,
             turn_deadline_at=turn_deadline_at,
         )
-        series = self._series_status(record.session_id)
-        if series is not None:
-            update["series"] = series
-        if self.tournaments is not None:
-            tournament = self.tournaments.session_context(session_id=record.session_id)
-            if tournament is not None:
-                update["tournament"] = tournament
+        if sources.series is not None:
+            update["series"] = deepcopy(sources.series)
+        if sources.tournament is not None:
+            update["tournament"] = deepcopy(sources.tournament)
         self._notify_turn(record, seats, turn_player_id, revision)
         self._cache_update_context(update)
         return update
 
+    def _sources_for_update(
+        self, session_id: str, revision: int, *, cached: bool
+    ) -> _UpdateSources:
+        """Return the lobby read model and side lookups for ``revision``.
+
+        Polling readers (``cached``) share one entry per committed revision for a
+        short TTL; every command path reads fresh and replaces that entry, so a
+        local lobby write is visible to the next poll immediately.
+        """
+
+        now = time.monotonic()
+        if cached:
+            with self._update_context_lock:
+                sources = self._update_sources.get(session_id)
+                if (
+                    sources is not None
+                    and sources.revision == revision
+                    and sources.expires_at > now
+                ):
+                    self._update_sources.move_to_end(session_id)
+                    return sources
+        model = self._read_model(session_id, revision)
+        tournament = (
+            self.tournaments.session_context(session_id=model.record.session_id)
+            if self.tournaments is not None
+            else None
+        )
+        sources = _UpdateSources(
+            revision=revision,
+            expires_at=now + UPDATE_SOURCE_TTL_SECONDS,
+            model=model,
+            player_profiles=(
+                self.social.player_profiles(model.seats, model.record.controllers)
+                if self.social is not None
+                else []
+            ),
+            series=self._series_status(model.record.session_id),
+            tournament=tournament,
+        )
+        with self._update_context_lock:
+            self._update_sources[model.record.session_id] = sources
+            self._update_sources.move_to_end(model.record.session_id)
+            while len(self._update_sources) > UPDATE_CONTEXT_CACHE_LIMIT:
+                self._update_sources.popitem(last=False)
+        return sources
+
+    def _read_model(self, session_id: str, revision: int) -> SessionReadModel:
+        after_revision = max(0, revision - GAME_LOG_WINDOW)
+        model = self.lobby.read_model(
+            session_id, after_revision=after_revision, revision=revision
+        )
+        if model.actions is not None:
+            return model
+        return replace(
+            model,
+            actions=[
+                event.payload
+                for event in self.runtime.events(
+                    model.record.session_id, after_revision=after_revision
+                )
+                if event.revision <= revision
+            ],
+        )
+
     def _cached_action_update(
         self,
         record: SessionRecord,
@@ -1635,8 +1876,51 @@ class OnlineApplication:
                     body="The final results are ready.",
                 )
 
-    def _listing(self, record: object, *, browser_listing: bool = False) -> JsonObject:
-        seats = self.lobby.seats(record.session_id)
+    def _listing_snapshot(
+        self, operation: str, build: Callable[[], list[JsonObject]]
+    ) -> list[JsonObject]:
+        """Serve one browse listing to every request within a short TTL.
+
+        Concurrent requests for an expired snapshot wait for a single rebuild
+        instead of each issuing their own listing queries.
+        """
+
+        cached = self._listings.get(operation)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        with self._listing_locks[operation]:
+            cached = self._listings.get(operation)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+            listings = build()
+            self._listings[operation] = (
+                time.monotonic() + LISTING_SNAPSHOT_TTL_SECONDS,
+                listings,
+            )
+            return listings
+
+    def _listings_for(
+        self, records: list[SessionRecord], *, browser_listing: bool = False
+    ) -> list[JsonObject]:
+        seats = self.lobby.seats_for_sessions([record.session_id for record in records])
+        return [
+            self._listing(
+                record,
+                browser_listing=browser_listing,
+                seats=seats.get(record.session_id, []),
+            )
+            for record in records
+        ]
+
+    def _listing(
+        self,
+        record: object,
+        *,
+        browser_listing: bool = False,
+        seats: list[SeatRecord] | None = None,
+    ) -> JsonObject:
+        if seats is None:
+            seats = self.lobby.seats(record.session_id)
         player_profiles = (
             self.social.player_profiles(seats, record.controllers)
             if self.social is not None
@@ -1746,7 +2030,28 @@ class OnlineApplication:
     def _sync_turn_deadline(
         self, record: object, seats: list[SeatRecord], waiting: object
     ) -> tuple[int | None, float | None]:
-        current_player, current_deadline = self.lobby.turn_state(record.session_id)
+        current = self.lobby.turn_state(record.session_id)
+        desired = self._desired_turn_deadline(record, seats, waiting, current)
+        if desired is None:
+            return current
+        self.lobby.set_turn_deadline(
+            record.session_id,
+            desired[0],
+            deadline_at=desired[1],
+            now=time.time(),
+        )
+        return desired
+
+    @staticmethod
+    def _desired_turn_deadline(
+        record: object,
+        seats: list[SeatRecord],
+        waiting: object,
+        current: tuple[int | None, float | None],
+    ) -> tuple[int | None, float | None] | None:
+        """Return the turn deadline to store, or ``None`` if ``current`` holds."""
+
+        current_player, current_deadline = current
         waiting_player = (
             waiting if isinstance(waiting, int) and 0 <= waiting < 4 else None
         )
@@ -1764,15 +2069,8 @@ class OnlineApplication:
         if desired == current_player and (
             desired is None or current_deadline is not None
         ):
-            return current_player, current_deadline
-        deadline = time.time() + 90 if desired is not None else None
-        self.lobby.set_turn_deadline(
-            record.session_id,
-            desired,
-            deadline_at=deadline,
-            now=time.time(),
-        )
-        return desired, deadline
+            return None
+        return desired, time.time() + 90 if desired is not None else None
 
     @staticmethod
     def _update_waits_for_human(
@@ -1829,11 +2127,14 @@ class OnlineApplication:
             raise ServerError(HTTPStatus.UNAUTHORIZED, "missing auth token")
         if seat.user_id is not None and user_id != seat.user_id:
             raise ServerError(HTTPStatus.UNAUTHORIZED, "invalid auth token")
+        # Matching the token hash in the write rejects seats that changed hands
+        # after ``seats`` was read, e.g. from a cached read model.
         self.lobby.touch_seat(
             session_id,
             player_id,
             now=time.time(),
             session_ttl_seconds=self.session_ttl_seconds,
+            token_hash=seat.token_hash,
         )
 
     def authenticate_realtime(
@@ -1878,6 +2179,7 @@ class OnlineApplication:
                 updated = self.social.update_profile(body, user_id=user_id)
                 with self._update_context_lock:
                     self._update_contexts.clear()
+                    self._update_sources.clear()
                 return updated
             except ValueError as error:
                 raise ServerError(HTTPStatus.BAD_REQUEST, str(error)) from error
@@ -2024,8 +2326,12 @@ class _ApplicationMatchmakingRepository:
 
     def open_sessions(self, now: float) -> list[MatchmakingSession]:
         sessions: list[MatchmakingSession] = []
-        for record in self.lobby.list_open(now):
-            seats = self.lobby.seats(record.session_id)
+        records = self.lobby.list_open(now)
+        seats_by_session = self.lobby.seats_for_sessions(
+            [record.session_id for record in records]
+        )
+        for record in records:
+            seats = seats_by_session.get(record.session_id, [])
             sessions.append(
                 MatchmakingSession(
                     record.session_id,
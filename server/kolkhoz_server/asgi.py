@@ -25,6 +25,7 @@ from .distributed import (
     RealtimeSubscriberOverflow,
 )
 from .errors import ServerError
+from .events import decode_viewer_state
 from .metrics import ServerMetrics
 from .store import GameNotFound, RevisionConflict
 
@@ -340,9 +341,7 @@ class ASGIApplication:
             await send({"type": "websocket.close", "code": 1008})
             return
 
-        subscription = await asyncio.to_thread(
-            self.realtime_bus.subscribe, f"session:{match}"
-        )
+        subscription = self.realtime_bus.subscribe(f"session:{match}")
         self.metrics.increment("realtime.connections")
         self.metrics.gauge(
             "realtime.subscribers",
@@ -384,7 +383,7 @@ class ASGIApplication:
         except ServerError:
             await send({"type": "websocket.close", "code": 1008})
         finally:
-            await asyncio.to_thread(subscription.close)
+            subscription.close()
             self.metrics.gauge(
                 "realtime.subscribers",
                 float(getattr(self.realtime_bus, "local_subscriber_count", 0)),
@@ -404,22 +403,36 @@ class ASGIApplication:
     ) -> None:
         stop = asyncio.Event()
         overflow = asyncio.Event()
+        ready = asyncio.Event()
+        # Bus subscriptions wake this loop directly; only plain pollers need a
+        # worker thread.
+        awaitable = getattr(subscription, "receive", None)
+
+        def finish() -> None:
+            stop.set()
+            ready.set()
 
         async def receive_client() -> None:
             while True:
                 message = await receive()
                 if message["type"] == "websocket.disconnect":
-                    stop.set()
+                    finish()
                     return
 
         async def produce() -> None:
             while not stop.is_set():
                 try:
-                    message = await asyncio.to_thread(subscription.poll, 0.25)
+                    if awaitable is not None:
+                        message = await awaitable()
+                        if message is None:
+                            finish()
+                            return
+                    else:
+                        message = await asyncio.to_thread(subscription.poll, 0.25)
                 except RealtimeSubscriberOverflow:
                     self.metrics.increment("realtime.overflow")
                     overflow.set()
-                    stop.set()
+                    finish()
                     return
                 if message is None:
                     continue
@@ -427,8 +440,9 @@ class ASGIApplication:
                 if result in {EnqueueResult.FULL, EnqueueResult.OVERSIZED}:
                     self.metrics.increment("realtime.overflow")
                     overflow.set()
-                    stop.set()
+                    finish()
                     return
+                ready.set()
 
         receiver = asyncio.create_task(receive_client())
         producer = asyncio.create_task(produce())
@@ -436,7 +450,8 @@ class ASGIApplication:
             while not stop.is_set():
                 messages = buffer.drain(16)
                 if not messages:
-                    await asyncio.sleep(0.01)
+                    ready.clear()
+                    await ready.wait()
                     continue
                 highest = max(int(item.payload.get("revision", 0)) for item in messages)
                 if highest <= revision:
@@ -665,10 +680,12 @@ def _direct_committed_updates(
 ) -> tuple[dict[str, Any], dict[str, Any], int] | None:
     """Build normal action frames without another authenticated state request.
 
-    The game owner publishes one privacy-scoped engine projection per player. The
-    gateway selects only the authenticated viewer's projection and carries forward
-    session metadata from the full state sent when the WebSocket connected. Missing
-    projections, revision gaps, and terminal transitions use durable catch-up.
+    The game owner publishes one privacy-scoped engine projection per player,
+    usually as a delta against the previous revision. The gateway decodes only
+    the authenticated viewer's projection, applies it to the snapshot it last
+    sent, and carries forward session metadata from the full state sent when the
+    WebSocket connected. Missing projections, revision gaps, and terminal
+    transitions use durable catch-up.
     """
 
     pending = sorted(
@@ -687,9 +704,15 @@ def _direct_committed_updates(
         if committed_revision != expected:
             return None
         states = message.payload.get("statesByViewer")
-        if not isinstance(states, Mapping):
+        delta = message.payload.get("stateDelta")
+        if isinstance(states, Mapping):
+            raw_state = states.get(str(viewer_id), states.get(viewer_id))
+        elif isinstance(delta, Mapping):
+            raw_state = decode_viewer_state(
+                delta, viewer_id, committed_revision, _viewer_state(latest)
+            )
+        else:
             return None
-        raw_state = states.get(str(viewer_id), states.get(viewer_id))
         action_payload = message.payload.get("payload")
         if not isinstance(raw_state, Mapping) or not isinstance(
             action_payload, Mapping
@@ -754,6 +777,15 @@ def _direct_committed_updates(
     return response, latest, final_revision
 
 
+def _viewer_state(update: Mapping[str, Any]) -> dict[str, Any] | None:
+    snapshot = update.get("snapshot")
+    if not isinstance(snapshot, Mapping):
+        return None
+    # Only the viewer's own legal actions survive projection, which is all the
+    # next projection keeps anyway.
+    return {**snapshot, "legalActions": update.get("legalActions", [])}
+
+
 def _latest_update(
     current: Mapping[str, Any], updates: Mapping[str, Any]
 ) -> dict[str, Any]:
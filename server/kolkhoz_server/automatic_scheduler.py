@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING
 
 from .lobby import LobbyRepository
@@ -18,11 +18,14 @@ class AutomaticTurnScheduler:
         repository: LobbyRepository,
         advance: Callable[[str], None],
         *,
+        advance_batch: Callable[[list[str]], Mapping[str, Exception | None]]
+        | None = None,
         batch_size: int = 64,
         metrics: ServerMetrics | None = None,
     ) -> None:
         self.repository = repository
         self.advance = advance
+        self.advance_batch = advance_batch
         self.batch_size = batch_size
         self.metrics = metrics
         self.consecutive_failures = 0
@@ -33,19 +36,35 @@ class AutomaticTurnScheduler:
         current = time.time() if now is None else now
         completed = 0
         failed = False
-        for session_id in self.repository.automatic_due_sessions(
-            now=current, limit=self.batch_size
-        ):
+        due = self.repository.automatic_due_sessions(now=current, limit=self.batch_size)
+        results: Mapping[str, Exception | None]
+        if self.advance_batch is not None and due:
             try:
-                self.advance(session_id)
+                results = self.advance_batch(due)
+            except Exception as error:
+                results = dict.fromkeys(due, error)
+        else:
+            serial: dict[str, Exception | None] = {}
+            for session_id in due:
+                try:
+                    self.advance(session_id)
+                    serial[session_id] = None
+                except Exception as error:
+                    serial[session_id] = error
+            results = serial
+        for session_id in due:
+            error = results.get(session_id)
+            if error is None:
                 completed += 1
-            except Exception:
-                failed = True
-                logging.exception(
-                    "automatic turn advancement failed for %s", session_id
-                )
-                if self.metrics is not None:
-                    self.metrics.increment("automatic.failures")
+                continue
+            failed = True
+            logging.error(
+                "automatic turn advancement failed for %s",
+                session_id,
+                exc_info=error,
+            )
+            if self.metrics is not None:
+                self.metrics.increment("automatic.failures")
         self.consecutive_failures = self.consecutive_failures + 1 if failed else 0
         if self.metrics is not None:
             self.metrics.gauge("automatic.healthy", int(self.healthy))
@@ -9,6 +9,7 @@ game mutation so a crash between mutation and acknowledgement is harmless.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import threading
@@ -16,7 +17,9 @@ import time
 import uuid
 import zlib
 from collections import deque
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
 from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING, Any, Protocol
 
@@ -44,6 +47,7 @@ class GameCommand:
     fencing_token: int
     expected_revision: int | None = None
     created_at: float = 0.0
+    reply_to: str | None = None
 
     def __post_init__(self) -> None:
         if not self.command_id or not self.session_id or not self.kind:
@@ -85,11 +89,22 @@ class CommandBroker(Protocol):
         self, partition: int, consumer_id: str, timeout_seconds: float
     ) -> CommandDelivery | None: ...
 
+    def receive_batch(
+        self,
+        partitions: Sequence[int],
+        consumer_id: str,
+        timeout_seconds: float,
+        *,
+        count: int = 1,
+    ) -> list[CommandDelivery]: ...
+
     def acknowledge(self, delivery: CommandDelivery) -> None: ...
 
     def retry_or_dead_letter(self, delivery: CommandDelivery, error: str) -> bool: ...
 
-    def store_result(self, result: CommandResult) -> CommandResult: ...
+    def store_result(
+        self, result: CommandResult, *, reply_to: str | None = None
+    ) -> CommandResult: ...
 
     def result(self, command_id: str) -> CommandResult | None: ...
 
@@ -98,6 +113,20 @@ class CommandBroker(Protocol):
     ) -> CommandResult | None: ...
 
 
+class CommandResultListener(Protocol):
+    reply_to: str
+
+    @property
+    def healthy(self) -> bool: ...
+
+    @property
+    def subscriptions(self) -> int: ...
+
+    def register(self, command_id: str) -> Future[CommandResult]: ...
+
+    def discard(self, command_id: str) -> None: ...
+
+
 def session_partition(session_id: str, partition_count: int) -> int:
     """Return a stable partition independent of Python hash randomization."""
     if partition_count <= 0:
@@ -106,18 +135,165 @@ def session_partition(session_id: str, partition_count: int) -> int:
 
 
 class CommandClient:
-    def __init__(self, broker: CommandBroker) -> None:
+    def __init__(
+        self,
+        broker: CommandBroker,
+        listener: CommandResultListener | None = None,
+        *,
+        result_poll_seconds: float = 0.05,
+        max_result_poll_seconds: float = 0.5,
+    ) -> None:
+        if result_poll_seconds <= 0 or max_result_poll_seconds < result_poll_seconds:
+            raise ValueError("result poll intervals must be positive and ordered")
         self._broker = broker
+        self._listener = listener
+        self._result_poll_seconds = result_poll_seconds
+        self._max_result_poll_seconds = max_result_poll_seconds
 
     def execute(self, command: GameCommand, timeout_seconds: float) -> CommandResult:
         cached = self._broker.result(command.command_id)
         if cached is not None:
             return cached
-        self._broker.publish(command)
-        result = self._broker.wait_for_result(command.command_id, timeout_seconds)
-        if result is None:
-            raise CommandTimeout(f"command {command.command_id} timed out")
-        return result
+        if self._listener is None:
+            self._broker.publish(command)
+            result = self._broker.wait_for_result(command.command_id, timeout_seconds)
+            if result is None:
+                raise CommandTimeout(f"command {command.command_id} timed out")
+            return result
+        future, subscriptions = self._submit(command)
+        try:
+            return self._await_result(command, future, subscriptions, timeout_seconds)
+        finally:
+            self._listener.discard(command.command_id)
+
+    def execute_many(
+        self, commands: Sequence[GameCommand], timeout_seconds: float
+    ) -> list[CommandResult | Exception]:
+        """Publish every command, then await them against one shared deadline.
+
+        Commands on different partitions run on their owning workers at the same
+        time, so the wait is bounded by the slowest command rather than the sum.
+        Each entry is the command's result, or the error that publishing or
+        waiting raised for it.
+        """
+
+        deadline = time.monotonic() + max(0.0, timeout_seconds)
+        submitted: list[tuple[Future[CommandResult], int] | Exception | None] = []
+        for command in commands:
+            try:
+                if self._listener is None:
+                    self._broker.publish(command)
+                    submitted.append(None)
+                else:
+                    submitted.append(self._submit(command))
+            except Exception as error:
+                submitted.append(error)
+        results: list[CommandResult | Exception] = []
+        for command, entry in zip(commands, submitted):
+            if isinstance(entry, Exception):
+                results.append(entry)
+                continue
+            remaining = max(0.0, deadline - time.monotonic())
+            try:
+                if entry is None:
+                    result = self._broker.wait_for_result(command.command_id, remaining)
+                    if result is None:
+                        raise CommandTimeout(f"command {command.command_id} timed out")
+                    results.append(result)
+                else:
+                    future, subscriptions = entry
+                    results.append(
+                        self._await_result(command, future, subscriptions, remaining)
+                    )
+            except Exception as error:
+                results.append(error)
+            finally:
+                if self._listener is not None:
+                    self._listener.discard(command.command_id)
+        return results
+
+    async def execute_async(
+        self, command: GameCommand, timeout_seconds: float
+    ) -> CommandResult:
+        """Await a routed command without parking a thread on its completion."""
+
+        if self._listener is None:
+            return await asyncio.to_thread(self.execute, command, timeout_seconds)
+        cached = await asyncio.to_thread(self._broker.result, command.command_id)
+        if cached is not None:
+            return cached
+        future, subscriptions = await asyncio.to_thread(self._submit, command)
+        waiter = asyncio.wrap_future(future)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, timeout_seconds)
+        interval = self._result_poll_seconds
+        try:
+            while True:
+                remaining = deadline - loop.time()
+                await asyncio.wait({waiter}, timeout=max(0.0, min(interval, remaining)))
+                if waiter.done():
+                    return waiter.result()
+                final = remaining <= interval
+                if final or self._reply_may_be_lost(subscriptions):
+                    subscriptions = self._listener.subscriptions
+                    result = await asyncio.to_thread(
+                        self._broker.result, command.command_id
+                    )
+                    if result is not None:
+                        return result
+                if final:
+                    raise CommandTimeout(f"command {command.command_id} timed out")
+                interval = min(interval * 2, self._max_result_poll_seconds)
+        finally:
+            waiter.cancel()
+            self._listener.discard(command.command_id)
+
+    def _submit(self, command: GameCommand) -> tuple[Future[CommandResult], int]:
+        assert self._listener is not None
+        # Read before publishing, so a resubscribe during the round-trip counts.
+        subscriptions = self._listener.subscriptions
+        future = self._listener.register(command.command_id)
+        try:
+            self._broker.publish(replace(command, reply_to=self._listener.reply_to))
+        except Exception:
+            self._listener.discard(command.command_id)
+            raise
+        return future, subscriptions
+
+    def _await_result(
+        self,
+        command: GameCommand,
+        future: Future[CommandResult],
+        subscriptions: int,
+        timeout_seconds: float,
+    ) -> CommandResult:
+        assert self._listener is not None
+        deadline = time.monotonic() + max(0.0, timeout_seconds)
+        interval = self._result_poll_seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                return future.result(timeout=max(0.0, min(interval, remaining)))
+            except FutureTimeout:
+                pass
+            final = remaining <= interval
+            if final or self._reply_may_be_lost(subscriptions):
+                subscriptions = self._listener.subscriptions
+                result = self._broker.result(command.command_id)
+                if result is not None:
+                    return result
+            if final:
+                raise CommandTimeout(f"command {command.command_id} timed out")
+            interval = min(interval * 2, self._max_result_poll_seconds)
+
+    def _reply_may_be_lost(self, subscriptions: int) -> bool:
+        # A reply published while the listener is down or resubscribing is gone,
+        # but its durable result key is not. While the listener stays subscribed
+        # the waits above are local, and only the deadline reads the key.
+        assert self._listener is not None
+        return (
+            not self._listener.healthy or self._listener.subscriptions != subscriptions
+        )
 
 
 class InMemoryCommandBroker:
@@ -197,6 +373,40 @@ class InMemoryCommandBroker:
                     return None
                 self._condition.wait(min(remaining, 0.05))
 
+    def receive_batch(
+        self,
+        partitions: Sequence[int],
+        consumer_id: str,
+        timeout_seconds: float,
+        *,
+        count: int = 1,
+    ) -> list[CommandDelivery]:
+        """Take up to ``count`` deliveries from each partition in one wait."""
+
+        del consumer_id
+        if any(not 0 <= partition < self.partition_count for partition in partitions):
+            raise ValueError("invalid command partition")
+        deadline = self._clock() + max(0.0, timeout_seconds)
+        with self._condition:
+            while True:
+                deliveries: list[CommandDelivery] = []
+                for partition in partitions:
+                    self._redeliver_expired_locked(partition)
+                    queue = self._queues[partition]
+                    for _ in range(min(count, len(queue))):
+                        delivery = queue.popleft()
+                        self._pending[delivery.delivery_id] = (
+                            delivery,
+                            self._clock() + self._visibility_timeout,
+                        )
+                        deliveries.append(delivery)
+                if deliveries:
+                    return deliveries
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    return []
+                self._condition.wait(min(remaining, 0.05))
+
     def acknowledge(self, delivery: CommandDelivery) -> None:
         with self._condition:
             self._pending.pop(delivery.delivery_id, None)
@@ -212,7 +422,10 @@ class InMemoryCommandBroker:
             self._condition.notify_all()
             return True
 
-    def store_result(self, result: CommandResult) -> CommandResult:
+    def store_result(
+        self, result: CommandResult, *, reply_to: str | None = None
+    ) -> CommandResult:
+        del reply_to
         with self._condition:
             canonical = self._results.setdefault(result.command_id, result)
             self._condition.notify_all()
@@ -266,9 +479,12 @@ class RedisStreamsCommandBroker:
         max_stream_length: int = 100_000,
         max_attempts: int = 5,
         visibility_timeout_seconds: float = 30.0,
+        reclaim_interval_seconds: float = 5.0,
         result_ttl_seconds: int = 86_400,
         metrics: ServerMetrics | None = None,
     ) -> None:
+        if reclaim_interval_seconds <= 0:
+            raise ValueError("reclaim_interval_seconds must be positive")
         self._client = client
         self._response_client = response_client or client
         self._namespace = namespace.rstrip(":")
@@ -276,8 +492,14 @@ class RedisStreamsCommandBroker:
         self._max_stream_length = max_stream_length
         self._max_attempts = max_attempts
         self._visibility_ms = int(visibility_timeout_seconds * 1_000)
+        self._reclaim_interval = reclaim_interval_seconds
+        # Each partition has one owning worker thread, so entries are only ever
+        # written by that thread.
+        self._reclaim_due: dict[int, float] = {}
         self._result_ttl = result_ttl_seconds
         self._known_groups: set[int] = set()
+        # Partitions whose pre-upgrade per-partition group still has pending entries.
+        self._legacy_partitions: set[int] = set()
         self._group_lock = threading.Lock()
         self._metrics = metrics
 
@@ -380,6 +602,10 @@ class RedisStreamsCommandBroker:
     ) -> CommandDelivery | None:
         self._ensure_group(partition)
         stream = self._stream(partition)
+        if partition in self._legacy_partitions:
+            legacy = self._reclaim_legacy(partition, consumer_id, 1)
+            if legacy:
+                return legacy[0]
         claimed = self._client.xautoclaim(
             stream,
             self._group(partition),
@@ -401,6 +627,96 @@ class RedisStreamsCommandBroker:
         if not messages:
             return None
         delivery_id, fields = messages[0]
+        return self._delivery(partition, delivery_id, fields)
+
+    def receive_batch(
+        self,
+        partitions: Sequence[int],
+        consumer_id: str,
+        timeout_seconds: float,
+        *,
+        count: int = 1,
+    ) -> list[CommandDelivery]:
+        """Read every owned partition with one blocking ``XREADGROUP``.
+
+        Pending entries whose consumer died are reclaimed with ``XAUTOCLAIM`` only
+        once per ``reclaim_interval_seconds`` per partition, not on every poll.
+        """
+
+        for partition in partitions:
+            self._ensure_group(partition)
+        reclaimed = self._reclaim_expired(partitions, consumer_id, count)
+        if reclaimed:
+            return reclaimed
+        streams = {self._stream(partition): partition for partition in partitions}
+        batches = self._client.xreadgroup(
+            self._group(partitions[0]),
+            consumer_id,
+            {stream: ">" for stream in streams},
+            count=count,
+            block=max(0, int(timeout_seconds * 1_000)),
+        )
+        return [
+            self._delivery(streams[str(stream)], delivery_id, fields)
+            for stream, messages in batches or []
+            for delivery_id, fields in messages
+        ]
+
+    def _reclaim_expired(
+        self, partitions: Sequence[int], consumer_id: str, count: int
+    ) -> list[CommandDelivery]:
+        now = time.monotonic()
+        reclaimed: list[CommandDelivery] = []
+        for partition in partitions:
+            if self._reclaim_due.get(partition, 0.0) > now:
+                continue
+            self._reclaim_due[partition] = now + self._reclaim_interval
+            if partition in self._legacy_partitions:
+                reclaimed.extend(self._reclaim_legacy(partition, consumer_id, count))
+            claimed = self._client.xautoclaim(
+                self._stream(partition),
+                self._group(partition),
+                consumer_id,
+                min_idle_time=self._visibility_ms,
+                start_id="0-0",
+                count=count,
+            )
+            reclaimed.extend(
+                self._delivery(partition, delivery_id, fields)
+                for delivery_id, fields in (claimed[1] if len(claimed) > 1 else [])
+            )
+        return reclaimed
+
+    def _reclaim_legacy(
+        self, partition: int, consumer_id: str, count: int
+    ) -> list[CommandDelivery]:
+        """Take over entries the previous release read but never acknowledged.
+
+        They are claimed after the same visibility timeout as any other pending
+        entry, so a draining old worker can still finish and acknowledge them.
+        """
+
+        stream = self._stream(partition)
+        legacy = self._legacy_group(partition)
+        if not int(self._client.xpending(stream, legacy)["pending"]):
+            self._legacy_partitions.discard(partition)
+            return []
+        claimed = self._client.xautoclaim(
+            stream,
+            legacy,
+            consumer_id,
+            min_idle_time=self._visibility_ms,
+            start_id="0-0",
+            count=count,
+        )
+        return [
+            self._delivery(partition, delivery_id, fields)
+            for delivery_id, fields in (claimed[1] if len(claimed) > 1 else [])
+        ]
+
+    def _delivery(
+        self, partition: int, delivery_id: object, fields: Mapping[str, Any]
+    ) -> CommandDelivery:
         delivery = CommandDelivery(
             delivery_id=str(delivery_id),
             partition=partition,
@@ -423,6 +739,10 @@ class RedisStreamsCommandBroker:
             self._group(delivery.partition),
             delivery.delivery_id,
         )
+        if delivery.partition in self._legacy_partitions:
+            self._client.xack(
+                stream, self._legacy_group(delivery.partition), delivery.delivery_id
+            )
         self._client.xdel(stream, delivery.delivery_id)
 
     def retry_or_dead_letter(self, delivery: CommandDelivery, error: str) -> bool:
@@ -454,16 +774,24 @@ class RedisStreamsCommandBroker:
         self.acknowledge(delivery)
         return True
 
-    def store_result(self, result: CommandResult) -> CommandResult:
+    def store_result(
+        self, result: CommandResult, *, reply_to: str | None = None
+    ) -> CommandResult:
         key = self._result_key(result.command_id)
         encoded = _encode_result(result)
         if self._client.set(key, encoded, nx=True, ex=self._result_ttl):
+            if reply_to is not None:
+                self._client.publish(reply_to, encoded)
+                return result
             notification = self._notification_key(result.command_id)
             self._client.rpush(notification, "ready")
             self._client.expire(notification, self._result_ttl)
             return result
         existing = self.result(result.command_id)
-        return existing if existing is not None else result
+        canonical = existing if existing is not None else result
+        if reply_to is not None:
+            self._client.publish(reply_to, _encode_result(canonical))
+        return canonical
 
     def result(self, command_id: str) -> CommandResult | None:
         encoded = self._client.get(self._result_key(command_id))
@@ -486,11 +814,20 @@ class RedisStreamsCommandBroker:
         with self._group_lock:
             if partition in self._known_groups:
                 return
+            stream = self._stream(partition)
+            start_id = "0-0"
+            legacy = self._legacy_group_info(partition)
+            if legacy is not None:
+                # Entries the previous release already read stay with its group;
+                # starting after them keeps the new group from redelivering them.
+                start_id = str(legacy["last-delivered-id"])
+                if int(legacy["pending"]):
+                    self._legacy_partitions.add(partition)
             try:
                 self._client.xgroup_create(
-                    self._stream(partition),
+                    stream,
                     self._group(partition),
-                    id="0-0",
+                    id=start_id,
                     mkstream=True,
                 )
             except Exception as error:
@@ -504,8 +841,25 @@ class RedisStreamsCommandBroker:
         return f"{self._namespace}:partition:{partition}"
 
     def _group(self, partition: int) -> str:
+        # One group name on every partition stream lets a single XREADGROUP cover
+        # all partitions a worker owns; Redis scopes groups to their stream.
+        del partition
+        return f"{self._namespace}:workers"
+
+    def _legacy_group(self, partition: int) -> str:
+        # Releases before the shared group read each stream as this group.
         return f"{self._namespace}:workers:{partition}"
 
+    def _legacy_group_info(self, partition: int) -> Mapping[str, Any] | None:
+        try:
+            groups = self._client.xinfo_groups(self._stream(partition))
+        except Exception as error:
+            if "no such key" not in str(error).lower():
+                raise
+            return None
+        legacy = self._legacy_group(partition)
+        return next((group for group in groups if group["name"] == legacy), None)
+
     def _result_key(self, command_id: str) -> str:
         return f"{self._namespace}:result:{command_id}"
 
@@ -537,6 +891,132 @@ class RedisStreamsCommandBroker:
         )
 
 
+class RedisCommandResultListener:
+    """Gateway-wide completion listener for routed commands.
+
+    Workers publish each result, payload included, to the reply channel named in
+    its command. One reader thread owns this gateway's pubsub connection and
+    resolves the waiting future, so an in-flight request holds no Redis
+    connection of its own. ``CommandClient`` reads the durable result only while
+    this listener is down or has resubscribed since the command was sent, and
+    once at the deadline. Workers must therefore be upgraded to publish replies
+    before gateways start sending ``reply_to``.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        namespace: str = "kolkhoz:commands",
+        listener_id: str | None = None,
+        reconnect_delay_seconds: float = 0.05,
+        metrics: ServerMetrics | None = None,
+    ) -> None:
+        self._client = client
+        self.reply_to = (
+            f"{namespace.rstrip(':')}:reply:{listener_id or uuid.uuid4().hex}"
+        )
+        self._reconnect_delay_seconds = reconnect_delay_seconds
+        self._metrics = metrics
+        self._futures: dict[str, Future[CommandResult]] = {}
+        self._lock = threading.Lock()
+        self._subscribed = threading.Event()
+        self._subscriptions = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="redis-command-results", daemon=True
+        )
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> RedisCommandResultListener:
+        import redis
+
+        client = redis.Redis.from_url(
+            url, decode_responses=True, socket_connect_timeout=0.5, socket_timeout=0.5
+        )
+        return cls(client, **kwargs)
+
+    @property
+    def healthy(self) -> bool:
+        return self._subscribed.is_set() and self._thread.is_alive()
+
+    @property
+    def subscriptions(self) -> int:
+        """Count of (re)subscriptions; a change means replies may have been lost."""
+        return self._subscriptions
+
+    def start(self, timeout_seconds: float = 2.0) -> None:
+        self._thread.start()
+        # Replies published before the subscription exists are only recovered by
+        # the durable-result fallback, so give the first subscribe a head start.
+        self._subscribed.wait(timeout_seconds)
+
+    def register(self, command_id: str) -> Future[CommandResult]:
+        future: Future[CommandResult] = Future()
+        with self._lock:
+            self._futures[command_id] = future
+        if self._metrics is not None:
+            self._metrics.gauge("redis.command_results_waiting", len(self._futures))
+        return future
+
+    def discard(self, command_id: str) -> None:
+        with self._lock:
+            self._futures.pop(command_id, None)
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+
+    def _run(self) -> None:
+        pubsub: Any | None = None
+        while not self._stop.is_set():
+            try:
+                if pubsub is None:
+                    pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                    pubsub.subscribe(self.reply_to)
+                    self._subscriptions += 1
+                    self._subscribed.set()
+                    if self._metrics is not None:
+                        self._metrics.gauge("redis.command_results_healthy", 1)
+                raw = pubsub.get_message(timeout=0.1)
+                if raw is not None:
+                    self._resolve(raw)
+            except Exception:
+                self._subscribed.clear()
+                if self._metrics is not None:
+                    self._metrics.increment("redis.command_results_reconnect")
+                    self._metrics.gauge("redis.command_results_healthy", 0)
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+                pubsub = None
+                self._stop.wait(self._reconnect_delay_seconds)
+        self._subscribed.clear()
+        if pubsub is not None:
+            try:
+                pubsub.close()
+            except Exception:
+                pass
+
+    def _resolve(self, raw: Mapping[str, Any]) -> None:
+        data = raw.get("data")
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        result = _decode_result(data)
+        with self._lock:
+            future = self._futures.pop(result.command_id, None)
+        if future is None:
+            return
+        try:
+            future.set_result(result)
+        except InvalidStateError:
+            # The waiter already timed out and cancelled its future.
+            pass
+
+
 class CommandWorker:
     """Consume assigned partitions and invoke a fenced game-command handler."""
 
@@ -547,6 +1027,9 @@ class CommandWorker:
         partitions: tuple[int, ...],
         handler: Callable[[GameCommand], CommandResult],
         after_handler: Callable[[GameCommand, CommandResult], None] | None = None,
+        *,
+        batch_size: int = 1,
+        dispatch_threads: int = 1,
     ) -> None:
         if not partitions:
             raise ValueError("worker must own at least one command partition")
@@ -555,13 +1038,23 @@ class CommandWorker:
             for partition in partitions
         ):
             raise ValueError("worker command partitions must be unique and in range")
+        if batch_size <= 0 or dispatch_threads <= 0:
+            raise ValueError("batch_size and dispatch_threads must be positive")
         self._broker = broker
         self._consumer_id = consumer_id
         self._partitions = partitions
         self._handler = handler
         self._after_handler = after_handler
+        self._batch_size = batch_size
+        self._dispatcher = (
+            ThreadPoolExecutor(
+                max_workers=dispatch_threads,
+                thread_name_prefix="kolkhoz-command-dispatch",
+            )
+            if dispatch_threads > 1
+            else None
+        )
         self._stop = threading.Event()
-        self._next_partition = 0
 
     @property
     def broker(self) -> CommandBroker:
@@ -576,34 +1069,52 @@ class CommandWorker:
         return self._partitions
 
     def run_once(self, timeout_seconds: float = 0.0) -> bool:
-        per_partition = timeout_seconds / len(self._partitions)
-        ordered = (
-            self._partitions[self._next_partition :]
-            + self._partitions[: self._next_partition]
+        deliveries = self._broker.receive_batch(
+            self._partitions,
+            self._consumer_id,
+            timeout_seconds,
+            count=self._batch_size,
         )
-        for offset, partition in enumerate(ordered):
-            delivery = self._broker.receive(partition, self._consumer_id, per_partition)
-            if delivery is None:
-                continue
-            self._next_partition = (self._next_partition + offset + 1) % len(
-                self._partitions
-            )
-            cached = self._broker.result(delivery.command.command_id)
-            if cached is not None:
-                self._broker.acknowledge(delivery)
-                return True
-            try:
-                result = self._handler(delivery.command)
-                if result.command_id != delivery.command.command_id:
-                    raise ValueError("handler returned a mismatched command ID")
-                if self._after_handler is not None:
-                    self._after_handler(delivery.command, result)
-                self._broker.store_result(result)
-                self._broker.acknowledge(delivery)
-            except Exception as error:
-                self._broker.retry_or_dead_letter(delivery, str(error))
+        if not deliveries:
+            return False
+        # A session lives on exactly one partition, so its deliveries arrive in
+        # stream order. Sessions run concurrently; each session stays sequential.
+        by_session: dict[str, list[CommandDelivery]] = {}
+        for delivery in deliveries:
+            by_session.setdefault(delivery.command.session_id, []).append(delivery)
+        if self._dispatcher is None or len(by_session) == 1:
+            for session_deliveries in by_session.values():
+                self._process_all(session_deliveries)
             return True
-        return False
+        for future in [
+            self._dispatcher.submit(self._process_all, session_deliveries)
+            for session_deliveries in by_session.values()
+        ]:
+            future.result()
+        return True
+
+    def _process_all(self, deliveries: list[CommandDelivery]) -> None:
+        for delivery in deliveries:
+            self._process(delivery)
+
+    def _process(self, delivery: CommandDelivery) -> None:
+        reply_to = delivery.command.reply_to
+        cached = self._broker.result(delivery.command.command_id)
+        if cached is not None:
+            if reply_to is not None:
+                self._broker.store_result(cached, reply_to=reply_to)
+            self._broker.acknowledge(delivery)
+            return
+        try:
+            result = self._handler(delivery.command)
+            if result.command_id != delivery.command.command_id:
+                raise ValueError("handler returned a mismatched command ID")
+            if self._after_handler is not None:
+                self._after_handler(delivery.command, result)
+            self._broker.store_result(result, reply_to=reply_to)
+            self._broker.acknowledge(delivery)
+        except Exception as error:
+            self._broker.retry_or_dead_letter(delivery, str(error))
 
     def run(self, poll_timeout_seconds: float = 1.0) -> None:
         broker_unavailable = False
@@ -624,6 +1135,8 @@ class CommandWorker:
 
     def stop(self) -> None:
         self._stop.set()
+        if self._dispatcher is not None:
+            self._dispatcher.shutdown(wait=False)
 
 
 class CommandWorkerService:
@@ -921,6 +1434,34 @@ class RoutedGameRuntime:
             )
         )
 
+    def advance_automatic_batch(
+        self, session_ids: Iterable[str], *, now: float | None = None
+    ) -> dict[str, Any]:
+        if self._owns_all_partitions:
+            return self._local.advance_automatic_batch(session_ids, now=now)
+        # Other workers own these sessions. Publish every command before awaiting
+        # any, so each partition's worker advances its sessions concurrently.
+        unique = list(dict.fromkeys(session_ids))
+        commands = [
+            self._command(
+                session_id, "game.advance_and_state", {"viewerID": None, "now": now}
+            )
+            for session_id in unique
+        ]
+        results: dict[str, Any] = {}
+        for session_id, result in zip(
+            unique, self._client.execute_many(commands, self._timeout)
+        ):
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                if not result.ok:
+                    _raise_remote_error(result)
+                results[session_id] = self._update(dict(result.payload))
+            except Exception as error:
+                results[session_id] = error
+        return results
+
     def set_autopilot(
         self, session_id: str, player_id: int, controller: str = "heuristicAI"
     ) -> None:
@@ -1020,14 +1561,8 @@ class RoutedGameRuntime:
         expected_revision: int | None = None,
     ) -> JsonObject:
         result = self._client.execute(
-            GameCommand(
-                command_id=str(uuid.uuid4()),
-                session_id=session_id,
-                kind=kind,
-                payload=payload,
-                fencing_token=self._fencing_token,
-                expected_revision=expected_revision,
-                created_at=time.time(),
+            self._command(
+                session_id, kind, payload, expected_revision=expected_revision
             ),
             self._timeout,
         )
@@ -1035,6 +1570,24 @@ class RoutedGameRuntime:
             _raise_remote_error(result)
         return dict(result.payload)
 
+    def _command(
+        self,
+        session_id: str,
+        kind: str,
+        payload: JsonObject,
+        *,
+        expected_revision: int | None = None,
+    ) -> GameCommand:
+        return GameCommand(
+            command_id=str(uuid.uuid4()),
+            session_id=session_id,
+            kind=kind,
+            payload=payload,
+            fencing_token=self._fencing_token,
+            expected_revision=expected_revision,
+            created_at=time.time(),
+        )
+
     @staticmethod
     def _update(payload: JsonObject) -> Any:
         from .model import GameUpdate, StoredEvent
@@ -1118,6 +1671,7 @@ def _encode_command(command: GameCommand) -> str:
             "fencingToken": command.fencing_token,
             "expectedRevision": command.expected_revision,
             "createdAt": command.created_at,
+            "replyTo": command.reply_to,
         },
         separators=(",", ":"),
         sort_keys=True,
@@ -1134,6 +1688,7 @@ def _decode_command(encoded: str | bytes) -> GameCommand:
         fencing_token=int(decoded["fencingToken"]),
         expected_revision=decoded.get("expectedRevision"),
         created_at=float(decoded.get("createdAt", 0.0)),
+        reply_to=decoded.get("replyTo"),
     )
 
 
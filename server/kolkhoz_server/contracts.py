@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ctypes
+from dataclasses import dataclass
 from http import HTTPStatus
 from typing import Iterable, Mapping, Sequence
 
@@ -239,9 +240,54 @@ def merge_session_engine_projection(
 def snapshot_json(
     engine: object, pointer: ctypes.c_void_p, viewer_id: int | None
 ) -> JsonObject:
+    return snapshot_projection(engine, pointer).view(viewer_id)
+
+
+@dataclass(frozen=True)
+class SnapshotProjection:
+    """One engine snapshot rendered once, with both sides of each private field.
+
+    ``view`` only overlays the viewer's own player and score, so every viewer of
+    a revision shares the nested public values; treat them as read-only.
+    """
+
+    shared: JsonObject
+    public_players: tuple[JsonObject, ...]
+    own_players: tuple[JsonObject, ...]
+    visible_scores: tuple[dict[str, int], ...]
+    final_scores: tuple[dict[str, int], ...]
+    game_over: bool
+
+    def view(self, viewer_id: int | None) -> JsonObject:
+        value = dict(self.shared)
+        value["players"] = [
+            self.own_players[i] if viewer_id == i else self.public_players[i]
+            for i in range(PLAYER_COUNT)
+        ]
+        value["scores"] = [
+            self.final_scores[i]
+            if self.game_over or viewer_id == i
+            else self.visible_scores[i]
+            for i in range(PLAYER_COUNT)
+        ]
+        return value
+
+
+def snapshot_projection(engine: object, pointer: ctypes.c_void_p) -> SnapshotProjection:
     state = engine.snapshot(pointer)
     game_over = int(state.phase) == PHASE_GAME_OVER
-    return {
+    visible_scores = []
+    final_scores = []
+    for i in range(PLAYER_COUNT):
+        visible = int(engine.lib.kc_visible_score(pointer, ctypes.c_int32(i)))
+        final = int(engine.lib.kc_final_score(pointer, ctypes.c_int32(i)))
+        visible_scores.append(
+            {"playerID": i, "visibleScore": visible, "finalScore": visible}
+        )
+        final_scores.append(
+            {"playerID": i, "visibleScore": visible, "finalScore": final}
+        )
+    shared: JsonObject = {
         "year": int(state.year),
         "phase": int(state.phase),
         "currentPlayer": int(state.current_player),
@@ -252,9 +298,8 @@ def snapshot_json(
         "trump": int(state.trump),
         "trickCount": int(state.trick_count),
         "isFamine": bool(state.is_famine),
-        "players": [
-            player_to_json(state.players[i], viewer_id) for i in range(PLAYER_COUNT)
-        ],
+        # Overlaid per viewer; the placeholder keeps the established key order.
+        "players": None,
         "jobPiles": redacted_suit_cards(SUIT_COUNT),
         "revealedJobs": revealed_jobs_json(state),
         "claimedJobs": [s for s in range(SUIT_COUNT) if bool(state.claimed_jobs[s])],
@@ -281,10 +326,7 @@ def snapshot_json(
         "pendingAssignments": pending_assignments_json(state),
         "requisitionEvents": requisition_events_json(state),
         "transitionEvents": transition_events_json(state),
-        "scores": [
-            score_json(engine, pointer, i, viewer_id, game_over)
-            for i in range(PLAYER_COUNT)
-        ],
+        "scores": None,
         "winnerID": int(state.winner_id),
         "swapConfirmed": [
             i for i in range(PLAYER_COUNT) if bool(state.swap_confirmed[i])
@@ -295,6 +337,14 @@ def snapshot_json(
         ],
         "finalYearTrumpCard": card_to_json(state.final_year_trump_card),
     }
+    return SnapshotProjection(
+        shared,
+        tuple(player_to_json(state.players[i], None) for i in range(PLAYER_COUNT)),
+        tuple(player_to_json(state.players[i], i) for i in range(PLAYER_COUNT)),
+        tuple(visible_scores),
+        tuple(final_scores),
+        game_over,
+    )
 
 
 def listing_json(
@@ -468,20 +518,6 @@ def requisition_message(kind: int) -> str:
     }.get(kind, "Requisition resolved.")
 
 
-def score_json(
-    engine: object,
-    pointer: ctypes.c_void_p,
-    player_id: int,
-    viewer_id: int | None,
-    game_over: bool,
-) -> dict[str, int]:
-    visible = int(engine.lib.kc_visible_score(pointer, ctypes.c_int32(player_id)))
-    final = int(engine.lib.kc_final_score(pointer, ctypes.c_int32(player_id)))
-    if not game_over and viewer_id != player_id:
-        final = visible
-    return {"playerID": player_id, "visibleScore": visible, "finalScore": final}
-
-
 def optional_int(value: object, default: int | None = None) -> int | None:
     if value is None:
         return default
@@ -7,6 +7,7 @@ fenced owner mutates a session at a time.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import queue
 import threading
@@ -36,6 +37,12 @@ class RealtimeSubscription(Protocol):
     def close(self) -> None: ...
 
 
+class AsyncRealtimeSubscription(RealtimeSubscription, Protocol):
+    async def receive(self) -> RealtimeMessage | None:
+        """Wait on the caller's event loop; ``None`` once the subscription closes."""
+        ...
+
+
 class RealtimeSubscriberOverflow(RuntimeError):
     """A local realtime consumer fell behind its bounded mailbox."""
 
@@ -251,6 +258,28 @@ class _MultiplexedSubscription:
         self._condition = threading.Condition()
         self._closed = False
         self._overflowed = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+
+    async def receive(self) -> RealtimeMessage | None:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self._overflowed:
+                    raise RealtimeSubscriberOverflow(
+                        "realtime subscriber buffer overflow"
+                    )
+                if self._messages:
+                    return self._messages.popleft()
+                if self._closed:
+                    return None
+                if self._wakeup is None or self._loop is not loop:
+                    self._loop = loop
+                    self._wakeup = asyncio.Event()
+                # Cleared under the condition, so any later offer sets it again.
+                self._wakeup.clear()
+                wakeup = self._wakeup
+            await wakeup.wait()
 
     def poll(self, timeout_seconds: float = 0.0) -> RealtimeMessage | None:
         deadline = time.monotonic() + max(0.0, timeout_seconds)
@@ -267,13 +296,23 @@ class _MultiplexedSubscription:
     def close(self) -> None:
         with self._condition:
             self._closed = True
-            self._condition.notify_all()
+            self._notify_all_locked()
         self._bus._remove(self)
 
     def _close_from_bus(self) -> None:
         with self._condition:
             self._closed = True
-            self._condition.notify_all()
+            self._notify_all_locked()
+
+    def _notify_all_locked(self) -> None:
+        self._condition.notify_all()
+        if self._loop is None or self._wakeup is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # The awaiting event loop already shut down.
+            self._loop = None
 
     def _offer(self, message: RealtimeMessage) -> None:
         with self._condition:
@@ -287,10 +326,10 @@ class _MultiplexedSubscription:
                     self._bus._metrics.increment("realtime.overflow")
                 self._overflowed = True
                 self._closed = True
-                self._condition.notify_all()
+                self._notify_all_locked()
                 return
             self._messages.append(message)
-            self._condition.notify()
+            self._notify_all_locked()
 
 
 @dataclass(frozen=True, slots=True)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from typing import Protocol
+import zlib
+from typing import TYPE_CHECKING, Protocol
 
 from .model import JsonObject
 
+if TYPE_CHECKING:
+    from .contracts import SnapshotProjection
+
 
 class GameEngine(Protocol):
     def apply(self, action: JsonObject) -> None: ...
@@ -41,6 +45,13 @@ class KolkhozCEngineFactory:
             controllers=controllers_native(controllers),
         )
 
+    def restore(self, seed: int, variants: JsonObject, state: bytes) -> GameEngine:
+        """Rebuild an engine from ``KolkhozCEngine.checkpoint`` bytes."""
+
+        return KolkhozCEngine(
+            self._engine, seed, variants=None, controllers=None, state=state
+        )
+
     def provenance(self) -> JsonObject:
         value = self._engine.provenance()
         return {"gitSHA": value.git_sha, "engineSHA256": value.c_sha256}
@@ -48,13 +59,30 @@ class KolkhozCEngineFactory:
 
 class KolkhozCEngine:
     def __init__(
-        self, engine: object, seed: int, *, variants: object, controllers: object
+        self,
+        engine: object,
+        seed: int,
+        *,
+        variants: object,
+        controllers: object,
+        state: bytes | None = None,
     ) -> None:
         self._engine = engine
+        if state is not None:
+            self._pointer = engine.restore_engine(zlib.decompress(state))
+            return
         self._pointer = engine.new_engine(
             seed, variants=variants, controllers=controllers
         )
 
+    def checkpoint(self) -> bytes:
+        # The struct is mostly zeroed fixed-capacity arrays; ~110 KB compresses
+        # to well under 1 KB.
+        return zlib.compress(self._engine.engine_state(self._pointer))
+
+    def resident_bytes(self) -> int:
+        return self._engine.engine_state_size()
+
     def apply(self, action: JsonObject) -> None:
         from .contracts import action_from_json
 
@@ -124,12 +152,19 @@ class KolkhozCEngine:
         )
 
     def view(self, viewer_id: int | None = None) -> JsonObject:
-        from .contracts import snapshot_json
+        return self.projection().view(viewer_id)
+
+    def projection(self) -> SnapshotProjection:
+        """Render the viewer-independent snapshot once for several ``view`` calls."""
+
+        from .contracts import snapshot_projection
 
         legal = self._engine.legal_actions(self._pointer)
-        value = snapshot_json(self._engine, self._pointer, viewer_id)
-        value["legalActions"] = [self._action_json(action) for action in legal]
-        return value
+        projection = snapshot_projection(self._engine, self._pointer)
+        projection.shared["legalActions"] = [
+            self._action_json(action) for action in legal
+        ]
+        return projection
 
     @staticmethod
     def _action_json(action: object) -> JsonObject:
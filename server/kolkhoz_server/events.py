@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import json
 import queue
 import threading
 from collections import defaultdict
 from collections.abc import Mapping
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any
 from typing import Iterator
 
@@ -38,11 +40,22 @@ class EventHub:
                     if not subscribers:
                         self._subscribers.pop(session_id, None)
 
+    @property
+    def realtime_enabled(self) -> bool:
+        return self._realtime_bus is not None
+
     def publish(
         self,
         event: StoredEvent,
         states_by_viewer: Mapping[int, Mapping[str, Any]] | None = None,
+        previous_by_viewer: Mapping[int, Mapping[str, Any]] | None = None,
     ) -> None:
+        """Fan out a committed event.
+
+        ``previous_by_viewer`` holds the same viewers' states at the prior
+        revision; with it the realtime payload carries only what changed.
+        """
+
         with self._lock:
             subscribers = tuple(self._subscribers.get(event.session_id, ()))
         for mailbox in subscribers:
@@ -62,10 +75,9 @@ class EventHub:
                 "createdAt": event.created_at,
             }
             if states_by_viewer is not None:
-                payload["statesByViewer"] = {
-                    str(viewer_id): dict(state)
-                    for viewer_id, state in states_by_viewer.items()
-                }
+                payload["stateDelta"] = encode_state_delta(
+                    event.revision, states_by_viewer, previous_by_viewer
+                )
             self._realtime_bus.publish(  # type: ignore[attr-defined]
                 RealtimeMessage(
                     topic=f"session:{event.session_id}",
@@ -73,3 +85,101 @@ class EventHub:
                     payload=payload,
                 )
             )
+
+
+def encode_state_delta(
+    revision: int,
+    states_by_viewer: Mapping[int, Mapping[str, Any]],
+    previous_by_viewer: Mapping[int, Mapping[str, Any]] | None = None,
+) -> dict[str, object]:
+    """Encode viewer states as one shared fragment plus a fragment per viewer.
+
+    Top-level keys unchanged since ``previous_by_viewer`` are omitted, and changed
+    values that every viewer sees identically are sent once. Fragments are JSON
+    text, so a gateway parses only the viewers its sockets need. A ``baseRevision``
+    of ``None`` means the fragments together form complete states.
+    """
+
+    complete = previous_by_viewer is None or any(
+        viewer_id not in previous_by_viewer
+        or previous_by_viewer[viewer_id].keys() - state.keys()
+        for viewer_id, state in states_by_viewer.items()
+    )
+    changed: dict[int, dict[str, Any]] = {}
+    for viewer_id, state in states_by_viewer.items():
+        before = None if complete else previous_by_viewer[viewer_id]  # type: ignore[index]
+        changed[viewer_id] = {
+            key: value
+            for key, value in state.items()
+            if before is None or key not in before or before[key] != value
+        }
+    viewers = list(changed.values())
+    shared = (
+        {
+            key: value
+            for key, value in viewers[0].items()
+            if all(
+                key in other and (other[key] is value or other[key] == value)
+                for other in viewers[1:]
+            )
+        }
+        if viewers
+        else {}
+    )
+    return {
+        "baseRevision": None if complete else revision - 1,
+        "shared": _fragment(shared),
+        "viewers": {
+            str(viewer_id): _fragment(
+                {key: value for key, value in delta.items() if key not in shared}
+            )
+            for viewer_id, delta in changed.items()
+        },
+    }
+
+
+def decode_viewer_state(
+    delta: Mapping[str, Any],
+    viewer_id: int,
+    revision: int,
+    base: Mapping[str, Any] | None,
+) -> dict[str, Any] | None:
+    """Rebuild one viewer's state at ``revision``; ``None`` means catch up instead.
+
+    ``base`` is that viewer's state at the previous revision and is required
+    unless the delta is complete.
+    """
+
+    fragments = delta.get("viewers")
+    shared = delta.get("shared")
+    if not isinstance(fragments, Mapping) or not isinstance(shared, str):
+        return None
+    fragment = fragments.get(str(viewer_id))
+    if not isinstance(fragment, str):
+        return None
+    base_revision = delta.get("baseRevision")
+    state: dict[str, Any] = {}
+    if base_revision is not None:
+        if base is None or base_revision != revision - 1:
+            return None
+        state.update(base)
+    try:
+        state.update(_parsed_fragment(shared))
+        state.update(_parsed_fragment(fragment))
+    except ValueError:
+        return None
+    return state
+
+
+def _fragment(value: Mapping[str, Any]) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+@lru_cache(maxsize=256)
+def _parsed_fragment(text: str) -> Mapping[str, Any]:
+    # Sockets of one session on a gateway share the decoded shared fragment; the
+    # merged states are shallow copies and never mutate nested values.
+    value = json.loads(text)
+    if not isinstance(value, dict):
+        raise ValueError("state fragment must be a JSON object")
+    return value
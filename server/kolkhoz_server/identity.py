@@ -8,17 +8,22 @@ import os
 import secrets
 import ssl
 import struct
+import threading
 import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
 from http import HTTPStatus
-from typing import Callable, Mapping, Protocol
+from typing import TYPE_CHECKING, Callable, Mapping, Protocol
 from urllib import parse, request
 
 from .errors import ServerError
 from .store import ConnectionPool
 from .accounts import detach_player_from_sessions
 
+if TYPE_CHECKING:
+    from .metrics import ServerMetrics
+
 try:
     import certifi
 except ImportError:
@@ -219,7 +224,10 @@ class IdentityRepository(Protocol):
     def migrate_legacy(
         self, player_id: str, guest_hash: str, device_id: str, now: float
     ) -> dict[str, object]: ...
-    def player_for_token(self, token_hash: str, now: float) -> str | None: ...
+    def token_session(
+        self, token_hash: str, now: float
+    ) -> tuple[str, float] | None: ...
+    def touch_sessions(self, token_hashes: list[str], now: float) -> None: ...
     def create_link(
         self, player_id: str, code_hash: str, expires_at: float, now: float
     ) -> str: ...
@@ -380,22 +388,109 @@ class IdentityService:
 
 
 class IdentitySessionVerifier:
+    """Resolve first-party ``khz_`` tokens through a bounded LRU/TTL cache.
+
+    Unknown tokens are cached for the shorter ``negative_ttl_seconds``, and no
+    entry outlives its session's ``expires_at``. Local revocations call
+    ``invalidate_user``; another process keeps accepting a revoked token for up
+    to ``ttl_seconds``, so that TTL is the cross-process revocation window.
+    Cache hits refresh ``last_used_at`` in one batched write per TTL.
+    """
+
     def __init__(
         self,
         repository: IdentityRepository,
         *,
         clock: Callable[[], float] = time.time,
+        ttl_seconds: float = 30,
+        negative_ttl_seconds: float = 5,
+        capacity: int = 100_000,
+        metrics: ServerMetrics | None = None,
     ) -> None:
+        if min(ttl_seconds, negative_ttl_seconds, capacity) <= 0:
+            raise ValueError("identity cache TTLs and capacity must be positive")
         self.repository = repository
         self.clock = clock
+        self._ttl = ttl_seconds
+        self._negative_ttl = negative_ttl_seconds
+        self._capacity = capacity
+        self._metrics = metrics
+        self._entries: OrderedDict[str, tuple[str | None, float]] = OrderedDict()
+        self._token_hashes: dict[str, set[str]] = {}
+        self._generation = 0
+        self._used: set[str] = set()
+        self._touch_due = clock() + ttl_seconds
+        self._lock = threading.Lock()
 
     def user_id(self, authorization: str | None) -> str | None:
         if not authorization or not authorization.startswith("Bearer khz_"):
             return None
         token = authorization.removeprefix("Bearer ").strip()
-        return self.repository.player_for_token(
-            hashlib.sha256(token.encode()).hexdigest(), self.clock()
-        )
+        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        now = self.clock()
+        touched: list[str] = []
+        with self._lock:
+            cached = self._entries.get(token_hash)
+            hit = cached if cached is not None and cached[1] > now else None
+            if hit is not None:
+                self._entries.move_to_end(token_hash)
+                if hit[0] is not None:
+                    self._used.add(token_hash)
+                touched = self._take_used_locked(now)
+            elif cached is not None:
+                self._forget_locked(token_hash)
+            generation = self._generation
+        if hit is not None:
+            self._count("auth.identity_cache.hit")
+            if touched:
+                self.repository.touch_sessions(touched, now)
+            return hit[0]
+        self._count("auth.identity_cache.miss")
+        session = self.repository.token_session(token_hash, now)
+        player_id = session[0] if session is not None else None
+        with self._lock:
+            # A revocation that raced this lookup must not be undone by caching it.
+            if generation == self._generation:
+                cached_until = (
+                    min(now + self._ttl, session[1])
+                    if session is not None
+                    else now + self._negative_ttl
+                )
+                self._entries[token_hash] = (player_id, cached_until)
+                if player_id is not None:
+                    self._token_hashes.setdefault(player_id, set()).add(token_hash)
+                while len(self._entries) > self._capacity:
+                    self._forget_locked(next(iter(self._entries)))
+        return player_id
+
+    def invalidate_user(self, user_id: str) -> None:
+        with self._lock:
+            self._generation += 1
+            for token_hash in self._token_hashes.pop(user_id, set()):
+                self._entries.pop(token_hash, None)
+
+    def _take_used_locked(self, now: float) -> list[str]:
+        if now < self._touch_due or not self._used:
+            return []
+        self._touch_due = now + self._ttl
+        used = list(self._used)
+        self._used.clear()
+        return used
+
+    def _forget_locked(self, token_hash: str) -> None:
+        self._used.discard(token_hash)
+        player_id, _ = self._entries.pop(token_hash)
+        if player_id is None:
+            return
+        hashes = self._token_hashes.get(player_id)
+        if hashes is not None:
+            hashes.discard(token_hash)
+            if not hashes:
+                self._token_hashes.pop(player_id, None)
+
+    def _count(self, name: str) -> None:
+        if self._metrics is not None:
+            self._metrics.increment(name)
 
 
 class CompositeAuthVerifier:
@@ -650,13 +745,20 @@ class PostgresIdentityRepository:
             },
         }
 
-    def player_for_token(self, token_hash: str, now: float) -> str | None:
+    def token_session(self, token_hash: str, now: float) -> tuple[str, float] | None:
         with self.pool.connection() as connection, connection.transaction():  # type: ignore[attr-defined]
             row = connection.execute(
-                "update server_identity_sessions set last_used_at=to_timestamp(%s) where token_hash=%s and revoked_at is null and expires_at>to_timestamp(%s) returning player_id::text",
+                "update server_identity_sessions set last_used_at=to_timestamp(%s) where token_hash=%s and revoked_at is null and expires_at>to_timestamp(%s) returning player_id::text,extract(epoch from expires_at)",
                 (now, token_hash, now),
             ).fetchone()  # type: ignore[attr-defined]
-            return str(row[0]) if row else None
+            return (str(row[0]), float(row[1])) if row else None
+
+    def touch_sessions(self, token_hashes: list[str], now: float) -> None:
+        with self.pool.connection() as connection, connection.transaction():  # type: ignore[attr-defined]
+            connection.execute(
+                "update server_identity_sessions set last_used_at=to_timestamp(%s) where token_hash=any(%s) and revoked_at is null",
+                (now, token_hashes),
+            )  # type: ignore[attr-defined]
 
     def create_link(
         self, player_id: str, code_hash: str, expires_at: float, now: float
@@ -3,6 +3,7 @@ from __future__ import annotations
 import secrets
 import time
 import uuid
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Protocol
 
@@ -39,6 +40,32 @@ class SeatRecord:
     autopilot: bool
 
 
+@dataclass(frozen=True)
+class SessionReadModel:
+    """Lobby metadata and the recent action log needed to render one revision.
+
+    ``actions`` is ``None`` from repositories that do not share a database with
+    the game event log; callers then read the window from the event store.
+    """
+
+    record: SessionRecord
+    seats: list[SeatRecord]
+    turn_player_id: int | None
+    turn_deadline_at: float | None
+    reactions: list[dict[str, object]]
+    actions: list[JsonObject] | None
+
+
+@dataclass(frozen=True)
+class SessionSyncState:
+    """Lobby row, seats and turn deadline needed to synchronize one session."""
+
+    record: SessionRecord
+    seats: list[SeatRecord]
+    turn_player_id: int | None
+    turn_deadline_at: float | None
+
+
 @dataclass(frozen=True)
 class DueTurn:
     session_id: str
@@ -73,6 +100,13 @@ class LobbyRepository(Protocol):
     def create(self, record: SessionRecord, seats: list[SeatRecord]) -> None: ...
     def session(self, session_id_or_invite: str) -> SessionRecord: ...
     def seats(self, session_id: str) -> list[SeatRecord]: ...
+    def seats_for_sessions(
+        self, session_ids: list[str]
+    ) -> dict[str, list[SeatRecord]]: ...
+    def read_model(
+        self, session_id: str, *, after_revision: int, revision: int
+    ) -> SessionReadModel: ...
+    def sync_states(self, session_ids: list[str]) -> dict[str, SessionSyncState]: ...
     def list_open(self, now: float) -> list[SessionRecord]: ...
     def list_watchable(self, now: float) -> list[SessionRecord]: ...
     def automatic_due_sessions(self, *, now: float, limit: int) -> list[str]: ...
@@ -144,6 +178,12 @@ class LobbyRepository(Protocol):
         deadline_at: float | None,
         now: float,
     ) -> None: ...
+    def set_turn_deadlines(
+        self,
+        deadlines: Mapping[str, tuple[int | None, float | None]],
+        *,
+        now: float,
+    ) -> None: ...
     def turn_state(self, session_id: str) -> tuple[int | None, float | None]: ...
     def claim_due_turns(
         self, *, owner: str, now: float, lease_seconds: float, limit: int
@@ -157,6 +197,7 @@ class LobbyRepository(Protocol):
         *,
         now: float,
         session_ttl_seconds: float | None = None,
+        token_hash: str | None = None,
     ) -> None: ...
     def complete_lifecycle_intent(
         self, session_id: str, operation: str, *, fencing_token: int | None = None
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Mapping
 
 from .lobby import (
     DueTurn,
     LifecycleIntent,
     SeatRecord,
     SeatUnavailable,
+    SessionReadModel,
     SessionRecord,
+    SessionSyncState,
     TimeoutResult,
     new_session_record,
 )
@@ -145,6 +148,69 @@ class PostgresLobbyRepository:
             ).fetchall()
         return [self._seat_row(row) for row in rows]
 
+    def seats_for_sessions(self, session_ids: list[str]) -> dict[str, list[SeatRecord]]:
+        seats: dict[str, list[SeatRecord]] = {
+            session_id: [] for session_id in session_ids
+        }
+        if not session_ids:
+            return seats
+        with self._pool.connection() as connection:
+            rows = connection.execute(  # type: ignore[attr-defined]
+                """
+                select session_id::text, player_id, controller, occupied, user_id,
+                       token_hash, extract(epoch from last_seen_at), timeouts,
+                       abandoned, autopilot
+                  from server_seats where session_id = any(%s::uuid[])
+                 order by session_id, player_id
+                """,
+                (list(session_ids),),
+            ).fetchall()
+        for row in rows:
+            seats.setdefault(str(row[0]), []).append(self._seat_row(row[1:]))
+        return seats
+
+    def sync_states(self, session_ids: list[str]) -> dict[str, SessionSyncState]:
+        """Session rows, seats and turn state for a batch in two queries."""
+
+        if not session_ids:
+            return {}
+        with self._pool.connection() as connection:
+            session_rows = connection.execute(  # type: ignore[attr-defined]
+                """
+                select session_id::text, invite_code, seed, variants, controllers,
+                       ranked, browser_joinable, status, created_by_user_id,
+                       extract(epoch from created_at), extract(epoch from updated_at),
+                       extract(epoch from expires_at),
+                       extract(epoch from lobby_countdown_ends_at),
+                       turn_player_id, extract(epoch from turn_deadline_at)
+                  from server_sessions where session_id = any(%s::uuid[])
+                """,
+                (list(session_ids),),
+            ).fetchall()
+            seat_rows = connection.execute(  # type: ignore[attr-defined]
+                """
+                select session_id::text, player_id, controller, occupied, user_id,
+                       token_hash, extract(epoch from last_seen_at), timeouts,
+                       abandoned, autopilot
+                  from server_seats where session_id = any(%s::uuid[])
+                 order by session_id, player_id
+                """,
+                (list(session_ids),),
+            ).fetchall()
+        seats: dict[str, list[SeatRecord]] = {}
+        for row in seat_rows:
+            seats.setdefault(str(row[0]), []).append(self._seat_row(row[1:]))
+        states: dict[str, SessionSyncState] = {}
+        for row in session_rows:
+            record = self._session_row(row[:13])
+            states[record.session_id] = SessionSyncState(
+                record=record,
+                seats=seats.get(record.session_id, []),
+                turn_player_id=int(row[13]) if row[13] is not None else None,
+                turn_deadline_at=float(row[14]) if row[14] is not None else None,
+            )
+        return states
+
     def list_open(self, now: float) -> list[SessionRecord]:
         with self._pool.connection() as connection:
             rows = connection.execute(  # type: ignore[attr-defined]
@@ -723,6 +789,7 @@ class PostgresLobbyRepository:
         *,
         now: float,
         session_ttl_seconds: float | None = None,
+        token_hash: str | None = None,
     ) -> None:
         with self._pool.connection() as connection, connection.transaction():  # type: ignore[attr-defined]
             row = connection.execute(  # type: ignore[attr-defined]
@@ -731,9 +798,10 @@ class PostgresLobbyRepository:
                    set last_seen_at = to_timestamp(%s),
                        autopilot = case when abandoned then autopilot else false end
                  where session_id = %s::uuid and player_id = %s and occupied
+                   and (%s::text is null or token_hash = %s)
                 returning player_id
                 """,
-                (now, session_id, player_id),
+                (now, session_id, player_id, token_hash, token_hash),
             ).fetchone()
             if row is None:
                 raise SeatUnavailable(f"seat {player_id} is unavailable")
@@ -773,6 +841,42 @@ class PostgresLobbyRepository:
                 (player_id, deadline_at, deadline_at, now, session_id),
             )
 
+    def set_turn_deadlines(
+        self,
+        deadlines: Mapping[str, tuple[int | None, float | None]],
+        *,
+        now: float,
+    ) -> None:
+        if any(
+            (player_id is None) != (deadline_at is None)
+            for player_id, deadline_at in deadlines.values()
+        ):
+            raise ValueError(
+                "player_id and deadline_at must both be set or both be null"
+            )
+        if not deadlines:
+            return
+        session_ids = list(deadlines)
+        with self._pool.connection() as connection, connection.transaction():  # type: ignore[attr-defined]
+            connection.execute(  # type: ignore[attr-defined]
+                """
+                update server_sessions as s
+                   set turn_player_id = d.player_id,
+                       turn_deadline_at = case when d.deadline_at is null then null else to_timestamp(d.deadline_at) end,
+                       updated_at = to_timestamp(%s), scheduler_claim_owner = null,
+                       scheduler_claim_until = null
+                  from unnest(%s::uuid[], %s::smallint[], %s::double precision[])
+                       as d(session_id, player_id, deadline_at)
+                 where s.session_id = d.session_id
+                """,
+                (
+                    now,
+                    session_ids,
+                    [deadlines[value][0] for value in session_ids],
+                    [deadlines[value][1] for value in session_ids],
+                ),
+            )
+
     def turn_state(self, session_id: str) -> tuple[int | None, float | None]:
         with self._pool.connection() as connection:
             row = connection.execute(  # type: ignore[attr-defined]
@@ -789,6 +893,87 @@ class PostgresLobbyRepository:
             float(row[1]) if row[1] is not None else None,
         )
 
+    def read_model(
+        self, session_id: str, *, after_revision: int, revision: int
+    ) -> SessionReadModel:
+        """Read everything a session update renders in one round trip.
+
+        Seats, reactions and the action-log window are folded into JSON aggregates
+        beside the session row, so a state read costs one statement instead of one
+        per table.
+        """
+
+        with self._pool.connection() as connection:
+            row = connection.execute(  # type: ignore[attr-defined]
+                """
+                with session as (
+                    select session_id, invite_code, seed, variants, controllers,
+                           ranked, browser_joinable, status, created_by_user_id,
+                           created_at, updated_at, expires_at,
+                           lobby_countdown_ends_at, turn_player_id, turn_deadline_at
+                      from server_sessions where session_id = %s::uuid
+                ),
+                seats as (
+                    select coalesce(jsonb_agg(jsonb_build_array(
+                               player_id, controller, occupied, user_id, token_hash,
+                               extract(epoch from last_seen_at), timeouts, abandoned,
+                               autopilot
+                           ) order by player_id), '[]'::jsonb) as value
+                      from server_seats
+                     where session_id = (select session_id from session)
+                ),
+                reactions as (
+                    select coalesce(jsonb_agg(jsonb_build_object(
+                               'revision', revision,
+                               'playerID', player_id,
+                               'reactionID', reaction_id,
+                               'year', year,
+                               'phase', phase,
+                               'createdAt', extract(epoch from created_at)
+                           ) order by revision), '[]'::jsonb) as value
+                      from server_reactions
+                     where session_id = (select session_id from session)
+                ),
+                actions as (
+                    select coalesce(
+                               jsonb_agg(payload order by revision), '[]'::jsonb
+                           ) as value
+                      from server_game_events
+                     where session_id = (select session_id from session)
+                       and revision > %s and revision <= %s
+                )
+                select session.session_id::text, invite_code, seed, variants,
+                       controllers, ranked, browser_joinable, status,
+                       created_by_user_id, extract(epoch from created_at),
+                       extract(epoch from updated_at), extract(epoch from expires_at),
+                       extract(epoch from lobby_countdown_ends_at), turn_player_id,
+                       extract(epoch from turn_deadline_at), seats.value,
+                       reactions.value, actions.value
+                  from session, seats, reactions, actions
+                """,
+                (session_id, after_revision, revision),
+            ).fetchone()
+        if row is None:
+            raise KeyError(session_id)
+        return SessionReadModel(
+            record=self._session_row(row[:13]),
+            seats=[self._seat_row(value) for value in row[15]],
+            turn_player_id=int(row[13]) if row[13] is not None else None,
+            turn_deadline_at=float(row[14]) if row[14] is not None else None,
+            reactions=[
+                {
+                    "revision": int(value["revision"]),
+                    "playerID": int(value["playerID"]),
+                    "reactionID": str(value["reactionID"]),
+                    "year": int(value["year"]),
+                    "phase": int(value["phase"]),
+                    "createdAt": float(value["createdAt"]),
+                }
+                for value in row[16]
+            ],
+            actions=[dict(value) for value in row[17]],
+        )
+
     def claim_due_turns(
         self, *, owner: str, now: float, lease_seconds: float, limit: int
     ) -> list[DueTurn]:
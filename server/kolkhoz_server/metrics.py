@@ -1,55 +1,125 @@
 from __future__ import annotations
 
+import math
 import re
 import sys
 import threading
 import time
-from collections import defaultdict, deque
+from array import array
+from collections import defaultdict
 from contextlib import contextmanager
 from typing import Iterator
 
+# Log-linear buckets: each power-of-two octave above LOWEST_SECONDS is split into
+# SUB_BUCKETS equal slices, bounding the relative error of any percentile to
+# 1/SUB_BUCKETS. Boundaries are fixed, so buckets from any process can be summed.
+# Values past the last octave land in one overflow slot after the buckets.
+LOWEST_SECONDS = 2.0**-20
+OCTAVES = 32
+SUB_BUCKETS = 16
+BUCKET_COUNT = OCTAVES * SUB_BUCKETS
+# Prometheus gets every fourth sub-bucket boundary (1.25x, 1.5x, 1.75x and 2x of
+# each octave), so a merged ``histogram_quantile`` is within 25% of the value.
+EXPORTED_SUB_BUCKETS = 4
 
-def _percentile(values: list[float], percentile: float) -> float:
-    if not values:
-        return 0.0
-    return values[min(len(values) - 1, int((len(values) - 1) * percentile))]
+
+def _bucket_index(elapsed: float) -> int:
+    if elapsed < LOWEST_SECONDS:
+        return 0
+    mantissa, exponent = math.frexp(elapsed / LOWEST_SECONDS)
+    if exponent > OCTAVES:
+        return BUCKET_COUNT
+    return (exponent - 1) * SUB_BUCKETS + int((mantissa * 2 - 1) * SUB_BUCKETS)
+
+
+def _bucket_upper(index: int) -> float:
+    octave, sub_bucket = divmod(index, SUB_BUCKETS)
+    return LOWEST_SECONDS * 2.0**octave * (1 + (sub_bucket + 1) / SUB_BUCKETS)
 
 
 class MetricBucket:
-    def __init__(self, capacity: int = 2048) -> None:
+    """Fixed-memory latency histogram with O(1) recording and mergeable buckets."""
+
+    def __init__(self) -> None:
         self.count = 0
         self.total = 0.0
         self.minimum: float | None = None
         self.maximum = 0.0
-        self.samples: deque[float] = deque(maxlen=capacity)
+        self.buckets = array("Q", [0]) * (BUCKET_COUNT + 1)
 
     def record(self, elapsed: float) -> None:
         self.count += 1
         self.total += elapsed
         self.minimum = elapsed if self.minimum is None else min(self.minimum, elapsed)
         self.maximum = max(self.maximum, elapsed)
-        self.samples.append(elapsed)
+        self.buckets[_bucket_index(elapsed)] += 1
+
+    def merge(self, other: MetricBucket) -> None:
+        if not other.count:
+            return
+        self.count += other.count
+        self.total += other.total
+        self.minimum = (
+            other.minimum
+            if self.minimum is None
+            else min(self.minimum, other.minimum or 0.0)
+        )
+        self.maximum = max(self.maximum, other.maximum)
+        for index, value in enumerate(other.buckets):
+            if value:
+                self.buckets[index] += value
+
+    def percentiles(self, *quantiles: float) -> list[float]:
+        """Bucket upper bounds for ascending ``quantiles`` in one pass."""
+
+        if not self.count:
+            return [0.0 for _ in quantiles]
+        values: list[float] = []
+        ranks = [max(1, math.ceil(self.count * value)) for value in quantiles]
+        seen = 0
+        for index, value in enumerate(self.buckets):
+            seen += value
+            while len(values) < len(ranks) and seen >= ranks[len(values)]:
+                upper = _bucket_upper(index)
+                values.append(min(max(upper, self.minimum or 0.0), self.maximum))
+            if len(values) == len(ranks):
+                break
+        return values
+
+    def cumulative_counts(self) -> list[tuple[float, int]]:
+        """Cumulative counts at each exported boundary, for Prometheus ``le``.
+
+        Overflowing values are left out; they only appear in ``le="+Inf"``.
+        """
+
+        stride = SUB_BUCKETS // EXPORTED_SUB_BUCKETS
+        counts: list[tuple[float, int]] = []
+        seen = 0
+        for index in range(BUCKET_COUNT):
+            seen += self.buckets[index]
+            if (index + 1) % stride == 0:
+                counts.append((_bucket_upper(index), seen))
+        return counts
 
     def snapshot(self) -> dict[str, object]:
-        samples = sorted(self.samples)
+        p50, p95, p99 = self.percentiles(0.50, 0.95, 0.99)
         return {
             "count": self.count,
             "meanMs": self.total * 1000 / self.count if self.count else 0.0,
             "minMs": (self.minimum or 0.0) * 1000,
             "maxMs": self.maximum * 1000,
-            "p50Ms": _percentile(samples, 0.50) * 1000,
-            "p95Ms": _percentile(samples, 0.95) * 1000,
-            "p99Ms": _percentile(samples, 0.99) * 1000,
+            "p50Ms": p50 * 1000,
+            "p95Ms": p95 * 1000,
+            "p99Ms": p99 * 1000,
         }
 
 
 class ServerMetrics:
     """Bounded, thread-safe process metrics with low-cardinality labels."""
 
-    def __init__(self, *, max_series: int = 512, sample_capacity: int = 2048) -> None:
+    def __init__(self, *, max_series: int = 512) -> None:
         self.started_at = time.time()
         self._max_series = max_series
-        self._sample_capacity = sample_capacity
         self._routes: dict[str, MetricBucket] = {}
         self._statuses: dict[str, int] = defaultdict(int)
         self._observations: dict[str, MetricBucket] = {}
@@ -68,18 +138,14 @@ class ServerMetrics:
         key = f"{method} {route}"
         with self._lock:
             key = self._bounded_key(self._routes, key)
-            self._routes.setdefault(key, MetricBucket(self._sample_capacity)).record(
-                elapsed
-            )
+            self._routes.setdefault(key, MetricBucket()).record(elapsed)
             status_key = self._bounded_key(self._statuses, f"{key} {status}")
             self._statuses[status_key] += 1
 
     def observe(self, name: str, elapsed: float) -> None:
         with self._lock:
             key = self._bounded_key(self._observations, name)
-            self._observations.setdefault(
-                key, MetricBucket(self._sample_capacity)
-            ).record(max(0.0, elapsed))
+            self._observations.setdefault(key, MetricBucket()).record(max(0.0, elapsed))
 
     def increment(self, name: str, value: float = 1.0) -> None:
         with self._lock:
@@ -140,6 +206,11 @@ class ServerMetrics:
 
     def prometheus(self, runtime: object) -> str:
         snapshot = self.snapshot(runtime)
+        with self._lock:
+            histograms = {
+                name: (bucket.cumulative_counts(), bucket.count, bucket.total)
+                for name, bucket in sorted(self._observations.items())
+            }
         lines = [
             "# HELP kolkhoz_uptime_seconds Process uptime.",
             "# TYPE kolkhoz_uptime_seconds gauge",
@@ -151,16 +222,18 @@ class ServerMetrics:
         for name, value in snapshot["gauges"].items():
             metric = _metric_name(name)
             lines.extend((f"# TYPE {metric} gauge", f"{metric} {value}"))
-        for name, value in snapshot["operations"].items():
+        for name, (cumulative_counts, count, total) in histograms.items():
             metric = _metric_name(name) + "_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            lines.extend(
+                f'{metric}_bucket{{le="{upper:.9g}"}} {cumulative}'
+                for upper, cumulative in cumulative_counts
+            )
             lines.extend(
                 (
-                    f"# TYPE {metric} summary",
-                    f'{metric}{{quantile="0.5"}} {value["p50Ms"] / 1000:.9f}',
-                    f'{metric}{{quantile="0.95"}} {value["p95Ms"] / 1000:.9f}',
-                    f'{metric}{{quantile="0.99"}} {value["p99Ms"] / 1000:.9f}',
-                    f"{metric}_count {value['count']}",
-                    f"{metric}_sum {value['meanMs'] * value['count'] / 1000:.9f}",
+                    f'{metric}_bucket{{le="+Inf"}} {count}',
+                    f"{metric}_count {count}",
+                    f"{metric}_sum {total:.9f}",
                 )
             )
         for key, count in snapshot["routeStatuses"].items():
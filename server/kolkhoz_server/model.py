@@ -28,6 +28,18 @@ class StoredEvent:
     created_at: float
 
 
+@dataclass(frozen=True)
+class EngineCheckpoint:
+    """Opaque engine state after ``revision``; a cache over the durable event log."""
+
+    session_id: str
+    revision: int
+    engine_sha256: str
+    engine_contract_version: int
+    settings_sha256: str
+    state: bytes
+
+
 @dataclass(frozen=True)
 class GameUpdate:
     session_id: str
@@ -16,6 +16,7 @@ from .commands import (
     CommandClient,
     CommandWorker,
     CommandWorkerService,
+    RedisCommandResultListener,
     RedisStreamsCommandBroker,
     RoutedGameRuntime,
     RuntimeCommandHandler,
@@ -91,6 +92,15 @@ def _production_auth_verifier() -> CachingAuthVerifier | StagingAuthVerifier | N
     )
 
 
+def _shard_memory_budget(shards: int) -> int | None:
+    """Split the process-wide engine memory budget evenly across the shards."""
+
+    budget = int(os.environ.get("KOLKHOZ_ENGINE_MEMORY_BUDGET_BYTES", "268435456"))
+    if budget <= 0:
+        return None
+    return max(1, budget // max(1, shards))
+
+
 def _enabled(name: str, default: bool = True) -> bool:
     value = os.environ.get(name)
     if value is None:
@@ -138,7 +148,12 @@ def create_asgi_application() -> ASGIApplication:
         metrics=metrics,
     )
     identity = identity_service_from_environment(pool)
-    identity_auth_verifier = IdentitySessionVerifier(identity.repository)
+    identity_auth_verifier = IdentitySessionVerifier(
+        identity.repository,
+        ttl_seconds=float(os.environ.get("KOLKHOZ_AUTH_CACHE_TTL_SECONDS", "30")),
+        capacity=int(os.environ.get("KOLKHOZ_AUTH_CACHE_CAPACITY", "100000")),
+        metrics=metrics,
+    )
     auth_verifier = (
         CompositeAuthVerifier(identity_auth_verifier, legacy_auth_verifier)
         if isinstance(legacy_auth_verifier, StagingAuthVerifier)
@@ -203,6 +218,14 @@ def create_asgi_application() -> ASGIApplication:
             owner_id=owner_id,
             lease_ttl_seconds=float(os.environ.get("KOLKHOZ_LEASE_TTL_SECONDS", "15")),
             metrics=metrics,
+            checkpoint_interval=int(
+                os.environ.get("KOLKHOZ_CHECKPOINT_INTERVAL", "16")
+            ),
+            memory_budget_bytes=_shard_memory_budget(args.shards),
+            idle_ttl_seconds=float(
+                os.environ.get("KOLKHOZ_ENGINE_IDLE_TTL_SECONDS", "900")
+            )
+            or None,
         )
     else:
         local_runtime = GatewayRuntimeContext(store, EventHub(realtime_bus), owner_id)
@@ -217,6 +240,9 @@ def create_asgi_application() -> ASGIApplication:
         visibility_timeout_seconds=float(
             os.environ.get("KOLKHOZ_COMMAND_VISIBILITY_SECONDS", "30")
         ),
+        reclaim_interval_seconds=float(
+            os.environ.get("KOLKHOZ_COMMAND_RECLAIM_SECONDS", "5")
+        ),
         metrics=metrics,
     )
     assigned = os.environ.get("KOLKHOZ_COMMAND_PARTITIONS")
@@ -243,6 +269,12 @@ def create_asgi_application() -> ASGIApplication:
                         f"{worker_id}:{index}",
                         partition_group,
                         RuntimeCommandHandler(local_runtime, lobby),
+                        batch_size=int(
+                            os.environ.get("KOLKHOZ_COMMAND_BATCH_SIZE", "32")
+                        ),
+                        dispatch_threads=int(
+                            os.environ.get("KOLKHOZ_COMMAND_DISPATCH_THREADS", "4")
+                        ),
                     )
                 )
                 service.start()
@@ -254,9 +286,13 @@ def create_asgi_application() -> ASGIApplication:
             realtime_bus.close()
             pool.close()
             raise
+    result_listener = RedisCommandResultListener.from_url(
+        redis_url, listener_id=worker_id, metrics=metrics
+    )
+    result_listener.start()
     runtime = RoutedGameRuntime(
         local_runtime,
-        CommandClient(command_broker),
+        CommandClient(command_broker, result_listener),
         timeout_seconds=float(os.environ.get("KOLKHOZ_COMMAND_TIMEOUT_SECONDS", "10")),
         owns_all_partitions=(
             bool(command_workers) and set(partitions) == set(range(command_partitions))
@@ -304,6 +340,10 @@ def create_asgi_application() -> ASGIApplication:
         runtime,
         owner_id=os.environ.get("KOLKHOZ_SCHEDULER_ID"),
         batch_size=int(os.environ.get("KOLKHOZ_DEADLINE_BATCH_SIZE", "128")),
+        workers=int(os.environ.get("KOLKHOZ_DEADLINE_WORKERS", "8")),
+        tick_budget_seconds=float(
+            os.environ.get("KOLKHOZ_DEADLINE_TICK_BUDGET_SECONDS", "10")
+        ),
         metrics=metrics,
         on_state=application.finalize_runtime_state,
     )
@@ -346,6 +386,7 @@ def create_asgi_application() -> ASGIApplication:
     automatic = AutomaticTurnScheduler(
         lobby,
         application.advance_automatic_session,
+        advance_batch=application.advance_automatic_sessions,
         batch_size=int(os.environ.get("KOLKHOZ_AUTOMATIC_BATCH_SIZE", "64")),
         metrics=metrics,
     )
@@ -364,6 +405,7 @@ def create_asgi_application() -> ASGIApplication:
         scheduler.close()
         for command_worker in command_workers:
             command_worker.close()
+        result_listener.close()
         local_runtime.close()
         realtime_bus.close()
         pool.close()
@@ -398,6 +440,7 @@ def create_asgi_application() -> ASGIApplication:
             command_broker.readiness_check()
             checks["redisCommands"] = (
                 command_broker.partition_ownership_ready()
+                and result_listener.healthy
                 and all(worker.ownership_healthy for worker in command_workers)
             )
         except Exception:
@@ -1,21 +1,35 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import os
 import queue
 import threading
 import time
 import uuid
-from concurrent.futures import Future, TimeoutError as FutureTimeout
+from collections import OrderedDict, deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    TimeoutError as FutureTimeout,
+    wait,
+)
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Callable, Mapping
+from typing import Callable, Iterable, Mapping
 from typing import TYPE_CHECKING
 
 from .engine import EngineFactory, GameEngine, KolkhozCEngineFactory
 from .events import EventHub
 from .ai import HUMAN, AutomaticAdvancer, AutomaticState
-from .model import ENGINE_REPLAY_CONTRACT_VERSION, GameUpdate, JsonObject
+from .model import (
+    ENGINE_REPLAY_CONTRACT_VERSION,
+    EngineCheckpoint,
+    GameRecord,
+    GameUpdate,
+    JsonObject,
+    StoredEvent,
+)
 from .store import EventStore
 from .updates import ShardUpdateBuffer
 from .distributed import SessionLease, SessionLeaseRepository
@@ -23,8 +37,20 @@ from .errors import ServerError
 
 
 PLAYER_COUNT = 4
+CHECKPOINT_INTERVAL = 16
+# Used for engines that cannot report their own footprint.
+ENGINE_RESIDENT_BYTES = 128 * 1024
+# A rendered viewer state or buffered update as Python objects (~3.4 KB as JSON).
+VIEW_RESIDENT_BYTES = 20 * 1024
+IDLE_SWEEP_SECONDS = 5.0
+EXECUTE_TIMEOUT_SECONDS = 10.0
+# A second automatic pass this far ahead plays through bot pacing delays.
+AUTOMATIC_CATCH_UP_SECONDS = 10.0
+# Automatic sessions advanced per mailbox turn; human commands queue between turns.
+AUTOMATIC_ENVELOPE_SESSIONS = 4
 
 if TYPE_CHECKING:
+    from .contracts import SnapshotProjection
     from .metrics import ServerMetrics
 
 
@@ -35,6 +61,22 @@ class _Envelope:
     result: Future[object]
 
 
+@dataclass
+class _Projection:
+    """Views of one engine at one revision, rendered at most once per viewer."""
+
+    engine: GameEngine
+    revision: int
+    snapshot: SnapshotProjection | None
+    views: dict[int | None, JsonObject]
+
+
+@dataclass
+class _CheckpointCursor:
+    settings_sha256: str
+    revision: int
+
+
 class _Shard:
     def __init__(
         self,
@@ -47,6 +89,11 @@ class _Shard:
         owner_id: str,
         lease_ttl: timedelta,
         metrics: ServerMetrics | None,
+        *,
+        engine_sha256: str = "unknown",
+        checkpoint_interval: int = CHECKPOINT_INTERVAL,
+        memory_budget_bytes: int | None = None,
+        idle_ttl_seconds: float | None = None,
     ):
         self.index = index
         self.store = store
@@ -57,11 +104,23 @@ class _Shard:
         self.owner_id = owner_id
         self.lease_ttl = lease_ttl
         self.metrics = metrics
+        self.engine_sha256 = engine_sha256
+        self.checkpoint_interval = checkpoint_interval
         self.session_leases: dict[str, SessionLease] = {}
         self.engines: dict[str, GameEngine] = {}
         self.finished_states: dict[str, GameUpdate] = {}
         self.automatic_states: dict[str, AutomaticState] = {}
         self.update_buffers: dict[str, ShardUpdateBuffer] = {}
+        self.checkpoints: dict[str, _CheckpointCursor] = {}
+        self.projections: dict[str, _Projection] = {}
+        self.memory_budget_bytes = memory_budget_bytes
+        self.idle_ttl_seconds = idle_ttl_seconds
+        # Least recently used first; values are monotonic last-use times.
+        self.recent: OrderedDict[str, float] = OrderedDict()
+        self.resident: dict[str, int] = {}
+        self.finished_bytes: dict[str, int] = {}
+        self.resident_bytes = 0
+        self.evictions = {"idle": 0, "memory": 0}
         self.mailbox: queue.Queue[_Envelope | None] = queue.Queue(maxsize=4096)
         self.thread = threading.Thread(
             target=self._run, name=f"kolkhoz-game-shard-{index}", daemon=True
@@ -69,8 +128,17 @@ class _Shard:
         self.thread.start()
 
     def _run(self) -> None:
+        timeout = (
+            None
+            if self.idle_ttl_seconds is None
+            else min(self.idle_ttl_seconds, IDLE_SWEEP_SECONDS)
+        )
         while True:
-            envelope = self.mailbox.get()
+            try:
+                envelope = self.mailbox.get(timeout=timeout)
+            except queue.Empty:
+                self.evict_idle()
+                continue
             if envelope is None:
                 return
             try:
@@ -78,6 +146,132 @@ class _Shard:
                 envelope.result.set_result(envelope.operation(self, engine))
             except BaseException as error:
                 envelope.result.set_exception(error)
+            self.touch(envelope.session_id)
+            self.evict_idle()
+            self.enforce_budget(keep=envelope.session_id)
+
+    def view(
+        self,
+        session_id: str,
+        engine: GameEngine,
+        revision: int,
+        viewer_id: int | None = None,
+    ) -> JsonObject:
+        """Render ``engine`` at ``revision``, reusing earlier views of that revision.
+
+        Receipts, realtime fan-out, responses, and archiving all read the same
+        committed state, so the snapshot is walked once and only the per-viewer
+        privacy overlay is repeated.
+        """
+
+        cached = self.projections.get(session_id)
+        if cached is None or cached.engine is not engine or cached.revision != revision:
+            project = getattr(engine, "projection", None)
+            cached = _Projection(
+                engine, revision, project() if project is not None else None, {}
+            )
+            self.projections[session_id] = cached
+        value = cached.views.get(viewer_id)
+        if value is None:
+            value = (
+                engine.view(viewer_id)
+                if cached.snapshot is None
+                else cached.snapshot.view(viewer_id)
+            )
+            cached.views[viewer_id] = value
+        return dict(value)
+
+    def views_by_viewer(
+        self, session_id: str, engine: GameEngine, revision: int
+    ) -> dict[int, JsonObject]:
+        return {
+            player_id: self.view(session_id, engine, revision, player_id)
+            for player_id in range(PLAYER_COUNT)
+        }
+
+    def touch(self, session_id: str, now: float | None = None) -> None:
+        """Mark a session most recently used and re-measure what it keeps resident.
+
+        Counts the engine, a finished snapshot, cached views of the current
+        revision and the buffered per-viewer updates and reactions.
+        """
+
+        if not self._holds(session_id):
+            self._forget(session_id)
+            return
+        self.recent[session_id] = time.monotonic() if now is None else now
+        self.recent.move_to_end(session_id)
+        size = 0
+        engine = self.engines.get(session_id)
+        if engine is not None:
+            measure = getattr(engine, "resident_bytes", None)
+            size += ENGINE_RESIDENT_BYTES if measure is None else int(measure())
+        if session_id in self.finished_states:
+            size += self.finished_bytes.get(session_id, 0)
+        projection = self.projections.get(session_id)
+        if projection is not None:
+            size += VIEW_RESIDENT_BYTES * len(projection.views)
+        buffer = self.update_buffers.get(session_id)
+        if buffer is not None:
+            size += VIEW_RESIDENT_BYTES * buffer.retained_entries()
+        self.resident_bytes += size - self.resident.get(session_id, 0)
+        self.resident[session_id] = size
+
+    def evict_idle(self, now: float | None = None) -> None:
+        if self.idle_ttl_seconds is None:
+            return
+        deadline = (time.monotonic() if now is None else now) - self.idle_ttl_seconds
+        while self.recent:
+            session_id, last_used = next(iter(self.recent.items()))
+            if last_used > deadline:
+                return
+            self.evict(session_id, "idle")
+
+    def enforce_budget(self, *, keep: str | None = None) -> None:
+        if self.memory_budget_bytes is None:
+            return
+        for session_id in list(self.recent):
+            if self.resident_bytes <= self.memory_budget_bytes:
+                return
+            if session_id != keep:
+                self.evict(session_id, "memory")
+
+    def evict(self, session_id: str, reason: str) -> None:
+        """Drop every cached piece of a session and hand its lease back.
+
+        The durable log stays authoritative, so the next command simply replays
+        from the latest checkpoint, written here first to keep that replay short.
+        """
+
+        engine = self.engines.get(session_id)
+        automatic = self.automatic_states.get(session_id)
+        if engine is not None and automatic is not None:
+            self.checkpoint(session_id, engine, automatic.action_count, force=True)
+        self._discard_cache(session_id)
+        lease = self.session_leases.pop(session_id, None)
+        if lease is not None and self.leases is not None:
+            try:
+                self.leases.release(lease)
+            except Exception:
+                # The lease expires on its own; another worker waits out the TTL.
+                self._increment("lease.release_errors")
+        self.evictions[reason] += 1
+        self._increment(f"shard.evictions.{reason}")
+
+    def _holds(self, session_id: str) -> bool:
+        return (
+            session_id in self.engines
+            or session_id in self.finished_states
+            or session_id in self.automatic_states
+            or session_id in self.update_buffers
+            or session_id in self.session_leases
+        )
+
+    def _forget(self, session_id: str) -> None:
+        self.recent.pop(session_id, None)
+        self.projections.pop(session_id, None)
+        self.finished_bytes.pop(session_id, None)
+        self.resident_bytes -= self.resident.pop(session_id, 0)
 
     def load(self, session_id: str) -> GameEngine:
         self.finished_states.pop(session_id, None)
@@ -97,35 +291,132 @@ class _Shard:
             self.engines.pop(session_id, None)
             self.automatic_states.pop(session_id, None)
             self.update_buffers.pop(session_id, None)
-        engine = self.factory.create(record.seed, record.variants)
-        for event in self.store.events(session_id):
-            if event.kind == "action":
-                if event.payload.get("source") == "automatic":
-                    engine.apply_ai_action(event.payload)
-                else:
-                    player_id = int(event.payload.get("playerID", -1))
-                    if player_id < 0:
-                        engine.apply(event.payload)
-                        continue
-                    controller = engine.controller(player_id)  # type: ignore[attr-defined]
-                    if (
-                        controller != HUMAN and engine.waiting_player() != player_id  # type: ignore[attr-defined]
-                    ):
-                        # A later durable autopilot override can make engine
-                        # creation perform this formerly-manual action already.
-                        continue
-                    engine.set_controller(player_id, HUMAN)  # type: ignore[attr-defined]
-                    try:
-                        engine.apply(event.payload)
-                    finally:
-                        engine.set_controller(player_id, controller)  # type: ignore[attr-defined]
+        restored = self._restore_checkpoint(record)
+        if restored is None:
+            engine = self.factory.create(record.seed, record.variants)
+            checkpoint_revision = 0
+        else:
+            engine, checkpoint_revision = restored
+        try:
+            self._replay(
+                engine,
+                self.store.events(session_id, after_revision=checkpoint_revision),
+            )
+        except Exception:
+            engine.close()
+            raise
         self.engines[session_id] = engine
         self.automatic_states[session_id] = desired
         self.update_buffers[session_id] = ShardUpdateBuffer(
             session_id, current_revision=record.revision
         )
+        self.checkpoints[session_id] = _CheckpointCursor(
+            _settings_sha256(record.variants), checkpoint_revision
+        )
+        self.checkpoint(session_id, engine, record.revision)
         return engine
 
+    @staticmethod
+    def _replay(engine: GameEngine, events: list[StoredEvent]) -> None:
+        for event in events:
+            if event.kind != "action":
+                continue
+            if event.payload.get("source") == "automatic":
+                engine.apply_ai_action(event.payload)
+                continue
+            player_id = int(event.payload.get("playerID", -1))
+            if player_id < 0:
+                engine.apply(event.payload)
+                continue
+            controller = engine.controller(player_id)  # type: ignore[attr-defined]
+            if (
+                controller != HUMAN and engine.waiting_player() != player_id  # type: ignore[attr-defined]
+            ):
+                # A later durable autopilot override can make engine
+                # creation perform this formerly-manual action already.
+                continue
+            engine.set_controller(player_id, HUMAN)  # type: ignore[attr-defined]
+            try:
+                engine.apply(event.payload)
+            finally:
+                engine.set_controller(player_id, controller)  # type: ignore[attr-defined]
+
+    def _restore_checkpoint(self, record: GameRecord) -> tuple[GameEngine, int] | None:
+        restore = getattr(self.factory, "restore", None)
+        if restore is None or not self._checkpoints_enabled():
+            return None
+        try:
+            checkpoint = self.store.checkpoint(record.session_id)
+        except Exception:
+            self._increment("checkpoint.errors")
+            return None
+        if checkpoint is None:
+            return None
+        if (
+            checkpoint.engine_sha256 != self.engine_sha256
+            or checkpoint.engine_contract_version != ENGINE_REPLAY_CONTRACT_VERSION
+            or checkpoint.settings_sha256 != _settings_sha256(record.variants)
+            or checkpoint.revision > record.revision
+        ):
+            # Incompatible or ahead of durable truth: replay the whole log.
+            self._increment("checkpoint.stale")
+            return None
+        try:
+            engine = restore(record.seed, record.variants, checkpoint.state)
+        except Exception:
+            self._increment("checkpoint.errors")
+            return None
+        self._increment("checkpoint.restored")
+        return engine, checkpoint.revision
+
+    def checkpoint(
+        self,
+        session_id: str,
+        engine: GameEngine,
+        revision: int,
+        *,
+        force: bool = False,
+    ) -> None:
+        """Persist a replay shortcut every N revisions, or now when forced.
+
+        A failed write only costs a longer replay later, so it never fails the
+        command that triggered it.
+        """
+
+        cursor = self.checkpoints.get(session_id)
+        capture = getattr(engine, "checkpoint", None)
+        if cursor is None or capture is None or not self._checkpoints_enabled():
+            return
+        if revision <= cursor.revision:
+            return
+        if not force and revision - cursor.revision < self.checkpoint_interval:
+            return
+        try:
+            self.store.save_checkpoint(
+                EngineCheckpoint(
+                    session_id,
+                    revision,
+                    self.engine_sha256,
+                    ENGINE_REPLAY_CONTRACT_VERSION,
+                    cursor.settings_sha256,
+                    capture(),
+                )
+            )
+        except Exception:
+            self._increment("checkpoint.errors")
+            return
+        cursor.revision = revision
+        self._increment("checkpoint.saved")
+
+    def _checkpoints_enabled(self) -> bool:
+        # Without a known engine digest nothing proves a stored state layout
+        # matches this build.
+        return self.checkpoint_interval > 0 and self.engine_sha256 != "unknown"
+
+    def _increment(self, name: str) -> None:
+        if self.metrics is not None:
+            self.metrics.increment(name)
+
     def ensure_lease(self, session_id: str) -> int | None:
         if self.leases is None:
             return None
@@ -154,23 +445,118 @@ class _Shard:
         self.automatic_states.pop(session_id, None)
         self.update_buffers.pop(session_id, None)
         self.finished_states.pop(session_id, None)
+        self.checkpoints.pop(session_id, None)
+        self._forget(session_id)
 
     def archive_if_finished(
         self, session_id: str, engine: GameEngine, revision: int
     ) -> GameUpdate | None:
-        state = engine.view()
+        state = self.view(session_id, engine, revision)
         if int(state.get("phase", -1)) != 5:
             return None
         update = GameUpdate(session_id, revision, state)
         self.finished_states[session_id] = update
+        self.finished_bytes[session_id] = len(json.dumps(state, separators=(",", ":")))
         engine.close()
         self.engines.pop(session_id, None)
         self.automatic_states.pop(session_id, None)
+        self.checkpoints.pop(session_id, None)
+        self.projections.pop(session_id, None)
         return update
 
     def finished_state(self, session_id: str) -> GameUpdate | None:
         return self.finished_states.get(session_id)
 
+    def state(
+        self, session_id: str, engine: GameEngine | None, viewer_id: int | None
+    ) -> GameUpdate:
+        finished = self.finished_state(session_id)
+        if finished is not None:
+            return finished
+        engine = engine or self.load(session_id)
+        revision = self.store.game(session_id).revision
+        update = GameUpdate(
+            session_id,
+            revision,
+            self.view(session_id, engine, revision, viewer_id),
+        )
+        archived = self.archive_if_finished(session_id, engine, revision)
+        return update if archived is None else archived
+
+    def advance_automatic(
+        self, session_id: str, engine: GameEngine | None, *, now: float | None
+    ) -> int:
+        if self.finished_state(session_id) is not None:
+            return 0
+        engine = engine or self.load(session_id)
+        if self.advancer is None:
+            return 0
+        state = self.automatic_states[session_id]
+        if not self.advancer.needs_action(engine, state):  # type: ignore[arg-type]
+            return 0
+        fencing_token = self.ensure_lease(session_id)
+        engine = self.engines.get(session_id) or self.load(session_id)
+        state = self.automatic_states[session_id]
+        if not self.advancer.needs_action(engine, state):  # type: ignore[arg-type]
+            return 0
+
+        previous_by_viewer = (
+            self.views_by_viewer(session_id, engine, state.action_count)
+            if self.hub.realtime_enabled
+            else None
+        )
+
+        durable_revision = state.action_count
+        pending: list[tuple[JsonObject, dict[int, JsonObject] | None]] = []
+
+        def record(action: JsonObject, source: str) -> None:
+            payload = dict(action)
+            payload["source"] = source
+            # The engine moves on before the batch commits, so each
+            # revision's views are captured now and published after commit.
+            states_by_viewer = (
+                self.views_by_viewer(session_id, engine, state.action_count + 1)
+                if self.hub.realtime_enabled
+                else None
+            )
+            pending.append((payload, states_by_viewer))
+
+        def flush() -> None:
+            nonlocal durable_revision, previous_by_viewer
+            if not pending:
+                return
+            events = self.store.append_many(
+                session_id,
+                expected_revision=durable_revision,
+                kind="action",
+                payloads=[payload for payload, _ in pending],
+                fencing_token=fencing_token,
+            )
+            durable_revision = events[-1].revision
+            for event, (_, states_by_viewer) in zip(events, pending):
+                self.hub.publish(event, states_by_viewer, previous_by_viewer)
+                previous_by_viewer = states_by_viewer
+            pending.clear()
+
+        try:
+            applied = self.advancer.advance(
+                engine,  # type: ignore[arg-type]
+                state,
+                now=time.time() if now is None else now,
+                record=record,
+                flush=flush,
+            )
+            if applied:
+                self.checkpoint(session_id, engine, state.action_count, force=True)
+            self.archive_if_finished(session_id, engine, state.action_count)
+            return applied
+        except Exception:
+            engine.close()
+            self.engines.pop(session_id, None)
+            self.automatic_states.pop(session_id, None)
+            self.projections.pop(session_id, None)
+            raise
+
     @staticmethod
     def _automatic_state(
         session_id: str, settings: JsonObject, revision: int
@@ -191,6 +577,12 @@ class _Shard:
         self.finished_states.clear()
         self.automatic_states.clear()
         self.update_buffers.clear()
+        self.checkpoints.clear()
+        self.projections.clear()
+        self.recent.clear()
+        self.resident.clear()
+        self.finished_bytes.clear()
+        self.resident_bytes = 0
         if self.leases is not None:
             for lease in self.session_leases.values():
                 self.leases.release(lease)
@@ -212,9 +604,18 @@ class GameRuntime:
         owner_id: str | None = None,
         lease_ttl_seconds: float = 15,
         metrics: ServerMetrics | None = None,
+        checkpoint_interval: int = CHECKPOINT_INTERVAL,
+        memory_budget_bytes: int | None = None,
+        idle_ttl_seconds: float | None = None,
     ) -> None:
         if shard_count < 1:
             raise ValueError("shard_count must be positive")
+        if checkpoint_interval < 0:
+            raise ValueError("checkpoint_interval must not be negative")
+        if memory_budget_bytes is not None and memory_budget_bytes <= 0:
+            raise ValueError("memory_budget_bytes must be positive")
+        if idle_ttl_seconds is not None and idle_ttl_seconds <= 0:
+            raise ValueError("idle_ttl_seconds must be positive")
         self.store = store
         self.hub = event_hub or EventHub()
         factory = engine_factory or KolkhozCEngineFactory()
@@ -243,6 +644,10 @@ class GameRuntime:
                 resolved_owner,
                 lease_ttl,
                 metrics,
+                engine_sha256=self._engine_sha256,
+                checkpoint_interval=checkpoint_interval,
+                memory_budget_bytes=memory_budget_bytes,
+                idle_ttl_seconds=idle_ttl_seconds,
             )
             for index in range(shard_count)
         ]
@@ -255,6 +660,9 @@ class GameRuntime:
         for shard in self._shards:
             if shard.metrics is not None:
                 shard.metrics.gauge(f"shard.queue.{shard.index}", shard.mailbox.qsize())
+                shard.metrics.gauge(
+                    f"shard.resident_bytes.{shard.index}", shard.resident_bytes
+                )
         advancer = self._shards[0].advancer if self._shards else None
         policy_sha = advancer.models.sha256() if advancer is not None else None
         return {
@@ -266,6 +674,13 @@ class GameRuntime:
             "shardQueues": [shard.mailbox.qsize() for shard in self._shards],
             "shardQueueCapacity": self._shards[0].mailbox.maxsize,
             "overloadRejections": self._overload_rejections,
+            "residentBytes": sum(shard.resident_bytes for shard in self._shards),
+            "shardResidentBytes": [shard.resident_bytes for shard in self._shards],
+            "shardMemoryBudgetBytes": self._shards[0].memory_budget_bytes,
+            "evictions": {
+                reason: sum(shard.evictions[reason] for shard in self._shards)
+                for reason in ("idle", "memory")
+            },
             "workerID": self.owner_id,
             "policyModelSHA": policy_sha,
             "persistenceQueueDepth": 0,
@@ -273,21 +688,18 @@ class GameRuntime:
         }
 
     def health_state(self) -> dict[str, object]:
-        provenance = getattr(self._factory, "provenance", None)
-        details = provenance() if provenance is not None else {}
+        # Provenance is resolved once in __init__; the loaded engine cannot change.
         return {
             "status": "ok",
-            "gitSHA": os.environ.get(
-                "KOLKHOZ_BUILD_SHA", str(details.get("gitSHA", "unknown"))
-            ),
-            "engineSHA256": details.get("engineSHA256", "unknown"),
+            "gitSHA": self._engine_build_sha,
+            "engineSHA256": self._engine_sha256,
         }
 
-    def _execute(
+    def _submit(
         self,
         session_id: str,
         operation: Callable[[_Shard, GameEngine | None], object],
-    ) -> object:
+    ) -> Future[object]:
         future: Future[object] = Future()
         shard = self._shards[self.shard_index(session_id)]
         try:
@@ -298,8 +710,16 @@ class GameRuntime:
             if shard.metrics is not None:
                 shard.metrics.increment("shard.overload")
             raise ServerError(503, "server is overloaded") from error
+        return future
+
+    def _execute(
+        self,
+        session_id: str,
+        operation: Callable[[_Shard, GameEngine | None], object],
+    ) -> object:
+        future = self._submit(session_id, operation)
         try:
-            return future.result(timeout=10)
+            return future.result(timeout=EXECUTE_TIMEOUT_SECONDS)
         except FutureTimeout as error:
             raise ServerError(504, "game worker timed out") from error
 
@@ -327,7 +747,10 @@ class GameRuntime:
                 if existing.seed != seed or existing.variants != variants:
                     raise ValueError("session already exists with different settings")
                 return GameUpdate(
-                    session_id, existing.revision, unused.view(), event=None
+                    session_id,
+                    existing.revision,
+                    shard.view(session_id, unused, existing.revision),
+                    event=None,
                 )
             fencing_token = shard.ensure_lease(session_id)
             engine = shard.factory.create(seed, variants)
@@ -337,7 +760,7 @@ class GameRuntime:
                 {
                     "session_id": session_id,
                     "revision": 0,
-                    "state": engine.view(),
+                    "state": shard.view(session_id, engine, 0),
                     "event": None,
                 },
             )
@@ -361,20 +784,16 @@ class GameRuntime:
                 session_id, variants, 0
             )
             shard.update_buffers[session_id] = ShardUpdateBuffer(session_id)
-            return GameUpdate(session_id, 0, engine.view())
+            shard.checkpoints[session_id] = _CheckpointCursor(
+                _settings_sha256(variants), 0
+            )
+            return GameUpdate(session_id, 0, shard.view(session_id, engine, 0))
 
         return self._execute(session_id, create)  # type: ignore[return-value]
 
     def state(self, session_id: str, viewer_id: int | None = None) -> GameUpdate:
         def read(shard: _Shard, engine: GameEngine | None) -> GameUpdate:
-            finished = shard.finished_state(session_id)
-            if finished is not None:
-                return finished
-            engine = engine or shard.load(session_id)
-            revision = shard.store.game(session_id).revision
-            update = GameUpdate(session_id, revision, engine.view(viewer_id))
-            archived = shard.archive_if_finished(session_id, engine, revision)
-            return update if archived is None else archived
+            return shard.state(session_id, engine, viewer_id)
 
         return self._execute(session_id, read)  # type: ignore[return-value]
 
@@ -402,6 +821,11 @@ class GameRuntime:
                 from .store import RevisionConflict
 
                 raise RevisionConflict(expected_revision, record.revision)
+            previous_by_viewer = (
+                shard.views_by_viewer(session_id, engine, expected_revision)
+                if shard.hub.realtime_enabled
+                else None
+            )
             # The shard is the local single writer, so validate/apply once on its
             # owned engine. The database CAS protects against another process.
             engine.apply(action)
@@ -411,7 +835,9 @@ class GameRuntime:
                 {
                     "session_id": session_id,
                     "revision": expected_revision + 1,
-                    "state": engine.view(viewer_id),
+                    "state": shard.view(
+                        session_id, engine, expected_revision + 1, viewer_id
+                    ),
                     "event": None,
                 },
             )
@@ -435,17 +861,23 @@ class GameRuntime:
                 engine.close()
                 shard.engines.pop(session_id, None)
                 shard.automatic_states.pop(session_id, None)
+                shard.projections.pop(session_id, None)
                 raise
-            states_by_viewer = {
-                player_id: engine.view(player_id) for player_id in range(PLAYER_COUNT)
-            }
-            shard.hub.publish(event, states_by_viewer)
+            shard.hub.publish(
+                event,
+                shard.views_by_viewer(session_id, engine, event.revision),
+                previous_by_viewer,
+            )
             automatic = shard.automatic_states.get(session_id)
             if automatic is not None:
                 automatic.action_count = event.revision
             update = GameUpdate(
-                session_id, event.revision, engine.view(viewer_id), event
+                session_id,
+                event.revision,
+                shard.view(session_id, engine, event.revision, viewer_id),
+                event,
             )
+            shard.checkpoint(session_id, engine, event.revision)
             shard.archive_if_finished(session_id, engine, event.revision)
             return update
 
@@ -453,50 +885,7 @@ class GameRuntime:
 
     def advance_automatic(self, session_id: str, *, now: float | None = None) -> int:
         def advance(shard: _Shard, engine: GameEngine | None) -> int:
-            if shard.finished_state(session_id) is not None:
-                return 0
-            engine = engine or shard.load(session_id)
-            if shard.advancer is None:
-                return 0
-            state = shard.automatic_states[session_id]
-            if not shard.advancer.needs_action(engine, state):  # type: ignore[arg-type]
-                return 0
-            fencing_token = shard.ensure_lease(session_id)
-            engine = shard.engines.get(session_id) or shard.load(session_id)
-            state = shard.automatic_states[session_id]
-            if not shard.advancer.needs_action(engine, state):  # type: ignore[arg-type]
-                return 0
-
-            def record(action: JsonObject, source: str) -> None:
-                payload = dict(action)
-                payload["source"] = source
-                event = shard.store.append(
-                    session_id,
-                    expected_revision=state.action_count,
-                    kind="action",
-                    payload=payload,
-                    fencing_token=fencing_token,
-                )
-                states_by_viewer = {
-                    player_id: engine.view(player_id)
-                    for player_id in range(PLAYER_COUNT)
-                }
-                shard.hub.publish(event, states_by_viewer)
-
-            try:
-                applied = shard.advancer.advance(
-                    engine,  # type: ignore[arg-type]
-                    state,
-                    now=time.time() if now is None else now,
-                    record=record,
-                )
-                shard.archive_if_finished(session_id, engine, state.action_count)
-                return applied
-            except Exception:
-                engine.close()
-                shard.engines.pop(session_id, None)
-                shard.automatic_states.pop(session_id, None)
-                raise
+            return shard.advance_automatic(session_id, engine, now=now)
 
         return self._execute(session_id, advance)  # type: ignore[return-value]
 
@@ -509,9 +898,96 @@ class GameRuntime:
     ) -> GameUpdate:
         started_at = time.time() if now is None else now
         self.advance_automatic(session_id, now=started_at)
-        self.advance_automatic(session_id, now=started_at + 10.0)
+        self.advance_automatic(session_id, now=started_at + AUTOMATIC_CATCH_UP_SECONDS)
         return self.state(session_id, viewer_id)
 
+    def advance_automatic_batch(
+        self, session_ids: Iterable[str], *, now: float | None = None
+    ) -> dict[str, GameUpdate | Exception]:
+        """``advance_and_state`` for many sessions, batched per owner shard.
+
+        Each shard advances up to ``AUTOMATIC_ENVELOPE_SESSIONS`` sessions per
+        mailbox turn, and every shard's first turn is queued before any result is
+        awaited, so shards advance their bots concurrently. A shard's next turn is
+        queued only once its previous one finishes, behind any command that arrived
+        meanwhile, and each turn has the usual execute timeout. A session that
+        fails maps to its exception and does not stop the rest of its turn.
+        """
+
+        started_at = time.time() if now is None else now
+        slices: dict[int, deque[list[str]]] = {}
+        for session_id in dict.fromkeys(session_ids):
+            shard_slices = slices.setdefault(self.shard_index(session_id), deque())
+            if not shard_slices or len(shard_slices[-1]) >= AUTOMATIC_ENVELOPE_SESSIONS:
+                shard_slices.append([])
+            shard_slices[-1].append(session_id)
+
+        def advance_group(
+            group: list[str],
+        ) -> Callable[[_Shard, GameEngine | None], object]:
+            def advance(shard: _Shard, unused: GameEngine | None) -> object:
+                results: dict[str, GameUpdate | Exception] = {}
+                for session_id in group:
+                    try:
+                        for at in (started_at, started_at + AUTOMATIC_CATCH_UP_SECONDS):
+                            shard.advance_automatic(
+                                session_id, shard.engines.get(session_id), now=at
+                            )
+                        results[session_id] = shard.state(
+                            session_id, shard.engines.get(session_id), None
+                        )
+                    except Exception as error:
+                        results[session_id] = error
+                    # Hold the memory budget after every session, not just the group.
+                    shard.touch(session_id)
+                    shard.enforce_budget(keep=session_id)
+                return results
+
+            return advance
+
+        results: dict[str, GameUpdate | Exception] = {}
+        pending: dict[Future[object], tuple[int, list[str], float]] = {}
+
+        def fail_remaining(shard_index: int, error: Exception) -> None:
+            while slices[shard_index]:
+                results.update(dict.fromkeys(slices[shard_index].popleft(), error))
+
+        def submit_next(shard_index: int) -> None:
+            if not slices[shard_index]:
+                return
+            group = slices[shard_index].popleft()
+            try:
+                future = self._submit(group[0], advance_group(group))
+            except ServerError as error:
+                results.update(dict.fromkeys(group, error))
+                fail_remaining(shard_index, error)
+                return
+            deadline = time.monotonic() + EXECUTE_TIMEOUT_SECONDS
+            pending[future] = (shard_index, group, deadline)
+
+        for shard_index in slices:
+            submit_next(shard_index)
+        while pending:
+            nearest = min(deadline for _, _, deadline in pending.values())
+            done, _ = wait(
+                pending,
+                timeout=max(0.0, nearest - time.monotonic()),
+                return_when=FIRST_COMPLETED,
+            )
+            checked_at = time.monotonic()
+            for future, (shard_index, group, deadline) in list(pending.items()):
+                if future in done:
+                    del pending[future]
+                    results.update(future.result())  # type: ignore[arg-type]
+                    submit_next(shard_index)
+                elif deadline <= checked_at:
+                    # A stuck shard would time out every later turn as well.
+                    del pending[future]
+                    error = ServerError(504, "game worker timed out")
+                    results.update(dict.fromkeys(group, error))
+                    fail_remaining(shard_index, error)
+        return results
+
     def consume_timeout(
         self, claim: object, repository: object, *, now: float
     ) -> GameUpdate:
@@ -701,6 +1177,11 @@ class GatewayRuntimeContext:
         return None
 
 
+def _settings_sha256(settings: JsonObject) -> str:
+    encoded = json.dumps(settings, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
 def _successful_receipt(
     command_id: str | None, session_id: str, payload: JsonObject
 ) -> JsonObject | None:
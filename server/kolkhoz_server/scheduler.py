@@ -5,6 +5,7 @@ import threading
 import time
 import uuid
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Mapping, Protocol
 
 from .lobby import DueTurn, LobbyRepository, SeatUnavailable
@@ -17,6 +18,8 @@ if TYPE_CHECKING:
 DEFAULT_TURN_SECONDS = 90.0
 DEFAULT_CLAIM_SECONDS = 30.0
 DEFAULT_BATCH_SIZE = 128
+DEFAULT_WORKERS = 8
+DEFAULT_TICK_BUDGET_SECONDS = 10.0
 
 
 class ScheduledRuntime(Protocol):
@@ -37,6 +40,10 @@ class DeadlineScheduler:
 
     Database claim leases make replicas safe: one replica consumes a specific deadline,
     while the runtime's session lease and ordered mailbox fence engine mutation.
+    Claims are processed concurrently, one serial lane per runtime shard, so a slow
+    session only delays deadlines that share its mailbox. Claims not started within
+    ``tick_budget_seconds`` are carried to the next tick while their lease still
+    holds rather than waiting for it to expire.
     """
 
     def __init__(
@@ -48,25 +55,43 @@ class DeadlineScheduler:
         turn_seconds: float = DEFAULT_TURN_SECONDS,
         claim_seconds: float = DEFAULT_CLAIM_SECONDS,
         batch_size: int = DEFAULT_BATCH_SIZE,
+        workers: int = DEFAULT_WORKERS,
+        tick_budget_seconds: float = DEFAULT_TICK_BUDGET_SECONDS,
         clock: Callable[[], float] = time.time,
         metrics: ServerMetrics | None = None,
         on_state: Callable[[str, Mapping[str, object]], None] | None = None,
     ) -> None:
-        if turn_seconds <= 0 or claim_seconds <= 0 or batch_size <= 0:
-            raise ValueError("scheduler durations and batch size must be positive")
+        if min(turn_seconds, claim_seconds, batch_size, workers) <= 0:
+            raise ValueError(
+                "scheduler durations, batch size, and workers must be positive"
+            )
+        if tick_budget_seconds <= 0:
+            raise ValueError("tick_budget_seconds must be positive")
         self.repository = repository
         self.runtime = runtime
         self.owner_id = owner_id or str(uuid.uuid4())
         self.turn_seconds = turn_seconds
         self.claim_seconds = claim_seconds
         self.batch_size = batch_size
+        self.workers = workers
+        self.tick_budget_seconds = tick_budget_seconds
         self.clock = clock
         self._stop = threading.Event()
         self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._tick_lock = threading.Lock()
+        # Claims deferred by the tick budget, with the time their lease expires.
+        self._carried: list[tuple[DueTurn, float]] = []
+        # Shards that reported a lag on the previous tick.
+        self._lag_shards: set[int] = set()
         self.metrics = metrics
         self.on_state = on_state
 
     def run_once(self, *, now: float | None = None) -> int:
+        with self._tick_lock:
+            return self._run_once(now)
+
+    def _run_once(self, now: float | None) -> int:
         started = time.perf_counter()
         current = self.clock() if now is None else now
         activated = self.repository.activate_ready_sessions(now=current)
@@ -75,24 +100,90 @@ class DeadlineScheduler:
             if self.on_state is not None:
                 self.on_state(session_id, state.state)
             self._schedule_waiting(session_id, self._waiting_player(state), current)
-        claims = self.repository.claim_due_turns(
-            owner=self.owner_id,
-            now=current,
-            lease_seconds=self.claim_seconds,
-            limit=self.batch_size,
-        )
+        carried = [
+            (claim, lease_until)
+            for claim, lease_until in self._carried
+            if lease_until > current
+        ]
+        self._carried = []
+        claims = [claim for claim, _ in carried]
+        fresh: list[DueTurn] = []
+        if len(claims) < self.batch_size:
+            fresh = self.repository.claim_due_turns(
+                owner=self.owner_id,
+                now=current,
+                lease_seconds=self.claim_seconds,
+                limit=self.batch_size - len(claims),
+            )
+            claims.extend(fresh)
+        leases = dict(carried)
+        leases.update((claim, current + self.claim_seconds) for claim in fresh)
+        lanes = self._lanes(claims)
         if self.metrics is not None:
-            self.metrics.increment("scheduler.claims", len(claims))
+            self.metrics.increment("scheduler.claims", len(fresh))
             self.metrics.gauge("scheduler.claim_batch", len(claims))
-            if claims:
+            self.metrics.gauge(
+                "scheduler.lag_seconds",
+                max(0.0, current - min(claim.deadline_at for claim in claims))
+                if claims
+                else 0.0,
+            )
+            shards = {shard for shard in lanes if isinstance(shard, int)}
+            # A shard with nothing due this tick has no lag, not its last value.
+            for shard in self._lag_shards - shards:
+                self.metrics.gauge(f"scheduler.lag_seconds.{shard}", 0.0)
+            for shard in shards:
                 self.metrics.gauge(
-                    "scheduler.lag_seconds",
-                    max(0.0, current - min(claim.deadline_at for claim in claims)),
+                    f"scheduler.lag_seconds.{shard}",
+                    max(
+                        0.0,
+                        current - min(claim.deadline_at for claim in lanes[shard]),
+                    ),
                 )
+            self._lag_shards = shards
+        if len(lanes) <= 1 or self.workers == 1:
+            outcomes = [
+                self._process_lane(lane, current, started) for lane in lanes.values()
+            ]
+        else:
+            executor = self._pool()
+            outcomes = list(
+                executor.map(
+                    lambda lane: self._process_lane(lane, current, started),
+                    lanes.values(),
+                )
+            )
+        completed = sum(done for done, _ in outcomes)
+        deferred = [claim for _, skipped in outcomes for claim in skipped]
+        self._carried = [(claim, leases[claim]) for claim in deferred]
+        if self.metrics is not None:
+            self.metrics.increment("scheduler.completed", completed)
+            self.metrics.gauge("scheduler.deferred", len(deferred))
+            self.metrics.observe("scheduler.tick", time.perf_counter() - started)
+        return completed
+
+    def _lanes(self, claims: list[DueTurn]) -> dict[int | str, list[DueTurn]]:
+        # Runtimes without local shards (routed commands) serialize per session.
+        shard_index = getattr(self.runtime, "shard_index", None)
+        lanes: dict[int | str, list[DueTurn]] = {}
+        for claim in sorted(claims, key=lambda claim: claim.deadline_at):
+            key = (
+                shard_index(claim.session_id)
+                if shard_index is not None
+                else claim.session_id
+            )
+            lanes.setdefault(key, []).append(claim)
+        return lanes
+
+    def _process_lane(
+        self, lane: list[DueTurn], now: float, started: float
+    ) -> tuple[int, list[DueTurn]]:
         completed = 0
-        for claim in claims:
+        for position, claim in enumerate(lane):
+            if time.perf_counter() - started >= self.tick_budget_seconds:
+                return completed, lane[position:]
             try:
-                if self._process(claim, current):
+                if self._process(claim, now):
                     completed += 1
             except (KeyError, SeatUnavailable):
                 # A human action, leave, or session deletion can legitimately win
@@ -100,10 +191,15 @@ class DeadlineScheduler:
                 continue
             except Exception:
                 logging.exception("deadline processing failed for %s", claim.session_id)
-        if self.metrics is not None:
-            self.metrics.increment("scheduler.completed", completed)
-            self.metrics.observe("scheduler.tick", time.perf_counter() - started)
-        return completed
+        return completed, []
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix=f"kolkhoz-deadlines-{self.owner_id}",
+            )
+        return self._executor
 
     def _process(self, claim: DueTurn, now: float) -> bool:
         before = self.runtime.state(claim.session_id)
@@ -166,3 +262,6 @@ class DeadlineScheduler:
         if self._thread is not None:
             self._thread.join(timeout=5)
             self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -8,10 +8,11 @@ import time
 from contextlib import closing
 from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Iterator, Protocol
+from typing import TYPE_CHECKING, Callable, Iterator, Protocol, Sequence
 
 from .model import (
     ENGINE_REPLAY_CONTRACT_VERSION,
+    EngineCheckpoint,
     GameRecord,
     JsonObject,
     StoredEvent,
@@ -71,6 +72,22 @@ class EventStore(Protocol):
         command_result: JsonObject | None = None,
     ) -> StoredEvent: ...
 
+    def append_many(
+        self,
+        session_id: str,
+        *,
+        expected_revision: int,
+        kind: str,
+        payloads: Sequence[JsonObject],
+        fencing_token: int | None = None,
+    ) -> list[StoredEvent]:
+        """Commit a contiguous run of events after one revision and fence check."""
+        ...
+
+    def save_checkpoint(self, checkpoint: EngineCheckpoint) -> None: ...
+
+    def checkpoint(self, session_id: str) -> EngineCheckpoint | None: ...
+
     def delete_game(
         self,
         session_id: str,
@@ -201,6 +218,16 @@ create table if not exists game_events (
     primary key (session_id, revision)
 );
 
+create table if not exists game_engine_checkpoints (
+    session_id text primary key references games(session_id) on delete cascade,
+    revision integer not null,
+    engine_sha256 text not null,
+    engine_contract_version integer not null,
+    settings_sha256 text not null,
+    state blob not null,
+    created_at real not null
+);
+
 create table if not exists game_command_receipts (
     command_id text primary key,
     session_id text not null,
@@ -234,7 +261,9 @@ class SQLiteEventStore:
                 ("engine_contract_version", "integer not null default 1"),
             ):
                 if name not in columns:
-                    connection.execute(f"alter table games add column {name} {definition}")
+                    connection.execute(
+                        f"alter table games add column {name} {definition}"
+                    )
         finally:
             connection.close()
 
@@ -395,6 +424,106 @@ class SQLiteEventStore:
             connection.close()
         return StoredEvent(session_id, revision, kind, dict(payload), now)
 
+    def append_many(
+        self,
+        session_id: str,
+        *,
+        expected_revision: int,
+        kind: str,
+        payloads: Sequence[JsonObject],
+        fencing_token: int | None = None,
+    ) -> list[StoredEvent]:
+        if not payloads:
+            return []
+        now = time.time()
+        connection = self._connect()
+        try:
+            connection.execute("begin immediate")
+            updated = connection.execute(
+                """
+                update games
+                   set revision = revision + ?, updated_at = ?
+                 where session_id = ? and revision = ?
+                """,
+                (len(payloads), now, session_id, expected_revision),
+            )
+            if updated.rowcount != 1:
+                row = connection.execute(
+                    "select revision from games where session_id = ?", (session_id,)
+                ).fetchone()
+                if row is None:
+                    raise GameNotFound(session_id)
+                raise RevisionConflict(expected_revision, int(row["revision"]))
+            connection.executemany(
+                "insert into game_events values (?, ?, ?, ?, ?)",
+                [
+                    (
+                        session_id,
+                        expected_revision + offset,
+                        kind,
+                        json.dumps(payload, sort_keys=True),
+                        now,
+                    )
+                    for offset, payload in enumerate(payloads, start=1)
+                ],
+            )
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+        return [
+            StoredEvent(
+                session_id, expected_revision + offset, kind, dict(payload), now
+            )
+            for offset, payload in enumerate(payloads, start=1)
+        ]
+
+    def save_checkpoint(self, checkpoint: EngineCheckpoint) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                """
+                insert into game_engine_checkpoints values (?, ?, ?, ?, ?, ?, ?)
+                on conflict (session_id) do update set
+                    revision = excluded.revision,
+                    engine_sha256 = excluded.engine_sha256,
+                    engine_contract_version = excluded.engine_contract_version,
+                    settings_sha256 = excluded.settings_sha256,
+                    state = excluded.state,
+                    created_at = excluded.created_at
+                 where game_engine_checkpoints.revision <= excluded.revision
+                """,
+                (
+                    checkpoint.session_id,
+                    checkpoint.revision,
+                    checkpoint.engine_sha256,
+                    checkpoint.engine_contract_version,
+                    checkpoint.settings_sha256,
+                    checkpoint.state,
+                    time.time(),
+                ),
+            )
+
+    def checkpoint(self, session_id: str) -> EngineCheckpoint | None:
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                """select session_id, revision, engine_sha256,
+                          engine_contract_version, settings_sha256, state
+                     from game_engine_checkpoints where session_id = ?""",
+                (session_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return EngineCheckpoint(
+            str(row["session_id"]),
+            int(row["revision"]),
+            str(row["engine_sha256"]),
+            int(row["engine_contract_version"]),
+            str(row["settings_sha256"]),
+            bytes(row["state"]),
+        )
+
     def close(self) -> None:
         pass
 
@@ -681,6 +810,126 @@ class PostgresEventStore:
             )
         return StoredEvent(session_id, revision, kind, dict(payload), created_at)
 
+    def append_many(
+        self,
+        session_id: str,
+        *,
+        expected_revision: int,
+        kind: str,
+        payloads: Sequence[JsonObject],
+        fencing_token: int | None = None,
+    ) -> list[StoredEvent]:
+        if not payloads:
+            return []
+        with self._pool.connection() as connection, connection.transaction():  # type: ignore[attr-defined]
+            row = connection.execute(  # type: ignore[attr-defined]
+                """
+                update server_games
+                   set revision = revision + %s,
+                       fencing_token = greatest(
+                           fencing_token, coalesce(%s, fencing_token)
+                       ),
+                       updated_at = now()
+                 where session_id = %s::uuid and revision = %s
+                   and (%s is null or fencing_token <= %s)
+                returning extract(epoch from updated_at)
+                """,
+                (
+                    len(payloads),
+                    fencing_token,
+                    session_id,
+                    expected_revision,
+                    fencing_token,
+                    fencing_token,
+                ),
+            ).fetchone()
+            if row is None:
+                current = connection.execute(  # type: ignore[attr-defined]
+                    "select revision, fencing_token from server_games where session_id = %s::uuid",
+                    (session_id,),
+                ).fetchone()
+                if current is None:
+                    raise GameNotFound(session_id)
+                if (
+                    int(current[0]) == expected_revision
+                    and fencing_token is not None
+                    and int(current[1]) > fencing_token
+                ):
+                    raise LeaseLost(f"stale fencing token for session {session_id}")
+                raise RevisionConflict(expected_revision, int(current[0]))
+            created_at = float(row[0])
+            connection.execute(  # type: ignore[attr-defined]
+                """
+                insert into server_game_events
+                    (session_id, revision, kind, payload, created_at)
+                select %s::uuid, %s::bigint + item.position, %s, item.payload,
+                       to_timestamp(%s)
+                  from jsonb_array_elements(%s) with ordinality as item(payload, position)
+                """,
+                (
+                    session_id,
+                    expected_revision,
+                    kind,
+                    created_at,
+                    self._jsonb(list(payloads)),
+                ),
+            )
+        return [
+            StoredEvent(
+                session_id, expected_revision + offset, kind, dict(payload), created_at
+            )
+            for offset, payload in enumerate(payloads, start=1)
+        ]
+
+    def save_checkpoint(self, checkpoint: EngineCheckpoint) -> None:
+        with self._pool.connection() as connection, connection.transaction():  # type: ignore[attr-defined]
+            connection.execute(  # type: ignore[attr-defined]
+                """
+                insert into server_game_checkpoints (
+                    session_id, revision, engine_sha256,
+                    engine_contract_version, settings_sha256, state
+                )
+                values (%s::uuid, %s, %s, %s, %s, %s)
+                on conflict (session_id) do update set
+                    revision = excluded.revision,
+                    engine_sha256 = excluded.engine_sha256,
+                    engine_contract_version = excluded.engine_contract_version,
+                    settings_sha256 = excluded.settings_sha256,
+                    state = excluded.state,
+                    created_at = now()
+                 where server_game_checkpoints.revision <= excluded.revision
+                """,
+                (
+                    checkpoint.session_id,
+                    checkpoint.revision,
+                    checkpoint.engine_sha256,
+                    checkpoint.engine_contract_version,
+                    checkpoint.settings_sha256,
+                    checkpoint.state,
+                ),
+            )
+
+    def checkpoint(self, session_id: str) -> EngineCheckpoint | None:
+        with self._pool.connection() as connection:
+            row = connection.execute(  # type: ignore[attr-defined]
+                """
+                select session_id::text, revision, engine_sha256,
+                       engine_contract_version, settings_sha256, state
+                  from server_game_checkpoints where session_id = %s::uuid
+                """,
+                (session_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return EngineCheckpoint(
+            str(row[0]),
+            int(row[1]),
+            str(row[2]),
+            int(row[3]),
+            str(row[4]),
+            bytes(row[5]),
+        )
+
     def close(self) -> None:
         if self._owns_pool:
             self._pool.close()
@@ -102,6 +102,13 @@ class ShardUpdateBuffer:
         self._reactions.append(deepcopy(dict(reaction)))
         self.reaction_revision = revision
 
+    def retained_entries(self) -> int:
+        """Viewer updates and reactions held in memory, for shard accounting."""
+
+        return len(self._reactions) + sum(
+            len(entry.updates_by_viewer) for entry in self._actions
+        )
+
     def updates_since(
         self,
         after_revision: int,
@@ -31,6 +31,19 @@ create table if not exists server_game_events (
 create index if not exists server_game_events_created_at_idx
     on server_game_events (created_at);
 
+-- Engine checkpoints are a replay cache, never an authority. A worker restores
+-- the latest compatible row and replays only later events; a mismatched engine
+-- digest, contract version, or settings digest falls back to full replay.
+create table if not exists server_game_checkpoints (
+    session_id uuid primary key references server_games(session_id) on delete cascade,
+    revision bigint not null,
+    engine_sha256 text not null,
+    engine_contract_version integer not null,
+    settings_sha256 text not null,
+    state bytea not null,
+    created_at timestamptz not null default now()
+);
+
 update server_games
 set variants = case
     when variants ? 'variants' then jsonb_set(
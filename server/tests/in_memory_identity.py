@@ -173,7 +173,7 @@ class InMemoryIdentityRepository:
             },
         }
 
-    def player_for_token(self, token_hash: str, now: float) -> str | None:
+    def token_session(self, token_hash: str, now: float) -> tuple[str, float] | None:
         with self.lock:
             session = self.sessions.get(token_hash)
             if (
@@ -182,7 +182,15 @@ class InMemoryIdentityRepository:
                 or float(session["expiresAt"]) <= now
             ):
                 return None
-            return str(session["playerID"])
+            session["lastUsedAt"] = now
+            return str(session["playerID"]), float(session["expiresAt"])
+
+    def touch_sessions(self, token_hashes: list[str], now: float) -> None:
+        with self.lock:
+            for token_hash in token_hashes:
+                session = self.sessions.get(token_hash)
+                if session is not None and not session["revoked"]:
+                    session["lastUsedAt"] = now
 
     def create_link(
         self, player_id: str, code_hash: str, expires_at: float, now: float
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import threading
 import time
+from collections.abc import Mapping
 from dataclasses import replace
 
 from server.kolkhoz_server.lobby import (
@@ -9,7 +10,9 @@ from server.kolkhoz_server.lobby import (
     LifecycleIntent,
     SeatRecord,
     SeatUnavailable,
+    SessionReadModel,
     SessionRecord,
+    SessionSyncState,
     TimeoutResult,
     new_session_record,
 )
@@ -77,6 +80,48 @@ class InMemoryLobbyRepository:
         with self._lock:
             return list(self._seats.get(session_id, ()))
 
+    def seats_for_sessions(self, session_ids: list[str]) -> dict[str, list[SeatRecord]]:
+        with self._lock:
+            return {
+                session_id: list(self._seats.get(session_id, ()))
+                for session_id in session_ids
+            }
+
+    def read_model(
+        self, session_id: str, *, after_revision: int, revision: int
+    ) -> SessionReadModel:
+        with self._lock:
+            record = self._sessions.get(session_id)
+            if record is None:
+                raise KeyError(session_id)
+            turn_player_id, turn_deadline_at = self._turns.get(
+                session_id, (None, None)
+            )[:2]
+            # One locked read, like the single query of the Postgres repository.
+            return SessionReadModel(
+                record=record,
+                seats=list(self._seats.get(session_id, ())),
+                turn_player_id=turn_player_id,
+                turn_deadline_at=turn_deadline_at,
+                reactions=[
+                    dict(value) for value in self._reactions.get(session_id, ())
+                ],
+                actions=None,
+            )
+
+    def sync_states(self, session_ids: list[str]) -> dict[str, SessionSyncState]:
+        with self._lock:
+            return {
+                session_id: SessionSyncState(
+                    record=self._sessions[session_id],
+                    seats=list(self._seats.get(session_id, ())),
+                    turn_player_id=self._turns[session_id][0],
+                    turn_deadline_at=self._turns[session_id][1],
+                )
+                for session_id in session_ids
+                if session_id in self._sessions
+            }
+
     def list_open(self, now: float) -> list[SessionRecord]:
         with self._lock:
             records = [
@@ -467,10 +512,13 @@ class InMemoryLobbyRepository:
         *,
         now: float,
         session_ttl_seconds: float | None = None,
+        token_hash: str | None = None,
     ) -> None:
         with self._lock:
             seat = self._seat(session_id, player_id)
-            if not seat.occupied:
+            if not seat.occupied or (
+                token_hash is not None and seat.token_hash != token_hash
+            ):
                 raise SeatUnavailable(f"seat {player_id} is unavailable")
             self._replace_seat(
                 session_id,
@@ -481,7 +529,7 @@ class InMemoryLobbyRepository:
                 ),
             )
             if session_ttl_seconds is not None:
-                record = self.session(session_id)
+                record = self._sessions[session_id]
                 if record.status in {"open", "active"}:
                     self._sessions[session_id] = replace(
                         record,
@@ -505,6 +553,18 @@ class InMemoryLobbyRepository:
             self._turns[session_id] = (player_id, deadline_at, None, None, token)
             self._touch_session(session_id, now)
 
+    def set_turn_deadlines(
+        self,
+        deadlines: Mapping[str, tuple[int | None, float | None]],
+        *,
+        now: float,
+    ) -> None:
+        with self._lock:
+            for session_id, (player_id, deadline_at) in deadlines.items():
+                self.set_turn_deadline(
+                    session_id, player_id, deadline_at=deadline_at, now=now
+                )
+
     def turn_state(self, session_id: str) -> tuple[int | None, float | None]:
         with self._lock:
             turn = self._turns.get(session_id)
@@ -681,7 +741,7 @@ class InMemoryLobbyRepository:
         )
 
     def _touch_session(self, session_id: str, now: float) -> None:
-        record = self.session(session_id)
+        record = self._sessions[session_id]
         self._sessions[session_id] = replace(record, updated_at=now)
 
     def _release_finished_seats(self, user_id: str) -> None:
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import os
 import tempfile
 import threading
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from server.kolkhoz_server.ai import (
     AUTOMATIC_BATCH_LIMIT,
@@ -215,6 +217,23 @@ class AITests(unittest.TestCase):
             self.assertTrue(all(value is results[0] for value in results))
             self.assertEqual(len(cache.sha256() or ""), 64)
 
+    def test_model_cache_rehashes_only_when_a_policy_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "model.json"
+            path.write_text("model")
+            cache = ModelCache({"neuralAI": path}, lambda value: object())
+            first = cache.sha256()
+
+            with patch.object(Path, "open", side_effect=AssertionError("rehashed")):
+                self.assertEqual(cache.sha256(), first)
+
+            path.write_text("retrained")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.assertNotEqual(cache.sha256(), first)
+            path.unlink()
+            self.assertIsNone(cache.sha256())
+
     def test_profile_restore_and_selection_are_stable(self) -> None:
         profiles = [
             {"user_id": "a", "controller": "mediumAI"},
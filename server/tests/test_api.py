@@ -435,6 +435,219 @@ class CompatibilityApiTests(unittest.TestCase):
         self.assertEqual(self.application.lobby.turn_state(session_id), before_turn)
         self.assertEqual(self.application.results.recorded, before_results)
 
+    def test_polling_reads_share_one_lobby_read_per_revision(self) -> None:
+        status, created = self.request(
+            "POST",
+            "/sessions",
+            {
+                "seed": 10,
+                "controllers": ["human", "heuristicAI", "heuristicAI", "heuristicAI"],
+            },
+            bearer="host-token",
+        )
+        self.assertEqual(status, 200)
+        session_id = created["sessionID"]
+        lobby = self.application.lobby
+
+        with patch.object(lobby, "read_model", wraps=lobby.read_model) as read_model:
+            for _ in range(3):
+                read_status, update = self.request(
+                    "GET",
+                    f"/sessions/{session_id}/state?viewerID=0",
+                    bearer="host-token",
+                    seat_token=created["seatToken"],
+                )
+                self.assertEqual(read_status, 200)
+                self.assertEqual(update["reactions"], [])
+            self.assertEqual(read_model.call_count, 0)
+
+            lobby.append_reaction(
+                session_id,
+                player_id=0,
+                reaction_id="comrade",
+                year=1,
+                phase=0,
+                now=100.0,
+            )
+            refreshed = self.application._read_update(session_id, 0)
+            self.assertEqual(read_model.call_count, 1)
+            _, update = self.request(
+                "GET",
+                f"/sessions/{session_id}/state?viewerID=0",
+                bearer="host-token",
+                seat_token=created["seatToken"],
+            )
+
+        self.assertEqual(read_model.call_count, 1)
+        self.assertEqual(
+            [value["reactionID"] for value in update["reactions"]], ["comrade"]
+        )
+        self.assertEqual(update["reactions"], refreshed["reactions"])
+
+    def test_polling_reads_authenticate_from_the_read_model(self) -> None:
+        status, created = self.request(
+            "POST",
+            "/sessions",
+            {
+                "seed": 11,
+                "controllers": ["human", "heuristicAI", "heuristicAI", "heuristicAI"],
+            },
+            bearer="host-token",
+        )
+        self.assertEqual(status, 200)
+        session_id = created["sessionID"]
+        lobby = self.application.lobby
+        self.application._update_sources.clear()
+
+        with (
+            patch.object(lobby, "session", wraps=lobby.session) as session,
+            patch.object(lobby, "seats", wraps=lobby.seats) as seats,
+            patch.object(lobby, "reactions", wraps=lobby.reactions) as reactions,
+            patch.object(lobby, "read_model", wraps=lobby.read_model) as read_model,
+        ):
+            for path in (
+                f"/sessions/{session_id}/state?viewerID=0",
+                f"/sessions/{session_id}/players/0/actions?viewerID=0",
+                f"/sessions/{session_id}/actions?viewerID=0&afterRevision=0",
+            ):
+                read_status, _ = self.request(
+                    "GET",
+                    path,
+                    bearer="host-token",
+                    seat_token=created["seatToken"],
+                )
+                self.assertEqual(read_status, 200)
+
+        self.assertEqual(read_model.call_count, 1)
+        self.assertEqual(session.call_count, 0)
+        self.assertEqual(seats.call_count, 0)
+        self.assertEqual(reactions.call_count, 0)
+
+    def test_polling_reads_reject_a_seat_reassigned_within_the_cache_ttl(
+        self,
+    ) -> None:
+        status, created = self.request(
+            "POST",
+            "/sessions",
+            {
+                "seed": 11,
+                "controllers": ["human", "heuristicAI", "heuristicAI", "heuristicAI"],
+            },
+            bearer="host-token",
+        )
+        self.assertEqual(status, 200)
+        session_id = created["sessionID"]
+        path = f"/sessions/{session_id}/state?viewerID=0"
+        read_status, _ = self.request(
+            "GET", path, bearer="host-token", seat_token=created["seatToken"]
+        )
+        self.assertEqual(read_status, 200)
+        # Another gateway moves the seat to a new occupant; this process still
+        # caches the read model with the old seat.
+        lobby = self.application.lobby
+        with lobby._lock:
+            lobby._release_seat(session_id, 0, now=100.0)
+        lobby.occupy_seat(
+            session_id, 0, user_id="guest", token_hash="rekeyed", now=100.0
+        )
+
+        with patch.object(lobby, "read_model", wraps=lobby.read_model) as read_model:
+            stale_status, _ = self.request(
+                "GET", path, bearer="host-token", seat_token=created["seatToken"]
+            )
+
+        self.assertEqual(stale_status, 401)
+        self.assertEqual(read_model.call_count, 1)
+
+    def test_automatic_sessions_sync_the_lobby_in_one_read_and_one_write(
+        self,
+    ) -> None:
+        session_ids = []
+        for seed in (12, 13):
+            status, created = self.request(
+                "POST",
+                "/sessions",
+                {
+                    "seed": seed,
+                    "controllers": [
+                        "human",
+                        "heuristicAI",
+                        "heuristicAI",
+                        "heuristicAI",
+                    ],
+                },
+                bearer="host-token" if seed == 12 else "guest-token",
+            )
+            self.assertEqual(status, 200)
+            session_ids.append(created["sessionID"])
+        lobby = self.application.lobby
+        for session_id in session_ids:
+            # A stale deadline the engine no longer waits on must be cleared.
+            lobby.set_turn_deadline(session_id, 0, deadline_at=50.0, now=1.0)
+
+        with (
+            patch.object(lobby, "session", wraps=lobby.session) as session,
+            patch.object(lobby, "seats", wraps=lobby.seats) as seats,
+            patch.object(lobby, "turn_state", wraps=lobby.turn_state) as turn_state,
+            patch.object(
+                lobby, "set_turn_deadline", wraps=lobby.set_turn_deadline
+            ) as set_turn_deadline,
+            patch.object(lobby, "sync_states", wraps=lobby.sync_states) as states,
+            patch.object(
+                lobby, "set_turn_deadlines", wraps=lobby.set_turn_deadlines
+            ) as set_turn_deadlines,
+        ):
+            results = self.application.advance_automatic_sessions(
+                [*session_ids, "missing"]
+            )
+
+        self.assertEqual(results[session_ids[0]], None)
+        self.assertEqual(results[session_ids[1]], None)
+        self.assertIsInstance(results["missing"], KeyError)
+        self.assertEqual(states.call_count, 1)
+        self.assertEqual(set_turn_deadlines.call_count, 1)
+        self.assertEqual(set(set_turn_deadlines.call_args.args[0]), set(session_ids))
+        for session_id in session_ids:
+            self.assertEqual(lobby.turn_state(session_id), (None, None))
+        for method in (session, seats, turn_state):
+            self.assertEqual(method.call_count, 0)
+        # The batched write goes through the per-session setter in this fake only.
+        self.assertEqual(set_turn_deadline.call_count, 2)
+
+    def test_browse_listing_loads_seats_in_one_batch_and_shares_a_snapshot(
+        self,
+    ) -> None:
+        self.application.auth = StaticAuthVerifier(
+            {f"host-{index}": f"host-{index}" for index in range(4)}
+            | {"guest-token": "guest"}
+        )
+        for index in range(3):
+            status, _ = self.request(
+                "POST", "/sessions", {"seed": index}, bearer=f"host-{index}"
+            )
+            self.assertEqual(status, 200)
+        lobby = self.application.lobby
+
+        with (
+            patch.object(lobby, "seats", wraps=lobby.seats) as seats,
+            patch.object(
+                lobby, "seats_for_sessions", wraps=lobby.seats_for_sessions
+            ) as batch,
+        ):
+            first_status, first = self.request("GET", "/sessions", bearer="guest-token")
+            _, second = self.request("GET", "/sessions", bearer="guest-token")
+            self.assertEqual(seats.call_count, 0)
+            self.request("POST", "/sessions", {"seed": 3}, bearer="host-3")
+            listed_seats = seats.call_count
+            _, third = self.request("GET", "/sessions", bearer="guest-token")
+            self.assertEqual(seats.call_count, listed_seats)
+
+        self.assertEqual(first_status, 200)
+        self.assertEqual(len(first), 3)
+        self.assertIs(second, first)
+        self.assertEqual(len(third), 4)
+        self.assertEqual(batch.call_count, 2)
+
     def request(
         self,
         method: str,
@@ -15,6 +15,7 @@ from server.kolkhoz_server.asgi import (
 )
 from server.kolkhoz_server.distributed import RealtimeMessage
 from server.kolkhoz_server.errors import ServerError
+from server.kolkhoz_server.events import encode_state_delta
 
 
 @dataclass
@@ -620,3 +621,53 @@ def test_direct_projections_are_ordered_and_gaps_use_catch_up() -> None:
     assert [item["revision"] for item in updates["updates"]] == [1, 2]
     assert _direct_committed_updates("s1", 2, 0, current, [message(2)]) is None
     assert _direct_committed_updates("s1", 2, 0, current, [message(1, phase=5)]) is None
+
+
+def test_direct_projection_applies_state_deltas_to_the_last_snapshot() -> None:
+    current = {
+        "sessionID": "s1",
+        "viewerID": 2,
+        "actionLogCount": 0,
+        "gameLogActions": [],
+        "reactions": [],
+        "legalActions": [],
+        "snapshot": {"phase": 2, "waitingPlayer": 1, "hand": ["kept"]},
+    }
+    previous = {
+        viewer: {"phase": 2, "waitingPlayer": 1, "hand": [f"hand-{viewer}"]}
+        for viewer in range(4)
+    }
+    previous[2]["hand"] = ["kept"]
+    states = {
+        viewer: {
+            **state,
+            "waitingPlayer": 2,
+            "legalActions": [{"kind": 0, "playerID": 2}],
+        }
+        for viewer, state in previous.items()
+    }
+
+    def message(revision: int, delta: dict[str, object]) -> RealtimeMessage:
+        return RealtimeMessage(
+            "session:s1",
+            f"s1:{revision}",
+            {
+                "revision": revision,
+                "payload": {"kind": 0, "playerID": 1, "suit": 0},
+                "stateDelta": delta,
+            },
+        )
+
+    delta = encode_state_delta(1, states, previous)
+    assert "hand" not in json.loads(delta["shared"])
+    assert json.loads(delta["viewers"]["2"]) == {}
+    direct = _direct_committed_updates("s1", 2, 0, current, [message(1, delta)])
+    assert direct is not None
+    updates, latest, revision = direct
+    assert revision == 1
+    assert latest["snapshot"] == {"phase": 2, "waitingPlayer": 2, "hand": ["kept"]}
+    assert latest["isViewerTurn"] is True
+    assert "hand-1" not in json.dumps(updates)
+    # A delta against a revision this socket never saw falls back to catch-up.
+    stale = encode_state_delta(2, states, previous)
+    assert _direct_committed_updates("s1", 2, 0, current, [message(1, stale)]) is None
@@ -25,3 +25,20 @@ def test_scheduler_surfaces_failures_as_unhealthy() -> None:
     )
     assert scheduler.run_once(now=10) == 0
     assert not scheduler.healthy
+
+
+def test_scheduler_advances_due_sessions_in_one_batch() -> None:
+    batches: list[list[str]] = []
+
+    def advance_batch(session_ids: list[str]) -> dict[str, Exception | None]:
+        batches.append(session_ids)
+        return {"a": None, "b": RuntimeError("b")}
+
+    scheduler = AutomaticTurnScheduler(  # type: ignore[arg-type]
+        Repository(),
+        lambda session_id: (_ for _ in ()).throw(AssertionError(session_id)),
+        advance_batch=advance_batch,
+    )
+    assert scheduler.run_once(now=10) == 1
+    assert batches == [["a", "b"]]
+    assert not scheduler.healthy
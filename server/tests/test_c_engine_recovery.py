@@ -68,6 +68,44 @@ class RealCEngineRecoveryTests(unittest.TestCase):
 
             self.assertEqual(recovered, committed)
 
+    def test_checkpoint_restore_matches_full_replay(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary:
+            database = Path(temporary) / "checkpoint.sqlite3"
+            settings = {
+                "variants": {},
+                "controllers": ["human"] * 4,
+            }
+            first = GameRuntime(
+                SQLiteEventStore(database), shard_count=1, checkpoint_interval=2
+            )
+            first.create_game(seed=42042, variants=settings, session_id="snapshot")
+            for revision in range(3):
+                legal = first.state("snapshot").state["legalActions"]
+                first.submit_action(
+                    "snapshot", expected_revision=revision, action=legal[0]
+                )
+            committed = first.state("snapshot").state
+            first.close()
+            checkpoint = SQLiteEventStore(database).checkpoint("snapshot")
+
+            restored = GameRuntime(
+                SQLiteEventStore(database), shard_count=1, checkpoint_interval=2
+            )
+            replayed = GameRuntime(
+                SQLiteEventStore(database), shard_count=1, checkpoint_interval=0
+            )
+            try:
+                from_checkpoint = restored.state("snapshot").state
+                from_events = replayed.state("snapshot").state
+            finally:
+                restored.close()
+                replayed.close()
+
+            self.assertIsNotNone(checkpoint)
+            self.assertEqual(checkpoint.revision, 2)  # type: ignore[union-attr]
+            self.assertEqual(from_checkpoint, committed)
+            self.assertEqual(from_events, committed)
+
 
 if __name__ == "__main__":
     unittest.main()
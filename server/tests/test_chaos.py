@@ -105,14 +105,20 @@ class _FencedStore(SQLiteEventStore):
         self._fence_lock = threading.Lock()
 
     def append(self, session_id: str, **kwargs):  # type: ignore[no-untyped-def]
-        token = kwargs.get("fencing_token")
+        self._check_fence(session_id, kwargs.get("fencing_token"))
+        return super().append(session_id, **kwargs)
+
+    def append_many(self, session_id: str, **kwargs):  # type: ignore[no-untyped-def]
+        self._check_fence(session_id, kwargs.get("fencing_token"))
+        return super().append_many(session_id, **kwargs)
+
+    def _check_fence(self, session_id: str, token: int | None) -> None:
         with self._fence_lock:
             highest = self.highest_fence.get(session_id, 0)
             if token is not None and token < highest:
                 raise LeaseLost(f"stale fencing token for session {session_id}")
             if token is not None:
                 self.highest_fence[session_id] = token
-        return super().append(session_id, **kwargs)
 
 
 def _runtime(path: Path, **kwargs: object) -> GameRuntime:
@@ -247,7 +253,24 @@ def test_stale_fencing_token_is_rejected_after_takeover(tmp_path: Path) -> None:
             payload={"delta": 100},
             fencing_token=1,
         )
+    with pytest.raises(LeaseLost, match="stale fencing token"):
+        store.append_many(
+            "fenced",
+            expected_revision=1,
+            kind="action",
+            payloads=[{"delta": 100}, {"delta": 200}],
+            fencing_token=1,
+        )
+    with pytest.raises(RevisionConflict):
+        store.append_many(
+            "fenced",
+            expected_revision=0,
+            kind="action",
+            payloads=[{"delta": 100}],
+            fencing_token=2,
+        )
     assert store.game("fenced").revision == 1
+    assert [event.revision for event in store.events("fenced")] == [1]
 
 
 def test_duplicate_event_delivery_and_queue_saturation_are_bounded() -> None:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import queue
 import threading
 import time
 from pathlib import Path
@@ -16,6 +18,7 @@ from server.kolkhoz_server.commands import (
     CommandWorkerService,
     GameCommand,
     InMemoryCommandBroker,
+    RedisCommandResultListener,
     RedisStreamsCommandBroker,
     RoutedGameRuntime,
     RuntimeCommandHandler,
@@ -23,7 +26,7 @@ from server.kolkhoz_server.commands import (
 )
 from server.kolkhoz_server.runtime import GameRuntime
 from server.kolkhoz_server.metrics import ServerMetrics
-from server.kolkhoz_server.store import RevisionConflict, SQLiteEventStore
+from server.kolkhoz_server.store import GameNotFound, RevisionConflict, SQLiteEventStore
 from server.kolkhoz_server.api import OnlineApplication, Request
 from server.kolkhoz_server.auth import StaticAuthVerifier
 from server.tests.in_memory_lobby import InMemoryLobbyRepository
@@ -64,7 +67,7 @@ def test_partition_is_stable_and_session_commands_remain_ordered():
     assert session_partition("session-a", 8) == partition
 
 
-def test_worker_rotates_partition_scan_after_each_delivery():
+def test_worker_drains_every_owned_partition_in_one_receive():
     broker = InMemoryCommandBroker(partition_count=3)
     sessions = {}
     for suffix in range(1000):
@@ -73,24 +76,30 @@ def test_worker_rotates_partition_scan_after_each_delivery():
         sessions.setdefault(partition, session_id)
         if len(sessions) == 3:
             break
-    for value, partition in enumerate((0, 1, 2)):
-        broker.publish(command(f"command-{value}", sessions[partition], value))
+    for partition in (0, 1, 2):
+        for value in range(4):
+            broker.publish(
+                command(f"command-{partition}-{value}", sessions[partition], value)
+            )
+
+    seen: dict[str, list[int]] = {}
+    lock = threading.Lock()
+
+    def handle(item: GameCommand) -> CommandResult:
+        with lock:
+            seen.setdefault(item.session_id, []).append(item.payload["value"])
+        return CommandResult(item.command_id, item.session_id, True, {})
 
-    seen = []
     worker = CommandWorker(
-        broker,
-        "worker-a",
-        (0, 1, 2),
-        lambda item: (
-            seen.append(session_partition(item.session_id, 3))
-            or CommandResult(item.command_id, item.session_id, True, {})
-        ),
+        broker, "worker-a", (0, 1, 2), handle, batch_size=4, dispatch_threads=3
     )
+    try:
+        assert worker.run_once()
+        assert not worker.run_once()
+    finally:
+        worker.stop()
 
-    assert worker.run_once()
-    assert worker.run_once()
-    assert worker.run_once()
-    assert seen == [0, 1, 2]
+    assert seen == {session_id: [0, 1, 2, 3] for session_id in sessions.values()}
 
 
 def test_unacknowledged_command_is_redelivered_to_failover_worker():
@@ -188,14 +197,45 @@ def test_request_reply_unblocks_when_worker_completes():
     assert result.payload == {"revision": 7}
 
 
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.messages = queue.Queue()
+
+    def subscribe(self, *channels):
+        for channel in channels:
+            self.redis.subscribers.setdefault(channel, []).append(self)
+
+    def get_message(self, timeout=0.0):
+        try:
+            return self.messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        for subscribers in self.redis.subscribers.values():
+            if self in subscribers:
+                subscribers.remove(self)
+
+
+def _stream_id(value):
+    return tuple(int(part) for part in str(value).split("-"))
+
+
 class FakeStreamsRedis:
     def __init__(self):
+        self.subscribers = {}
+        self.published = []
         self.streams = {}
         self.pending = {}
+        self.groups = {}
         self.values = {}
         self.next_id = 1
         self.lists = {}
         self.blocking_reads = 0
+        self.result_reads = 0
+        self.group_reads = 0
+        self.autoclaims = 0
 
     def eval(self, script, _keys, *args):
         if "XLEN" not in script:
@@ -219,10 +259,28 @@ class FakeStreamsRedis:
         entries.append((delivery_id, {"command": encoded, "attempts": str(attempts)}))
         return 1
 
-    def xgroup_create(self, stream, _group, **_kwargs):
+    def xgroup_create(self, stream, group, id="$", **_kwargs):
         self.streams.setdefault(stream, [])
+        self.groups.setdefault((stream, group), id)
+
+    def xinfo_groups(self, stream):
+        if stream not in self.streams:
+            raise RuntimeError("ERR no such key")
+        return [
+            {
+                "name": group,
+                "pending": len(self.pending.get((stream, group), [])),
+                "last-delivered-id": last_id,
+            }
+            for (name, group), last_id in self.groups.items()
+            if name == stream
+        ]
+
+    def xpending(self, stream, group):
+        return {"pending": len(self.pending.get((stream, group), []))}
 
     def xautoclaim(self, stream, group, consumer, **_kwargs):
+        self.autoclaims += 1
         key = (stream, group)
         items = self.pending.get(key, [])
         if not items:
@@ -231,16 +289,25 @@ class FakeStreamsRedis:
         items[0] = (delivery_id, fields, consumer)
         return (delivery_id, [(delivery_id, fields)])
 
-    def xreadgroup(self, group, consumer, streams, **_kwargs):
-        stream = next(iter(streams))
-        entries = self.streams[stream]
-        pending_ids = {item[0] for item in self.pending.setdefault((stream, group), [])}
-        available = [item for item in entries if item[0] not in pending_ids]
-        if not available:
-            return []
-        delivery_id, fields = available[0]
-        self.pending[(stream, group)].append((delivery_id, fields, consumer))
-        return [(stream, [(delivery_id, fields)])]
+    def xreadgroup(self, group, consumer, streams, count=1, **_kwargs):
+        self.group_reads += 1
+        batches = []
+        for stream in streams:
+            pending = self.pending.setdefault((stream, group), [])
+            pending_ids = {item[0] for item in pending}
+            last_id = _stream_id(self.groups.get((stream, group), "0-0"))
+            available = [
+                item
+                for item in self.streams[stream]
+                if item[0] not in pending_ids and _stream_id(item[0]) > last_id
+            ][:count]
+            pending.extend(
+                (delivery_id, fields, consumer) for delivery_id, fields in available
+            )
+            if available:
+                self.groups[(stream, group)] = available[-1][0]
+                batches.append((stream, available))
+        return batches
 
     def xack(self, stream, group, delivery_id):
         key = (stream, group)
@@ -261,6 +328,8 @@ class FakeStreamsRedis:
         return True
 
     def get(self, key):
+        if ":result:" in key:
+            self.result_reads += 1
         return self.values.get(key)
 
     def mget(self, keys):
@@ -284,6 +353,15 @@ class FakeStreamsRedis:
     def ping(self):
         return True
 
+    def pubsub(self, **_kwargs):
+        return FakePubSub(self)
+
+    def publish(self, channel, data):
+        self.published.append(channel)
+        for subscriber in self.subscribers.get(channel, []):
+            subscriber.messages.put({"type": "message", "data": data})
+        return len(self.subscribers.get(channel, []))
+
 
 def test_redis_streams_adapter_routes_reclaims_and_deduplicates_results():
     redis = FakeStreamsRedis()
@@ -312,6 +390,60 @@ def test_redis_streams_adapter_routes_reclaims_and_deduplicates_results():
     assert redis.streams[f"test:partition:{partition}"] == []
 
 
+def test_upgraded_worker_does_not_redeliver_commands_read_by_the_old_release():
+    redis = FakeStreamsRedis()
+    broker = RedisStreamsCommandBroker(redis, namespace="test", partition_count=1)
+    stream = "test:partition:0"
+    legacy_group = "test:workers:0"
+    in_flight = command("old-release", "session-a", 1)
+    broker.publish(in_flight)
+    # The previous release reads through its per-partition group and stops before
+    # acknowledging, leaving the entry pending there.
+    redis.xgroup_create(stream, legacy_group, id="0-0", mkstream=True)
+    assert redis.xreadgroup(legacy_group, "old-worker", {stream: ">"})
+    queued = command("new-release", "session-b", 1)
+    broker.publish(queued)
+
+    def receive(*, reclaim: bool) -> list[str]:
+        broker._reclaim_due[0] = 0.0 if reclaim else float("inf")
+        batch = broker.receive_batch((0,), "new-worker", 0, count=4)
+        for delivery in batch:
+            broker.acknowledge(delivery)
+        return [delivery.command.command_id for delivery in batch]
+
+    # New reads start after the old release's position; its in-flight entry is
+    # only reclaimed from its own group after the visibility timeout.
+    assert receive(reclaim=False) == ["new-release"]
+    assert receive(reclaim=True) == ["old-release"]
+    assert receive(reclaim=True) == []
+    assert redis.pending[(stream, legacy_group)] == []
+    assert redis.streams[stream] == []
+    assert 0 not in broker._legacy_partitions
+
+
+def test_redis_batch_receive_reads_all_partitions_and_reclaims_on_a_cadence():
+    redis = FakeStreamsRedis()
+    broker = RedisStreamsCommandBroker(
+        redis, namespace="test", partition_count=4, reclaim_interval_seconds=60
+    )
+    for value in range(8):
+        broker.publish(command(f"command-{value}", f"session-{value}", value))
+
+    first = broker.receive_batch((0, 1, 2, 3), "worker-a", 0, count=8)
+    second = broker.receive_batch((0, 1, 2, 3), "worker-a", 0, count=8)
+
+    assert sorted(item.command.command_id for item in first) == [
+        f"command-{value}" for value in range(8)
+    ]
+    assert all(
+        item.partition == session_partition(item.command.session_id, 4)
+        for item in first
+    )
+    assert second == []
+    assert redis.group_reads == 2
+    assert redis.autoclaims == 4
+
+
 def test_redis_result_wait_blocks_on_completion_notification() -> None:
     redis = FakeStreamsRedis()
     broker = RedisStreamsCommandBroker(redis, namespace="test", partition_count=1)
@@ -320,6 +452,190 @@ def test_redis_result_wait_blocks_on_completion_notification() -> None:
     assert redis.blocking_reads == 1
 
 
+def test_gateway_listener_resolves_results_inline_without_blocking_reads() -> None:
+    redis = FakeStreamsRedis()
+    broker = RedisStreamsCommandBroker(redis, namespace="test", partition_count=1)
+    listener = RedisCommandResultListener(redis, namespace="test", listener_id="g1")
+    listener.start()
+    client = CommandClient(broker, listener)
+    worker = CommandWorker(
+        broker,
+        "worker-a",
+        (0,),
+        lambda item: CommandResult(
+            item.command_id, item.session_id, True, {"value": item.payload["value"]}
+        ),
+    )
+    stop = threading.Event()
+
+    def consume() -> None:
+        while not stop.is_set():
+            worker.run_once(0.01)
+
+    thread = threading.Thread(target=consume)
+    thread.start()
+    try:
+        result = client.execute(command("sync", "session-a", 1), timeout_seconds=2)
+        second = client.execute(command("second", "session-a", 2), timeout_seconds=2)
+    finally:
+        stop.set()
+        thread.join()
+        listener.close()
+
+    assert result.payload == {"value": 1}
+    assert second.payload == {"value": 2}
+    assert redis.published == ["test:reply:g1", "test:reply:g1"]
+    assert redis.blocking_reads == 0
+    # Only the gateway's and the worker's idempotency checks read the result.
+    assert redis.result_reads == 4
+    assert not listener.healthy
+
+
+def test_gateway_listener_awaits_routed_results_from_asyncio() -> None:
+    redis = FakeStreamsRedis()
+    broker = RedisStreamsCommandBroker(redis, namespace="test", partition_count=1)
+    listener = RedisCommandResultListener(redis, namespace="test", listener_id="g1")
+    listener.start()
+    client = CommandClient(broker, listener)
+    worker = CommandWorker(
+        broker,
+        "worker-a",
+        (0,),
+        lambda item: CommandResult(
+            item.command_id, item.session_id, True, {"value": item.payload["value"]}
+        ),
+    )
+    stop = threading.Event()
+
+    def consume() -> None:
+        while not stop.is_set():
+            worker.run_once(0.01)
+
+    async def execute_all() -> list[CommandResult]:
+        return list(
+            await asyncio.gather(
+                *(
+                    client.execute_async(
+                        command(f"async-{value}", f"session-{value}", value),
+                        timeout_seconds=2,
+                    )
+                    for value in range(3)
+                )
+            )
+        )
+
+    thread = threading.Thread(target=consume)
+    thread.start()
+    try:
+        results = asyncio.run(execute_all())
+    finally:
+        stop.set()
+        thread.join()
+    try:
+        with pytest.raises(CommandTimeout):
+            asyncio.run(
+                client.execute_async(
+                    command("never-run", "session-a", 9), timeout_seconds=0.05
+                )
+            )
+    finally:
+        listener.close()
+
+    assert [result.payload for result in results] == [
+        {"value": value} for value in range(3)
+    ]
+    assert redis.blocking_reads == 0
+
+
+def test_gateway_listener_falls_back_to_the_durable_result_after_a_lost_reply():
+    redis = FakeStreamsRedis()
+    broker = RedisStreamsCommandBroker(redis, namespace="test", partition_count=1)
+    listener = RedisCommandResultListener(redis, namespace="test", listener_id="g1")
+    client = CommandClient(broker, listener)
+    item = command("lost-reply", "session-a", 0)
+    worker = CommandWorker(
+        broker,
+        "worker-a",
+        (0,),
+        lambda value: CommandResult(value.command_id, value.session_id, True, {}),
+    )
+    thread = threading.Thread(target=lambda: (time.sleep(0.01), worker.run_once()))
+    thread.start()
+    result = client.execute(item, timeout_seconds=0.1)
+    thread.join()
+
+    assert result == CommandResult(item.command_id, item.session_id, True, {})
+    with pytest.raises(CommandTimeout):
+        client.execute(command("never-run", "session-a", 1), timeout_seconds=0.01)
+
+
+def test_gateway_listener_reads_the_durable_result_once_after_a_resubscribe():
+    redis = FakeStreamsRedis()
+    broker = RedisStreamsCommandBroker(redis, namespace="test", partition_count=1)
+    listener = RedisCommandResultListener(redis, namespace="test", listener_id="g1")
+    listener.start()
+    client = CommandClient(broker, listener)
+    item = command("resubscribed", "session-a", 0)
+    future, subscriptions = client._submit(item)
+    # The reply was published while the listener was between subscriptions.
+    broker.store_result(CommandResult(item.command_id, item.session_id, True, {}))
+    listener._subscriptions += 1
+    try:
+        started = time.monotonic()
+        result = client._await_result(item, future, subscriptions, timeout_seconds=5)
+        elapsed = time.monotonic() - started
+    finally:
+        listener.discard(item.command_id)
+        listener.close()
+
+    assert result == CommandResult(item.command_id, item.session_id, True, {})
+    assert redis.result_reads == 1
+    assert elapsed < 1
+
+
+def test_gateway_listener_reads_a_reply_less_worker_result_at_the_deadline():
+    redis = FakeStreamsRedis()
+    broker = RedisStreamsCommandBroker(redis, namespace="test", partition_count=1)
+    listener = RedisCommandResultListener(redis, namespace="test", listener_id="g1")
+    listener.start()
+    client = CommandClient(broker, listener)
+
+    class LegacyWorkerBroker(RedisStreamsCommandBroker):
+        # Workers released before reply channels drop ``reply_to``.
+        def store_result(
+            self, result: CommandResult, *, reply_to: str | None = None
+        ) -> CommandResult:
+            return super().store_result(result)
+
+    worker = CommandWorker(
+        LegacyWorkerBroker(redis, namespace="test", partition_count=1),
+        "legacy-worker",
+        (0,),
+        lambda item: CommandResult(item.command_id, item.session_id, True, {}),
+    )
+    item = command("legacy", "session-a", 0)
+    stop = threading.Event()
+
+    def consume() -> None:
+        while not stop.is_set():
+            worker.run_once(0.01)
+
+    thread = threading.Thread(target=consume)
+    thread.start()
+    try:
+        result = client.execute(item, timeout_seconds=0.3)
+    finally:
+        stop.set()
+        thread.join()
+        listener.close()
+
+    # Workers must publish replies before gateways rely on them; a reply-less
+    # worker's result is still recovered, but only by the gateway's final read.
+    assert result == CommandResult(item.command_id, item.session_id, True, {})
+    assert redis.published == []
+    assert redis.result_reads == 3
+
+
 def test_command_worker_refuses_overlapping_partition_ownership() -> None:
     redis = FakeStreamsRedis()
     broker = RedisStreamsCommandBroker(redis, namespace="test", partition_count=1)
@@ -456,6 +772,62 @@ def test_routed_runtime_executes_on_remote_worker_and_preserves_domain_errors():
     assert remote_state.state == {"value": 12, "viewerID": 2}
 
 
+def test_routed_automatic_batch_runs_every_partition_concurrently():
+    sessions = {
+        session_partition(f"bot-{index}", 2): f"bot-{index}" for index in range(8)
+    }
+    assert set(sessions) == {0, 1}
+    with TemporaryDirectory() as directory:
+        database = Path(directory) / "events.sqlite3"
+        worker_runtime = GameRuntime(
+            SQLiteEventStore(database), engine_factory=TinyFactory(), shard_count=2
+        )
+        gateway_runtime = GameRuntime(
+            SQLiteEventStore(database), engine_factory=TinyFactory(), shard_count=1
+        )
+        for session_id in sessions.values():
+            worker_runtime.create_game(seed=3, session_id=session_id)
+        broker = InMemoryCommandBroker(partition_count=2)
+        handler = RuntimeCommandHandler(worker_runtime)
+        # Each partition's command blocks until the other one is executing too.
+        both_running = threading.Barrier(2, timeout=2)
+
+        def advance(item: GameCommand) -> CommandResult:
+            if item.session_id in sessions.values():
+                both_running.wait()
+            return handler(item)
+
+        services = [
+            CommandWorkerService(
+                CommandWorker(broker, f"worker-{partition}", (partition,), advance),
+                poll_timeout_seconds=0.01,
+            )
+            for partition in (0, 1)
+        ]
+        routed = RoutedGameRuntime(
+            gateway_runtime,
+            CommandClient(broker),
+            timeout_seconds=3,
+            owns_all_partitions=False,
+        )
+        for service in services:
+            service.start()
+        try:
+            results = routed.advance_automatic_batch(
+                [*sessions.values(), "missing"], now=100
+            )
+        finally:
+            for service in services:
+                service.close()
+            gateway_runtime.close()
+            worker_runtime.close()
+
+    assert not both_running.broken
+    for session_id in sessions.values():
+        assert results[session_id].state == {"value": 3, "viewerID": None}
+    assert isinstance(results["missing"], GameNotFound)
+
+
 def test_routed_runtime_submits_locally_when_it_owns_every_partition():
     with TemporaryDirectory() as directory:
         runtime = GameRuntime(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import threading
 import time
@@ -157,6 +158,39 @@ def test_multiplexed_subscriber_buffer_is_bounded_and_reports_overflow():
     bus.close()
 
 
+def test_multiplexed_subscription_wakes_async_receivers_without_threads():
+    redis = FakeRedis()
+    bus = RedisRealtimeBus(redis, namespace="test")
+    subscription = bus.subscribe("session:abc")
+    deadline = time.monotonic() + 1
+    while redis.subscription.channel is None and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+    async def scenario():
+        pending = asyncio.create_task(subscription.receive())
+        await asyncio.sleep(0)
+        redis.subscription.messages.append(
+            {
+                "data": json.dumps(
+                    {"topic": "session:abc", "eventId": "1", "payload": {}}
+                )
+            }
+        )
+        received = await asyncio.wait_for(pending, 1)
+        closing = asyncio.create_task(subscription.receive())
+        await asyncio.sleep(0)
+        subscription.close()
+        return received, await asyncio.wait_for(closing, 1)
+
+    threads = threading.active_count()
+    received, closed = asyncio.run(scenario())
+    bus.close()
+
+    assert received == RealtimeMessage("session:abc", "1", {})
+    assert closed is None
+    assert threading.active_count() <= threads
+
+
 class FakeCursor:
     def __init__(self, row=None, rowcount=0):
         self.row = row
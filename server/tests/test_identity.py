@@ -8,11 +8,13 @@ import json
 import struct
 from datetime import datetime, timedelta, timezone
 from http import HTTPStatus
+from types import SimpleNamespace
 from unittest.mock import patch
 
 from server.kolkhoz_server.api import OnlineApplication, Request
 from server.kolkhoz_server.auth import StaticAuthVerifier
 from server.kolkhoz_server.errors import ServerError
+from server.kolkhoz_server.metrics import ServerMetrics
 from server.kolkhoz_server.identity import (
     AppleGameCenterVerifier,
     CredentialError,
@@ -433,9 +435,85 @@ class IdentityTests(unittest.TestCase):
         self.assertEqual(verifier.user_id(f"Bearer {token}"), player_id)
         self.assertTrue(self.service.account_status(player_id)["portable"])
         self.service.delete_player(player_id)
+        verifier.invalidate_user(player_id)
         self.assertIsNone(verifier.user_id(f"Bearer {token}"))
         self.assertFalse(self.repository.identities)
 
+    def test_session_verifier_caches_tokens_until_invalidated_or_expired(
+        self,
+    ) -> None:
+        login = self.authenticate("game_center", "gc-1", "gc-code")
+        token = str(login["accessToken"])
+        player_id = str(login["player"]["id"])  # type: ignore[index]
+        metrics = ServerMetrics()
+        lookups: list[str] = []
+        token_session = self.repository.token_session
+
+        def counted(token_hash: str, now: float) -> tuple[str, float] | None:
+            lookups.append(token_hash)
+            return token_session(token_hash, now)
+
+        self.repository.token_session = counted  # type: ignore[method-assign]
+        verifier = IdentitySessionVerifier(
+            self.repository,
+            clock=lambda: self.now[0],
+            ttl_seconds=30,
+            negative_ttl_seconds=5,
+            metrics=metrics,
+        )
+        for _ in range(3):
+            self.assertEqual(verifier.user_id(f"Bearer {token}"), player_id)
+            self.assertIsNone(verifier.user_id("Bearer khz_unknown"))
+        self.assertEqual(len(lookups), 2)
+        self.assertNotIn(token, lookups)
+        counters = metrics.snapshot(SimpleNamespace(metrics_state=dict))["counters"]
+        self.assertEqual(counters["auth.identity_cache.hit"], 4)
+        self.assertEqual(counters["auth.identity_cache.miss"], 2)
+
+        self.now[0] += 6
+        self.assertIsNone(verifier.user_id("Bearer khz_unknown"))
+        self.assertEqual(verifier.user_id(f"Bearer {token}"), player_id)
+        self.assertEqual(len(lookups), 3)
+
+        self.service.delete_player(player_id)
+        self.assertEqual(verifier.user_id(f"Bearer {token}"), player_id)
+        verifier.invalidate_user(player_id)
+        self.assertIsNone(verifier.user_id(f"Bearer {token}"))
+        self.assertEqual(len(lookups), 4)
+
+    def test_session_verifier_caps_entries_at_expiry_and_batches_last_used(
+        self,
+    ) -> None:
+        login = self.authenticate("game_center", "gc-1", "gc-code")
+        token = str(login["accessToken"])
+        player_id = str(login["player"]["id"])  # type: ignore[index]
+        session = self.repository.sessions[hashlib.sha256(token.encode()).hexdigest()]
+        verifier = IdentitySessionVerifier(
+            self.repository, clock=lambda: self.now[0], ttl_seconds=30
+        )
+        touches: list[list[str]] = []
+        touch_sessions = self.repository.touch_sessions
+
+        def counted(token_hashes: list[str], now: float) -> None:
+            touches.append(token_hashes)
+            touch_sessions(token_hashes, now)
+
+        self.repository.touch_sessions = counted  # type: ignore[method-assign]
+        self.assertEqual(verifier.user_id(f"Bearer {token}"), player_id)
+        self.now[0] += 10
+        self.assertEqual(verifier.user_id(f"Bearer {token}"), player_id)
+        self.assertEqual(touches, [])
+        self.now[0] += 21
+        session["expiresAt"] = self.now[0] + 5
+        self.assertEqual(verifier.user_id(f"Bearer {token}"), player_id)
+        self.now[0] += 1
+        self.assertEqual(verifier.user_id(f"Bearer {token}"), player_id)
+        self.assertEqual(len(touches), 1)
+        self.assertEqual(session["lastUsedAt"], self.now[0])
+
+        self.now[0] += 4
+        self.assertIsNone(verifier.user_id(f"Bearer {token}"))
+
     def test_two_device_flow_through_api_rotates_target_session_and_deletes_account(
         self,
     ) -> None:
@@ -498,6 +576,18 @@ class IdentityTests(unittest.TestCase):
             device_id="iphone",
         )
         request_id = str(link["requestID"])
+        auth = application.auth
+        with patch.object(
+            auth, "invalidate_user", wraps=auth.invalidate_user
+        ) as invalidate_user:
+            pending = dispatch(
+                "GET",
+                f"/identity/device-links/{request_id}",
+                bearer=source_token,
+                device_id="iphone",
+            )
+        self.assertEqual(pending["status"], "pending")
+        invalidate_user.assert_not_called()
         redeemed = dispatch(
             "POST",
             "/identity/device-links/redeem",
@@ -513,12 +603,16 @@ class IdentityTests(unittest.TestCase):
             device_id="iphone",
         )
         self.assertEqual(approved["status"], "approved")
-        linked = dispatch(
-            "GET",
-            f"/identity/device-links/{request_id}",
-            bearer=target_token,
-            device_id="android",
-        )
+        with patch.object(
+            auth, "invalidate_user", wraps=auth.invalidate_user
+        ) as invalidate_user:
+            linked = dispatch(
+                "GET",
+                f"/identity/device-links/{request_id}",
+                bearer=target_token,
+                device_id="android",
+            )
+        invalidate_user.assert_called_once_with(target_id)
         linked_token = str(linked["accessToken"])
         self.assertEqual(linked["player"]["id"], source_id)  # type: ignore[index]
         self.assertNotEqual(linked_token, target_token)
@@ -404,6 +404,22 @@ class PostgresLobbyRepositoryTests(unittest.TestCase):
             (1923.0, "00000000-0000-0000-0000-000000000001"),
         )
 
+    def test_touch_rejects_a_seat_whose_token_changed_in_database(self) -> None:
+        connection = FakeConnection([FakeResult(row=None)])
+        repository = self.repository(connection)
+
+        with self.assertRaises(SeatUnavailable):
+            repository.touch_seat(
+                "00000000-0000-0000-0000-000000000001",
+                1,
+                now=123.0,
+                token_hash="stale",
+            )
+
+        touch_sql, touch_parameters = connection.executions[0]
+        self.assertIn("token_hash = %s", touch_sql)
+        self.assertEqual(touch_parameters[-2:], ("stale", "stale"))
+
     def test_device_lease_serializes_by_user_and_rejects_fresh_conflict(self) -> None:
         connection = FakeConnection([FakeResult(), FakeResult(row=(1,))])
         repository = self.repository(connection)
@@ -1,4 +1,4 @@
-from server.kolkhoz_server.metrics import ServerMetrics
+from server.kolkhoz_server.metrics import MetricBucket, ServerMetrics
 
 
 class Runtime:
@@ -7,7 +7,7 @@ class Runtime:
 
 
 def test_registry_is_bounded_thread_safe_shape_and_prometheus_safe():
-    metrics = ServerMetrics(max_series=2, sample_capacity=2)
+    metrics = ServerMetrics(max_series=2)
     for index in range(10):
         metrics.record_route("GET", f"/unsafe/{index}", 200, index / 1000)
         metrics.observe(f"operation.{index}", index / 1000)
@@ -22,3 +22,58 @@ def test_registry_is_bounded_thread_safe_shape_and_prometheus_safe():
     rendered = metrics.prometheus(Runtime())
     assert "kolkhoz_http_requests_total" in rendered
     assert "/unsafe/9" not in rendered
+
+
+def test_histogram_percentiles_are_bounded_and_merge_across_processes():
+    gateway, worker = MetricBucket(), MetricBucket()
+    for index in range(1, 1001):
+        (gateway if index % 2 else worker).record(index / 1000)
+
+    gateway.merge(worker)
+    snapshot = gateway.snapshot()
+
+    assert snapshot["count"] == 1000
+    assert snapshot["minMs"] == 1.0
+    assert snapshot["maxMs"] == 1000.0
+    for key, exact in (("p50Ms", 500), ("p95Ms", 950), ("p99Ms", 990)):
+        assert exact <= snapshot[key] <= exact * (1 + 1 / 16)
+
+
+def test_prometheus_exposes_cumulative_histogram_buckets():
+    metrics = ServerMetrics()
+    for elapsed in (0.001, 0.002, 0.5):
+        metrics.observe("store.append", elapsed)
+
+    lines = metrics.prometheus(Runtime()).splitlines()
+    buckets = [
+        line for line in lines if line.startswith("kolkhoz_store_append_seconds_bucket")
+    ]
+    counts = [int(line.rsplit(" ", 1)[1]) for line in buckets]
+
+    assert "# TYPE kolkhoz_store_append_seconds histogram" in lines
+    assert "summary" not in "\n".join(lines)
+    assert counts == sorted(counts)
+    assert buckets[-1] == 'kolkhoz_store_append_seconds_bucket{le="+Inf"} 3'
+    assert "kolkhoz_store_append_seconds_count 3" in lines
+
+
+def test_prometheus_buckets_resolve_within_an_octave():
+    metrics = ServerMetrics()
+    for elapsed in (0.0011, 0.0013, 0.0016, 0.0018, 1e6):
+        metrics.observe("store.append", elapsed)
+
+    lines = metrics.prometheus(Runtime()).splitlines()
+    counts = {
+        line.split('le="', 1)[1].split('"', 1)[0]: int(line.rsplit(" ", 1)[1])
+        for line in lines
+        if line.startswith("kolkhoz_store_append_seconds_bucket")
+    }
+    bounds = sorted((float(le), count) for le, count in counts.items() if le != "+Inf")
+    seen = [count for bound, count in bounds if 2**-10 < bound <= 2**-9]
+
+    assert len(bounds) == 4 * 32
+    # Four exported boundaries split the ~1-2 ms octave one value apiece.
+    assert seen == [1, 2, 3, 4]
+    # Overflowing values are counted only in +Inf, not under the top bound.
+    assert bounds[-1][1] == 4
+    assert counts["+Inf"] == 5
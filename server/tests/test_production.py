@@ -5,7 +5,11 @@ import unittest
 from unittest.mock import patch
 
 from server.kolkhoz_server.auth import CachingAuthVerifier
-from server.kolkhoz_server.production import _enabled, _production_auth_verifier
+from server.kolkhoz_server.production import (
+    _enabled,
+    _production_auth_verifier,
+    _shard_memory_budget,
+)
 
 
 class ProductionConfigurationTests(unittest.TestCase):
@@ -25,6 +29,18 @@ class ProductionConfigurationTests(unittest.TestCase):
             run_worker = _enabled("KOLKHOZ_RUN_COMMAND_WORKER")
             self.assertFalse(_enabled("KOLKHOZ_RUN_AUTOMATIC_SCHEDULER", run_worker))
 
+    def test_engine_memory_budget_is_shared_by_all_shards(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(_shard_memory_budget(16), 268435456 // 16)
+        with patch.dict(
+            os.environ, {"KOLKHOZ_ENGINE_MEMORY_BUDGET_BYTES": "1000"}, clear=True
+        ):
+            self.assertEqual(_shard_memory_budget(3), 333)
+        with patch.dict(
+            os.environ, {"KOLKHOZ_ENGINE_MEMORY_BUDGET_BYTES": "0"}, clear=True
+        ):
+            self.assertIsNone(_shard_memory_budget(16))
+
     def test_legacy_auth_configuration_is_optional(self) -> None:
         with patch.dict(os.environ, {}, clear=True):
             self.assertIsNone(_production_auth_verifier())
@@ -7,12 +7,25 @@ import time
 import unittest
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import patch
 
-from server.kolkhoz_server.events import EventHub
-from server.kolkhoz_server.ai import AutomaticAdvancer, ModelCache
+from server.kolkhoz_server.events import EventHub, decode_viewer_state
+from server.kolkhoz_server.ai import (
+    AUTOMATIC_BATCH_LIMIT,
+    AutomaticAdvancer,
+    ModelCache,
+)
 from server.kolkhoz_server.distributed import SessionLease
 from server.kolkhoz_server.errors import ServerError
-from server.kolkhoz_server.runtime import GameRuntime, GatewayRuntimeContext
+from server.kolkhoz_server.model import GameUpdate
+from server.kolkhoz_server.runtime import (
+    AUTOMATIC_ENVELOPE_SESSIONS,
+    ENGINE_RESIDENT_BYTES,
+    VIEW_RESIDENT_BYTES,
+    GameRuntime,
+    GatewayRuntimeContext,
+    _Shard,
+)
 from server.kolkhoz_server.store import (
     ConnectionPool,
     RevisionConflict,
@@ -81,6 +94,72 @@ class VersionedFakeEngineFactory(FakeEngineFactory):
         return {"gitSHA": "build-123", "engineSHA256": "engine-456"}
 
 
+class CheckpointFakeEngine(FakeEngine):
+    def checkpoint(self) -> bytes:
+        return str(self.value).encode()
+
+
+class CheckpointFakeFactory(VersionedFakeEngineFactory):
+    def __init__(self, engine_sha256: str = "engine-456") -> None:
+        super().__init__()
+        self.engine_sha256 = engine_sha256
+        self.restored: list[bytes] = []
+        self.applied: list[int] = []
+
+    def create(self, seed: int, variants: dict[str, object]) -> CheckpointFakeEngine:
+        return self._tracked(CheckpointFakeEngine(seed, self.delay, self.tracker))
+
+    def restore(
+        self, seed: int, variants: dict[str, object], state: bytes
+    ) -> CheckpointFakeEngine:
+        self.restored.append(state)
+        return self._tracked(
+            CheckpointFakeEngine(int(state.decode()), self.delay, self.tracker)
+        )
+
+    def provenance(self) -> dict[str, str]:
+        return {"gitSHA": "build-123", "engineSHA256": self.engine_sha256}
+
+    def _tracked(self, engine: CheckpointFakeEngine) -> CheckpointFakeEngine:
+        original = engine.apply
+
+        def apply(action: dict[str, object]) -> None:
+            self.applied.append(int(action["delta"]))  # type: ignore[arg-type]
+            original(action)
+
+        engine.apply = apply  # type: ignore[method-assign]
+        return engine
+
+
+class CountingProjection:
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def view(self, viewer_id: int | None) -> dict[str, object]:
+        return {"value": self.value, "viewerID": viewer_id}
+
+
+class ProjectingFakeEngine(FakeEngine):
+    def __init__(self, seed: int, delay: float, tracker: EngineTracker) -> None:
+        super().__init__(seed, delay, tracker)
+        self.projections = 0
+
+    def projection(self) -> CountingProjection:
+        self.projections += 1
+        return CountingProjection(self.value)
+
+
+class ProjectingFakeFactory(FakeEngineFactory):
+    def __init__(self) -> None:
+        super().__init__()
+        self.created: list[ProjectingFakeEngine] = []
+
+    def create(self, seed: int, variants: dict[str, object]) -> ProjectingFakeEngine:
+        engine = ProjectingFakeEngine(seed, self.delay, self.tracker)
+        self.created.append(engine)
+        return engine
+
+
 class TerminalFakeEngine(FakeEngine):
     def view(self, viewer_id: int | None = None) -> dict[str, object]:
         return {
@@ -145,6 +224,21 @@ class AutomaticFakeFactory:
         return AutomaticFakeEngine(seed, list(controllers), self.tracker)
 
 
+class CountingEventStore(SQLiteEventStore):
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self.single_appends = 0
+        self.batches: list[int] = []
+
+    def append(self, session_id: str, **kwargs):  # type: ignore[no-untyped-def]
+        self.single_appends += 1
+        return super().append(session_id, **kwargs)
+
+    def append_many(self, session_id: str, **kwargs):  # type: ignore[no-untyped-def]
+        self.batches.append(len(kwargs["payloads"]))
+        return super().append_many(session_id, **kwargs)
+
+
 class RuntimeTests(unittest.TestCase):
     def setUp(self) -> None:
         self.temporary = tempfile.TemporaryDirectory()
@@ -200,6 +294,20 @@ class RuntimeTests(unittest.TestCase):
         self.assertEqual(record.engine_sha256, "engine-456")
         self.assertEqual(record.engine_contract_version, 1)
 
+    def test_health_reports_provenance_resolved_at_startup(self) -> None:
+        store = SQLiteEventStore(self.database)
+        factory = VersionedFakeEngineFactory()
+        runtime = GameRuntime(store, engine_factory=factory, shard_count=1)
+        factory.provenance = lambda: self.fail("provenance recomputed")
+        try:
+            for _ in range(3):
+                health = runtime.health_state()
+        finally:
+            runtime.close()
+
+        self.assertEqual(health["gitSHA"], "build-123")
+        self.assertEqual(health["engineSHA256"], "engine-456")
+
     def test_sqlite_store_migrates_existing_games_table(self) -> None:
         connection = sqlite3.connect(self.database)
         try:
@@ -213,9 +321,7 @@ class RuntimeTests(unittest.TestCase):
                        updated_at real not null
                    )"""
             )
-            connection.execute(
-                "insert into games values ('legacy', 4, '{}', 0, 1, 1)"
-            )
+            connection.execute("insert into games values ('legacy', 4, '{}', 0, 1, 1)")
             connection.commit()
         finally:
             connection.close()
@@ -365,6 +471,74 @@ class RuntimeTests(unittest.TestCase):
         self.assertEqual(recovered.revision, 2)
         self.assertEqual(recovered.state["value"], 17)
 
+    def test_cold_load_replays_only_events_after_checkpoint(self) -> None:
+        store = SQLiteEventStore(self.database)
+        first = GameRuntime(
+            store,
+            engine_factory=CheckpointFakeFactory(),
+            shard_count=1,
+            checkpoint_interval=2,
+        )
+        first.create_game(seed=7, session_id="checkpointed")
+        for revision in range(5):
+            first.submit_action(
+                "checkpointed", expected_revision=revision, action={"delta": 1}
+            )
+        first.close()
+        checkpoint = SQLiteEventStore(self.database).checkpoint("checkpointed")
+
+        factory = CheckpointFakeFactory()
+        second = GameRuntime(
+            SQLiteEventStore(self.database),
+            engine_factory=factory,
+            shard_count=1,
+            checkpoint_interval=2,
+        )
+        try:
+            recovered = second.state("checkpointed")
+        finally:
+            second.close()
+
+        assert checkpoint is not None
+        self.assertEqual(checkpoint.revision, 4)
+        self.assertEqual(checkpoint.engine_sha256, "engine-456")
+        self.assertEqual(factory.restored, [b"11"])
+        self.assertEqual(factory.applied, [1])
+        self.assertEqual(recovered.revision, 5)
+        self.assertEqual(recovered.state["value"], 12)
+
+    def test_checkpoint_from_other_engine_falls_back_to_full_replay(self) -> None:
+        first = GameRuntime(
+            SQLiteEventStore(self.database),
+            engine_factory=CheckpointFakeFactory(),
+            shard_count=1,
+            checkpoint_interval=1,
+        )
+        first.create_game(seed=7, session_id="rebuilt")
+        first.submit_action("rebuilt", expected_revision=0, action={"delta": 4})
+        first.submit_action("rebuilt", expected_revision=1, action={"delta": 6})
+        first.close()
+
+        factory = CheckpointFakeFactory(engine_sha256="engine-789")
+        second = GameRuntime(
+            SQLiteEventStore(self.database),
+            engine_factory=factory,
+            shard_count=1,
+            checkpoint_interval=1,
+        )
+        try:
+            recovered = second.state("rebuilt")
+        finally:
+            second.close()
+        rewritten = SQLiteEventStore(self.database).checkpoint("rebuilt")
+
+        self.assertEqual(factory.restored, [])
+        self.assertEqual(factory.applied, [4, 6])
+        self.assertEqual(recovered.state["value"], 17)
+        assert rewritten is not None
+        self.assertEqual(rewritten.engine_sha256, "engine-789")
+        self.assertEqual(rewritten.revision, 2)
+
     def test_committed_event_is_published_to_realtime_boundary(self) -> None:
         realtime = CapturingRealtimeBus()
         hub = EventHub(realtime)
@@ -386,11 +560,51 @@ class RuntimeTests(unittest.TestCase):
         self.assertEqual(event.payload, {"delta": 1})
         message = realtime.messages[0]
         self.assertEqual(message.payload["revision"], 1)
+        delta = message.payload["stateDelta"]
+        self.assertEqual(delta["baseRevision"], 0)
+        self.assertEqual(delta["shared"], '{"value":1}')
+        self.assertEqual(delta["viewers"]["2"], "{}")
         self.assertEqual(
-            message.payload["statesByViewer"]["2"],
+            decode_viewer_state(delta, 2, 1, {"value": 0, "viewerID": 2}),
             {"value": 1, "viewerID": 2},
         )
 
+    def test_submit_renders_each_revision_once_for_every_viewer(self) -> None:
+        realtime = CapturingRealtimeBus()
+        factory = ProjectingFakeFactory()
+        runtime = GameRuntime(
+            SQLiteEventStore(self.database),
+            engine_factory=factory,
+            shard_count=1,
+            event_hub=EventHub(realtime),
+        )
+        try:
+            runtime.create_game(seed=3, session_id="projected")
+            update = runtime.submit_action(
+                "projected",
+                expected_revision=0,
+                action={"delta": 2},
+                viewer_id=1,
+                command_id="command-1",
+            )
+            state = runtime.state("projected", 1)
+        finally:
+            runtime.close()
+
+        self.assertEqual(update.state, {"value": 5, "viewerID": 1})
+        self.assertEqual(state.state, {"value": 5, "viewerID": 1})
+        self.assertEqual(
+            decode_viewer_state(
+                realtime.messages[0].payload["stateDelta"],
+                3,
+                1,
+                {"value": 3, "viewerID": 3},
+            ),
+            {"value": 5, "viewerID": 3},
+        )
+        # One render at creation and one for the committed revision.
+        self.assertEqual(factory.created[0].projections, 2)
+
     def test_runtime_persists_automatic_actions_on_same_session_shard(self) -> None:
         factory = AutomaticFakeFactory()
         runtime = GameRuntime(
@@ -423,6 +637,180 @@ class RuntimeTests(unittest.TestCase):
         self.assertEqual(state.state["value"], 11)
         self.assertEqual(events[-1].payload["source"], "automatic")
 
+    def test_automatic_session_batch_advances_every_shard_and_isolates_failures(
+        self,
+    ) -> None:
+        runtime = GameRuntime(
+            SQLiteEventStore(self.database),
+            engine_factory=AutomaticFakeFactory(),
+            shard_count=3,
+            automatic_advancer=AutomaticAdvancer(ModelCache({}, lambda path: object())),
+        )
+        session_ids = [f"automatic-{index}" for index in range(6)]
+        try:
+            for session_id in session_ids:
+                runtime.create_game(
+                    seed=0,
+                    session_id=session_id,
+                    variants={
+                        "controllers": ["human", "heuristicAI", "human", "human"]
+                    },
+                )
+                runtime.submit_action(
+                    session_id,
+                    expected_revision=0,
+                    action={"playerID": 0, "delta": 1},
+                )
+            results = runtime.advance_automatic_batch(
+                [*session_ids, "missing"], now=100
+            )
+            events = runtime.events(session_ids[0])
+        finally:
+            runtime.close()
+
+        self.assertGreater(
+            len({runtime.shard_index(value) for value in session_ids}), 1
+        )
+        self.assertEqual(set(results), {*session_ids, "missing"})
+        self.assertIsInstance(results["missing"], Exception)
+        for session_id in session_ids:
+            update = results[session_id]
+            assert isinstance(update, GameUpdate)
+            self.assertEqual(update.revision, 2)
+            self.assertEqual(update.state["value"], 11)
+        self.assertEqual(events[-1].payload["source"], "automatic")
+
+    def test_automatic_batch_holds_the_memory_budget_after_each_session(
+        self,
+    ) -> None:
+        runtime = GameRuntime(
+            SQLiteEventStore(self.database),
+            engine_factory=AutomaticFakeFactory(),
+            shard_count=1,
+            automatic_advancer=AutomaticAdvancer(ModelCache({}, lambda path: object())),
+            memory_budget_bytes=ENGINE_RESIDENT_BYTES * 2 + VIEW_RESIDENT_BYTES * 8,
+        )
+        session_ids = [f"automatic-{index}" for index in range(4)]
+        peaks: list[int] = []
+        enforce_budget = _Shard.enforce_budget
+
+        def enforce(shard: _Shard, *, keep: str | None = None) -> None:
+            enforce_budget(shard, keep=keep)
+            peaks.append(shard.resident_bytes)
+
+        try:
+            for session_id in session_ids:
+                runtime.create_game(
+                    seed=0,
+                    session_id=session_id,
+                    variants={"controllers": ["heuristicAI"] * 4},
+                )
+            with patch.object(_Shard, "enforce_budget", autospec=True) as spy:
+                spy.side_effect = enforce
+                results = runtime.advance_automatic_batch(session_ids, now=100)
+        finally:
+            runtime.close()
+
+        self.assertTrue(
+            all(isinstance(results[value], GameUpdate) for value in session_ids)
+        )
+        kept = [call.kwargs["keep"] for call in spy.call_args_list]
+        self.assertEqual(kept[: len(session_ids)], session_ids)
+        self.assertLessEqual(
+            max(peaks), ENGINE_RESIDENT_BYTES * 2 + VIEW_RESIDENT_BYTES * 8
+        )
+
+    def test_automatic_batch_lets_queued_commands_run_between_envelopes(
+        self,
+    ) -> None:
+        runtime = GameRuntime(
+            SQLiteEventStore(self.database),
+            engine_factory=AutomaticFakeFactory(),
+            shard_count=1,
+            automatic_advancer=AutomaticAdvancer(ModelCache({}, lambda path: object())),
+        )
+        session_ids = [
+            f"automatic-{index}" for index in range(AUTOMATIC_ENVELOPE_SESSIONS + 2)
+        ]
+        order: list[str] = []
+        advance_automatic = _Shard.advance_automatic
+
+        def advance(shard: _Shard, session_id: str, *args, **kwargs):  # type: ignore[no-untyped-def]
+            if not order:
+                # A human command queued while the first envelope is running.
+                runtime._submit("human", lambda shard, engine: order.append("human"))
+            order.append(session_id)
+            return advance_automatic(shard, session_id, *args, **kwargs)
+
+        try:
+            for session_id in session_ids:
+                runtime.create_game(
+                    seed=0,
+                    session_id=session_id,
+                    variants={"controllers": ["heuristicAI"] * 4},
+                )
+            with patch.object(_Shard, "advance_automatic", autospec=True) as spy:
+                spy.side_effect = advance
+                results = runtime.advance_automatic_batch(session_ids, now=100)
+        finally:
+            runtime.close()
+
+        self.assertTrue(
+            all(isinstance(results[value], GameUpdate) for value in session_ids)
+        )
+        # Two automatic passes per session; the command runs after the first
+        # envelope instead of behind the whole batch.
+        first_envelope = 2 * AUTOMATIC_ENVELOPE_SESSIONS
+        self.assertNotIn("human", order[:first_envelope])
+        self.assertEqual(order[first_envelope], "human")
+        self.assertEqual(
+            order[first_envelope + 1 :],
+            [
+                value
+                for value in session_ids[AUTOMATIC_ENVELOPE_SESSIONS:]
+                for _ in range(2)
+            ],
+        )
+
+    def test_automatic_batch_commits_once_and_publishes_each_revision(self) -> None:
+        realtime = CapturingRealtimeBus()
+        store = CountingEventStore(self.database)
+        runtime = GameRuntime(
+            store,
+            engine_factory=AutomaticFakeFactory(),
+            shard_count=1,
+            event_hub=EventHub(realtime),
+            automatic_advancer=AutomaticAdvancer(ModelCache({}, lambda path: object())),
+        )
+        try:
+            runtime.create_game(
+                seed=0,
+                session_id="bots",
+                variants={"controllers": ["heuristicAI"] * 4},
+            )
+            applied = runtime.advance_automatic("bots", now=100)
+            events = runtime.events("bots")
+        finally:
+            runtime.close()
+
+        self.assertEqual(applied, AUTOMATIC_BATCH_LIMIT)
+        self.assertEqual(store.batches, [AUTOMATIC_BATCH_LIMIT])
+        self.assertEqual(store.single_appends, 0)
+        self.assertEqual(
+            [event.revision for event in events],
+            list(range(1, AUTOMATIC_BATCH_LIMIT + 1)),
+        )
+        self.assertEqual(
+            [message.payload["revision"] for message in realtime.messages],
+            list(range(1, AUTOMATIC_BATCH_LIMIT + 1)),
+        )
+        state = {"value": 0, "viewerID": 0}
+        for message in realtime.messages:
+            state = decode_viewer_state(
+                message.payload["stateDelta"], 0, message.payload["revision"], state
+            )
+        self.assertEqual(state, {"value": 10 * AUTOMATIC_BATCH_LIMIT, "viewerID": 0})
+
     def test_human_turn_automatic_check_does_not_renew_session_lease(self) -> None:
         leases = FakeLeaseRepository()
         runtime = GameRuntime(
@@ -471,6 +859,78 @@ class RuntimeTests(unittest.TestCase):
 
         self.assertEqual(accepted.revision, 1)
 
+    def test_memory_budget_evicts_least_recently_used_session(self) -> None:
+        leases = FakeLeaseRepository()
+        factory = FakeEngineFactory()
+        runtime = GameRuntime(
+            SQLiteEventStore(self.database),
+            engine_factory=factory,
+            shard_count=1,
+            lease_repository=leases,
+            owner_id="worker-a",
+            memory_budget_bytes=200_000,
+        )
+        try:
+            runtime.create_game(seed=1, session_id="older")
+            runtime.submit_action("older", expected_revision=0, action={"delta": 2})
+            runtime.create_game(seed=5, session_id="newer")
+            evicted = runtime.metrics_state()
+            self.assertNotIn("older", leases.current)
+            self.assertIn("newer", leases.current)
+            reloaded = runtime.state("older")
+            after_reload = runtime.metrics_state()
+        finally:
+            runtime.close()
+
+        self.assertEqual(evicted["activeSessions"], 1)
+        self.assertEqual(evicted["evictions"], {"idle": 0, "memory": 1})
+        self.assertLessEqual(evicted["residentBytes"], 200_000)
+        self.assertEqual(reloaded.revision, 1)
+        self.assertEqual(reloaded.state["value"], 3)
+        self.assertEqual(after_reload["evictions"]["memory"], 2)
+
+    def test_resident_bytes_count_cached_views(self) -> None:
+        runtime = GameRuntime(
+            SQLiteEventStore(self.database),
+            engine_factory=FakeEngineFactory(),
+            shard_count=1,
+            memory_budget_bytes=10_000_000,
+        )
+        try:
+            runtime.create_game(seed=1, session_id="game")
+            before = runtime.metrics_state()["residentBytes"]
+            runtime.state("game", viewer_id=0)
+            runtime.state("game", viewer_id=1)
+            after = runtime.metrics_state()["residentBytes"]
+        finally:
+            runtime.close()
+
+        self.assertGreaterEqual(after - before, 2 * VIEW_RESIDENT_BYTES)
+
+    def test_idle_sessions_are_evicted_and_leases_released(self) -> None:
+        leases = FakeLeaseRepository()
+        runtime = GameRuntime(
+            SQLiteEventStore(self.database),
+            engine_factory=FakeEngineFactory(),
+            shard_count=1,
+            lease_repository=leases,
+            owner_id="worker-a",
+            idle_ttl_seconds=0.05,
+        )
+        try:
+            runtime.create_game(seed=0, session_id="idle")
+            deadline = time.monotonic() + 5
+            while "idle" in leases.current and time.monotonic() < deadline:
+                time.sleep(0.01)
+            state = runtime.metrics_state()
+        finally:
+            runtime.close()
+
+        self.assertNotIn("idle", leases.current)
+        self.assertEqual(state["activeSessions"], 0)
+        self.assertEqual(state["residentBytes"], 0)
+        self.assertEqual(state["evictions"]["idle"], 1)
+
 
 class ConnectionPoolTests(unittest.TestCase):
     def test_pool_allows_bounded_parallel_leases(self) -> None:
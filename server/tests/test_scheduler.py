@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import threading
+import time
 import unittest
 
 from server.kolkhoz_server.lobby import SeatRecord
+from server.kolkhoz_server.metrics import ServerMetrics
 from server.kolkhoz_server.model import GameUpdate
 from server.kolkhoz_server.scheduler import DeadlineScheduler
 from server.tests.in_memory_lobby import InMemoryLobbyRepository
@@ -49,19 +52,41 @@ class FakeRuntime:
         return self.state(claim.session_id)
 
 
+class ShardedRuntime(FakeRuntime):
+    def __init__(self, shards: dict[str, int]) -> None:
+        super().__init__()
+        self.shards = shards
+        self.entered: threading.Barrier | None = None
+        self.delay = 0.0
+
+    def shard_index(self, session_id: str) -> int:
+        return self.shards[session_id]
+
+    def metrics_state(self) -> dict[str, object]:
+        return {}
+
+    def state(self, session_id: str, viewer_id: int | None = None) -> GameUpdate:
+        if self.entered is not None:
+            self.entered.wait()
+        time.sleep(self.delay)
+        return GameUpdate(session_id, 0, {"waitingPlayer": 0})
+
+
 class SchedulerTests(unittest.TestCase):
     def setUp(self) -> None:
         self.repository = InMemoryLobbyRepository()
+        self.session_id = self.active_session(1)
+
+    def active_session(self, seed: int) -> str:
         record = self.repository.new_session(
-            seed=1,
+            seed=seed,
             variants={},
             controllers=["human"] * 4,
             ranked=False,
             browser_joinable=True,
-            created_by_user_id="user-0",
+            created_by_user_id=f"user-{seed}-0",
             ttl_seconds=3600,
         )
-        self.session_id = record.session_id
         self.repository.create(
             record,
             [
@@ -69,8 +94,8 @@ class SchedulerTests(unittest.TestCase):
                     index,
                     "human",
                     index in (0, 1),
-                    f"user-{index}" if index in (0, 1) else None,
-                    f"token-{index}" if index in (0, 1) else None,
+                    f"user-{seed}-{index}" if index in (0, 1) else None,
+                    f"token-{seed}-{index}" if index in (0, 1) else None,
                     0.0 if index in (0, 1) else None,
                     0,
                     False,
@@ -79,11 +104,12 @@ class SchedulerTests(unittest.TestCase):
                 for index in range(4)
             ],
         )
-        self.repository.set_status(self.session_id, "active", now=1.0)
+        self.repository.set_status(record.session_id, "active", now=1.0)
+        return record.session_id
 
-    def due(self, deadline: float = 100.0) -> None:
+    def due(self, deadline: float = 100.0, session_id: str | None = None) -> None:
         self.repository.set_turn_deadline(
-            self.session_id, 0, deadline_at=deadline, now=deadline - 90
+            session_id or self.session_id, 0, deadline_at=deadline, now=deadline - 90
         )
 
     def test_claims_are_exclusive_and_recover_after_lease_expiry(self) -> None:
@@ -184,6 +210,64 @@ class SchedulerTests(unittest.TestCase):
             [],
         )
 
+    def test_claims_on_different_shards_are_processed_concurrently(self) -> None:
+        other = self.active_session(2)
+        self.due(98.0)
+        self.due(99.5, other)
+        runtime = ShardedRuntime({self.session_id: 0, other: 1})
+        # Serial processing would leave the first lane waiting for the second.
+        runtime.entered = threading.Barrier(2, timeout=5)
+        metrics = ServerMetrics()
+        scheduler = DeadlineScheduler(
+            self.repository, runtime, owner_id="scheduler", metrics=metrics
+        )
+        try:
+            self.assertEqual(scheduler.run_once(now=100.0), 2)
+        finally:
+            scheduler.close()
+
+        gauges = metrics.snapshot(runtime)["gauges"]
+        self.assertEqual(gauges["scheduler.lag_seconds.0"], 2.0)
+        self.assertEqual(gauges["scheduler.lag_seconds.1"], 0.5)
+        self.assertEqual(gauges["scheduler.lag_seconds"], 2.0)
+
+        self.due(100.5)
+        scheduler.run_once(now=101.0)
+        gauges = metrics.snapshot(runtime)["gauges"]
+        self.assertEqual(gauges["scheduler.lag_seconds.0"], 0.5)
+        self.assertEqual(gauges["scheduler.lag_seconds.1"], 0.0)
+
+        scheduler.run_once(now=102.0)
+        gauges = metrics.snapshot(runtime)["gauges"]
+        self.assertEqual(gauges["scheduler.lag_seconds.0"], 0.0)
+        self.assertEqual(gauges["scheduler.lag_seconds"], 0.0)
+
+    def test_claims_past_the_tick_budget_carry_to_the_next_tick(self) -> None:
+        other = self.active_session(2)
+        self.due(98.0)
+        self.due(99.0, other)
+        runtime = ShardedRuntime({self.session_id: 0, other: 0})
+        runtime.delay = 0.05
+        scheduler = DeadlineScheduler(
+            self.repository,
+            runtime,
+            owner_id="scheduler",
+            tick_budget_seconds=0.02,
+        )
+
+        self.assertEqual(scheduler.run_once(now=100.0), 1)
+        self.assertEqual(self.repository.seats(self.session_id)[0].timeouts, 1)
+        self.assertEqual(self.repository.seats(other)[0].timeouts, 0)
+        # The deferred claim still holds its lease, so no replica can take it.
+        self.assertEqual(
+            self.repository.claim_due_turns(
+                owner="other", now=101.0, lease_seconds=10, limit=8
+            ),
+            [],
+        )
+        self.assertEqual(scheduler.run_once(now=101.0), 1)
+        self.assertEqual(self.repository.seats(other)[0].timeouts, 1)
+
     def test_scheduler_activates_ready_countdown_without_a_get_request(self) -> None:
         record = self.repository.new_session(
             seed=2,